@@ -0,0 +1,111 @@
+"""
+Benchmark project file detection on a simulated slow filesystem.
+
+Network filesystems and container overlay mounts make every metadata syscall
+expensive. This benchmark wraps os.stat and os.scandir in a latency shim and
+compares the previous detection (one os.path.exists call per candidate file)
+against the single scandir pass used by analyze_project_directory.
+
+Usage:
+    python benchmarks/analysis_benchmark.py [--latency-ms MS] [--number N]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from unittest.mock import patch
+
+from registry_mcp.project_files import ProjectFiles
+
+COMMON_FILES = [
+    "pyproject.toml",
+    "package.json",
+    "Cargo.toml",
+    "go.mod",
+    "requirements.txt",
+    "setup.py",
+    "README.md",
+    "LICENSE",
+]
+
+
+def _previous_detection(project_path: str) -> list[str]:
+    detected = [file for file in COMMON_FILES if os.path.exists(os.path.join(project_path, file))]
+    os.path.exists(os.path.join(project_path, "pyproject.toml"))
+    os.path.exists(os.path.join(project_path, "README.md"))
+    for license_file in ["LICENSE", "LICENSE.txt", "LICENSE.md"]:
+        if os.path.exists(os.path.join(project_path, license_file)):
+            break
+    return detected
+
+
+def _scandir_detection(project_path: str) -> list[str]:
+    files = ProjectFiles(project_path)
+    detected = [files.get(file) for file in COMMON_FILES[:6] if file in files]
+    return detected + [file for file in (files.readme, files.license) if file]
+
+
+class LatencyShim:
+    """Add a fixed latency to os.stat and os.scandir and count the calls."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.calls = 0
+        self._stat = os.stat
+        self._scandir = os.scandir
+
+    def stat(self, *args, **kwargs):
+        """Count the call and run os.stat after the latency."""
+        self.calls += 1
+        time.sleep(self.latency)
+        return self._stat(*args, **kwargs)
+
+    def scandir(self, *args, **kwargs):
+        """Count the call and run os.scandir after the latency."""
+        self.calls += 1
+        time.sleep(self.latency)
+        return self._scandir(*args, **kwargs)
+
+    def __enter__(self):
+        self._patches = [patch("os.stat", self.stat), patch("os.scandir", self.scandir)]
+        for p in self._patches:
+            p.start()
+        return self
+
+    def __exit__(self, *exc):
+        for p in self._patches:
+            p.stop()
+
+
+def main() -> None:
+    """Run the project analysis benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--latency-ms", type=float, default=2.0, help="Simulated latency per metadata syscall")
+    parser.add_argument("--number", type=int, default=20, help="Calls per measurement")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as project:
+        # A typical Python project: some of the candidates exist, most do not
+        for name in ("pyproject.toml", "README.rst", "COPYING", "uv.lock", "Makefile"):
+            with open(os.path.join(project, name), "w") as f:
+                f.write("content")
+        os.mkdir(os.path.join(project, "src"))
+
+        for label, detect in (
+            ("os.path.exists per file (before)", _previous_detection),
+            ("single scandir pass (after)", _scandir_detection),
+        ):
+            with LatencyShim(args.latency_ms / 1000) as shim:
+                start = time.perf_counter()
+                for _ in range(args.number):
+                    detected = detect(project)
+                elapsed = time.perf_counter() - start
+            print(
+                f"{label:<35} {elapsed / args.number * 1e3:8.2f} ms/call  "
+                f"{shim.calls / args.number:5.1f} syscalls/call  detected={detected}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Benchmark reading the git remote and branch of a project.
+
+Compares asking a git subprocess (git config --get remote.origin.url and
+git rev-parse) against parsing .git/config, HEAD and packed-refs in-process,
+both uncached and with the per-repository cache used by the project analyzer.
+
+Usage:
+    python benchmarks/git_metadata_benchmark.py [--number N]
+"""
+
+import argparse
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+
+from registry_mcp.git_metadata import clear_git_cache, read_git_repository
+
+
+def _subprocess_metadata(path: str) -> tuple[str, str]:
+    url = subprocess.run(
+        ["git", "config", "--get", "remote.origin.url"], cwd=path, capture_output=True, text=True, check=True
+    ).stdout.strip()
+    branch = subprocess.run(
+        ["git", "rev-parse", "--abbrev-ref", "HEAD"], cwd=path, capture_output=True, text=True, check=True
+    ).stdout.strip()
+    return url, branch
+
+
+def _parsed_metadata(path: str) -> tuple[str, str]:
+    clear_git_cache()
+    repository = read_git_repository(path)
+    return repository.remote_url(), repository.branch
+
+
+def _cached_metadata(path: str) -> tuple[str, str]:
+    repository = read_git_repository(path)
+    return repository.remote_url(), repository.branch
+
+
+def main() -> None:
+    """Run the git metadata benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--number", type=int, default=200, help="Calls per measurement")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as project:
+        git_dir = os.path.join(project, ".git")
+        os.makedirs(os.path.join(git_dir, "refs", "heads"))
+        with open(os.path.join(git_dir, "config"), "w") as f:
+            f.write(
+                '[core]\n\trepositoryformatversion = 0\n[remote "origin"]\n'
+                "\turl = git@github.com:owner/repo.git\n\tfetch = +refs/heads/*:refs/remotes/origin/*\n"
+            )
+        with open(os.path.join(git_dir, "HEAD"), "w") as f:
+            f.write("ref: refs/heads/main\n")
+        with open(os.path.join(git_dir, "packed-refs"), "w") as f:
+            f.write("0123456789abcdef0123456789abcdef01234567 refs/heads/main\n")
+        os.makedirs(os.path.join(git_dir, "objects"))
+
+        methods = [("parse .git files", _parsed_metadata), ("parse .git files, cached", _cached_metadata)]
+        if shutil.which("git"):
+            methods.insert(0, ("git subprocess (before)", _subprocess_metadata))
+        else:
+            print("git not found, skipping the subprocess measurement")
+
+        for label, read in methods:
+            start = time.perf_counter()
+            for _ in range(args.number):
+                result = read(project)
+            elapsed = time.perf_counter() - start
+            print(f"{label:<30} {elapsed / args.number * 1e6:10.1f} us/call  {result}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+Benchmark registry submissions against a local stand-in registry server.
+
+Compares the previous client, one requests.post per submission without a
+session (a new TCP connection every time), against the shared async httpx
+client that keeps connections alive, both sequentially and with concurrent
+submissions. The stand-in server speaks HTTP/1.1 with keep-alive, answers
+every POST with 201 after an optional delay and counts the TCP connections it
+accepts. It runs in a separate process, so the client does not compete with
+it for the GIL. Against the real registry each new connection also pays DNS and a TLS
+handshake, so the savings there are larger than measured here.
+
+Usage:
+    python benchmarks/http_client_benchmark.py [--number N] [--concurrency C] [--latency MS]
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from registry_mcp.http_client import close_http_client, post_json
+
+DOCUMENT = {
+    "@context": "https://schema.org",
+    "@type": "SoftwareApplication",
+    "identifier": "test/bench-mcp",
+    "name": "Benchmark MCP",
+    "description": "A valid MCP server used for submission benchmarks",
+    "codeRepository": "https://github.com/test/bench-mcp",
+}
+
+
+class _RegistryHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately; avoid Nagle/delayed-ACK stalls on kept-alive connections
+    disable_nagle_algorithm = True
+    latency = 0.0
+    connections = None
+
+    def setup(self):
+        super().setup()
+        with self.connections.get_lock():
+            self.connections.value += 1
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if self.latency:
+            time.sleep(self.latency)
+        body = json.dumps({"id": "benchmark"}).encode()
+        self.send_response(201)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _serve(port, connections, latency: float) -> None:
+    _RegistryHandler.connections = connections
+    _RegistryHandler.latency = latency
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _RegistryHandler)
+    server.daemon_threads = True
+    server.request_queue_size = 128
+    port.value = server.server_port
+    server.serve_forever()
+
+
+def _requests_sequential(url: str, number: int) -> None:
+    for _ in range(number):
+        requests.post(url, json=DOCUMENT, headers={"Accept": "application/json"}, timeout=30).json()
+
+
+async def _httpx_sequential(url: str, number: int) -> None:
+    for _ in range(number):
+        (await post_json(url, DOCUMENT)).json()
+    await close_http_client()
+
+
+async def _httpx_concurrent(url: str, number: int, concurrency: int) -> None:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def submit():
+        async with semaphore:
+            (await post_json(url, DOCUMENT)).json()
+
+    await asyncio.gather(*(submit() for _ in range(number)))
+    await close_http_client()
+
+
+def main() -> None:
+    """Run the HTTP client benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--number", type=int, default=500, help="Submissions per measurement")
+    parser.add_argument("--concurrency", type=int, default=16, help="Concurrent submissions of the concurrent run")
+    parser.add_argument("--latency", type=float, default=0.0, help="Server latency per request in milliseconds")
+    args = parser.parse_args()
+
+    port = multiprocessing.Value("i", 0)
+    connections = multiprocessing.Value("i", 0)
+    server = multiprocessing.Process(target=_serve, args=(port, connections, args.latency / 1000), daemon=True)
+    server.start()
+    while not port.value:
+        time.sleep(0.01)
+    url = f"http://127.0.0.1:{port.value}/registry/submit"
+
+    runs = [
+        ("requests.post (before)", lambda: _requests_sequential(url, args.number)),
+        ("httpx shared client", lambda: asyncio.run(_httpx_sequential(url, args.number))),
+        (
+            f"httpx shared client x{args.concurrency}",
+            lambda: asyncio.run(_httpx_concurrent(url, args.number, args.concurrency)),
+        ),
+    ]
+    try:
+        for label, run in runs:
+            connections.value = 0
+            start = time.perf_counter()
+            run()
+            elapsed = time.perf_counter() - start
+            print(
+                f"{label:<28} {elapsed / args.number * 1e3:8.3f} ms/submission  "
+                f"{args.number / elapsed:8.0f} submissions/s  {connections.value:5d} connections"
+            )
+    finally:
+        server.terminate()
+
+
+if __name__ == "__main__":
+    main()
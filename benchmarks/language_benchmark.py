@@ -0,0 +1,65 @@
+"""
+Benchmark source language detection on a large project tree.
+
+Compares an exhaustive os.walk extension histogram against the bounded,
+sampled scandir walk used by analyze_project_directory, on a given tree or a
+generated monorepo.
+
+Usage:
+    python benchmarks/language_benchmark.py [PATH] [--packages N] [--files N]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from registry_mcp.languages import LANGUAGE_EXTENSIONS, detect_languages
+
+
+def _exhaustive(path: str) -> list[tuple[str, float]]:
+    totals: dict[str, int] = {}
+    for root, _, files in os.walk(path):
+        for name in files:
+            language = LANGUAGE_EXTENSIONS.get(os.path.splitext(name)[1].lower())
+            if language:
+                totals[language] = totals.get(language, 0) + os.stat(os.path.join(root, name)).st_size
+    total = sum(totals.values()) or 1
+    return sorted(((language, round(size / total, 3)) for language, size in totals.items()), key=lambda x: -x[1])
+
+
+def _sampled(path: str) -> list[tuple[str, float]]:
+    return [(entry["language"], entry["share"]) for entry in detect_languages(path).languages]
+
+
+def _generate(root: str, packages: int, files: int) -> None:
+    for i in range(packages):
+        for language, extension, size in (("ts", ".ts", 3000), ("py", ".py", 1000)):
+            directory = os.path.join(root, "packages", f"pkg{i}", "src", language)
+            os.makedirs(directory, exist_ok=True)
+            for j in range(files):
+                with open(os.path.join(directory, f"module{j}{extension}"), "w") as f:
+                    f.write("x" * size)
+
+
+def main() -> None:
+    """Run the language detection benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("path", nargs="?", help="Project tree (defaults to a generated monorepo)")
+    parser.add_argument("--packages", type=int, default=200, help="Packages in the generated monorepo")
+    parser.add_argument("--files", type=int, default=50, help="Files per language and package")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = args.path
+        if path is None:
+            path = temp_dir
+            _generate(path, args.packages, args.files)
+        for label, detect in (("exhaustive os.walk", _exhaustive), ("bounded sampled scandir", _sampled)):
+            start = time.perf_counter()
+            result = detect(path)
+            print(f"{label:<25} {(time.perf_counter() - start) * 1e3:9.1f} ms  {result[:3]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+Benchmark offline SPDX license identification.
+
+Reports the time to load the bundled license index and the time to identify
+each given license file (defaults to the repository's own LICENSE).
+
+Usage:
+    python benchmarks/license_benchmark.py [FILE ...] [--number N]
+"""
+
+import argparse
+import os
+import time
+
+from registry_mcp.spdx import LicenseIndex
+
+DEFAULT_FILES = [os.path.join(os.path.dirname(__file__), "..", "LICENSE")]
+
+
+def main() -> None:
+    """Run the license identification benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("files", nargs="*", default=DEFAULT_FILES, help="License files to identify")
+    parser.add_argument("--number", type=int, default=100, help="Identifications per file")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    index = LicenseIndex.load()
+    print(f"index load: {(time.perf_counter() - start) * 1e3:.1f} ms ({len(index.licenses)} license texts)")
+
+    for path in args.files:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            text = f.read()
+        start = time.perf_counter()
+        for _ in range(args.number):
+            match = index.identify(text)
+        elapsed = (time.perf_counter() - start) / args.number
+        result = f"{match.spdx_id} ({match.confidence})" if match else "no match"
+        print(f"{os.path.basename(path):<20} {len(text):>7} bytes  {elapsed * 1e3:6.2f} ms  {result}")
+
+
+if __name__ == "__main__":
+    main()
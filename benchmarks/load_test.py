@@ -0,0 +1,177 @@
+"""
+Load-test the submit and confirm tools against the stand-in registry API.
+
+Starts a RegistryStub (see registry_mcp.registry_stub) in a separate process,
+so it does not compete with the server for the GIL, and drives the MCP server
+through N concurrent in-memory fastmcp.Client sessions. Every session prepares
+and confirms unique submissions in a loop: submit_to_registry_tool writes the
+meta.yaml, confirm_and_submit_to_registry_tool submits it. The p50/p95/p99
+latency of each tool call and of the whole round, the throughput and the
+outcome of every submission (submitted, queued for a retry, failed) are
+reported together with the retry and circuit breaker counters of the HTTP
+client and the request counters of the stub.
+
+The submission ledger and outbox are kept in a temporary directory, and the
+stub's failure modes (latency, error rate, 429s, status codes) are set with the
+same options as python -m registry_mcp.registry_stub.
+
+Usage:
+    python benchmarks/load_test.py [--sessions N] [--submissions M] [--latency MS] [--error-rate R] [--throttle-rate R]
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import statistics
+import tempfile
+import time
+import urllib.request
+from collections import Counter
+
+from fastmcp import Client
+
+import registry_mcp
+from registry_mcp.http_client import close_http_client, get_http_stats
+from registry_mcp.ledger import SubmissionLedger, set_submission_ledger
+from registry_mcp.outbox import SubmissionOutbox, set_submission_outbox
+from registry_mcp.registry_stub import RegistryStub, add_stub_arguments, stub_options
+from registry_mcp.tools.registry_submission import stop_submission_worker
+
+YAML_TEMPLATE = """
+"@context": https://schema.org
+"@type": SoftwareApplication
+"@id": https://github.com/load-test/mcp-{session}-{index}
+identifier: load-test/mcp-{session}-{index}
+name: Load Test MCP {session}-{index}
+description: A valid MCP server used for load tests
+codeRepository: https://github.com/load-test/mcp-{session}-{index}
+maintainer:
+  - "@type": Person
+    name: Load Tester
+license: https://spdx.org/licenses/MIT.html
+applicationCategory: HealthApplication
+keywords:
+  - test
+programmingLanguage:
+  - Python
+"""
+
+
+def _serve(url, options) -> None:
+    stub = RegistryStub(**options)
+    url.value = stub.url.encode()
+    stub.serve_forever()
+
+
+async def _session(
+    session: int, submissions: int, endpoint: str, directory: str, latencies: dict[str, list[float]], outcomes: Counter
+) -> None:
+    async with Client(registry_mcp.mcp) as client:
+        for index in range(submissions):
+            project_path = os.path.join(directory, f"{session}-{index}")
+            os.makedirs(project_path)
+            start = time.perf_counter()
+            prepared = await client.call_tool(
+                "submit_to_registry_tool",
+                {
+                    "yaml_content": YAML_TEMPLATE.format(session=session, index=index),
+                    "api_endpoint": endpoint,
+                    "project_path": project_path,
+                },
+            )
+            confirm_start = time.perf_counter()
+            result = await client.call_tool(
+                "confirm_and_submit_to_registry_tool",
+                {
+                    "yaml_file_path": prepared.data["yaml_file"],
+                    "api_endpoint": endpoint,
+                },
+            )
+            end = time.perf_counter()
+            latencies["prepare"].append(confirm_start - start)
+            latencies["confirm"].append(end - confirm_start)
+            latencies["round"].append(end - start)
+            data = result.data
+            outcomes["submitted" if data["success"] else "queued" if data.get("queued") else "failed"] += 1
+
+
+async def _load_test(sessions: int, submissions: int, endpoint: str) -> tuple[dict[str, list[float]], Counter, float]:
+    latencies: dict[str, list[float]] = {"prepare": [], "confirm": [], "round": []}
+    outcomes: Counter = Counter()
+    with tempfile.TemporaryDirectory() as directory:
+        set_submission_ledger(SubmissionLedger(os.path.join(directory, "submissions.db")))
+        set_submission_outbox(SubmissionOutbox(os.path.join(directory, "outbox.jsonl")))
+        start = time.perf_counter()
+        try:
+            await asyncio.gather(
+                *(
+                    _session(session, submissions, endpoint, directory, latencies, outcomes)
+                    for session in range(sessions)
+                )
+            )
+            elapsed = time.perf_counter() - start
+        finally:
+            await stop_submission_worker()
+            await close_http_client()
+            set_submission_outbox(None)
+            set_submission_ledger(None)
+    return latencies, outcomes, elapsed
+
+
+def _percentiles(values: list[float]) -> tuple[float, float, float]:
+    if len(values) < 2:
+        return (values[0],) * 3 if values else (0.0,) * 3
+    quantiles = statistics.quantiles(values, n=100, method="inclusive")
+    return quantiles[49], quantiles[94], quantiles[98]
+
+
+def main() -> None:
+    """Run the load test."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sessions", type=int, default=8, help="Concurrent MCP client sessions")
+    parser.add_argument("--submissions", type=int, default=25, help="Submissions per session")
+    parser.add_argument("--endpoint", default=None, help="Registry endpoint to use instead of the stub")
+    add_stub_arguments(parser)
+    args = parser.parse_args()
+
+    server = None
+    endpoint = args.endpoint
+    if endpoint is None:
+        url = multiprocessing.Array("c", 256)
+        server = multiprocessing.Process(target=_serve, args=(url, stub_options(args)), daemon=True)
+        server.start()
+        while not url.value:
+            time.sleep(0.01)
+        endpoint = url.value.decode()
+
+    try:
+        latencies, outcomes, elapsed = asyncio.run(_load_test(args.sessions, args.submissions, endpoint))
+        total = args.sessions * args.submissions
+        print(f"{total} submissions in {args.sessions} sessions: {elapsed:.2f} s, {total / elapsed:.1f} submissions/s")
+        print(f"{'call':<10} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+        for name, values in latencies.items():
+            p50, p95, p99 = _percentiles(values)
+            print(f"{name:<10} {p50 * 1e3:9.2f} {p95 * 1e3:9.2f} {p99 * 1e3:9.2f}")
+        print("outcomes:", dict(outcomes))
+        http_stats = get_http_stats()
+        print(
+            "http client:",
+            {
+                key: http_stats[key]
+                for key in ("attempts", "retries", "retries_exhausted", "circuit_rejections", "failures")
+            },
+            "retries by reason:",
+            http_stats["retries_by_reason"],
+        )
+        if server is not None:
+            with urllib.request.urlopen(endpoint.rsplit("/registry/", 1)[0] + "/stats") as response:
+                print("stub:", json.load(response))
+    finally:
+        if server is not None:
+            server.terminate()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Benchmark building and searching the registry index.
+
+Writes a synthetic registry checkout of meta.yaml files to a temporary
+directory and measures building the in-memory index, opening the SQLite-backed
+index cold (empty database) and warm (a restart), and the latency of typical
+searches (filters, free text, both, and paging through everything) on both.
+
+Usage:
+    python benchmarks/registry_index_benchmark.py [--entries N] [--queries Q]
+"""
+
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+
+from registry_mcp.registry_index import RegistryIndex
+from registry_mcp.registry_store import RegistryIndexStore
+from registry_mcp.yaml_backend import dump_yaml
+
+TOPICS = [
+    "genomics",
+    "proteomics",
+    "literature",
+    "clinical",
+    "imaging",
+    "variants",
+    "pathways",
+    "ontology",
+    "search",
+    "model",
+]
+# Vocabulary of the descriptions: the topics plus filler words of decreasing frequency
+WORDS = TOPICS + [f"word{i}" for i in range(500)]
+CATEGORIES = ["HealthApplication", "DeveloperApplication", "ResearchApplication", "EducationalApplication"]
+LANGUAGES = ["Python", "TypeScript", "Rust", "Go", "R"]
+
+
+def _document(index: int, rng: random.Random) -> dict:
+    name = f"bench-mcp-{index}"
+    return {
+        "@context": "https://schema.org",
+        "@type": "SoftwareApplication",
+        "identifier": f"org{index % 50}/{name}",
+        "name": f"{rng.choice(TOPICS).title()} MCP {index}",
+        "description": " ".join(rng.choice(WORDS[: int(rng.paretovariate(1.2)) * 10]) for _ in range(30)),
+        "codeRepository": f"https://github.com/org{index % 50}/{name}",
+        "maintainer": [{"@type": "Person", "name": f"Maintainer {rng.randrange(200)}"}],
+        "license": "https://spdx.org/licenses/MIT.html",
+        "applicationCategory": rng.choice(CATEGORIES),
+        "keywords": rng.sample(TOPICS, 3),
+        "programmingLanguage": [rng.choice(LANGUAGES)],
+        "featureList": [f"{rng.choice(TOPICS).title()} feature {i}" for i in range(3)],
+    }
+
+
+def _latencies(index: RegistryIndex, queries: list[dict]) -> list[float]:
+    latencies = []
+    for query in queries:
+        start = time.perf_counter()
+        index.search(**query)
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def main() -> None:
+    """Run the registry index benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--entries", type=int, default=2000, help="Number of synthetic registry entries")
+    parser.add_argument("--queries", type=int, default=1000, help="Number of searches per query kind")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    with tempfile.TemporaryDirectory() as registry:
+        for i in range(args.entries):
+            directory = os.path.join(registry, "servers", f"bench-mcp-{i}")
+            os.makedirs(directory)
+            with open(os.path.join(directory, "meta.yaml"), "w", encoding="utf-8") as f:
+                f.write(dump_yaml(_document(i, rng)))
+
+        built = RegistryIndex.build(registry)
+        stats = built.stats()
+        print(
+            f"build:      {stats['entries']} entries, {stats['tokens']} tokens in {built.build_seconds * 1e3:.1f} ms "
+            f"({stats['yaml_backend']})"
+        )
+
+        database = os.path.join(registry, "index.db")
+        cold = RegistryIndex.open(registry, store=RegistryIndexStore(database))
+        print(f"open cold:  {cold.build_seconds * 1e3:.1f} ms")
+        cold.store.close()
+        opened = RegistryIndex.open(registry, store=RegistryIndexStore(database))
+        print(
+            f"open warm:  {opened.build_seconds * 1e3:.1f} ms (sync {opened.store.last_sync['seconds'] * 1e3:.1f} ms, "
+            f"{opened.store.last_sync['unchanged']} files unchanged)"
+        )
+
+        kinds = {
+            "filter": lambda: {"category": rng.choice(CATEGORIES), "language": rng.choice(LANGUAGES)},
+            "text": lambda: {"query": " ".join(rng.sample(TOPICS, 2))},
+            "rare text": lambda: {"query": rng.choice(WORDS[100:])},
+            "text+filter": lambda: {"query": rng.choice(WORDS[:50]), "keyword": rng.choice(TOPICS)},
+            "all, page 5": lambda: {"offset": 80, "limit": 20},
+        }
+        for name, index in (("memory", built), ("sqlite", opened)):
+            for kind, make_query in kinds.items():
+                latencies = sorted(_latencies(index, [make_query() for _ in range(args.queries)]))
+                p50 = statistics.median(latencies) * 1e3
+                p99 = latencies[int(len(latencies) * 0.99) - 1] * 1e3
+                print(f"{name:<7}{kind:<12} p50 {p50:7.3f} ms   p99 {p99:7.3f} ms")
+        opened.store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""
+Benchmark CPU time and peak memory of one prepare + confirm submission round.
+
+Compares the previous pipeline, which converted between YAML strings and
+dictionaries at every step (parse to validate, parse again, dump to file, load,
+dump to file, dump to string, parse and validate again), against the
+SubmissionDocument pipeline that parses once per step. The registry API call is
+replaced by an in-process response so only local work is measured, and the
+validation cache is cleared before each round.
+
+Usage:
+    python benchmarks/submission_benchmark.py [--number N]
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+import tracemalloc
+from unittest.mock import patch
+
+import requests
+
+from registry_mcp.tools import registry_submission
+from registry_mcp.tools.registry_submission import (
+    SubmissionDocument,
+    clear_validation_cache,
+    validate_yaml_specification,
+)
+from registry_mcp.yaml_backend import dump_yaml, load_yaml
+
+VALID_YAML = """
+"@context": https://schema.org
+"@type": SoftwareApplication
+"@id": https://github.com/test/bench-mcp
+identifier: test/bench-mcp
+name: Benchmark MCP
+description: A valid MCP server used for submission benchmarks
+codeRepository: https://github.com/test/bench-mcp
+maintainer:
+  - "@type": Person
+    name: Test User
+    identifier: 'GitHub: testuser'
+    url: https://github.com/testuser
+license: https://spdx.org/licenses/MIT.html
+applicationCategory: HealthApplication
+keywords:
+  - test
+  - benchmark
+programmingLanguage:
+  - Python
+featureList:
+  - Benchmarking
+"""
+
+
+class _Response:
+    status_code = 201
+
+    @staticmethod
+    def json():
+        return {"id": "benchmark"}
+
+
+async def _post_json(url, data):
+    return _Response()
+
+
+# submit_to_registry is async; all rounds share one event loop
+_LOOP = asyncio.new_event_loop()
+
+
+def _legacy_round(path: str) -> None:
+    # submit_to_registry_tool
+    validate_yaml_specification(VALID_YAML)
+    yaml_data = load_yaml(VALID_YAML)
+    yaml_data["user_confirmed"] = False
+    with open(path, "w", encoding="utf-8") as f:
+        dump_yaml(yaml_data, f)
+    # confirm_and_submit_to_registry_tool
+    with open(path, encoding="utf-8") as f:
+        yaml_data = load_yaml(f)
+    yaml_data["user_confirmed"] = True
+    with open(path, "w", encoding="utf-8") as f:
+        dump_yaml(yaml_data, f)
+    yaml_content = dump_yaml(yaml_data)
+    # submit_to_registry
+    validate_yaml_specification(yaml_content)
+    requests.post("", json=load_yaml(yaml_content))
+
+
+def _document_round(path: str) -> None:
+    # submit_to_registry_tool
+    document = SubmissionDocument.from_yaml(VALID_YAML)
+    document.validate()
+    document.set_field("user_confirmed", False)
+    document.write(path)
+    # confirm_and_submit_to_registry_tool
+    document = SubmissionDocument.from_file(path)
+    document.set_field("user_confirmed", True)
+    document.write(path)
+    _LOOP.run_until_complete(registry_submission.submit_to_registry(document))
+
+
+def _measure(round_function, path: str, number: int) -> tuple[float, float]:
+    cpu = 0.0
+    for _ in range(number):
+        clear_validation_cache()
+        start = time.process_time()
+        round_function(path)
+        cpu += time.process_time() - start
+
+    clear_validation_cache()
+    tracemalloc.start()
+    round_function(path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return cpu / number, peak
+
+
+def main() -> None:
+    """Run the submission pipeline benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--number", type=int, default=300, help="Rounds per measurement")
+    args = parser.parse_args()
+
+    with (
+        tempfile.TemporaryDirectory() as temp_dir,
+        patch.object(requests, "post", return_value=_Response()),
+        patch.object(registry_submission, "post_json", _post_json),
+    ):
+        path = os.path.join(temp_dir, "meta.yaml")
+        _document_round(path)  # warm up the shared validators
+
+        results = {}
+        for label, round_function in (("previous pipeline", _legacy_round), ("SubmissionDocument", _document_round)):
+            cpu, peak = _measure(round_function, path, args.number)
+            results[label] = (cpu, peak)
+            print(f"{label:<20} {cpu * 1e6:10.1f} us CPU/round   {peak / 1024:8.1f} KiB peak traced")
+
+    (legacy_cpu, legacy_peak), (document_cpu, document_peak) = results.values()
+    print(f"CPU time: {legacy_cpu / document_cpu:.1f}x less, traced memory: {legacy_peak / document_peak:.1f}x less")
+
+
+if __name__ == "__main__":
+    main()
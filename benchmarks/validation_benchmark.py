@@ -0,0 +1,83 @@
+"""
+Benchmark per-call latency of registry YAML validation.
+
+Compares the previous approach (``jsonschema.validate`` with a freshly built
+schema on every call) against the shared, pre-compiled registry validator, and
+reports the end-to-end latency with and without the validation result cache.
+
+Usage:
+    python benchmarks/validation_benchmark.py [--number N]
+"""
+
+import argparse
+import timeit
+
+import jsonschema
+import yaml
+
+from registry_mcp.tools.registry_submission import (
+    get_compiled_registry_validator,
+    get_registry_schema,
+    get_registry_validator,
+    validate_yaml_specification,
+)
+
+VALID_YAML = """
+"@context": https://schema.org
+"@type": SoftwareApplication
+"@id": https://github.com/test/bench-mcp
+identifier: test/bench-mcp
+name: Benchmark MCP
+description: A valid MCP server used for validation benchmarks
+codeRepository: https://github.com/test/bench-mcp
+maintainer:
+  - "@type": Person
+    name: Test User
+    identifier: 'GitHub: testuser'
+    url: https://github.com/testuser
+license: https://spdx.org/licenses/MIT.html
+applicationCategory: HealthApplication
+keywords:
+  - test
+  - benchmark
+programmingLanguage:
+  - Python
+"""
+
+
+def _report(label: str, seconds: float, number: int) -> None:
+    print(f"{label:<45} {seconds / number * 1e6:10.1f} us/call")
+
+
+def main() -> None:
+    """Run the validation benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--number", type=int, default=2000, help="Calls per measurement")
+    args = parser.parse_args()
+
+    data = yaml.safe_load(VALID_YAML)
+    get_registry_validator()  # warm up the shared validators
+    get_compiled_registry_validator()
+
+    before = timeit.timeit(lambda: jsonschema.validate(data, get_registry_schema()), number=args.number)
+    after = timeit.timeit(lambda: get_registry_validator().validate(data), number=args.number)
+    compiled = timeit.timeit(lambda: get_compiled_registry_validator()(data), number=args.number)
+    end_to_end = timeit.timeit(lambda: validate_yaml_specification(VALID_YAML, use_cache=False), number=args.number)
+    end_to_end_compiled = timeit.timeit(
+        lambda: validate_yaml_specification(VALID_YAML, use_cache=False, engine="compiled"), number=args.number
+    )
+    cached = timeit.timeit(lambda: validate_yaml_specification(VALID_YAML), number=args.number)
+
+    _report("schema check: jsonschema.validate (before)", before, args.number)
+    _report("schema check: shared validator (after)", after, args.number)
+    _report("schema check: compiled engine", compiled, args.number)
+    _report("validate_yaml_specification (end to end)", end_to_end, args.number)
+    _report("validate_yaml_specification (compiled engine)", end_to_end_compiled, args.number)
+    _report("validate_yaml_specification (cached repeat)", cached, args.number)
+    print(
+        f"speedup (schema check): {before / after:.1f}x, compiled engine vs shared validator: {after / compiled:.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
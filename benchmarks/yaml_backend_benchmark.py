@@ -0,0 +1,90 @@
+"""
+Benchmark YAML parsing and writing with the libyaml and pure-Python backends.
+
+Generates a synthetic corpus of registry meta.yaml documents and measures the
+time to load and dump the whole corpus with each available backend.
+
+Usage:
+    python benchmarks/yaml_backend_benchmark.py [--documents N] [--repeat R]
+"""
+
+import argparse
+import random
+import time
+
+from registry_mcp.yaml_backend import YAML_BACKENDS, dump_yaml, load_yaml
+
+
+def _document(index: int, rng: random.Random) -> dict:
+    name = f"bench-mcp-{index}"
+    return {
+        "@context": "https://schema.org",
+        "@type": "SoftwareApplication",
+        "@id": f"https://github.com/bench/{name}",
+        "identifier": f"bench/{name}",
+        "name": f"Benchmark MCP {index}",
+        "description": " ".join(
+            rng.choice(["fast", "registry", "server", "model", "context", "protocol"]) for _ in range(40)
+        ),
+        "codeRepository": f"https://github.com/bench/{name}",
+        "url": f"https://{name}.example.com",
+        "maintainer": [
+            {
+                "@type": "Person",
+                "name": f"Maintainer {i}",
+                "identifier": f"GitHub: user{i}",
+                "url": f"https://github.com/user{i}",
+            }
+            for i in range(rng.randint(1, 3))
+        ],
+        "license": "https://spdx.org/licenses/MIT.html",
+        "applicationCategory": "HealthApplication",
+        "keywords": [f"keyword{i}" for i in range(rng.randint(1, 10))],
+        "operatingSystem": ["Linux", "macOS", "Windows"],
+        "programmingLanguage": ["Python"],
+        "featureList": [f"Feature {i}" for i in range(rng.randint(1, 8))],
+        "user_confirmed": False,
+    }
+
+
+def _measure(function, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    """Run the YAML backend benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--documents", type=int, default=1000, help="Number of synthetic documents")
+    parser.add_argument("--repeat", type=int, default=3, help="Repetitions per measurement (best is reported)")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    documents = [_document(i, rng) for i in range(args.documents)]
+    texts = [dump_yaml(document, backend="python") for document in documents]
+    size = sum(len(text) for text in texts)
+    print(f"corpus: {len(texts)} documents, {size / 1024:.0f} KiB")
+
+    timings = {}
+    for backend in sorted(YAML_BACKENDS, reverse=True):
+        load = _measure(lambda backend=backend: [load_yaml(text, backend=backend) for text in texts], args.repeat)
+        dump = _measure(
+            lambda backend=backend: [dump_yaml(document, backend=backend) for document in documents], args.repeat
+        )
+        timings[backend] = (load, dump)
+        print(f"{backend:<8} load {load * 1e3:9.1f} ms   dump {dump * 1e3:9.1f} ms")
+
+    if "libyaml" in timings:
+        python_load, python_dump = timings["python"]
+        libyaml_load, libyaml_dump = timings["libyaml"]
+        print(f"speedup with libyaml: load {python_load / libyaml_load:.1f}x, dump {python_dump / libyaml_dump:.1f}x")
+    else:
+        print("PyYAML was built without libyaml, only the pure-Python backend is available")
+
+
+if __name__ == "__main__":
+    main()
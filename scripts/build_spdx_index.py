@@ -0,0 +1,67 @@
+"""
+Build the bundled SPDX license index used for offline license identification.
+
+Reads license texts in the layout of the SPDX license-list-data repository
+(text/<id>.txt and json/licenses.json) and writes the shingle index to
+src/registry_mcp/data/spdx_index.json. Only the licenses given with --include
+are indexed for matching; every identifier in licenses.json is recorded so
+declared licenses can be recognised.
+
+Usage:
+    git clone --depth 1 https://github.com/spdx/license-list-data
+    python scripts/build_spdx_index.py license-list-data [--include ID ...]
+"""
+
+import argparse
+import json
+import os
+
+from registry_mcp.spdx import build_license_index
+
+# Licenses commonly used by open-source projects, matched against LICENSE files
+DEFAULT_LICENSES = (
+    "0BSD",
+    "Apache-2.0",
+    "BSD-2-Clause",
+    "BSD-3-Clause",
+    "BSL-1.0",
+    "CC0-1.0",
+    "GPL-2.0-or-later",
+    "GPL-3.0-or-later",
+    "ISC",
+    "LGPL-2.1-or-later",
+    "LGPL-3.0-or-later",
+    "MIT",
+    "MPL-2.0",
+    "Unlicense",
+    "Zlib",
+)
+
+OUTPUT = os.path.join(os.path.dirname(__file__), "..", "src", "registry_mcp", "data", "spdx_index.json")
+
+
+def main() -> None:
+    """Build the SPDX license index."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("license_list_data", help="Checkout of spdx/license-list-data")
+    parser.add_argument("--include", nargs="+", default=DEFAULT_LICENSES, help="SPDX ids of the licenses to index")
+    parser.add_argument("--output", default=OUTPUT, help="Path of the index to write")
+    args = parser.parse_args()
+
+    with open(os.path.join(args.license_list_data, "json", "licenses.json"), encoding="utf-8") as f:
+        licenses = {entry["licenseId"]: entry for entry in json.load(f)["licenses"]}
+
+    texts = {}
+    for spdx_id in args.include:
+        with open(os.path.join(args.license_list_data, "text", f"{spdx_id}.txt"), encoding="utf-8") as f:
+            texts[spdx_id] = (licenses.get(spdx_id, {}).get("name", spdx_id), f.read())
+
+    index = build_license_index(texts, licenses)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(index, f, separators=(",", ":"))
+        f.write("\n")
+    print(f"Indexed {len(texts)} license texts and {len(index['license_ids'])} identifiers: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Bounded thread pool for the blocking parts of the MCP tools.
+
+Tools that read or write files or call the registry API are async and run
+their blocking work on a shared pool, so a slow submission or a large project
+analysis no longer stalls the event loop (and with it every other client of
+the HTTP transport). The pool is bounded by REGISTRY_MCP_TOOL_WORKERS; calls
+beyond that limit wait for a free worker instead of starting more threads.
+"""
+
+import asyncio
+import contextvars
+import functools
+import os
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+DEFAULT_TOOL_WORKERS = int(os.environ.get("REGISTRY_MCP_TOOL_WORKERS", min(32, (os.cpu_count() or 1) + 4)))
+
+T = TypeVar("T")
+
+_EXECUTOR: ThreadPoolExecutor | None = None
+_EXECUTOR_LOCK = threading.Lock()
+
+
+def get_tool_executor() -> ThreadPoolExecutor:
+    """
+    Get the shared tool thread pool, creating it on first use.
+
+    Returns:
+        ThreadPoolExecutor with REGISTRY_MCP_TOOL_WORKERS workers
+    """
+    global _EXECUTOR
+    if _EXECUTOR is None:
+        with _EXECUTOR_LOCK:
+            if _EXECUTOR is None:
+                _EXECUTOR = ThreadPoolExecutor(
+                    max_workers=max(1, DEFAULT_TOOL_WORKERS), thread_name_prefix="registry-tool"
+                )
+    return _EXECUTOR
+
+
+def shutdown_tool_executor(wait: bool = True) -> None:
+    """
+    Shut down the shared tool thread pool.
+
+    The pool is recreated (with the current REGISTRY_MCP_TOOL_WORKERS) on next use.
+
+    Args:
+        wait: Whether to wait for running calls to finish
+    """
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        executor, _EXECUTOR = _EXECUTOR, None
+    if executor is not None:
+        executor.shutdown(wait=wait)
+
+
+async def run_blocking(func: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+    """
+    Run a blocking function on the tool thread pool.
+
+    Like asyncio.to_thread, the current context variables are propagated to
+    the worker thread, but the call runs on the bounded tool pool instead of
+    the loop's default executor.
+
+    Args:
+        func: Function to call
+        *args: Positional arguments of the call
+        **kwargs: Keyword arguments of the call
+
+    Returns:
+        Return value of the call
+    """
+    loop = asyncio.get_running_loop()
+    call = functools.partial(contextvars.copy_context().run, func, *args, **kwargs)
+    return await loop.run_in_executor(get_tool_executor(), call)
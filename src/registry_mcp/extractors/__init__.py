@@ -0,0 +1,166 @@
+"""
+Metadata extractors used by the project analyzer.
+
+Each extractor reads one project file format (pyproject.toml, package.json,
+Cargo.toml, ...) and suggests registry metadata. Extractors are registered with
+register_extractor; run_extractors runs every extractor whose input file exists
+in the project concurrently, and merge_suggestions combines their suggestions
+by precedence.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, NamedTuple
+
+from registry_mcp.extractors.base import (
+    PRIORITY_FALLBACK,
+    PRIORITY_MANIFEST,
+    PRIORITY_METADATA_FILE,
+    PRIORITY_PRIMARY,
+    PRIORITY_SECONDARY,
+    Extractor,
+    get_extractors,
+    parse_person,
+    register_extractor,
+    repository_metadata,
+    schema_languages,
+    split_list,
+)
+from registry_mcp.project_files import ProjectFiles
+
+DEFAULT_ANALYSIS_WORKERS = int(os.environ.get("REGISTRY_MCP_ANALYSIS_WORKERS", 8))
+
+# Suggested fields whose values are merged across extractors instead of taken from one
+LIST_FIELDS = ("authors", "keywords", "programming_language")
+
+
+class ExtractorResult(NamedTuple):
+    """
+    Suggestions of one extractor for one input file.
+
+    Attributes:
+        extractor: Extractor that produced the suggestions
+        filename: Name of the input file as it exists on disk
+        metadata: Suggested metadata (empty if extraction failed)
+        error: Exception raised by the extractor, if any
+    """
+
+    extractor: Extractor
+    filename: str
+    metadata: dict[str, Any]
+    error: Exception | None = None
+
+
+def applicable_extractors(files: ProjectFiles) -> list[tuple[Extractor, str]]:
+    """
+    Find the extractors whose input file exists in a project.
+
+    Args:
+        files: Index of the project directory
+
+    Returns:
+        List of (extractor, input file name) pairs ordered by precedence
+    """
+    applicable = []
+    for extractor in get_extractors():
+        filename = files.find(extractor.filenames)
+        if filename:
+            applicable.append((extractor, filename))
+    return applicable
+
+
+def _run(extractor: Extractor, files: ProjectFiles, filename: str) -> ExtractorResult:
+    try:
+        return ExtractorResult(extractor, filename, extractor.extract(files.join(filename)) or {})
+    except Exception as e:  # noqa: BLE001 - a broken manifest or extractor only drops its own suggestions
+        return ExtractorResult(extractor, filename, {}, e)
+
+
+def run_extractors(
+    files: ProjectFiles,
+    extractors: list[tuple[Extractor, str]] | None = None,
+    max_workers: int | None = None,
+) -> list[ExtractorResult]:
+    """
+    Run extractors concurrently on a thread pool.
+
+    Args:
+        files: Index of the project directory
+        extractors: (extractor, input file name) pairs to run (defaults to all applicable extractors)
+        max_workers: Size of the worker pool (defaults to REGISTRY_MCP_ANALYSIS_WORKERS)
+
+    Returns:
+        List of extractor results in the order of the given extractors
+    """
+    if extractors is None:
+        extractors = applicable_extractors(files)
+    if len(extractors) <= 1:
+        return [_run(extractor, files, filename) for extractor, filename in extractors]
+
+    workers = max(1, min(max_workers or DEFAULT_ANALYSIS_WORKERS, len(extractors)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="registry-analyze") as executor:
+        return list(executor.map(lambda job: _run(job[0], files, job[1]), extractors))
+
+
+def _is_empty(value: Any) -> bool:
+    return value is None or value == "" or value == [] or value == {}
+
+
+def merge_suggestions(results: list[ExtractorResult]) -> tuple[dict[str, Any], dict[str, list[str]]]:
+    """
+    Merge the suggestions of several extractors.
+
+    For single-valued fields the suggestion of the extractor with the highest
+    precedence (lowest priority value) wins. List fields (authors, keywords,
+    programming_language) are combined in order of precedence without duplicates.
+    Empty values never override other suggestions.
+
+    Args:
+        results: Extractor results
+
+    Returns:
+        Tuple of (merged metadata, input files each field was taken from)
+    """
+    metadata: dict[str, Any] = {}
+    sources: dict[str, list[str]] = {}
+    for result in sorted(results, key=lambda r: r.extractor.priority):
+        for key, value in result.metadata.items():
+            if _is_empty(value):
+                continue
+            if key in LIST_FIELDS:
+                merged = metadata.setdefault(key, [])
+                added = [item for item in (value if isinstance(value, list) else [value]) if item not in merged]
+                if added:
+                    merged.extend(added)
+                    sources.setdefault(key, []).append(result.filename)
+            elif key not in metadata:
+                metadata[key] = value
+                sources[key] = [result.filename]
+    return metadata, sources
+
+
+# Register the built-in extractors
+from registry_mcp.extractors import licenses, manifests, readme  # noqa: E402
+from registry_mcp.extractors.git import GIT_EXTRACTOR  # noqa: E402
+
+__all__ = [
+    "DEFAULT_ANALYSIS_WORKERS",
+    "GIT_EXTRACTOR",
+    "LIST_FIELDS",
+    "PRIORITY_FALLBACK",
+    "PRIORITY_MANIFEST",
+    "PRIORITY_METADATA_FILE",
+    "PRIORITY_PRIMARY",
+    "PRIORITY_SECONDARY",
+    "Extractor",
+    "ExtractorResult",
+    "applicable_extractors",
+    "get_extractors",
+    "merge_suggestions",
+    "parse_person",
+    "register_extractor",
+    "repository_metadata",
+    "run_extractors",
+    "schema_languages",
+    "split_list",
+]
@@ -0,0 +1,216 @@
+"""Extractor registry and helpers shared by the metadata extractors."""
+
+import re
+from collections.abc import Callable
+from typing import Any, NamedTuple
+
+# Precedence of common extractor groups, lower values win when suggestions conflict
+PRIORITY_PRIMARY = 10
+PRIORITY_METADATA_FILE = 20
+PRIORITY_MANIFEST = 40
+PRIORITY_SECONDARY = 60
+PRIORITY_FALLBACK = 90
+
+# Hosts supported by the registry schema for codeRepository
+REPOSITORY_HOSTS = ("github.com", "gitlab.com", "bitbucket.org", "codeberg.org")
+
+# URLs with a scheme (and an optional port), or scp-like user@host:path; query and fragment are dropped
+_REPOSITORY_URL = re.compile(
+    r"^(?:git\+)?(?:(?:https?|ssh|git)://(?:[^@/]+@)?(?P<host>[^/:?#]+)(?::\d+)?/"
+    r"|(?:[^@/:]+@)?(?P<scp_host>[^/:?#]+)[:/])(?P<path>[^?#]*)"
+)
+_OWNER = re.compile(r"^[A-Za-z0-9_-]+$")
+_REPO = re.compile(r"^[A-Za-z0-9_.-]+$")
+
+
+# Values of the schema's programmingLanguage enum by lower-cased common spelling
+_SCHEMA_LANGUAGES = {
+    "python": "Python",
+    "python3": "Python",
+    "python 3": "Python",
+    "typescript": "TypeScript",
+    "ts": "TypeScript",
+    "javascript": "JavaScript",
+    "js": "JavaScript",
+    "node.js": "JavaScript",
+    "nodejs": "JavaScript",
+    "r": "R",
+    "julia": "Julia",
+    "java": "Java",
+    "go": "Go",
+    "golang": "Go",
+    "rust": "Rust",
+    "c#": "C#",
+    "csharp": "C#",
+    "c++": "C++",
+    "cpp": "C++",
+}
+
+
+class Extractor(NamedTuple):
+    """
+    A metadata extractor for one project file format.
+
+    Attributes:
+        name: Short name of the extractor (e.g. "npm")
+        filenames: Candidate input file names in order of preference, matched case-insensitively
+        extract: Function taking the path of the input file and returning suggested metadata
+        priority: Precedence when suggestions of several extractors conflict (lower wins)
+    """
+
+    name: str
+    filenames: tuple[str, ...]
+    extract: Callable[[str], dict[str, Any]]
+    priority: int
+
+
+_EXTRACTORS: list[Extractor] = []
+
+
+def register_extractor(
+    name: str, filenames: tuple[str, ...] | list[str], priority: int = PRIORITY_MANIFEST
+) -> Callable:
+    """
+    Register a metadata extractor.
+
+    Args:
+        name: Short name of the extractor
+        filenames: Candidate input file names in order of preference
+        priority: Precedence when suggestions conflict (lower wins)
+
+    Returns:
+        Decorator registering the decorated extract function
+    """
+
+    def decorator(extract: Callable[[str], dict[str, Any]]) -> Callable[[str], dict[str, Any]]:
+        _EXTRACTORS[:] = [e for e in _EXTRACTORS if e.name != name]
+        _EXTRACTORS.append(Extractor(name, tuple(filenames), extract, priority))
+        _EXTRACTORS.sort(key=lambda e: e.priority)
+        return extract
+
+    return decorator
+
+
+def get_extractors() -> list[Extractor]:
+    """
+    Get the registered extractors.
+
+    Returns:
+        List of extractors ordered by precedence
+    """
+    return list(_EXTRACTORS)
+
+
+def repository_metadata(url: Any) -> dict[str, str]:
+    """
+    Derive codeRepository and identifier from a repository URL.
+
+    Supports HTTPS, SSH (git@host:owner/repo.git, also with a port) and git+ URLs on
+    GitHub, GitLab, Bitbucket and Codeberg, as well as "github:owner/repo" shorthands.
+    Projects in GitLab subgroups have no owner/repo identifier and are not supported.
+
+    Args:
+        url: Repository URL
+
+    Returns:
+        Dict with codeRepository and identifier, empty if the URL is not an owner/repository
+        URL on a supported host
+    """
+    if not isinstance(url, str):
+        return {}
+    url = url.strip()
+    shorthand = re.match(r"^(github|gitlab|bitbucket):([^/\s]+/[^/\s]+)$", url)
+    if shorthand:
+        host = {"github": "github.com", "gitlab": "gitlab.com", "bitbucket": "bitbucket.org"}[shorthand.group(1)]
+        url = f"https://{host}/{shorthand.group(2)}"
+    match = _REPOSITORY_URL.match(url)
+    if not match:
+        return {}
+    host = (match.group("host") or match.group("scp_host")).lower()
+    if host not in REPOSITORY_HOSTS:
+        return {}
+    # GitLab puts pages of a project after "/-/"; without it, more segments are subgroups
+    path = match.group("path").split("/-/")[0]
+    segments = [segment for segment in path.split("/") if segment]
+    if segments and segments[-1].endswith(".git"):
+        # A clone URL names the project exactly
+        segments[-1] = segments[-1][: -len(".git")]
+        if len(segments) != 2:
+            return {}
+    elif host == "gitlab.com":
+        if len(segments) != 2:
+            return {}
+    # Further segments on the other hosts are pages of the repository (tree/main, issues, ...)
+    if len(segments) < 2 or not _OWNER.match(segments[0]) or not _REPO.match(segments[1]):
+        return {}
+    owner, repo = segments[:2]
+    return {
+        "codeRepository": f"https://{host}/{owner}/{repo}",
+        "identifier": f"{owner}/{repo}",
+    }
+
+
+def parse_person(value: Any) -> dict[str, str] | None:
+    """
+    Normalise an author entry to a dict with name and optional email/url.
+
+    Accepts "Name <email> (url)" strings and dicts with name/email/url keys.
+
+    Args:
+        value: Author entry
+
+    Returns:
+        Dict with at least a name, or None if no name could be found
+    """
+    if isinstance(value, dict):
+        person = {key: str(value[key]).strip() for key in ("name", "email", "url") if value.get(key)}
+        return person if person.get("name") else None
+    if not isinstance(value, str):
+        return None
+    match = re.match(r"^\s*([^<(]*?)\s*(?:<([^>]*)>)?\s*(?:\(([^)]*)\))?\s*$", value)
+    if not match or not match.group(1):
+        return None
+    person = {"name": match.group(1)}
+    if match.group(2):
+        person["email"] = match.group(2).strip()
+    if match.group(3):
+        person["url"] = match.group(3).strip()
+    return person
+
+
+def split_list(value: Any) -> list[str]:
+    """
+    Split a comma- or newline-separated string into a list of stripped items.
+
+    Args:
+        value: String or list of strings
+
+    Returns:
+        List of non-empty items
+    """
+    if isinstance(value, list):
+        return [str(item).strip() for item in value if str(item).strip()]
+    if not isinstance(value, str):
+        return []
+    return [item.strip() for item in re.split(r"[,\n]", value) if item.strip()]
+
+
+def schema_languages(languages: Any) -> list[str]:
+    """
+    Map programming language names to the schema's programmingLanguage enum.
+
+    Args:
+        languages: Language name or list of names (e.g. "python3", "Node.js")
+
+    Returns:
+        List of unique enum values, unknown languages mapped to "Other"
+    """
+    if not isinstance(languages, list):
+        languages = [languages]
+    result = []
+    for language in languages:
+        if isinstance(language, str) and language.strip():
+            value = _SCHEMA_LANGUAGES.get(language.strip().lower(), "Other")
+            if value not in result:
+                result.append(value)
+    return result
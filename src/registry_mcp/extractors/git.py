@@ -0,0 +1,25 @@
+"""
+Extractor for the git remote of the project.
+
+Unlike the file-based extractors this one is not registered: the repository
+may be rooted in a parent of the project directory (e.g. a server inside a
+monorepo), so analyze_project_directory runs it on the project directory
+itself. The remote URL is read from .git/config without spawning git.
+"""
+
+from typing import Any
+
+from registry_mcp.extractors.base import PRIORITY_PRIMARY, Extractor, repository_metadata
+from registry_mcp.git_metadata import read_git_repository
+
+
+def extract_git_remote(path: str) -> dict[str, Any]:
+    """Suggest codeRepository and identifier from the remote of the repository containing path."""
+    repository = read_git_repository(path)
+    if repository is None:
+        return {}
+    return repository_metadata(repository.remote_url())
+
+
+# The remote the code is actually pushed to takes precedence over URLs in manifests
+GIT_EXTRACTOR = Extractor("git", (".git",), extract_git_remote, PRIORITY_PRIMARY - 5)
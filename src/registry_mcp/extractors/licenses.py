@@ -0,0 +1,32 @@
+"""
+Extractor for the project LICENSE file.
+
+The license text is identified offline against the bundled SPDX license
+index (see registry_mcp.spdx).
+"""
+
+from typing import Any
+
+from registry_mcp.extractors.base import PRIORITY_FALLBACK, register_extractor
+from registry_mcp.project_files import LICENSE_FILES
+from registry_mcp.spdx import identify_license
+
+# License texts are at most a few dozen KiB; larger files are third-party notices
+MAX_LICENSE_BYTES = 256 * 1024
+
+
+@register_extractor("license", LICENSE_FILES, priority=PRIORITY_FALLBACK)
+def extract_license_file(path: str) -> dict[str, Any]:
+    """Identify the SPDX license of the LICENSE/LICENCE/COPYING file."""
+    with open(path, "rb") as f:
+        text = f.read(MAX_LICENSE_BYTES).decode("utf-8", errors="replace")
+    metadata: dict[str, Any] = {"has_license_file": True}
+    match = identify_license(text)
+    if match:
+        metadata["license"] = match.url
+        metadata["license_detection"] = {
+            "spdx_id": match.spdx_id,
+            "name": match.name,
+            "confidence": match.confidence,
+        }
+    return metadata
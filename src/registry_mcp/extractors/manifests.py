@@ -0,0 +1,323 @@
+"""
+Extractors for package manifests and metadata files.
+
+Each extractor reads one file format and returns suggested metadata using the
+keys of analyze_project_directory: name, description, license, authors,
+keywords, programming_language, url, codeRepository and identifier. Declared
+licenses are normalised to SPDX license URLs.
+"""
+
+import configparser
+import json
+import re
+import tomllib
+from typing import Any
+
+from registry_mcp.extractors.base import (
+    PRIORITY_METADATA_FILE,
+    PRIORITY_PRIMARY,
+    PRIORITY_SECONDARY,
+    parse_person,
+    register_extractor,
+    repository_metadata,
+    schema_languages,
+    split_list,
+)
+from registry_mcp.spdx import spdx_license_url
+from registry_mcp.yaml_backend import load_yaml
+
+
+def _load_toml(path: str) -> dict[str, Any]:
+    with open(path, "rb") as f:
+        return tomllib.load(f)
+
+
+def _load_json(path: str) -> Any:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _first_repository(*urls: Any) -> dict[str, str]:
+    for url in urls:
+        metadata = repository_metadata(url)
+        if metadata:
+            return metadata
+    return {}
+
+
+def _people(values: Any) -> list[dict[str, str]]:
+    if not isinstance(values, list):
+        values = [values]
+    return [person for person in map(parse_person, values) if person]
+
+
+@register_extractor("pyproject", ("pyproject.toml",), priority=PRIORITY_PRIMARY)
+def extract_pyproject(path: str) -> dict[str, Any]:
+    """Extract metadata from the [project] table of pyproject.toml."""
+    project_data = _load_toml(path).get("project", {})
+    if not project_data:
+        return {}
+
+    metadata = {
+        "name": project_data.get("name", ""),
+        "description": project_data.get("description", ""),
+        # PEP 621 {file = ...} tables are covered by the license file extractor
+        "license": spdx_license_url(project_data.get("license")),
+        "authors": project_data.get("authors", []),
+        "keywords": project_data.get("keywords", []),
+        "programming_language": ["Python"],
+    }
+
+    # Extract repository URL
+    urls = {key.lower(): value for key, value in project_data.get("urls", {}).items()}
+    for key in ("repository", "source", "source code", "code", "homepage"):
+        repository = repository_metadata(urls.get(key))
+        if repository:
+            metadata.update(repository)
+            break
+    for key in ("homepage", "documentation"):
+        if urls.get(key) and urls[key] != metadata.get("codeRepository"):
+            metadata["url"] = urls[key]
+            break
+    return metadata
+
+
+@register_extractor("codemeta", ("codemeta.json",), priority=PRIORITY_METADATA_FILE)
+def extract_codemeta(path: str) -> dict[str, Any]:
+    """Extract metadata from a CodeMeta JSON-LD file."""
+    data = _load_json(path)
+    if not isinstance(data, dict):
+        return {}
+
+    authors = []
+    for author in data.get("author") or []:
+        if isinstance(author, dict):
+            name = author.get("name") or " ".join(
+                part for part in (author.get("givenName"), author.get("familyName")) if part
+            )
+            person = parse_person(
+                {"name": name, "email": author.get("email"), "url": author.get("@id") or author.get("url")}
+            )
+            if person:
+                authors.append(person)
+
+    languages = data.get("programmingLanguage") or []
+    if not isinstance(languages, list):
+        languages = [languages]
+    languages = [language.get("name") if isinstance(language, dict) else language for language in languages]
+
+    license_value = data.get("license")
+    if isinstance(license_value, list):
+        license_value = license_value[0] if license_value else None
+
+    return {
+        "name": data.get("name"),
+        "description": data.get("description"),
+        "license": spdx_license_url(license_value),
+        "authors": authors,
+        "keywords": split_list(data.get("keywords")),
+        "programming_language": schema_languages(languages),
+        "url": data.get("url"),
+        **_first_repository(data.get("codeRepository"), data.get("url")),
+    }
+
+
+@register_extractor("citation", ("CITATION.cff",), priority=PRIORITY_METADATA_FILE + 5)
+def extract_citation(path: str) -> dict[str, Any]:
+    """Extract metadata from a Citation File Format (CITATION.cff) file."""
+    with open(path, encoding="utf-8") as f:
+        data = load_yaml(f)
+    if not isinstance(data, dict):
+        return {}
+
+    authors = []
+    for author in data.get("authors") or []:
+        if isinstance(author, dict):
+            name = author.get("name") or " ".join(
+                part for part in (author.get("given-names"), author.get("family-names")) if part
+            )
+            person = parse_person({"name": name, "email": author.get("email"), "url": author.get("orcid")})
+            if person:
+                authors.append(person)
+
+    license_value = data.get("license")
+    if isinstance(license_value, list):
+        license_value = license_value[0] if license_value else None
+
+    return {
+        "name": data.get("title"),
+        "description": data.get("abstract"),
+        "license": spdx_license_url(license_value),
+        "authors": authors,
+        "keywords": split_list(data.get("keywords")),
+        "url": data.get("url"),
+        **_first_repository(data.get("repository-code"), data.get("repository"), data.get("url")),
+    }
+
+
+@register_extractor("npm", ("package.json",))
+def extract_package_json(path: str) -> dict[str, Any]:
+    """Extract metadata from an npm package.json."""
+    data = _load_json(path)
+    if not isinstance(data, dict):
+        return {}
+
+    repository = data.get("repository")
+    if isinstance(repository, dict):
+        repository = repository.get("url")
+
+    dependencies = {**(data.get("dependencies") or {}), **(data.get("devDependencies") or {})}
+    is_typescript = "typescript" in dependencies or bool(data.get("types") or data.get("typings"))
+
+    return {
+        "name": data.get("name"),
+        "description": data.get("description"),
+        "license": spdx_license_url(data.get("license")),
+        "authors": _people([data["author"]] if data.get("author") else []) + _people(data.get("contributors") or []),
+        "keywords": split_list(data.get("keywords")),
+        "programming_language": ["TypeScript" if is_typescript else "JavaScript"],
+        "url": data.get("homepage"),
+        **_first_repository(repository, data.get("homepage")),
+    }
+
+
+@register_extractor("cargo", ("Cargo.toml",))
+def extract_cargo(path: str) -> dict[str, Any]:
+    """Extract metadata from the [package] table of Cargo.toml."""
+    data = _load_toml(path)
+    package = data.get("package") or data.get("workspace", {}).get("package") or {}
+    if not package:
+        return {"programming_language": ["Rust"]}
+
+    # Workspace-inherited fields are tables like {workspace = true}
+    package = {key: value for key, value in package.items() if not isinstance(value, dict)}
+    return {
+        "name": package.get("name"),
+        "description": package.get("description"),
+        "license": spdx_license_url(package.get("license")),
+        "authors": _people(package.get("authors") or []),
+        "keywords": split_list(package.get("keywords")),
+        "programming_language": ["Rust"],
+        "url": package.get("homepage") or package.get("documentation"),
+        **_first_repository(package.get("repository"), package.get("homepage")),
+    }
+
+
+@register_extractor("go", ("go.mod",))
+def extract_go_mod(path: str) -> dict[str, Any]:
+    """Extract the module path from go.mod."""
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            match = re.match(r"^\s*module\s+\"?([^\s\"]+)\"?", line)
+            if match:
+                module = match.group(1)
+                return {
+                    "name": module.rstrip("/").split("/")[-1],
+                    "programming_language": ["Go"],
+                    **repository_metadata(f"https://{module}"),
+                }
+    return {"programming_language": ["Go"]}
+
+
+def _parse_dcf(path: str) -> dict[str, str]:
+    # Debian control format: "Field: value" with indented continuation lines
+    fields: dict[str, str] = {}
+    field = None
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line[:1] in (" ", "\t") and field:
+                fields[field] += "\n" + line.strip()
+            elif ":" in line:
+                field, value = line.split(":", 1)
+                field = field.strip()
+                fields[field] = value.strip()
+    return fields
+
+
+def _r_authors(authors_r: str) -> list[dict[str, str]]:
+    # Authors@R holds R code: c(person("Given", "Family", email = "...", role = c("aut", "cre")), ...)
+    authors = []
+    for call in re.split(r"\bperson\s*\(", authors_r)[1:]:
+        call = re.sub(r"\w+\s*=\s*c\([^)]*\)", "", call)
+        named = dict(re.findall(r"\b(given|family|email)\s*=\s*[\"']([^\"']*)[\"']", call))
+        positional = re.findall(r"[\"']([^\"']*)[\"']", re.sub(r"\b\w+\s*=\s*[\"'][^\"']*[\"']", "", call))
+        given = named.get("given") or (positional.pop(0) if positional else "")
+        family = named.get("family") or (positional.pop(0) if positional else "")
+        person = parse_person({"name": f"{given} {family}".strip(), "email": named.get("email")})
+        if person:
+            authors.append(person)
+    return authors
+
+
+@register_extractor("r", ("DESCRIPTION",))
+def extract_r_description(path: str) -> dict[str, Any]:
+    """Extract metadata from an R package DESCRIPTION file."""
+    fields = _parse_dcf(path)
+    if "Package" not in fields:
+        return {}
+
+    authors = _r_authors(fields["Authors@R"]) if "Authors@R" in fields else []
+    if not authors and fields.get("Author"):
+        authors = _people(re.split(r",\s*|\s+and\s+", re.sub(r"\[[^\]]*\]", "", fields["Author"])))
+
+    urls = split_list(fields.get("URL"))
+    description = " ".join(fields.get("Description", "").split())
+    return {
+        "name": fields.get("Package"),
+        "description": description or fields.get("Title"),
+        "license": spdx_license_url(fields.get("License")),
+        "authors": authors,
+        "programming_language": ["R"],
+        "url": next((url for url in urls if not repository_metadata(url)), None),
+        **_first_repository(*urls, fields.get("BugReports")),
+    }
+
+
+@register_extractor("julia", ("Project.toml", "JuliaProject.toml"))
+def extract_julia_project(path: str) -> dict[str, Any]:
+    """Extract metadata from a Julia Project.toml."""
+    data = _load_toml(path)
+    if not data.get("name") and not data.get("uuid"):
+        return {}
+    return {
+        "name": data.get("name"),
+        "authors": _people(data.get("authors") or []),
+        "programming_language": ["Julia"],
+    }
+
+
+@register_extractor("setup.cfg", ("setup.cfg",), priority=PRIORITY_SECONDARY)
+def extract_setup_cfg(path: str) -> dict[str, Any]:
+    """Extract metadata from the [metadata] section of setup.cfg."""
+    parser = configparser.ConfigParser(interpolation=None)
+    parser.read(path, encoding="utf-8")
+    if not parser.has_section("metadata"):
+        return {}
+    metadata = parser["metadata"]
+
+    authors = _people(split_list(metadata.get("author")))
+    if len(authors) == 1 and metadata.get("author_email"):
+        authors[0]["email"] = metadata["author_email"]
+
+    project_urls = {}
+    for line in split_list(metadata.get("project_urls")):
+        if "=" in line:
+            key, value = line.split("=", 1)
+            project_urls[key.strip().lower()] = value.strip()
+
+    return {
+        "name": metadata.get("name"),
+        "description": metadata.get("description"),
+        "license": spdx_license_url(metadata.get("license")),
+        "authors": authors,
+        "keywords": split_list(metadata.get("keywords")),
+        "programming_language": ["Python"],
+        "url": metadata.get("url") or metadata.get("home_page"),
+        **_first_repository(
+            project_urls.get("source"),
+            project_urls.get("repository"),
+            project_urls.get("source code"),
+            metadata.get("url"),
+            metadata.get("home_page"),
+        ),
+    }
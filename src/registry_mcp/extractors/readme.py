@@ -0,0 +1,144 @@
+"""
+Extractor for the project description in the README.
+
+The README is streamed line by line with a hard byte budget, so time and memory
+stay constant however large the file is. Front matter, headings, badges, HTML
+blocks, code fences and reStructuredText directives are skipped, and the first
+remaining paragraph becomes the description.
+"""
+
+import os
+import re
+from collections.abc import Iterator
+from typing import IO, Any
+
+from registry_mcp.extractors.base import PRIORITY_FALLBACK, register_extractor
+from registry_mcp.project_files import README_FILES
+
+# Maximum number of bytes read from the README, and per line
+README_BYTE_BUDGET = int(os.environ.get("REGISTRY_MCP_README_BYTE_BUDGET", 64 * 1024))
+MAX_LINE_BYTES = 4096
+
+# Number of paragraph lines joined into the description
+MAX_DESCRIPTION_LINES = 3
+
+# Section underlines/overlines of reStructuredText headings (e.g. "=====")
+_RST_ADORNMENT = re.compile(r"^([=\-~^\"'`#*+:.])\1{2,}\s*$")
+# Markdown images and linked images, inline or reference style: ![alt](src), [![alt](src)](href)
+_BADGE = re.compile(r"\[?!\[[^\]]*\](?:\([^)]*\)|\[[^\]]*\])(?:\]\([^)]*\)|\]\[[^\]]*\])?")
+# Link reference definitions: [label]: https://...
+_LINK_DEFINITION = re.compile(r"^\s{0,3}\[[^\]]+\]:\s*\S+")
+_FENCE = re.compile(r"^\s{0,3}(`{3,}|~{3,})")
+
+
+def _bounded_lines(f: IO[bytes], budget: int = README_BYTE_BUDGET, max_line: int = MAX_LINE_BYTES) -> Iterator[str]:
+    """Yield decoded lines until the byte budget is spent, truncating overlong lines."""
+    remaining = budget
+    while remaining > 0:
+        raw = f.readline(min(max_line, remaining))
+        if not raw:
+            return
+        remaining -= len(raw)
+        if not raw.endswith(b"\n"):
+            # Skip the rest of an overlong line, still counting it against the budget
+            while remaining > 0:
+                rest = f.readline(min(max_line, remaining))
+                remaining -= len(rest)
+                if not rest or rest.endswith(b"\n"):
+                    break
+        yield raw.decode("utf-8", errors="replace").rstrip("\r\n")
+
+
+def extract_description(lines: Iterator[str]) -> str | None:
+    """
+    Find the first prose paragraph of a Markdown or reStructuredText document.
+
+    Args:
+        lines: Lines of the document without line endings
+
+    Returns:
+        First lines of the first paragraph joined by spaces, or None if there is none
+    """
+    description_lines: list[str] = []
+    skip_until = None
+    in_html = False
+    in_directive = False
+    first = True
+
+    for line in lines:
+        stripped = line.strip()
+
+        if first:
+            first = False
+            if stripped in ("---", "+++"):
+                # YAML/TOML front matter
+                skip_until = stripped
+                continue
+
+        if skip_until is not None:
+            # Inside front matter, a code fence or an HTML comment
+            closed = skip_until in stripped if skip_until == "-->" else stripped.startswith(skip_until)
+            if closed:
+                skip_until = None
+            continue
+
+        fence = _FENCE.match(line)
+        if fence:
+            if description_lines:
+                break
+            skip_until = fence.group(1)
+            continue
+
+        if in_html:
+            in_html = bool(stripped)
+            continue
+
+        if in_directive:
+            if not stripped or line[:1] in (" ", "\t"):
+                continue
+            in_directive = False
+
+        if not stripped:
+            if description_lines:
+                break
+            continue
+
+        if stripped.startswith("<!--"):
+            if "-->" not in stripped:
+                skip_until = "-->"
+            continue
+        if stripped.startswith("<"):
+            if description_lines:
+                break
+            in_html = True
+            continue
+        if stripped.startswith(".. "):
+            if description_lines:
+                break
+            in_directive = True
+            continue
+        if _RST_ADORNMENT.match(line):
+            # Heading underline, the collected line was a heading
+            description_lines = []
+            continue
+        if line.startswith("#") or _LINK_DEFINITION.match(line) or not _BADGE.sub("", stripped).strip():
+            if description_lines:
+                break
+            continue
+        if not description_lines and line[:1] in (" ", "\t"):
+            # Indented code block
+            continue
+
+        description_lines.append(stripped)
+        if len(description_lines) == MAX_DESCRIPTION_LINES:
+            break
+
+    return " ".join(description_lines) or None
+
+
+@register_extractor("readme", README_FILES, priority=PRIORITY_FALLBACK)
+def extract_readme(path: str) -> dict[str, Any]:
+    """Extract the first paragraph of the README as description."""
+    with open(path, "rb") as f:
+        description = extract_description(_bounded_lines(f))
+    return {"description": description} if description else {}
@@ -0,0 +1,336 @@
+"""
+Git repository metadata read directly from the .git directory.
+
+The project analyzer only needs the remote URL and the current branch, so
+instead of spawning a git subprocess (or importing GitPython) the repository
+is located by walking up from the project directory and .git/config, HEAD and
+packed-refs are parsed in-process. Results are cached per repository and
+reused while none of the files they were read from has changed.
+"""
+
+import os
+import re
+from typing import Any, NamedTuple
+
+from registry_mcp.cache import LRUCache
+
+# Maximum number of parent directories searched for a repository
+MAX_PARENT_DIRECTORIES = 32
+
+_SECTION = re.compile(r'^\[\s*([A-Za-z0-9.-]+)(?:\s+"((?:[^"\\]|\\.)*)")?\s*\]')
+_ESCAPES = {"n": "\n", "t": "\t", "b": "\b", "\\": "\\", '"': '"'}
+_COMMIT = re.compile(r"^[0-9a-f]{40}(?:[0-9a-f]{24})?$")
+
+_REPOSITORY_CACHE = LRUCache(maxsize=int(os.environ.get("REGISTRY_MCP_GIT_CACHE_SIZE", 64)))
+
+
+class GitRepository(NamedTuple):
+    """
+    Metadata of a git repository.
+
+    Attributes:
+        root: Top-level directory of the working tree
+        git_dir: Git directory of the working tree (differs from common_dir in linked worktrees)
+        common_dir: Git directory holding config and refs
+        config: Parsed config as {section: {key: [values]}}, section and key names lower-cased
+            except for subsections (e.g. 'remote "origin"' is 'remote.origin')
+        branch: Checked-out branch name, or None if HEAD is detached
+        commit: Commit HEAD points to, or None if it cannot be resolved (e.g. no commits yet)
+    """
+
+    root: str
+    git_dir: str
+    common_dir: str
+    config: dict[str, dict[str, list[str]]]
+    branch: str | None
+    commit: str | None
+
+    def get(self, section: str, key: str) -> str | None:
+        """
+        Get the last value of a config key, like ``git config --get``.
+
+        Args:
+            section: Section name, with the subsection appended after a dot (e.g. "remote.origin")
+            key: Key name, compared case-insensitively
+
+        Returns:
+            Config value, or None if it is not set
+        """
+        values = self.config.get(_section_name(section), {}).get(key.lower())
+        return values[-1] if values else None
+
+    @property
+    def remotes(self) -> list[str]:
+        """Names of the configured remotes with a URL."""
+        return [
+            section[7:] for section, keys in self.config.items() if section.startswith("remote.") and keys.get("url")
+        ]
+
+    @property
+    def remote(self) -> str | None:
+        """
+        Name of the remote the repository is published at.
+
+        This is "origin" if it exists, else the remote the current branch tracks,
+        else the only configured remote.
+        """
+        remotes = self.remotes
+        if "origin" in remotes:
+            return "origin"
+        tracked = self.get(f"branch.{self.branch}", "remote") if self.branch else None
+        if tracked in remotes:
+            return tracked
+        return remotes[0] if len(remotes) == 1 else None
+
+    def remote_url(self, name: str | None = None) -> str | None:
+        """
+        Get the URL of a remote with url.<base>.insteadOf rewrites applied.
+
+        Args:
+            name: Remote name (defaults to the remote property)
+
+        Returns:
+            Remote URL, or None if the remote does not exist
+        """
+        name = name or self.remote
+        url = self.get(f"remote.{name}", "url") if name else None
+        if url is None:
+            return None
+        # The longest matching insteadOf prefix wins, as in git
+        best = ""
+        replacement = None
+        for section, keys in self.config.items():
+            if section.startswith("url."):
+                for prefix in keys.get("insteadof", []):
+                    if url.startswith(prefix) and len(prefix) > len(best):
+                        best, replacement = prefix, section[4:]
+        return replacement + url[len(best) :] if replacement is not None else url
+
+
+def _section_name(section: str) -> str:
+    name, dot, subsection = section.partition(".")
+    return name.lower() + dot + subsection
+
+
+def _parse_value(text: str) -> str:
+    """Parse a config value: strip comments and surrounding whitespace, unquote and unescape."""
+    value = []
+    pending_space = ""
+    quoted = False
+    i = 0
+    while i < len(text):
+        char = text[i]
+        if char == "\\" and i + 1 < len(text):
+            value.append(pending_space + _ESCAPES.get(text[i + 1], text[i + 1]))
+            pending_space = ""
+            i += 2
+            continue
+        if char == '"':
+            quoted = not quoted
+        elif not quoted and char in "#;":
+            break
+        elif not quoted and char in " \t":
+            # Whitespace is kept only between words
+            if value:
+                pending_space += char
+        else:
+            value.append(pending_space + char)
+            pending_space = ""
+        i += 1
+    return "".join(value)
+
+
+def parse_git_config(text: str) -> dict[str, dict[str, list[str]]]:
+    """
+    Parse a git config file.
+
+    Supports sections with quoted subsections (``[remote "origin"]``) and the
+    legacy ``[section.subsection]`` form, quoted values, escapes, comments,
+    line continuations and keys without a value (boolean true). Include
+    directives are not followed.
+
+    Args:
+        text: Content of the config file
+
+    Returns:
+        Dict of {section: {key: [values]}}; section and key names are lower-cased
+        and subsections appended after a dot (e.g. "remote.origin")
+    """
+    config: dict[str, dict[str, list[str]]] = {}
+    section = None
+    lines = iter(text.splitlines())
+    for line in lines:
+        stripped = line.strip()
+        if not stripped or stripped[0] in "#;":
+            continue
+        if stripped.startswith("["):
+            match = _SECTION.match(stripped)
+            if not match:
+                section = None
+                continue
+            name, subsection = match.group(1), match.group(2)
+            if subsection is not None:
+                section = name.lower() + "." + re.sub(r"\\(.)", r"\1", subsection)
+            else:
+                # Legacy [section.subsection] names are case-insensitive
+                section = name.lower()
+            config.setdefault(section, {})
+            rest = stripped[match.end() :].strip()
+            if not rest or rest[0] in "#;":
+                continue
+            # A key may follow the section header on the same line
+            stripped = rest
+        if section is None:
+            continue
+        key, equals, value = stripped.partition("=")
+        key = key.strip().lower()
+        if not re.match(r"^[a-z][a-z0-9-]*$", key):
+            continue
+        if not equals:
+            config[section].setdefault(key, []).append("true")
+            continue
+        while value.endswith("\\") and not value.endswith("\\\\"):
+            value = value[:-1] + next(lines, "")
+        config[section].setdefault(key, []).append(_parse_value(value))
+    return config
+
+
+def _read_text(path: str) -> str | None:
+    try:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def find_git_dir(path: str) -> tuple[str, str] | None:
+    """
+    Find the repository a directory belongs to, searching parent directories.
+
+    A ``.git`` file (linked worktrees and submodules) is followed to the git
+    directory it points to.
+
+    Args:
+        path: Directory inside the working tree
+
+    Returns:
+        Tuple of (working tree root, git directory), or None if the directory is not in a repository
+    """
+    directory = os.path.abspath(path)
+    for _ in range(MAX_PARENT_DIRECTORIES):
+        candidate = os.path.join(directory, ".git")
+        if os.path.isdir(candidate):
+            return directory, candidate
+        if os.path.isfile(candidate):
+            content = _read_text(candidate) or ""
+            if content.startswith("gitdir:"):
+                git_dir = os.path.join(directory, content[len("gitdir:") :].strip())
+                if os.path.isdir(git_dir):
+                    return directory, os.path.normpath(git_dir)
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            break
+        directory = parent
+    return None
+
+
+def _common_dir(git_dir: str) -> str:
+    content = _read_text(os.path.join(git_dir, "commondir"))
+    if content and content.strip():
+        return os.path.normpath(os.path.join(git_dir, content.strip()))
+    return git_dir
+
+
+def _resolve_ref(common_dir: str, git_dir: str, ref: str) -> str | None:
+    """Resolve a ref to a commit from its loose ref file or packed-refs."""
+    for directory in (git_dir, common_dir):
+        content = _read_text(os.path.join(directory, *ref.split("/")))
+        if content is not None:
+            content = content.strip()
+            if content.startswith("ref: "):
+                return _resolve_ref(common_dir, git_dir, content[5:].strip()) if content[5:].strip() != ref else None
+            return content if _COMMIT.match(content) else None
+    for line in (_read_text(os.path.join(common_dir, "packed-refs")) or "").splitlines():
+        if line.startswith(("#", "^")):
+            continue
+        commit, _, name = line.partition(" ")
+        if name.strip() == ref and _COMMIT.match(commit):
+            return commit
+    return None
+
+
+def _signature(paths: tuple[str, ...]) -> tuple[tuple[int, int] | None, ...]:
+    signature = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            signature.append((stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            signature.append(None)
+    return tuple(signature)
+
+
+def _read_repository(root: str, git_dir: str) -> tuple[GitRepository, tuple[str, ...]]:
+    common_dir = _common_dir(git_dir)
+    config = parse_git_config(_read_text(os.path.join(common_dir, "config")) or "")
+    if git_dir != common_dir:
+        # Per-worktree config (extensions.worktreeConfig)
+        for section, keys in parse_git_config(_read_text(os.path.join(git_dir, "config.worktree")) or "").items():
+            for key, values in keys.items():
+                config.setdefault(section, {}).setdefault(key, []).extend(values)
+
+    head = (_read_text(os.path.join(git_dir, "HEAD")) or "").strip()
+    paths = [os.path.join(git_dir, "HEAD"), os.path.join(common_dir, "config"), os.path.join(common_dir, "packed-refs")]
+    if head.startswith("ref: "):
+        ref = head[5:].strip()
+        branch = ref[len("refs/heads/") :] if ref.startswith("refs/heads/") else None
+        commit = _resolve_ref(common_dir, git_dir, ref)
+        paths.append(os.path.join(common_dir, *ref.split("/")))
+    else:
+        branch = None
+        commit = head if _COMMIT.match(head) else None
+    repository = GitRepository(root, git_dir, common_dir, config, branch, commit)
+    return repository, tuple(paths)
+
+
+def read_git_repository(path: str, use_cache: bool = True) -> GitRepository | None:
+    """
+    Read the metadata of the repository a directory belongs to.
+
+    Results are cached per repository and reused while the (mtime, size) of
+    HEAD, config, packed-refs and the checked-out branch ref are unchanged.
+
+    Args:
+        path: Directory inside the working tree
+        use_cache: Whether to use the repository cache
+
+    Returns:
+        GitRepository, or None if the directory is not in a repository
+    """
+    found = find_git_dir(path)
+    if found is None:
+        return None
+    root, git_dir = found
+    if use_cache:
+        cached = _REPOSITORY_CACHE.get(git_dir)
+        if cached is not None and _signature(cached[1]) == cached[2]:
+            return cached[0]
+    repository, paths = _read_repository(root, git_dir)
+    if use_cache:
+        _REPOSITORY_CACHE.set(git_dir, (repository, paths, _signature(paths)))
+    return repository
+
+
+def get_git_cache_stats() -> dict[str, Any]:
+    """
+    Get hit/miss statistics of the repository cache.
+
+    Returns:
+        Dict containing cache size, limits and hit/miss/eviction counters
+    """
+    return _REPOSITORY_CACHE.stats()
+
+
+def clear_git_cache() -> None:
+    """Clear the repository cache and reset its counters."""
+    _REPOSITORY_CACHE.clear()
@@ -0,0 +1,281 @@
+"""
+Shared async HTTP client for requests to the registry API.
+
+All submissions go through one httpx.AsyncClient, so connections to the
+registry are kept alive and reused instead of paying DNS, TCP and TLS setup on
+every request. HTTP/2 is negotiated when the optional h2 package is installed
+(``pip install registry_mcp[http2]``). Pool limits and timeouts are read from
+environment variables:
+
+- REGISTRY_MCP_HTTP_MAX_CONNECTIONS: maximum number of open connections (default 100)
+- REGISTRY_MCP_HTTP_MAX_KEEPALIVE: maximum number of idle keep-alive connections (default 20)
+- REGISTRY_MCP_HTTP_KEEPALIVE_EXPIRY: seconds an idle connection is kept (default 30)
+- REGISTRY_MCP_HTTP_CONNECT_TIMEOUT: seconds to establish a connection (default 5)
+- REGISTRY_MCP_HTTP_READ_TIMEOUT: seconds to wait for each chunk of the response (default 30)
+- REGISTRY_MCP_HTTP_TOTAL_TIMEOUT: seconds for the whole request, including waiting
+  for a pooled connection (default 60)
+- REGISTRY_MCP_HTTP2: "0" to disable HTTP/2 even if h2 is installed
+
+The client belongs to the event loop it was created on; it is closed by
+close_http_client when the server shuts down.
+
+Requests are retried and guarded by a circuit breaker per host as described
+in registry_mcp.retry; retry and breaker counters are reported by
+get_http_stats.
+"""
+
+import asyncio
+import importlib.util
+import os
+import threading
+from collections import Counter
+from typing import Any
+
+import httpx
+
+from registry_mcp.retry import RETRY_STATUS_CODES, CircuitBreaker, CircuitOpenError, RetryPolicy
+
+MAX_CONNECTIONS = int(os.environ.get("REGISTRY_MCP_HTTP_MAX_CONNECTIONS", 100))
+MAX_KEEPALIVE_CONNECTIONS = int(os.environ.get("REGISTRY_MCP_HTTP_MAX_KEEPALIVE", 20))
+KEEPALIVE_EXPIRY = float(os.environ.get("REGISTRY_MCP_HTTP_KEEPALIVE_EXPIRY", 30))
+CONNECT_TIMEOUT = float(os.environ.get("REGISTRY_MCP_HTTP_CONNECT_TIMEOUT", 5))
+READ_TIMEOUT = float(os.environ.get("REGISTRY_MCP_HTTP_READ_TIMEOUT", 30))
+TOTAL_TIMEOUT = float(os.environ.get("REGISTRY_MCP_HTTP_TOTAL_TIMEOUT", 60))
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+HTTP2_ENABLED = HTTP2_AVAILABLE and os.environ.get("REGISTRY_MCP_HTTP2", "1").lower() not in ("0", "false", "no")
+
+BREAKER_THRESHOLD = int(os.environ.get("REGISTRY_MCP_BREAKER_THRESHOLD", 5))
+BREAKER_RESET_TIMEOUT = float(os.environ.get("REGISTRY_MCP_BREAKER_RESET_TIMEOUT", 30))
+
+_CLIENT: httpx.AsyncClient | None = None
+_CLIENT_LOOP: asyncio.AbstractEventLoop | None = None
+
+_RETRY_POLICY = RetryPolicy.from_env()
+_BREAKERS: dict[str, CircuitBreaker] = {}
+_METRICS: Counter = Counter()
+_RETRY_REASONS: Counter = Counter()
+_METRICS_LOCK = threading.Lock()
+
+
+def create_http_client(**kwargs: Any) -> httpx.AsyncClient:
+    """
+    Create an AsyncClient with the configured pool limits and timeouts.
+
+    Args:
+        **kwargs: Overrides of the httpx.AsyncClient arguments (e.g. transport for tests)
+
+    Returns:
+        New httpx.AsyncClient
+    """
+    options: dict[str, Any] = {
+        "http2": HTTP2_ENABLED,
+        "limits": httpx.Limits(
+            max_connections=MAX_CONNECTIONS,
+            max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=KEEPALIVE_EXPIRY,
+        ),
+        "timeout": httpx.Timeout(READ_TIMEOUT, connect=CONNECT_TIMEOUT),
+        "headers": {"Accept": "application/json"},
+    }
+    options.update(kwargs)
+    return httpx.AsyncClient(**options)
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get the shared client, creating it on first use.
+
+    Must be called from a running event loop. A client created on another
+    (e.g. already closed) event loop is replaced, since its connections cannot
+    be used from this one.
+
+    Returns:
+        The shared httpx.AsyncClient
+    """
+    global _CLIENT, _CLIENT_LOOP
+    loop = asyncio.get_running_loop()
+    if _CLIENT is None or _CLIENT.is_closed or _CLIENT_LOOP not in (loop, None):
+        _CLIENT = create_http_client()
+    _CLIENT_LOOP = loop
+    return _CLIENT
+
+
+def set_http_client(client: httpx.AsyncClient | None) -> None:
+    """
+    Replace the shared client.
+
+    Args:
+        client: New client, or None to create one from the environment on next use
+    """
+    global _CLIENT, _CLIENT_LOOP
+    # The client is bound to the event loop of its first request
+    _CLIENT = client
+    _CLIENT_LOOP = None
+
+
+async def close_http_client() -> None:
+    """Close the shared client and its connections."""
+    global _CLIENT, _CLIENT_LOOP
+    client, _CLIENT, _CLIENT_LOOP = _CLIENT, None, None
+    if client is not None and not client.is_closed:
+        await client.aclose()
+
+
+def get_retry_policy() -> RetryPolicy:
+    """
+    Get the retry policy of requests to the registry.
+
+    Returns:
+        The RetryPolicy in use
+    """
+    return _RETRY_POLICY
+
+
+def set_retry_policy(policy: RetryPolicy | None) -> None:
+    """
+    Replace the retry policy.
+
+    Args:
+        policy: New RetryPolicy, or None to configure it from the environment
+    """
+    global _RETRY_POLICY
+    _RETRY_POLICY = policy or RetryPolicy.from_env()
+
+
+def get_circuit_breaker(host: str) -> CircuitBreaker:
+    """
+    Get the circuit breaker of a host, creating it on first use.
+
+    Args:
+        host: Host name (with port, if not the default one)
+
+    Returns:
+        CircuitBreaker configured by REGISTRY_MCP_BREAKER_THRESHOLD and REGISTRY_MCP_BREAKER_RESET_TIMEOUT
+    """
+    with _METRICS_LOCK:
+        breaker = _BREAKERS.get(host)
+        if breaker is None:
+            breaker = _BREAKERS[host] = CircuitBreaker(host, BREAKER_THRESHOLD, BREAKER_RESET_TIMEOUT)
+        return breaker
+
+
+def _count(name: str, reason: str | None = None) -> None:
+    with _METRICS_LOCK:
+        _METRICS[name] += 1
+        if reason:
+            _RETRY_REASONS[reason] += 1
+
+
+def get_http_stats() -> dict[str, Any]:
+    """
+    Get request, retry and circuit breaker metrics.
+
+    Returns:
+        Dict containing request/attempt/retry counters, retries by reason, the
+        state of every circuit breaker and the client configuration
+    """
+    with _METRICS_LOCK:
+        metrics = {
+            key: _METRICS[key]
+            for key in ("requests", "attempts", "retries", "retries_exhausted", "circuit_rejections", "failures")
+        }
+        metrics["retries_by_reason"] = dict(_RETRY_REASONS)
+        breakers = list(_BREAKERS.values())
+    metrics["circuit_breakers"] = {breaker.host: breaker.stats() for breaker in breakers}
+    metrics["config"] = {
+        "http2": HTTP2_ENABLED,
+        "max_connections": MAX_CONNECTIONS,
+        "max_keepalive_connections": MAX_KEEPALIVE_CONNECTIONS,
+        "connect_timeout": CONNECT_TIMEOUT,
+        "read_timeout": READ_TIMEOUT,
+        "total_timeout": TOTAL_TIMEOUT,
+        "max_attempts": _RETRY_POLICY.max_attempts,
+        "breaker_threshold": BREAKER_THRESHOLD,
+        "breaker_reset_timeout": BREAKER_RESET_TIMEOUT,
+    }
+    return metrics
+
+
+def reset_http_stats() -> None:
+    """Reset the metrics and forget all circuit breakers."""
+    with _METRICS_LOCK:
+        _METRICS.clear()
+        _RETRY_REASONS.clear()
+        _BREAKERS.clear()
+
+
+async def post_json(
+    url: str, data: Any, timeout: float | None = None, headers: dict[str, str] | None = None
+) -> httpx.Response:
+    """
+    POST a JSON document with the shared client, retrying transient failures.
+
+    Args:
+        url: Request URL
+        data: JSON-serialisable request body
+        timeout: Total timeout in seconds for all attempts (defaults to REGISTRY_MCP_HTTP_TOTAL_TIMEOUT)
+        headers: Additional request headers (an Idempotency-Key makes read errors retryable)
+
+    Returns:
+        The last response (not raised for error status codes)
+
+    Raises:
+        CircuitOpenError: If the circuit breaker of the host is open
+        httpx.HTTPError: If the request fails and is not retried (any more)
+        TimeoutError: If the request takes longer than the total timeout
+    """
+    client = get_http_client()
+    request = client.build_request("POST", url, json=data, headers=headers)
+    breaker = get_circuit_breaker(request.url.netloc.decode("ascii"))
+    policy = _RETRY_POLICY
+    loop = asyncio.get_running_loop()
+    timeout = timeout or TOTAL_TIMEOUT
+    deadline = loop.time() + timeout
+    _count("requests")
+
+    async with asyncio.timeout(timeout) as scope:
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                breaker.before_request()
+            except CircuitOpenError:
+                _count("circuit_rejections")
+                raise
+            _count("attempts")
+            response = error = None
+            try:
+                response = await client.send(request)
+            except httpx.TransportError as e:
+                error = e
+            except asyncio.CancelledError:
+                # Cut short by the total timeout (a failure) or cancelled by the caller (no outcome); either way
+                # the breaker must not be left waiting for the result of a half-open probe
+                if scope.expired():
+                    breaker.record_failure()
+                else:
+                    breaker.record_cancelled()
+                raise
+            except BaseException:
+                # Not about the host (an invalid URL, a body that cannot be decoded, a closed client, ...)
+                breaker.record_cancelled()
+                raise
+
+            # 429 means the registry is up, it only asks clients to slow down
+            if error is not None or response.status_code in RETRY_STATUS_CODES:
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+
+            reason = policy.retry_reason(request, response, error)
+            delay = policy.delay(attempt, response) if reason else None
+            if delay is None or loop.time() + delay >= deadline:
+                if reason:
+                    _count("retries_exhausted")
+                if error is not None:
+                    _count("failures")
+                    raise error
+                return response
+            _count("retries", reason)
+            await asyncio.sleep(delay)
@@ -0,0 +1,226 @@
+"""
+Detection of the programming languages of a project from its source files.
+
+The project is walked breadth-first with os.scandir, skipping the directories
+ProjectScan prunes (VCS metadata, dependency caches, virtualenvs, build output)
+and documentation. Source file sizes are summed per language into a histogram
+that is mapped to the schema's programmingLanguage enum and ranked by byte share.
+
+The walk is bounded: at most max_files files are measured and max_depth levels
+visited. Directories with many files and levels with many directories are
+sampled deterministically, and each sampled entry is weighted by the inverse
+of its sampling rate, so large repositories get an estimate of the same
+histogram at bounded cost.
+"""
+
+import os
+import zlib
+from collections.abc import Callable
+from typing import Any, NamedTuple
+
+from registry_mcp.project_scan import is_pruned_directory
+
+DEFAULT_MAX_FILES = int(os.environ.get("REGISTRY_MCP_LANGUAGE_MAX_FILES", 2000))
+DEFAULT_MAX_DEPTH = int(os.environ.get("REGISTRY_MCP_LANGUAGE_MAX_DEPTH", 8))
+
+# Sample sizes above which files of a directory and directories of a level are sampled
+FILES_PER_DIRECTORY = 200
+DIRECTORIES_PER_LEVEL = 64
+
+# Languages below this share of the source bytes are not reported
+MIN_SHARE = 0.05
+
+# Values of the schema's programmingLanguage enum by file extension (lower-cased)
+LANGUAGE_EXTENSIONS = {
+    ".py": "Python",
+    ".pyi": "Python",
+    ".pyx": "Python",
+    ".ts": "TypeScript",
+    ".tsx": "TypeScript",
+    ".mts": "TypeScript",
+    ".cts": "TypeScript",
+    ".js": "JavaScript",
+    ".jsx": "JavaScript",
+    ".mjs": "JavaScript",
+    ".cjs": "JavaScript",
+    ".r": "R",
+    ".jl": "Julia",
+    ".java": "Java",
+    ".go": "Go",
+    ".rs": "Rust",
+    ".cs": "C#",
+    ".cpp": "C++",
+    ".cc": "C++",
+    ".cxx": "C++",
+    ".hpp": "C++",
+    ".hh": "C++",
+    ".hxx": "C++",
+    # Programming languages without a value of their own in the enum
+    ".c": "Other",
+    ".kt": "Other",
+    ".scala": "Other",
+    ".rb": "Other",
+    ".php": "Other",
+    ".swift": "Other",
+    ".dart": "Other",
+    ".lua": "Other",
+    ".ex": "Other",
+    ".hs": "Other",
+}
+
+# Documentation sites often ship JavaScript and CSS that is not part of the project
+SKIPPED_DIRECTORIES = frozenset(("docs", "doc", "site"))
+
+# Generated or vendored sources
+_SKIPPED_SUFFIXES = (".min.js", ".bundle.js", ".d.ts", "_pb2.py", ".pb.go")
+
+
+class LanguageStats(NamedTuple):
+    """
+    Source language histogram of a project.
+
+    Attributes:
+        languages: Languages ranked by byte share ("Other" last), each a dict with language,
+            bytes, files and share
+        files_scanned: Number of source files measured
+        directories_scanned: Number of directories listed
+        sampled: Whether the histogram is an estimate from a sample of the project
+    """
+
+    languages: list[dict[str, Any]]
+    files_scanned: int
+    directories_scanned: int
+    sampled: bool
+
+    def schema_languages(self, min_share: float = MIN_SHARE) -> list[str]:
+        """
+        Get the programmingLanguage values of the project.
+
+        Args:
+            min_share: Minimum byte share of a language (the main language is always included)
+
+        Returns:
+            Enum values ranked by byte share
+        """
+        return [entry["language"] for i, entry in enumerate(self.languages) if i == 0 or entry["share"] >= min_share]
+
+
+def _sample(items: list, size: int, name: Callable[[Any], str]) -> list:
+    """Pick a deterministic sample that does not depend on the order of the names."""
+    if len(items) <= size:
+        return items
+    return sorted(items, key=lambda item: zlib.crc32(os.fsencode(name(item))))[:size]
+
+
+def _language(name: str) -> str | None:
+    lower = name.lower()
+    if lower.endswith(_SKIPPED_SUFFIXES):
+        return None
+    return LANGUAGE_EXTENSIONS.get(os.path.splitext(lower)[1])
+
+
+def detect_languages(
+    path: str,
+    max_files: int | None = None,
+    max_depth: int | None = None,
+    entries: list[os.DirEntry] | None = None,
+) -> LanguageStats:
+    """
+    Detect the programming languages of a project from the sizes of its source files.
+
+    Args:
+        path: Project directory
+        max_files: Maximum number of source files to measure (defaults to REGISTRY_MCP_LANGUAGE_MAX_FILES)
+        max_depth: Maximum directory depth to descend into (defaults to REGISTRY_MCP_LANGUAGE_MAX_DEPTH)
+        entries: Entries of the project directory, if it was already listed (see ProjectFiles.entries)
+
+    Returns:
+        LanguageStats with the languages ranked by byte share
+    """
+    max_files = max_files or DEFAULT_MAX_FILES
+    max_depth = DEFAULT_MAX_DEPTH if max_depth is None else max_depth
+    totals: dict[str, list[float]] = {}
+    files_scanned = 0
+    directories_scanned = 0
+    sampled = False
+
+    # Breadth-first, so a truncated walk still covers the top of the project
+    level = [(os.path.abspath(path), 1.0)]
+    for depth in range(max_depth + 1):
+        if not level:
+            break
+        if files_scanned >= max_files:
+            sampled = True
+            break
+        if len(level) > DIRECTORIES_PER_LEVEL:
+            rate = len(level) / DIRECTORIES_PER_LEVEL
+            level = [
+                (directory, weight * rate)
+                for directory, weight in _sample(level, DIRECTORIES_PER_LEVEL, lambda item: item[0])
+            ]
+            sampled = True
+
+        next_level = []
+        for directory, weight in level:
+            if files_scanned >= max_files:
+                sampled = True
+                break
+            if depth == 0 and entries is not None:
+                listing = entries
+            else:
+                try:
+                    with os.scandir(directory) as iterator:
+                        listing = list(iterator)
+                except OSError:
+                    continue
+            directories_scanned += 1
+            if any(entry.name == "pyvenv.cfg" for entry in listing):
+                continue
+
+            sources = []
+            for entry in listing:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if (
+                            depth < max_depth
+                            and not is_pruned_directory(entry.name)
+                            and entry.name.lower() not in SKIPPED_DIRECTORIES
+                        ):
+                            next_level.append((entry.path, weight))
+                    elif entry.is_file(follow_symlinks=False):
+                        language = _language(entry.name)
+                        if language:
+                            sources.append((entry, language))
+                except OSError:
+                    continue
+
+            limit = min(FILES_PER_DIRECTORY, max_files - files_scanned)
+            file_weight = weight
+            if len(sources) > limit:
+                file_weight = weight * len(sources) / limit
+                sources = _sample(sources, limit, lambda source: source[0].name)
+                sampled = True
+            for entry, language in sources:
+                try:
+                    size = entry.stat(follow_symlinks=False).st_size
+                except OSError:
+                    continue
+                files_scanned += 1
+                total = totals.setdefault(language, [0.0, 0.0])
+                total[0] += size * file_weight
+                total[1] += file_weight
+        level = next_level
+
+    total_bytes = sum(total[0] for total in totals.values())
+    languages = [
+        {
+            "language": language,
+            "bytes": round(size),
+            "files": round(files),
+            "share": round(size / total_bytes, 3) if total_bytes else 0.0,
+        }
+        for language, (size, files) in totals.items()
+    ]
+    # "Other" is ranked last, it only describes the project if no enum language was found
+    languages.sort(key=lambda entry: (entry["language"] != "Other", entry["bytes"], entry["files"]), reverse=True)
+    return LanguageStats(languages, files_scanned, directories_scanned, sampled)
@@ -0,0 +1,280 @@
+"""
+Local ledger of registry submissions.
+
+Every confirmed submission is recorded in a SQLite database, keyed by the
+registry endpoint and the content hash of the document (ignoring formatting,
+key order and the user_confirmed flag). The ledger is used to
+
+- skip documents that were already submitted unchanged, without a request,
+- send the same Idempotency-Key when a failed submission is retried, so the
+  registry can recognise a repeat of a request it may already have accepted,
+- answer which documents were submitted, and with which outcome, offline.
+
+The database lives at REGISTRY_MCP_LEDGER_PATH, by default
+registry-mcp/submissions.db under the XDG data directory. Unlike the caches it
+is not safe to delete while submissions are pending. It is opened in WAL mode,
+so several server processes can share it.
+"""
+
+import os
+import sqlite3
+import threading
+import uuid
+from datetime import UTC, datetime
+from typing import Any
+
+STATUS_PENDING = "pending"
+STATUS_SUBMITTED = "submitted"
+STATUS_FAILED = "failed"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS submissions (
+    endpoint TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    identifier TEXT,
+    file_path TEXT,
+    status TEXT NOT NULL,
+    idempotency_key TEXT NOT NULL,
+    submission_id TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    submitted_at TEXT,
+    PRIMARY KEY (endpoint, content_hash)
+);
+CREATE INDEX IF NOT EXISTS submissions_identifier ON submissions (identifier, updated_at);
+CREATE INDEX IF NOT EXISTS submissions_updated ON submissions (updated_at);
+"""
+
+
+def default_data_dir() -> str:
+    """
+    Get the directory for persistent state (submission ledger and outbox).
+
+    Returns:
+        registry-mcp under the XDG data directory
+    """
+    base = os.environ.get("XDG_DATA_HOME") or os.path.join(os.path.expanduser("~"), ".local", "share")
+    return os.path.join(base, "registry-mcp")
+
+
+def default_ledger_path() -> str:
+    """
+    Get the location of the submission ledger.
+
+    Returns:
+        REGISTRY_MCP_LEDGER_PATH if set, otherwise submissions.db in the data directory
+    """
+    if os.environ.get("REGISTRY_MCP_LEDGER_PATH"):
+        return os.environ["REGISTRY_MCP_LEDGER_PATH"]
+    return os.path.join(default_data_dir(), "submissions.db")
+
+
+def _now() -> str:
+    return datetime.now(UTC).isoformat(timespec="milliseconds")
+
+
+class SubmissionLedger:
+    """
+    SQLite-backed record of submissions, safe to use from several threads.
+
+    Args:
+        path: Database file, or ":memory:" for a ledger that is not persisted
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        if path != ":memory:" and os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=30)
+        self._conn.row_factory = sqlite3.Row
+        if path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def lookup(self, endpoint: str, content_hash: str) -> dict[str, Any] | None:
+        """
+        Get the record of a document at an endpoint.
+
+        Args:
+            endpoint: Registry API endpoint URL
+            content_hash: Submission hash of the document
+
+        Returns:
+            The record as a dict, or None if the document was never submitted there
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM submissions WHERE endpoint = ? AND content_hash = ?", (endpoint, content_hash)
+            ).fetchone()
+        return dict(row) if row is not None else None
+
+    def begin(
+        self, endpoint: str, content_hash: str, identifier: str | None = None, file_path: str | None = None
+    ) -> dict[str, Any]:
+        """
+        Record the start of a submission attempt.
+
+        The first attempt for a document creates its record and idempotency key;
+        later attempts reuse the key, so the registry can deduplicate them.
+
+        Args:
+            endpoint: Registry API endpoint URL
+            content_hash: Submission hash of the document
+            identifier: Identifier of the document
+            file_path: File the document was read from
+
+        Returns:
+            The updated record, with status "pending" and its idempotency_key
+        """
+        now = _now()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute(
+                    """
+                    INSERT INTO submissions
+                        (endpoint, content_hash, identifier, file_path, status, idempotency_key, attempts, created_at, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?, 1, ?, ?)
+                    ON CONFLICT (endpoint, content_hash) DO UPDATE SET
+                        identifier = excluded.identifier,
+                        file_path = COALESCE(excluded.file_path, file_path),
+                        status = excluded.status,
+                        attempts = attempts + 1,
+                        updated_at = excluded.updated_at
+                    """,
+                    (endpoint, content_hash, identifier, file_path, STATUS_PENDING, str(uuid.uuid4()), now, now),
+                )
+                row = self._conn.execute(
+                    "SELECT * FROM submissions WHERE endpoint = ? AND content_hash = ?", (endpoint, content_hash)
+                ).fetchone()
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return dict(row)
+
+    def finish(
+        self,
+        endpoint: str,
+        content_hash: str,
+        success: bool,
+        submission_id: str | None = None,
+        error: str | None = None,
+    ) -> None:
+        """
+        Record the outcome of a submission attempt started with begin.
+
+        Args:
+            endpoint: Registry API endpoint URL
+            content_hash: Submission hash of the document
+            success: Whether the registry accepted the document
+            submission_id: Id the registry assigned to the submission
+            error: Error message of a failed attempt
+        """
+        now = _now()
+        with self._lock:
+            if success:
+                self._conn.execute(
+                    """
+                    UPDATE submissions SET status = ?, submission_id = ?, last_error = NULL, updated_at = ?, submitted_at = ?
+                    WHERE endpoint = ? AND content_hash = ?
+                    """,
+                    (STATUS_SUBMITTED, submission_id, now, now, endpoint, content_hash),
+                )
+            else:
+                self._conn.execute(
+                    "UPDATE submissions SET status = ?, last_error = ?, updated_at = ? WHERE endpoint = ? AND content_hash = ?",
+                    (STATUS_FAILED, error, now, endpoint, content_hash),
+                )
+
+    def history(
+        self,
+        identifier: str | None = None,
+        status: str | None = None,
+        endpoint: str | None = None,
+        content_hash: str | None = None,
+        limit: int = 50,
+    ) -> list[dict[str, Any]]:
+        """
+        List recorded submissions, most recently updated first.
+
+        Args:
+            identifier: Only submissions of this identifier
+            status: Only submissions with this status ("pending", "submitted" or "failed")
+            endpoint: Only submissions to this endpoint
+            content_hash: Only submissions of this document content
+            limit: Maximum number of records
+
+        Returns:
+            List of records as dicts
+        """
+        filters = {"identifier": identifier, "status": status, "endpoint": endpoint, "content_hash": content_hash}
+        clauses = [f"{column} = ?" for column, value in filters.items() if value is not None]
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        params = [value for value in filters.values() if value is not None]
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT * FROM submissions {where} ORDER BY updated_at DESC, rowid DESC LIMIT ?",
+                (*params, max(0, limit)),
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Get the number of records per status.
+
+        Returns:
+            Dict containing the database path, the total and the count per status
+        """
+        with self._lock:
+            rows = self._conn.execute("SELECT status, COUNT(*) FROM submissions GROUP BY status").fetchall()
+        counts = {STATUS_PENDING: 0, STATUS_SUBMITTED: 0, STATUS_FAILED: 0, **dict(rows)}
+        return {"path": self.path, "total": sum(counts.values()), **counts}
+
+
+_LEDGER: SubmissionLedger | None = None
+_LEDGER_LOCK = threading.Lock()
+
+
+def get_submission_ledger() -> SubmissionLedger:
+    """
+    Get the shared submission ledger, opening it on first use.
+
+    Returns:
+        SubmissionLedger at REGISTRY_MCP_LEDGER_PATH
+    """
+    global _LEDGER
+    if _LEDGER is None:
+        with _LEDGER_LOCK:
+            if _LEDGER is None:
+                _LEDGER = SubmissionLedger(default_ledger_path())
+    return _LEDGER
+
+
+def set_submission_ledger(ledger: SubmissionLedger | None) -> None:
+    """
+    Replace the shared submission ledger.
+
+    Args:
+        ledger: New ledger, or None to open the one at REGISTRY_MCP_LEDGER_PATH on next use
+    """
+    global _LEDGER
+    with _LEDGER_LOCK:
+        _LEDGER = ledger
+
+
+def close_submission_ledger() -> None:
+    """Close the shared submission ledger; it is reopened on next use."""
+    global _LEDGER
+    with _LEDGER_LOCK:
+        ledger, _LEDGER = _LEDGER, None
+    if ledger is not None:
+        ledger.close()
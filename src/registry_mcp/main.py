@@ -1,10 +1,16 @@
+import asyncio
 import enum
 import logging
 import sys
 
 import click
 
+from .executor import shutdown_tool_executor
+from .http_client import close_http_client
+from .ledger import close_submission_ledger
+from .registry_index import clear_registry_indexes
 from .tools import *  # noqa: F403 import all tools to register them
+from .tools.registry_submission import start_submission_worker, stop_submission_worker
 
 
 class EnvironmentType(enum.Enum):
@@ -14,6 +20,27 @@ class EnvironmentType(enum.Enum):
     DEVELOPMENT = enum.auto()
 
 
+async def serve(transport: str = "stdio", **transport_kwargs) -> None:
+    """
+    Run the MCP server.
+
+    Submissions queued by a previous run are retried in the background while the
+    server runs. The shared HTTP client, tool thread pool, ledger and registry
+    index databases are released when it stops.
+    """
+    from registry_mcp.mcp import mcp
+
+    try:
+        start_submission_worker()
+        await mcp.run_async(transport=transport, **transport_kwargs)
+    finally:
+        await stop_submission_worker()
+        await close_http_client()
+        shutdown_tool_executor(wait=False)
+        close_submission_ledger()
+        clear_registry_indexes()
+
+
 @click.command(name="run")
 @click.option("-t", "--transport", "transport", type=str, help="MCP transport option. Defaults to 'stdio'.", default="stdio", envvar="MCP_TRANSPORT")
 @click.option("-p", "--port", "port", type=int, help="Port of MCP server. Defaults to '8000'", default=8000, envvar='MCP_PORT', required=False)
@@ -42,14 +69,12 @@ def run_app(
 
     logger = logging.getLogger(__name__)
 
-    from registry_mcp.mcp import mcp
-
     if environment == EnvironmentType.DEVELOPMENT:
         logger.info("Starting MCP server (DEVELOPMENT mode)")
         if transport == "http":
-            mcp.run(transport=transport, port=port, host=hostname)
+            asyncio.run(serve(transport, port=port, host=hostname))
         else:
-            mcp.run(transport=transport)
+            asyncio.run(serve(transport))
     else:
         raise NotImplementedError()
         # logger.info("Starting Starlette app with Uvicorn in PRODUCTION mode.")
@@ -0,0 +1,490 @@
+"""
+Durable outbox for registry submissions that could not be sent.
+
+A confirmed submission that fails for a transient reason (the registry is
+unreachable, overloaded or its circuit breaker is open) is put in the outbox
+instead of being dropped. The outbox is an append-only JSON lines file: every
+change to an item appends a full snapshot of it, and when the file is opened
+it is replayed, so queued submissions survive server restarts. Snapshots that
+were superseded, and finished items, are compacted away when the file is
+opened or has grown by REGISTRY_MCP_OUTBOX_COMPACT_LINES lines.
+
+An OutboxWorker task retries due items one at a time with exponential backoff
+(full jitter, but never sooner than the registry's Retry-After). Retrying one
+item at a time also spreads a burst of failed submissions out instead of
+replaying all of them the moment the registry is back.
+
+Every server process (e.g. one per stdio MCP client) shares the same queue
+file. Reads and writes take an exclusive advisory lock (flock) on a .lock file
+next to it and first replay what other processes appended, and a worker
+claims an item before sending it, so that it is sent by one process only. A
+claim lapses after REGISTRY_MCP_OUTBOX_CLAIM_TIMEOUT seconds, e.g. when the
+process died mid-attempt. Without fcntl (Windows) the queue must not be shared
+between processes.
+
+- REGISTRY_MCP_OUTBOX_PATH: queue file (default outbox.jsonl in the data directory)
+- REGISTRY_MCP_OUTBOX_BASE_DELAY: delay cap in seconds before the first retry (default 5)
+- REGISTRY_MCP_OUTBOX_MAX_DELAY: maximum delay cap in seconds (default 300)
+- REGISTRY_MCP_OUTBOX_MAX_ATTEMPTS: attempts after which an item is given up as failed (default 20, 0 for no limit)
+- REGISTRY_MCP_OUTBOX_CLAIM_TIMEOUT: seconds after which an unfinished attempt may be made by another process (default 600)
+"""
+
+import asyncio
+import json
+import logging
+import os
+import random
+import threading
+import time
+import uuid
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from datetime import UTC, datetime
+from typing import Any
+
+from registry_mcp.executor import run_blocking
+from registry_mcp.ledger import default_data_dir
+from registry_mcp.retry import RetryPolicy
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+STATUS_QUEUED = "queued"
+STATUS_SUBMITTED = "submitted"
+STATUS_FAILED = "failed"
+
+BASE_DELAY = float(os.environ.get("REGISTRY_MCP_OUTBOX_BASE_DELAY", 5))
+MAX_DELAY = float(os.environ.get("REGISTRY_MCP_OUTBOX_MAX_DELAY", 300))
+MAX_ATTEMPTS = int(os.environ.get("REGISTRY_MCP_OUTBOX_MAX_ATTEMPTS", 20))
+CLAIM_TIMEOUT = float(os.environ.get("REGISTRY_MCP_OUTBOX_CLAIM_TIMEOUT", 600))
+COMPACT_LINES = int(os.environ.get("REGISTRY_MCP_OUTBOX_COMPACT_LINES", 1000))
+
+
+def default_outbox_path() -> str:
+    """
+    Get the location of the submission outbox.
+
+    Returns:
+        REGISTRY_MCP_OUTBOX_PATH if set, otherwise outbox.jsonl in the data directory
+    """
+    if os.environ.get("REGISTRY_MCP_OUTBOX_PATH"):
+        return os.environ["REGISTRY_MCP_OUTBOX_PATH"]
+    return os.path.join(default_data_dir(), "outbox.jsonl")
+
+
+class SubmissionOutbox:
+    """
+    Append-only, disk-backed queue of submissions awaiting a retry, safe to use from several threads and processes.
+
+    Args:
+        path: Queue file
+        base_delay: Delay cap in seconds before the first retry, doubled for every further retry
+        max_delay: Maximum delay cap in seconds
+        max_attempts: Attempts after which an item is given up as failed, or 0 for no limit
+        claim_timeout: Seconds after which a claimed item that was not finished is due again
+        timer: Wall clock, injectable for tests (due times must survive restarts)
+        jitter: Source of jitter in [0, 1), injectable for tests
+    """
+
+    def __init__(
+        self,
+        path: str,
+        base_delay: float = BASE_DELAY,
+        max_delay: float = MAX_DELAY,
+        max_attempts: int = MAX_ATTEMPTS,
+        claim_timeout: float = CLAIM_TIMEOUT,
+        timer: Callable[[], float] = time.time,
+        jitter: Callable[[], float] = random.random,
+    ):
+        self.path = path
+        self._policy = RetryPolicy(base_delay=base_delay, max_delay=max_delay, jitter=jitter)
+        self.max_attempts = max_attempts
+        self.claim_timeout = claim_timeout
+        self._timer = timer
+        self._lock = threading.Lock()
+        self._items: dict[str, dict[str, Any]] = {}
+        self._appended = 0
+        # (inode, size, mtime) of the file as last read or written by this instance
+        self._seen: tuple[int, int, int] | None = None
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        with self._locked():
+            self._compact()
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        # The flock is released when the lock file is closed
+        with self._lock, open(f"{self.path}.lock", "a") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            self._refresh()
+            yield
+
+    def _stat(self) -> tuple[int, int, int] | None:
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+    def _refresh(self) -> None:
+        # Replay the file if another process appended to or compacted it
+        seen = self._stat()
+        if seen != self._seen:
+            self._load()
+            self._seen = seen
+
+    def _load(self) -> None:
+        self._items = {}
+        self._appended = 0
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                for line in f:
+                    self._appended += 1
+                    try:
+                        item = json.loads(line)
+                    except ValueError:
+                        # A snapshot cut short by a crash; the previous one is still valid
+                        logger.warning("Skipping damaged line in submission outbox %s", self.path)
+                        continue
+                    self._items[item["id"]] = item
+        except FileNotFoundError:
+            pass
+
+    def _compact(self) -> None:
+        self._items = {key: item for key, item in self._items.items() if item["status"] == STATUS_QUEUED}
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            for item in self._items.values():
+                f.write(json.dumps(item, separators=(",", ":")) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.path)
+        self._appended = 0
+        self._seen = self._stat()
+
+    def _append(self, item: dict[str, Any]) -> None:
+        item["updated_at"] = datetime.fromtimestamp(self._timer(), UTC).isoformat(timespec="milliseconds")
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(item, separators=(",", ":")) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        self._appended += 1
+        self._seen = self._stat()
+        if self._appended >= COMPACT_LINES:
+            self._compact()
+
+    def _due_at(self, attempt: int, retry_after: float | None) -> float:
+        return self._timer() + max(self._policy.backoff(attempt), retry_after or 0.0)
+
+    def enqueue(
+        self,
+        endpoint: str,
+        document: Any,
+        content_hash: str,
+        identifier: str | None = None,
+        file_path: str | None = None,
+        error: str | None = None,
+        retry_after: float | None = None,
+    ) -> dict[str, Any]:
+        """
+        Queue a submission for a later retry.
+
+        A document that is already queued for the endpoint is not queued twice.
+
+        Args:
+            endpoint: Registry API endpoint URL
+            document: Document data to submit
+            content_hash: Submission hash of the document
+            identifier: Identifier of the document
+            file_path: File the document was read from, marked as confirmed once submitted
+            error: Error of the failed submission
+            retry_after: Seconds the registry asked to wait before the next attempt
+
+        Returns:
+            The queued item (without the document)
+        """
+        with self._locked():
+            for item in self._items.values():
+                if (
+                    item["status"] == STATUS_QUEUED
+                    and item["endpoint"] == endpoint
+                    and item["content_hash"] == content_hash
+                ):
+                    return self._public(item)
+            item = {
+                "id": uuid.uuid4().hex,
+                "endpoint": endpoint,
+                "identifier": identifier,
+                "content_hash": content_hash,
+                "file_path": file_path,
+                "status": STATUS_QUEUED,
+                "attempts": 0,
+                "last_error": error,
+                "submission_id": None,
+                "enqueued_at": datetime.fromtimestamp(self._timer(), UTC).isoformat(timespec="milliseconds"),
+                "due_at": self._due_at(1, retry_after),
+                "document": document,
+            }
+            self._items[item["id"]] = item
+            self._append(item)
+            return self._public(item)
+
+    def due(self) -> list[dict[str, Any]]:
+        """
+        Get the queued items whose retry is due, earliest first.
+
+        Returns:
+            Copies of the items, including their documents
+        """
+        now = self._timer()
+        with self._locked():
+            items = [
+                dict(item) for item in self._items.values() if item["status"] == STATUS_QUEUED and item["due_at"] <= now
+            ]
+        return sorted(items, key=lambda item: item["due_at"])
+
+    def claim(self, item_id: str) -> dict[str, Any] | None:
+        """
+        Claim a due item for a retry, so that no other process sharing the queue sends it too.
+
+        The claim ends with record_success or record_failure, or lapses after
+        claim_timeout seconds.
+
+        Args:
+            item_id: Id of the item
+
+        Returns:
+            Copy of the item, including its document, or None if it is no longer queued
+            or not due (e.g. claimed by another process)
+        """
+        with self._locked():
+            item = self._items.get(item_id)
+            if item is None or item["status"] != STATUS_QUEUED or item["due_at"] > self._timer():
+                return None
+            item["due_at"] = self._timer() + self.claim_timeout
+            self._append(item)
+            return dict(item)
+
+    def next_due(self) -> float | None:
+        """
+        Get the time until the next retry is due.
+
+        Returns:
+            Seconds (0 if a retry is overdue), or None if nothing is queued
+        """
+        with self._locked():
+            due_times = [item["due_at"] for item in self._items.values() if item["status"] == STATUS_QUEUED]
+        return max(0.0, min(due_times) - self._timer()) if due_times else None
+
+    def record_success(self, item_id: str, submission_id: str | None = None) -> None:
+        """
+        Record that a queued item was submitted and remove it from the queue.
+
+        Args:
+            item_id: Id of the item
+            submission_id: Id the registry assigned to the submission
+        """
+        with self._locked():
+            item = self._items[item_id]
+            item.update(
+                status=STATUS_SUBMITTED,
+                attempts=item["attempts"] + 1,
+                submission_id=submission_id,
+                last_error=None,
+                document=None,
+            )
+            self._append(item)
+
+    def record_failure(
+        self, item_id: str, error: str, retry_after: float | None = None, permanent: bool = False
+    ) -> None:
+        """
+        Record a failed retry of a queued item.
+
+        The item is given up as failed once it has used up max_attempts.
+
+        Args:
+            item_id: Id of the item
+            error: Error of the attempt
+            retry_after: Seconds the registry asked to wait before the next attempt
+            permanent: Whether the registry rejected the document, so that it is not retried again
+        """
+        with self._locked():
+            item = self._items[item_id]
+            item.update(attempts=item["attempts"] + 1, last_error=error)
+            if permanent or (self.max_attempts and item["attempts"] >= self.max_attempts):
+                item.update(status=STATUS_FAILED, document=None)
+            else:
+                item["due_at"] = self._due_at(item["attempts"] + 1, retry_after)
+            self._append(item)
+
+    def _public(self, item: dict[str, Any]) -> dict[str, Any]:
+        public = {key: value for key, value in item.items() if key not in ("document", "due_at")}
+        public["next_attempt_in"] = (
+            round(max(0.0, item["due_at"] - self._timer()), 1) if item["status"] == STATUS_QUEUED else None
+        )
+        return public
+
+    def items(self, include_finished: bool = False) -> list[dict[str, Any]]:
+        """
+        List the items, in the order they were queued.
+
+        Args:
+            include_finished: Whether to include items submitted or rejected since the queue was last compacted
+
+        Returns:
+            Items without their documents, with next_attempt_in seconds for queued ones
+        """
+        with self._locked():
+            return [
+                self._public(item)
+                for item in self._items.values()
+                if include_finished or item["status"] == STATUS_QUEUED
+            ]
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Get the queue depth.
+
+        Returns:
+            Dict containing the queue file, the number of queued items and of items finished since the last compaction
+        """
+        with self._locked():
+            statuses = [item["status"] for item in self._items.values()]
+        return {
+            "path": self.path,
+            "depth": statuses.count(STATUS_QUEUED),
+            "submitted": statuses.count(STATUS_SUBMITTED),
+            "failed": statuses.count(STATUS_FAILED),
+            "next_attempt_in": round(next_due, 1) if (next_due := self.next_due()) is not None else None,
+        }
+
+
+class OutboxWorker:
+    """
+    Background task retrying the due items of an outbox.
+
+    Args:
+        outbox: Outbox to flush
+        submit: Coroutine function submitting a queued item; returns a result dict
+            like submit_to_registry (success, retryable, retry_after, submission_id, errors)
+    """
+
+    def __init__(self, outbox: SubmissionOutbox, submit: Callable[[dict[str, Any]], Awaitable[dict[str, Any]]]):
+        self.outbox = outbox
+        self._submit = submit
+        self._task: asyncio.Task | None = None
+        self._wake: asyncio.Event | None = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the task is running."""
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start the task on the running event loop, unless it is already running there."""
+        loop = asyncio.get_running_loop()
+        if self.running and self._task.get_loop() is loop:
+            return
+        self._wake = asyncio.Event()
+        self._task = loop.create_task(self._run(), name="registry-outbox")
+
+    def notify(self) -> None:
+        """Wake the task, e.g. after an item was queued."""
+        if self._wake is not None:
+            self._wake.set()
+
+    async def stop(self) -> None:
+        """Cancel the task and wait for it to end."""
+        task, self._task = self._task, None
+        if task is not None and not task.done() and task.get_loop() is asyncio.get_running_loop():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def flush(self) -> int:
+        """
+        Retry every item that is due.
+
+        Returns:
+            Number of items retried
+        """
+        retried = 0
+        for due in await run_blocking(self.outbox.due):
+            item = await run_blocking(self.outbox.claim, due["id"])
+            if item is None:
+                # Sent by another process sharing the queue meanwhile
+                continue
+            retried += 1
+            try:
+                result = await self._submit(item)
+            except Exception as e:  # noqa: BLE001 - keep the item queued whatever went wrong
+                result = {"success": False, "retryable": True, "errors": [f"Unexpected error: {e}"]}
+            if result["success"]:
+                await run_blocking(self.outbox.record_success, item["id"], result.get("submission_id"))
+                logger.info("Submitted queued %s to %s", item["identifier"], item["endpoint"])
+            else:
+                error = "; ".join(result.get("errors", [])) or result.get("message", "")
+                await run_blocking(
+                    self.outbox.record_failure,
+                    item["id"],
+                    error,
+                    result.get("retry_after"),
+                    not result.get("retryable"),
+                )
+                logger.info("Retry of queued %s failed: %s", item["identifier"], error)
+        return retried
+
+    async def _run(self) -> None:
+        while True:
+            # Cleared before flushing, so that an item queued meanwhile is not missed
+            self._wake.clear()
+            try:
+                await self.flush()
+                delay = await run_blocking(self.outbox.next_due)
+            except Exception:
+                logger.exception("Flushing the submission outbox failed")
+                delay = BASE_DELAY
+            try:
+                async with asyncio.timeout(delay):
+                    await self._wake.wait()
+            except TimeoutError:
+                pass
+
+
+_OUTBOX: SubmissionOutbox | None = None
+_OUTBOX_LOCK = threading.Lock()
+
+
+def get_submission_outbox() -> SubmissionOutbox:
+    """
+    Get the shared submission outbox, opening it on first use.
+
+    Returns:
+        SubmissionOutbox at REGISTRY_MCP_OUTBOX_PATH
+    """
+    global _OUTBOX
+    if _OUTBOX is None:
+        with _OUTBOX_LOCK:
+            if _OUTBOX is None:
+                _OUTBOX = SubmissionOutbox(default_outbox_path())
+    return _OUTBOX
+
+
+def set_submission_outbox(outbox: SubmissionOutbox | None) -> None:
+    """
+    Replace the shared submission outbox.
+
+    Args:
+        outbox: New outbox, or None to open the one at REGISTRY_MCP_OUTBOX_PATH on next use
+    """
+    global _OUTBOX
+    with _OUTBOX_LOCK:
+        _OUTBOX = outbox
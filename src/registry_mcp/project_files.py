@@ -0,0 +1,137 @@
+"""
+Index of the files in a project directory.
+
+The project analyzer looks for a couple of dozen well-known files (manifests,
+README, LICENSE variants). Instead of one stat call per candidate, the
+directory is listed once with os.scandir and all lookups are answered from a
+case-insensitive index of the file names.
+"""
+
+import os
+from collections.abc import Iterable
+
+# Candidate names in order of preference, compared case-insensitively
+README_FILES = ("README.md", "README.rst", "README.txt", "README")
+LICENSE_FILES = (
+    "LICENSE",
+    "LICENSE.txt",
+    "LICENSE.md",
+    "LICENSE.rst",
+    "LICENCE",
+    "LICENCE.txt",
+    "LICENCE.md",
+    "COPYING",
+    "COPYING.txt",
+    "COPYING.md",
+)
+
+
+class ProjectFiles:
+    """
+    Case-insensitive index of the regular files in a directory, built with a single scandir pass.
+
+    Args:
+        path: Directory to index
+
+    Attributes:
+        entries: All entries of the directory, including subdirectories
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._files: dict[str, str] = {}
+        self._entries: dict[str, os.DirEntry] = {}
+        self.entries: list[os.DirEntry] = []
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    self.entries.append(entry)
+                    try:
+                        # Keep the first spelling if names differ only in case
+                        if entry.is_file() and entry.name.lower() not in self._files:
+                            self._files[entry.name.lower()] = entry.name
+                            self._entries[entry.name.lower()] = entry
+                    except OSError:
+                        continue
+        except (FileNotFoundError, NotADirectoryError, PermissionError):
+            pass
+
+    def __contains__(self, name: str) -> bool:
+        return name.lower() in self._files
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+    @property
+    def names(self) -> list[str]:
+        """Sorted names of all indexed files."""
+        return sorted(self._files.values())
+
+    def get(self, name: str) -> str | None:
+        """
+        Get the actual name of a file.
+
+        Args:
+            name: File name, compared case-insensitively
+
+        Returns:
+            Name of the file as it exists on disk, or None if it does not exist
+        """
+        return self._files.get(name.lower())
+
+    def find(self, candidates: Iterable[str]) -> str | None:
+        """
+        Find the first existing file of a list of candidates.
+
+        Args:
+            candidates: File names in order of preference
+
+        Returns:
+            Name of the first existing file as it exists on disk, or None
+        """
+        for candidate in candidates:
+            name = self._files.get(candidate.lower())
+            if name is not None:
+                return name
+        return None
+
+    def signature(self, name: str) -> tuple[int, int] | None:
+        """
+        Get the modification time and size of a file, used to detect changes.
+
+        Args:
+            name: File name, compared case-insensitively
+
+        Returns:
+            Tuple of (mtime in nanoseconds, size in bytes), or None if the file does not exist
+        """
+        entry = self._entries.get(name.lower())
+        if entry is None:
+            return None
+        try:
+            stat = entry.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def join(self, name: str) -> str:
+        """
+        Get the full path of a file in the directory.
+
+        Args:
+            name: File name as returned by get() or find()
+
+        Returns:
+            Path of the file
+        """
+        return os.path.join(self.path, name)
+
+    @property
+    def readme(self) -> str | None:
+        """Name of the README file, if any."""
+        return self.find(README_FILES)
+
+    @property
+    def license(self) -> str | None:
+        """Name of the LICENSE/LICENCE/COPYING file, if any."""
+        return self.find(LICENSE_FILES)
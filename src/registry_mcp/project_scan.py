@@ -0,0 +1,131 @@
+"""
+Discovery of project roots in a directory tree.
+
+Walks a monorepo with os.scandir, pruning VCS metadata, dependency caches,
+virtualenvs and build output, and yields every directory that contains a
+package manifest as soon as it is found.
+"""
+
+import os
+from collections.abc import Iterator
+
+DEFAULT_MAX_DEPTH = int(os.environ.get("REGISTRY_MCP_SCAN_MAX_DEPTH", 6))
+DEFAULT_MAX_FILES = int(os.environ.get("REGISTRY_MCP_SCAN_MAX_FILES", 100_000))
+
+# Files that mark the root of a package (compared case-insensitively)
+MANIFEST_FILES = frozenset(
+    name.lower()
+    for name in (
+        "pyproject.toml",
+        "setup.py",
+        "setup.cfg",
+        "package.json",
+        "Cargo.toml",
+        "go.mod",
+        "DESCRIPTION",
+        "Project.toml",
+    )
+)
+
+# Directories that never contain project roots; hidden directories are skipped as well
+PRUNED_DIRECTORIES = frozenset(
+    (
+        "node_modules",
+        "bower_components",
+        "venv",
+        "env",
+        "virtualenv",
+        "site-packages",
+        "__pycache__",
+        "build",
+        "dist",
+        "target",
+        "out",
+        "_build",
+        "htmlcov",
+        "vendor",
+        "third_party",
+        "renv",
+        "packrat",
+    )
+)
+
+
+def is_pruned_directory(name: str) -> bool:
+    """
+    Check whether a directory is skipped when walking a project.
+
+    Args:
+        name: Directory name
+
+    Returns:
+        True for hidden directories, dependency caches, virtualenvs and build output
+    """
+    return name.startswith(".") or name.lower() in PRUNED_DIRECTORIES or name.endswith(".egg-info")
+
+
+class ProjectScan:
+    """
+    Iterative scandir walk that finds package roots under a directory.
+
+    Args:
+        root: Directory to scan
+        max_depth: Maximum directory depth below root to descend into
+        max_files: Maximum number of files to visit before stopping
+
+    Attributes:
+        directories: Number of directories listed so far
+        files: Number of files seen so far
+        truncated: Whether the walk stopped early because of max_files
+    """
+
+    def __init__(self, root: str, max_depth: int = DEFAULT_MAX_DEPTH, max_files: int = DEFAULT_MAX_FILES):
+        self.root = os.path.abspath(root)
+        self.max_depth = max_depth
+        self.max_files = max_files
+        self.directories = 0
+        self.files = 0
+        self.truncated = False
+
+    def roots(self) -> Iterator[str]:
+        """
+        Walk the tree and yield package roots as they are found.
+
+        Directories are visited depth-first in name order; package roots are
+        descended into as well, so nested packages of a workspace are found.
+
+        Yields:
+            Absolute paths of directories containing a package manifest
+        """
+        stack = [(self.root, 0)]
+        while stack:
+            path, depth = stack.pop()
+            try:
+                with os.scandir(path) as iterator:
+                    entries = sorted(iterator, key=lambda e: e.name)
+            except OSError:
+                continue
+            self.directories += 1
+
+            names = set()
+            subdirectories = []
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if depth < self.max_depth and not is_pruned_directory(entry.name):
+                            subdirectories.append(entry.path)
+                    else:
+                        names.add(entry.name.lower())
+                except OSError:
+                    continue
+            self.files += len(names)
+
+            if "pyvenv.cfg" in names:
+                # A virtualenv created with a non-standard name
+                continue
+            if names & MANIFEST_FILES:
+                yield path
+            if self.files >= self.max_files:
+                self.truncated = bool(stack or subdirectories)
+                return
+            stack.extend((subdirectory, depth + 1) for subdirectory in reversed(subdirectories))
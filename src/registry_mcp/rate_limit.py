@@ -0,0 +1,41 @@
+"""Token-bucket rate limiting of requests to one host."""
+
+import asyncio
+import time
+from collections.abc import Callable
+
+
+class RateLimiter:
+    """
+    Async token bucket: at most burst requests at once, refilled at rate per second.
+
+    Waiting callers are served in order, so a burst of submissions is spread out
+    evenly instead of hitting the registry at the same moment.
+
+    Args:
+        rate: Requests per second (0 or less disables the limit)
+        burst: Number of requests that may be sent without waiting
+        timer: Monotonic clock, injectable for tests
+    """
+
+    def __init__(self, rate: float, burst: int = 1, timer: Callable[[], float] = time.monotonic):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._timer = timer
+        self._tokens = float(self.burst)
+        self._updated = timer()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent."""
+        if self.rate <= 0:
+            return
+        async with self._lock:
+            now = self._timer()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._tokens = 1.0
+                self._updated = self._timer()
+            self._tokens -= 1
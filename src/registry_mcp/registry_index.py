@@ -0,0 +1,434 @@
+"""
+Searchable in-memory index over a local checkout of the registry.
+
+Every meta.yaml of the checkout is parsed once with the fast YAML path
+(libyaml when available) and reduced to a compact entry. Inverted indexes map
+normalised keywords, application categories, programming languages,
+maintainer names and identifiers to entry ids, and a token index covers the
+free text (identifier, name, keywords, description, featureList), so a search
+is a few set intersections and does not depend on the size of the registry
+beyond the number of matches.
+
+RegistryIndex.open keeps the parsed entries in a SQLite database (see
+registry_mcp.registry_store), so later starts only re-parse changed files, and
+answers free-text queries from its FTS5 index with BM25 ranking.
+"""
+
+import glob
+import heapq
+import os
+import re
+import threading
+import time
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any
+
+import yaml
+
+from registry_mcp.yaml_backend import YAML_BACKEND, load_yaml
+
+if TYPE_CHECKING:
+    from registry_mcp.registry_store import RegistryIndexStore
+
+DEFAULT_REGISTRY_PATH = os.environ.get("REGISTRY_MCP_REGISTRY_PATH")
+DEFAULT_PATTERN = "**/meta.yaml"
+MAX_PAGE_SIZE = 100
+
+# Filterable fields and the entry value they are built from
+FILTER_FIELDS = {
+    "keyword": "keywords",
+    "category": "applicationCategory",
+    "language": "programmingLanguage",
+    "maintainer": "maintainers",
+    "identifier": "identifier",
+}
+
+# Free-text fields and their weight in the ranking
+TEXT_WEIGHTS = {
+    "identifier": 4.0,
+    "name": 4.0,
+    "keywords": 2.0,
+    "featureList": 1.5,
+    "description": 1.0,
+}
+
+_TOKEN = re.compile(r"[^\W_]+")
+
+
+def normalize(value: str) -> str:
+    """Normalise a filter value for lookups: case-insensitive, surrounding whitespace ignored."""
+    return value.strip().casefold()
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase word tokens."""
+    return _TOKEN.findall(text.casefold())
+
+
+def _as_list(value: Any) -> list[Any]:
+    if value is None:
+        return []
+    return list(value) if isinstance(value, list | tuple) else [value]
+
+
+def _strings(value: Any) -> list[str]:
+    return [str(item) for item in _as_list(value) if isinstance(item, str | int | float) and str(item).strip()]
+
+
+def _maintainer_names(value: Any) -> list[str]:
+    names = []
+    for maintainer in _as_list(value):
+        if isinstance(maintainer, dict):
+            names.extend(_strings(maintainer.get("name")))
+        elif isinstance(maintainer, str):
+            names.append(maintainer)
+    return names
+
+
+def make_entry(data: dict[str, Any], file_path: str) -> dict[str, Any]:
+    """
+    Reduce a parsed meta.yaml to a registry index entry.
+
+    Args:
+        data: Parsed meta.yaml
+        file_path: Path of the meta.yaml
+
+    Returns:
+        Dict with the searchable fields (lists for multi-valued ones) and the file path
+    """
+    return {
+        "identifier": str(data.get("identifier") or ""),
+        "name": str(data.get("name") or ""),
+        "description": str(data.get("description") or ""),
+        "keywords": _strings(data.get("keywords")),
+        "applicationCategory": _strings(data.get("applicationCategory")),
+        "programmingLanguage": _strings(data.get("programmingLanguage")),
+        "maintainers": _maintainer_names(data.get("maintainer")),
+        "featureList": _strings(data.get("featureList")),
+        "codeRepository": data.get("codeRepository"),
+        "url": data.get("url"),
+        "license": data.get("license"),
+        "file": file_path,
+    }
+
+
+def parse_entry(content: bytes, file_path: str) -> dict[str, Any]:
+    """
+    Parse the content of one meta.yaml into an index entry.
+
+    Args:
+        content: Content of the meta.yaml
+        file_path: Path of the meta.yaml
+
+    Returns:
+        Index entry
+
+    Raises:
+        yaml.YAMLError: If the content is not valid YAML
+        ValueError: If the document is not a mapping
+    """
+    data = load_yaml(content)
+    if not isinstance(data, dict):
+        raise ValueError("Document is not a mapping")
+    return make_entry(data, file_path)
+
+
+def load_entry(file_path: str) -> dict[str, Any]:
+    """
+    Read and parse one meta.yaml into an index entry.
+
+    Args:
+        file_path: Path of the meta.yaml
+
+    Returns:
+        Index entry
+
+    Raises:
+        OSError: If the file cannot be read
+        yaml.YAMLError: If the file is not valid YAML
+        ValueError: If the document is not a mapping
+    """
+    with open(file_path, "rb") as f:
+        return parse_entry(f.read(), file_path)
+
+
+def find_registry_files(registry_path: str, pattern: str = DEFAULT_PATTERN) -> list[str]:
+    """
+    Find the meta.yaml files of a registry checkout.
+
+    Args:
+        registry_path: Root of the registry checkout
+        pattern: Glob pattern of the entries, relative to registry_path
+
+    Returns:
+        Sorted list of file paths
+    """
+    return sorted(p for p in glob.glob(os.path.join(registry_path, pattern), recursive=True) if os.path.isfile(p))
+
+
+class RegistryIndex:
+    """
+    In-memory registry index with inverted indexes for filters and free text.
+
+    Args:
+        entries: Index entries (see make_entry)
+    """
+
+    def __init__(self, entries: Iterable[dict[str, Any]] = ()):
+        self.entries: list[dict[str, Any]] = []
+        self._filters: dict[str, dict[str, set[int]]] = {name: {} for name in FILTER_FIELDS}
+        # token -> {entry id: weight of the best field the token occurs in}
+        self._postings: dict[str, dict[int, float]] = {}
+        self._ordering: tuple[list[int], list[int]] | None = None
+        self.errors: list[dict[str, str]] = []
+        self.path: str | None = None
+        self.build_seconds = 0.0
+        self.store: RegistryIndexStore | None = None
+        # Database row id -> entry id, for indexes loaded from a store
+        self._entry_ids: dict[int, int] = {}
+        for entry in entries:
+            self.add(entry)
+
+    @classmethod
+    def build(cls, registry_path: str, pattern: str = DEFAULT_PATTERN) -> "RegistryIndex":
+        """
+        Parse every meta.yaml of a registry checkout and index it.
+
+        Files that cannot be read or parsed are skipped and listed in errors.
+
+        Args:
+            registry_path: Root of the registry checkout
+            pattern: Glob pattern of the entries, relative to registry_path
+
+        Returns:
+            RegistryIndex of the checkout
+        """
+        start = time.perf_counter()
+        index = cls()
+        index.path = os.path.abspath(registry_path)
+        for file_path in find_registry_files(registry_path, pattern):
+            try:
+                index.add(load_entry(file_path))
+            except (OSError, ValueError, yaml.YAMLError) as e:
+                index.errors.append({"file": file_path, "error": str(e)})
+        index.build_seconds = time.perf_counter() - start
+        return index
+
+    @classmethod
+    def open(
+        cls,
+        registry_path: str,
+        pattern: str = DEFAULT_PATTERN,
+        store: "RegistryIndexStore | None" = None,
+    ) -> "RegistryIndex":
+        """
+        Load the index of a checkout from its database, syncing the database first.
+
+        Only files whose mtime or size changed since the last sync are read, and
+        only those whose content changed are parsed; the entries are then loaded
+        from the database.
+
+        Args:
+            registry_path: Root of the registry checkout
+            pattern: Glob pattern of the entries, relative to registry_path
+            store: Database to use (defaults to the one at default_index_path)
+
+        Returns:
+            RegistryIndex of the checkout, answering text queries from the database
+        """
+        from registry_mcp.registry_store import RegistryIndexStore, default_index_path
+
+        start = time.perf_counter()
+        store = store or RegistryIndexStore(default_index_path(registry_path, pattern))
+        store.sync(registry_path, pattern)
+        index = cls()
+        index.path = os.path.abspath(registry_path)
+        index.store = store
+        for file_id, entry in store.entries():
+            index._entry_ids[file_id] = index.add(entry)
+        index.errors = store.errors()
+        index.build_seconds = time.perf_counter() - start
+        return index
+
+    def add(self, entry: dict[str, Any]) -> int:
+        """
+        Add an entry to the index.
+
+        Args:
+            entry: Index entry
+
+        Returns:
+            Id of the entry
+        """
+        entry_id = len(self.entries)
+        self.entries.append(entry)
+        self._ordering = None
+        for name, field in FILTER_FIELDS.items():
+            for value in _as_list(entry.get(field)):
+                if value:
+                    self._filters[name].setdefault(normalize(value), set()).add(entry_id)
+        if self.store is not None:
+            # Text queries are answered by the database's FTS table
+            return entry_id
+        for field, weight in TEXT_WEIGHTS.items():
+            for value in _as_list(entry.get(field)):
+                for token in tokenize(value):
+                    posting = self._postings.setdefault(token, {})
+                    if posting.get(entry_id, 0.0) < weight:
+                        posting[entry_id] = weight
+        return entry_id
+
+    def _identifier_order(self) -> tuple[list[int], list[int]]:
+        # Entry ids in identifier order, and the position of each entry in it so sorting compares ints
+        if self._ordering is None:
+            order = sorted(range(len(self.entries)), key=lambda i: self.entries[i]["identifier"])
+            rank = [0] * len(order)
+            for position, entry_id in enumerate(order):
+                rank[entry_id] = position
+            # Published in one assignment, so concurrent searches never see half of it
+            self._ordering = (order, rank)
+        return self._ordering
+
+    def _match_filters(self, filters: dict[str, str | list[str] | None]) -> set[int] | None:
+        matches: set[int] | None = None
+        for name, values in filters.items():
+            if name not in FILTER_FIELDS:
+                raise ValueError(f"Unknown filter {name!r}, expected one of {', '.join(FILTER_FIELDS)}")
+            for value in _as_list(values):
+                ids = self._filters[name].get(normalize(value), set())
+                matches = set(ids) if matches is None else matches & ids
+                if not matches:
+                    return matches
+        return matches
+
+    @staticmethod
+    def _top_scores(scores: dict[int, float], count: int, rank: list[int]) -> list[int]:
+        # Group by score and break ties in identifier order; token scores are sums of a few weights, so the
+        # groups are large and this avoids sorting (score, rank) tuples
+        buckets: dict[float, list[int]] = {}
+        for entry_id, score in scores.items():
+            buckets.setdefault(score, []).append(entry_id)
+        top: list[int] = []
+        for score in sorted(buckets, reverse=True):
+            top.extend(heapq.nsmallest(count - len(top), buckets[score], key=rank.__getitem__))
+            if len(top) >= count:
+                break
+        return top
+
+    def search(
+        self,
+        query: str | None = None,
+        offset: int = 0,
+        limit: int = 20,
+        **filters: str | list[str] | None,
+    ) -> dict[str, Any]:
+        """
+        Search the index.
+
+        Args:
+            query: Free text; every word must occur in the identifier, name, keywords,
+                description or featureList of an entry
+            offset: Number of matches to skip
+            limit: Maximum number of results (at most MAX_PAGE_SIZE)
+            **filters: keyword, category, language, maintainer or identifier; a value or a
+                list of values, all of which must match (case-insensitive)
+
+        Returns:
+            Dict containing the total number of matches, the page of results (best text
+            matches first, then by identifier) and next_offset (None on the last page)
+
+        Raises:
+            ValueError: If an unknown filter is given
+        """
+        start = time.perf_counter()
+        offset = max(0, offset)
+        limit = max(1, min(limit, MAX_PAGE_SIZE))
+        matches = self._match_filters({name: value for name, value in filters.items() if value})
+        order, rank = self._identifier_order()
+
+        scores: dict[int, float] = {}
+        tokens = list(dict.fromkeys(tokenize(query or "")))
+        if tokens and self.store is not None:
+            for file_id, score in self.store.search(query).items():
+                entry_id = self._entry_ids.get(file_id)
+                if entry_id is not None and (matches is None or entry_id in matches):
+                    scores[entry_id] = score
+            total = len(scores)
+            page = self._top_scores(scores, offset + limit, rank)[offset:]
+        elif tokens:
+            # Rarest token first; each step keeps and scores only the entries matching so far
+            postings = sorted((self._postings.get(token, {}) for token in tokens), key=len)
+            scores = postings[0] if matches is None else {i: postings[0][i] for i in postings[0].keys() & matches}
+            for posting in postings[1:]:
+                scores = {i: scores[i] + posting[i] for i in scores.keys() & posting.keys()}
+            total = len(scores)
+            page = self._top_scores(scores, offset + limit, rank)[offset:]
+        elif matches is None:
+            total = len(order)
+            page = order[offset : offset + limit]
+        else:
+            total = len(matches)
+            page = heapq.nsmallest(offset + limit, matches, key=rank.__getitem__)[offset:]
+
+        return {
+            "total": total,
+            "offset": offset,
+            "limit": limit,
+            "next_offset": offset + limit if offset + limit < total else None,
+            "results": [{**self.entries[i], "score": scores[i]} if tokens else dict(self.entries[i]) for i in page],
+            "took_ms": round((time.perf_counter() - start) * 1e3, 3),
+        }
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Get the size of the index.
+
+        Returns:
+            Dict containing the registry path, number of entries, distinct values per filter and tokens
+            (0 for indexes loaded from a database, which answer text queries themselves), load errors
+            and, for indexes loaded from a database, the database statistics
+        """
+        return {
+            "path": self.path,
+            "entries": len(self.entries),
+            "distinct_values": {name: len(values) for name, values in self._filters.items()},
+            "tokens": len(self._postings),
+            "build_seconds": round(self.build_seconds, 3),
+            "yaml_backend": YAML_BACKEND,
+            "errors": list(self.errors),
+            "database": self.store.stats() if self.store is not None else None,
+        }
+
+
+_INDEXES: dict[tuple[str, str], RegistryIndex] = {}
+_INDEXES_LOCK = threading.Lock()
+
+
+def get_registry_index(registry_path: str, pattern: str = DEFAULT_PATTERN, refresh: bool = False) -> RegistryIndex:
+    """
+    Get the index of a registry checkout, opening it from its database on first use.
+
+    Args:
+        registry_path: Root of the registry checkout
+        pattern: Glob pattern of the entries, relative to registry_path
+        refresh: Whether to sync the database again, e.g. after the checkout was updated
+
+    Returns:
+        RegistryIndex of the checkout
+    """
+    key = (os.path.abspath(registry_path), pattern)
+    with _INDEXES_LOCK:
+        index = _INDEXES.get(key)
+        if index is None or refresh:
+            index = _INDEXES[key] = RegistryIndex.open(registry_path, pattern, store=index.store if index else None)
+        return index
+
+
+def clear_registry_indexes() -> None:
+    """Forget all opened registry indexes and close their databases."""
+    with _INDEXES_LOCK:
+        indexes = list(_INDEXES.values())
+        _INDEXES.clear()
+    for index in indexes:
+        if index.store is not None:
+            index.store.close()
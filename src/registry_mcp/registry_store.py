@@ -0,0 +1,300 @@
+"""
+Persistent registry index in SQLite.
+
+The parsed entries of a registry checkout are kept in a SQLite database, so a
+server start opens the database instead of parsing every meta.yaml again. Each
+file is recorded with its mtime, size and SHA-256 hash: a sync stats the
+checkout and only reads files whose mtime or size changed, and only parses
+those whose hash changed. Deleted files are dropped.
+
+An FTS5 table covers the identifier, name, description, keywords and
+featureList of every entry and ranks free-text matches with BM25, weighted
+like the in-memory token index (see registry_mcp.registry_index.TEXT_WEIGHTS).
+
+There is one database per checkout and pattern, under
+REGISTRY_MCP_REGISTRY_INDEX_DIR (by default registry-index in the cache
+directory). It only holds derived data and is rebuilt when deleted.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any
+
+import yaml
+
+from registry_mcp.registry_index import DEFAULT_PATTERN, TEXT_WEIGHTS, find_registry_files, parse_entry, tokenize
+from registry_mcp.schema_provider import default_cache_dir
+
+# Bumped when the layout changes; databases of another version are rebuilt
+SCHEMA_VERSION = 1
+
+# Free-text columns, in the order of the bm25() weights
+TEXT_COLUMNS = ("identifier", "name", "description", "keywords", "featureList")
+
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    path TEXT NOT NULL UNIQUE,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    content_hash TEXT NOT NULL,
+    entry TEXT,
+    error TEXT
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS entries_fts USING fts5({", ".join(TEXT_COLUMNS)});
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+def default_index_dir() -> str:
+    """
+    Get the directory of the persistent registry indexes.
+
+    Returns:
+        REGISTRY_MCP_REGISTRY_INDEX_DIR if set, otherwise registry-index in the cache directory
+    """
+    if os.environ.get("REGISTRY_MCP_REGISTRY_INDEX_DIR"):
+        return os.environ["REGISTRY_MCP_REGISTRY_INDEX_DIR"]
+    return os.path.join(default_cache_dir(), "registry-index")
+
+
+def default_index_path(registry_path: str, pattern: str = DEFAULT_PATTERN) -> str:
+    """
+    Get the database location of a checkout.
+
+    Args:
+        registry_path: Root of the registry checkout
+        pattern: Glob pattern of the entries, relative to registry_path
+
+    Returns:
+        Database file named after the checkout directory and a hash of its path and the pattern
+    """
+    registry_path = os.path.abspath(registry_path)
+    digest = hashlib.sha256(f"{registry_path}\0{pattern}".encode()).hexdigest()[:16]
+    return os.path.join(default_index_dir(), f"{os.path.basename(registry_path) or 'registry'}-{digest}.db")
+
+
+def _fts_values(entry: dict[str, Any]) -> tuple[str, ...]:
+    return tuple(
+        "\n".join(value) if isinstance(value := entry.get(column), list) else str(value or "")
+        for column in TEXT_COLUMNS
+    )
+
+
+def match_expression(query: str) -> str | None:
+    """
+    Turn free text into an FTS5 query requiring every word.
+
+    Args:
+        query: Free text
+
+    Returns:
+        FTS5 MATCH expression, or None if the text has no words
+    """
+    tokens = list(dict.fromkeys(tokenize(query)))
+    return " ".join(f'"{token}"' for token in tokens) or None
+
+
+class RegistryIndexStore:
+    """
+    SQLite database of the parsed entries of a registry checkout, safe to use from several threads.
+
+    Args:
+        path: Database file, or ":memory:" for a store that is not persisted
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        if path != ":memory:" and os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=30)
+        if path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        if self._conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+            self._conn.executescript(
+                "DROP TABLE IF EXISTS files; DROP TABLE IF EXISTS entries_fts; DROP TABLE IF EXISTS meta;"
+            )
+            self._conn.executescript(_SCHEMA)
+            self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self.last_sync: dict[str, Any] | None = None
+        # (files, entries), counted once per sync rather than on every stats() call
+        self._counts: tuple[int, int] | None = None
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def sync(self, registry_path: str, pattern: str = DEFAULT_PATTERN) -> dict[str, Any]:
+        """
+        Bring the database up to date with a checkout.
+
+        Files with unchanged mtime and size are not read; files with an unchanged
+        hash are not parsed. Files that cannot be parsed are recorded with their
+        error and retried once they change.
+
+        Args:
+            registry_path: Root of the registry checkout
+            pattern: Glob pattern of the entries, relative to registry_path
+
+        Returns:
+            Dict containing the number of files added, updated, unchanged, touched
+            (new mtime, same content) and removed, and the elapsed seconds
+        """
+        start = time.perf_counter()
+        counts = {"added": 0, "updated": 0, "unchanged": 0, "touched": 0, "removed": 0}
+        paths = find_registry_files(os.path.abspath(registry_path), pattern)
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                known = {
+                    row[1]: row
+                    for row in self._conn.execute("SELECT id, path, mtime_ns, size, content_hash FROM files")
+                }
+                for file_path in paths:
+                    row = known.pop(file_path, None)
+                    try:
+                        stat = os.stat(file_path)
+                        if row is not None and (row[2], row[3]) == (stat.st_mtime_ns, stat.st_size):
+                            counts["unchanged"] += 1
+                            continue
+                        with open(file_path, "rb") as f:
+                            content = f.read()
+                    except OSError:
+                        # Vanished since the glob; dropped like a deleted file
+                        if row is not None:
+                            self._delete(row[0])
+                            counts["removed"] += 1
+                        continue
+                    content_hash = hashlib.sha256(content).hexdigest()
+                    if row is not None and row[4] == content_hash:
+                        self._conn.execute(
+                            "UPDATE files SET mtime_ns = ?, size = ? WHERE id = ?",
+                            (stat.st_mtime_ns, stat.st_size, row[0]),
+                        )
+                        counts["touched"] += 1
+                        continue
+                    self._store(file_path, stat, content_hash, content)
+                    counts["added" if row is None else "updated"] += 1
+                for row in known.values():
+                    self._delete(row[0])
+                    counts["removed"] += 1
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                    [
+                        ("registry_path", os.path.abspath(registry_path)),
+                        ("pattern", pattern),
+                        ("synced_at", str(time.time())),
+                    ],
+                )
+                totals = self._conn.execute("SELECT COUNT(*), COUNT(entry) FROM files").fetchone()
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._counts = totals
+        self.last_sync = {**counts, "seconds": round(time.perf_counter() - start, 3)}
+        return self.last_sync
+
+    def _store(self, file_path: str, stat: os.stat_result, content_hash: str, content: bytes) -> None:
+        try:
+            entry, error = parse_entry(content, file_path), None
+        except (ValueError, yaml.YAMLError) as e:
+            entry, error = None, str(e)
+        (file_id,) = self._conn.execute(
+            """
+            INSERT INTO files (path, mtime_ns, size, content_hash, entry, error) VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT (path) DO UPDATE SET
+                mtime_ns = excluded.mtime_ns,
+                size = excluded.size,
+                content_hash = excluded.content_hash,
+                entry = excluded.entry,
+                error = excluded.error
+            RETURNING id
+            """,
+            (
+                file_path,
+                stat.st_mtime_ns,
+                stat.st_size,
+                content_hash,
+                json.dumps(entry) if entry is not None else None,
+                error,
+            ),
+        ).fetchone()
+        self._conn.execute("DELETE FROM entries_fts WHERE rowid = ?", (file_id,))
+        if entry is not None:
+            self._conn.execute(
+                f"INSERT INTO entries_fts (rowid, {', '.join(TEXT_COLUMNS)}) VALUES (?{', ?' * len(TEXT_COLUMNS)})",
+                (file_id, *_fts_values(entry)),
+            )
+
+    def _delete(self, file_id: int) -> None:
+        self._conn.execute("DELETE FROM entries_fts WHERE rowid = ?", (file_id,))
+        self._conn.execute("DELETE FROM files WHERE id = ?", (file_id,))
+
+    def entries(self) -> list[tuple[int, dict[str, Any]]]:
+        """
+        Get the stored entries.
+
+        Returns:
+            List of (row id, index entry) pairs, ordered by file path
+        """
+        with self._lock:
+            rows = self._conn.execute("SELECT id, entry FROM files WHERE entry IS NOT NULL ORDER BY path").fetchall()
+        return [(file_id, json.loads(entry)) for file_id, entry in rows]
+
+    def errors(self) -> list[dict[str, str]]:
+        """
+        Get the files that could not be parsed.
+
+        Returns:
+            List of dicts with the file and the error
+        """
+        with self._lock:
+            rows = self._conn.execute("SELECT path, error FROM files WHERE entry IS NULL ORDER BY path").fetchall()
+        return [{"file": path, "error": error} for path, error in rows]
+
+    def search(self, query: str) -> dict[int, float]:
+        """
+        Find the entries matching every word of a text.
+
+        The matches are not sorted here: ordering by identifier as a tie-break
+        would read the stored text of every match, so callers rank them.
+
+        Args:
+            query: Free text
+
+        Returns:
+            Dict mapping the row id of each match to its BM25 score (higher is better)
+        """
+        expression = match_expression(query)
+        if expression is None:
+            return {}
+        weights = ", ".join(str(TEXT_WEIGHTS[column]) for column in TEXT_COLUMNS)
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT rowid, bm25(entries_fts, {weights}) FROM entries_fts WHERE entries_fts MATCH ?", (expression,)
+            ).fetchall()
+        # bm25() is lower for better matches; report higher-is-better scores like the in-memory index
+        return {file_id: -score for file_id, score in rows}
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Get the size of the database and the outcome of the last sync.
+
+        Returns:
+            Dict containing the database path, number of files and entries, and the last sync counts
+        """
+        with self._lock:
+            if self._counts is None:
+                self._counts = self._conn.execute("SELECT COUNT(*), COUNT(entry) FROM files").fetchone()
+            files, entries = self._counts
+        return {"path": self.path, "files": files, "entries": entries, "last_sync": self.last_sync}
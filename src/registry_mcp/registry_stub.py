@@ -0,0 +1,261 @@
+"""
+Local stand-in for the registry API, for load tests and failure testing.
+
+The stub accepts submissions like the registry (POST of a JSON document,
+201 with {"id": ...}) and can be configured to be slow, to fail a share of
+requests with an error status and to throttle a share with 429 and
+Retry-After. A document without an identifier is rejected with 400. A repeated
+Idempotency-Key of an accepted submission is answered with the id of the
+first one, as the registry would, without counting a new submission.
+GET /stats returns the request counters.
+
+It is built on http.server, so it needs no extra dependencies, and runs in a
+background thread (start/stop, or as a context manager) or from the command
+line:
+
+    python -m registry_mcp.registry_stub --port 8080 --latency 50 --error-rate 0.1
+
+and is then reachable at http://127.0.0.1:8080/registry/submit.
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+
+class RegistryStub:
+    """
+    Stand-in registry API server.
+
+    Args:
+        host: Interface to listen on
+        port: Port to listen on (0 for a free port)
+        latency: Seconds each submission takes
+        jitter: Additional random latency in seconds, uniform between 0 and jitter
+        error_rate: Share of submissions (0 to 1) answered with error_status
+        error_status: Status code of failed submissions
+        throttle_rate: Share of submissions (0 to 1) answered with 429
+        retry_after: Retry-After header of 429 responses, in seconds
+        status: Status code of accepted submissions
+        seed: Seed of the random failure and latency choices, for reproducible runs
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        throttle_rate: float = 0.0,
+        retry_after: float = 1.0,
+        status: int = 201,
+        seed: int | None = None,
+    ):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.status = status
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._counters: Counter = Counter()
+        self._accepted: dict[str, str] = {}
+        self._thread: threading.Thread | None = None
+        self._server = ThreadingHTTPServer((host, port), _StubHandler)
+        self._server.daemon_threads = True
+        self._server.request_queue_size = 128
+        self._server.stub = self
+
+    @property
+    def url(self) -> str:
+        """Submission endpoint URL of the stub."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/registry/submit"
+
+    def start(self) -> "RegistryStub":
+        """
+        Serve requests on a background thread.
+
+        Returns:
+            The stub itself
+        """
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, args=(0.05,), name="registry-stub", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """Serve requests on the calling thread until interrupted."""
+        self._server.serve_forever()
+
+    def stop(self) -> None:
+        """Stop serving and close the socket."""
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def __enter__(self) -> "RegistryStub":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Get the request counters.
+
+        Returns:
+            Dict containing the number of requests, accepted submissions, idempotent replays and responses per status
+        """
+        with self._lock:
+            counters = dict(self._counters)
+        return {
+            "requests": counters.pop("requests", 0),
+            "accepted": counters.pop("accepted", 0),
+            "replayed": counters.pop("replayed", 0),
+            "responses": {int(key.split(":")[1]): value for key, value in sorted(counters.items())},
+        }
+
+    def _delay(self) -> float:
+        with self._lock:
+            return self.latency + self._random.uniform(0, self.jitter) if self.jitter else self.latency
+
+    def _respond(self, body: bytes, idempotency_key: str | None) -> tuple[int, dict[str, str], dict[str, Any]]:
+        with self._lock:
+            self._counters["requests"] += 1
+            if idempotency_key and idempotency_key in self._accepted:
+                self._counters["replayed"] += 1
+                return 200, {}, {"id": self._accepted[idempotency_key]}
+            draw = self._random.random()
+        if draw < self.throttle_rate:
+            return 429, {"Retry-After": f"{self.retry_after:g}"}, {"message": "Too many submissions"}
+        if draw < self.throttle_rate + self.error_rate:
+            return self.error_status, {}, {"message": "Registry unavailable"}
+        try:
+            document = json.loads(body)
+        except ValueError:
+            return 400, {}, {"message": "Request body is not valid JSON"}
+        if not isinstance(document, dict) or not document.get("identifier"):
+            return 400, {}, {"message": "Submission has no identifier"}
+        if self.status >= 300:
+            return self.status, {}, {"message": f"Stub configured to answer {self.status}"}
+        with self._lock:
+            self._counters["accepted"] += 1
+            submission_id = f"stub-{self._counters['accepted']}"
+            if idempotency_key:
+                self._accepted[idempotency_key] = submission_id
+        return self.status, {}, {"id": submission_id}
+
+    def _count(self, status: int) -> None:
+        with self._lock:
+            self._counters[f"status:{status}"] += 1
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately; avoid Nagle/delayed-ACK stalls on kept-alive connections
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        stub: RegistryStub = self.server.stub
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        delay = stub._delay()
+        if delay:
+            time.sleep(delay)
+        status, headers, payload = stub._respond(body, self.headers.get("Idempotency-Key"))
+        stub._count(status)
+        self._send(status, payload, headers)
+
+    def do_GET(self):
+        if self.path.rstrip("/").endswith("/stats"):
+            self._send(200, self.server.stub.stats())
+        else:
+            self._send(404, {"message": "Not found"})
+
+    def _send(self, status: int, payload: dict[str, Any], headers: dict[str, str] | None = None) -> None:
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def add_stub_arguments(parser: argparse.ArgumentParser) -> None:
+    """
+    Add the stub options (latency, failure rates, status codes) to a command line parser.
+
+    Args:
+        parser: Parser to extend
+    """
+    parser.add_argument("--latency", type=float, default=0.0, help="Latency per submission in milliseconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Additional random latency in milliseconds")
+    parser.add_argument(
+        "--error-rate", type=float, default=0.0, help="Share of submissions failing with --error-status"
+    )
+    parser.add_argument("--error-status", type=int, default=503, help="Status code of failed submissions")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="Share of submissions answered with 429")
+    parser.add_argument("--retry-after", type=float, default=1.0, help="Retry-After of 429 responses in seconds")
+    parser.add_argument("--status", type=int, default=201, help="Status code of accepted submissions")
+    parser.add_argument("--seed", type=int, default=None, help="Seed of the random failures")
+
+
+def stub_options(args: argparse.Namespace) -> dict[str, Any]:
+    """
+    Get the RegistryStub arguments from parsed stub options.
+
+    Args:
+        args: Namespace parsed by a parser extended with add_stub_arguments
+
+    Returns:
+        Keyword arguments for RegistryStub
+    """
+    return {
+        "latency": args.latency / 1000,
+        "jitter": args.jitter / 1000,
+        "error_rate": args.error_rate,
+        "error_status": args.error_status,
+        "throttle_rate": args.throttle_rate,
+        "retry_after": args.retry_after,
+        "status": args.status,
+        "seed": args.seed,
+    }
+
+
+def main() -> None:
+    """Run the stub registry API until interrupted."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to listen on")
+    parser.add_argument("--port", type=int, default=8080, help="Port to listen on")
+    add_stub_arguments(parser)
+    args = parser.parse_args()
+
+    stub = RegistryStub(args.host, args.port, **stub_options(args))
+    print(f"Stub registry API listening on {stub.url}")
+    try:
+        stub.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stub.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,288 @@
+"""
+Retry policy and circuit breaker for requests to the registry API.
+
+Only failures that are safe to repeat are retried: connection errors (the
+request never reached the registry), 502/503/504 from a gateway, and 429 when
+the registry says when to come back (Retry-After). Errors after the request
+was sent, such as read timeouts, are retried only for idempotent requests
+(GET/HEAD/PUT/DELETE/OPTIONS or a request carrying an Idempotency-Key header),
+since the registry may already have accepted the submission. Delays grow
+exponentially with full jitter, so clients that failed together do not retry
+together.
+
+A circuit breaker per host counts consecutive transient failures. After
+REGISTRY_MCP_BREAKER_THRESHOLD of them it opens and requests fail fast with
+CircuitOpenError for REGISTRY_MCP_BREAKER_RESET_TIMEOUT seconds; then one
+probe request is let through, which closes the breaker again on success.
+"""
+
+import email.utils
+import os
+import random
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+import httpx
+
+RETRY_STATUS_CODES = frozenset((502, 503, 504))
+IDEMPOTENT_METHODS = frozenset(("GET", "HEAD", "PUT", "DELETE", "OPTIONS"))
+
+# Transport errors raised before the request was sent
+_CONNECT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+class CircuitOpenError(Exception):
+    """
+    Raised instead of sending a request while the circuit breaker of its host is open.
+
+    Attributes:
+        host: Host of the request
+        retry_after: Seconds until the breaker lets a probe request through
+    """
+
+    def __init__(self, host: str, retry_after: float):
+        super().__init__(f"Registry API at {host} is unavailable, not retrying for {retry_after:.0f} s")
+        self.host = host
+        self.retry_after = retry_after
+
+
+def parse_retry_after(value: str | None, now: Callable[[], float] = time.time) -> float | None:
+    """
+    Parse a Retry-After header.
+
+    Args:
+        value: Header value, either delay seconds or an HTTP date
+        now: Wall clock used for HTTP dates
+
+    Returns:
+        Delay in seconds (at least 0), or None if the header is missing or invalid
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        date = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, date.timestamp() - now())
+
+
+class RetryPolicy:
+    """
+    Decide whether and when a failed request is retried.
+
+    Args:
+        max_attempts: Maximum number of attempts, including the first one
+        base_delay: Delay cap in seconds before the first retry, doubled for every further retry
+        max_delay: Maximum delay cap in seconds
+        max_retry_after: Longest Retry-After in seconds that is waited for; longer ones are not retried
+        jitter: Source of jitter in [0, 1), injectable for tests
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 4,
+        base_delay: float = 0.5,
+        max_delay: float = 10.0,
+        max_retry_after: float = 60.0,
+        jitter: Callable[[], float] = random.random,
+    ):
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_retry_after = max_retry_after
+        self._jitter = jitter
+
+    @classmethod
+    def from_env(cls) -> "RetryPolicy":
+        """
+        Create a policy configured from environment variables.
+
+        REGISTRY_MCP_RETRY_MAX_ATTEMPTS sets the number of attempts (default 4),
+        REGISTRY_MCP_RETRY_BASE_DELAY and REGISTRY_MCP_RETRY_MAX_DELAY the backoff
+        in seconds (defaults 0.5 and 10) and REGISTRY_MCP_RETRY_AFTER_MAX the
+        longest Retry-After that is honoured (default 60).
+
+        Returns:
+            Configured RetryPolicy
+        """
+        return cls(
+            max_attempts=int(os.environ.get("REGISTRY_MCP_RETRY_MAX_ATTEMPTS", 4)),
+            base_delay=float(os.environ.get("REGISTRY_MCP_RETRY_BASE_DELAY", 0.5)),
+            max_delay=float(os.environ.get("REGISTRY_MCP_RETRY_MAX_DELAY", 10.0)),
+            max_retry_after=float(os.environ.get("REGISTRY_MCP_RETRY_AFTER_MAX", 60.0)),
+        )
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Get the delay before a retry, with full jitter.
+
+        Args:
+            attempt: Number of the attempt that failed (1 for the first)
+
+        Returns:
+            Delay in seconds, uniformly drawn between 0 and the exponential cap
+        """
+        return self._jitter() * min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+
+    def retry_reason(
+        self, request: httpx.Request, response: httpx.Response | None = None, error: Exception | None = None
+    ) -> str | None:
+        """
+        Classify a failed attempt.
+
+        Args:
+            request: The request
+            response: Response of the attempt, if one was received
+            error: Transport error of the attempt, if no response was received
+
+        Returns:
+            Reason the attempt may be retried ("connect", "timeout", "status_503", ...),
+            or None if it must not be retried
+        """
+        if response is not None:
+            if response.status_code in RETRY_STATUS_CODES:
+                return f"status_{response.status_code}"
+            if response.status_code == 429 and parse_retry_after(response.headers.get("Retry-After")) is not None:
+                return "status_429"
+            return None
+        if isinstance(error, _CONNECT_ERRORS):
+            return "connect"
+        if isinstance(error, httpx.TransportError) and self.is_idempotent(request):
+            return "timeout" if isinstance(error, httpx.TimeoutException) else "transport"
+        return None
+
+    def delay(self, attempt: int, response: httpx.Response | None = None) -> float | None:
+        """
+        Get the delay before retrying a failed attempt.
+
+        Args:
+            attempt: Number of the attempt that failed (1 for the first)
+            response: Response of the attempt, if one was received
+
+        Returns:
+            Delay in seconds, or None if no attempts are left or Retry-After is too long
+        """
+        if attempt >= self.max_attempts:
+            return None
+        retry_after = parse_retry_after(response.headers.get("Retry-After")) if response is not None else None
+        if retry_after is not None:
+            return retry_after if retry_after <= self.max_retry_after else None
+        return self.backoff(attempt)
+
+    @staticmethod
+    def is_idempotent(request: httpx.Request) -> bool:
+        """Whether repeating the request cannot create a second submission."""
+        return request.method in IDEMPOTENT_METHODS or "Idempotency-Key" in request.headers
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker for one host.
+
+    Args:
+        host: Host the breaker protects
+        failure_threshold: Consecutive transient failures after which the breaker opens
+        reset_timeout: Seconds the breaker stays open before a probe request is let through
+        timer: Monotonic clock, injectable for tests
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        host: str,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        timer: Callable[[], float] = time.monotonic,
+    ):
+        self.host = host
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self._timer = timer
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self.opened = 0
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        """Current state: "closed", "open" or "half_open"."""
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self) -> str:
+        if self._state == self.OPEN and self._timer() - self._opened_at >= self.reset_timeout:
+            self._state = self.HALF_OPEN
+            self._probing = False
+        return self._state
+
+    def before_request(self) -> None:
+        """
+        Check that a request may be sent.
+
+        Raises:
+            CircuitOpenError: If the breaker is open, or half-open with a probe already in flight
+        """
+        with self._lock:
+            state = self._current_state()
+            if state == self.CLOSED:
+                return
+            if state == self.HALF_OPEN and not self._probing:
+                self._probing = True
+                return
+            self.rejected += 1
+            retry_after = max(0.0, self.reset_timeout - (self._timer() - self._opened_at))
+            raise CircuitOpenError(self.host, retry_after)
+
+    def record_success(self) -> None:
+        """Record a request that reached the registry, closing the breaker."""
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._probing = False
+
+    def record_cancelled(self) -> None:
+        """Record a request that ended without an outcome for the host, so a half-open breaker lets the next probe through."""
+        with self._lock:
+            self._probing = False
+
+    def record_failure(self) -> None:
+        """Record a transient failure, opening the breaker at the threshold or after a failed probe."""
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or (
+                self._state == self.CLOSED and self._failures >= self.failure_threshold
+            ):
+                self._state = self.OPEN
+                self._opened_at = self._timer()
+                self._probing = False
+                self.opened += 1
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Get the breaker state.
+
+        Returns:
+            Dict containing state, consecutive failures and open/reject counters
+        """
+        with self._lock:
+            state = self._current_state()
+            return {
+                "state": state,
+                "consecutive_failures": self._failures,
+                "opened": self.opened,
+                "rejected": self.rejected,
+                "retry_after": max(0.0, self.reset_timeout - (self._timer() - self._opened_at))
+                if state == self.OPEN
+                else 0.0,
+            }
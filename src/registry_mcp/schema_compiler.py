@@ -0,0 +1,299 @@
+"""
+Compile a JSON schema into a specialised Python validation function.
+
+The generated function unrolls the schema into flat ``isinstance`` checks,
+precompiled regular expressions, frozen enum sets and inline length and
+uniqueness checks. It supports the subset of Draft 2020-12 used by the
+registry schema and reports the same errors (path, keyword, value and message)
+as the generic jsonschema interpreter, so both engines can be used
+interchangeably.
+"""
+
+import numbers
+import re
+from collections.abc import Callable, Mapping, Sequence
+from itertools import islice
+from typing import Any, NamedTuple
+
+# Keywords that carry no validation semantics
+_ANNOTATIONS = frozenset(
+    {
+        "$schema",
+        "$id",
+        "$comment",
+        "title",
+        "description",
+        "default",
+        "examples",
+        "deprecated",
+        "readOnly",
+        "writeOnly",
+    }
+)
+
+_TYPE_CHECKS = {
+    "string": "isinstance({v}, str)",
+    "object": "isinstance({v}, dict)",
+    "array": "isinstance({v}, list)",
+    "boolean": "isinstance({v}, bool)",
+    "null": "{v} is None",
+    "number": "(isinstance({v}, _Number) and not isinstance({v}, bool))",
+    "integer": "((isinstance({v}, int) and not isinstance({v}, bool)) or (isinstance({v}, float) and {v}.is_integer()))",
+}
+
+
+class SchemaViolation(NamedTuple):
+    """A single schema violation reported by a compiled validator."""
+
+    path: tuple
+    validator: str
+    validator_value: Any
+    message: str
+
+
+class SchemaCompilationError(ValueError):
+    """Raised when a schema uses keywords the compiler does not support."""
+
+
+# Runtime helpers mirroring jsonschema's equality and uniqueness semantics
+# (bool is distinct from int, containers compare element-wise)
+def _unbool(element: Any, true: object = object(), false: object = object()) -> Any:
+    if element is True:
+        return true
+    if element is False:
+        return false
+    return element
+
+
+def _equal(one: Any, two: Any) -> bool:
+    if one is two:
+        return True
+    if isinstance(one, str) or isinstance(two, str):
+        return one == two
+    if isinstance(one, Sequence) and isinstance(two, Sequence):
+        return len(one) == len(two) and all(_equal(i, j) for i, j in zip(one, two, strict=True))
+    if isinstance(one, Mapping) and isinstance(two, Mapping):
+        return len(one) == len(two) and all(key in two and _equal(value, two[key]) for key, value in one.items())
+    return _unbool(one) == _unbool(two)
+
+
+def _uniq(container: list) -> bool:
+    if all(type(item) is str for item in container):
+        return len(set(container)) == len(container)
+    try:
+        ordered = sorted(_unbool(item) for item in container)
+        for i, j in zip(ordered, islice(ordered, 1, None), strict=False):
+            if _equal(i, j):
+                return False
+    except (NotImplementedError, TypeError):
+        seen: list = []
+        for item in container:
+            item = _unbool(item)
+            if any(_equal(other, item) for other in seen):
+                return False
+            seen.append(item)
+    return True
+
+
+class _Emitter:
+    """Generate the source of a validation function for one schema."""
+
+    def __init__(self, format_checker: Any = None):
+        self.format_checker = format_checker
+        self.lines: list[str] = []
+        self.constants: dict[str, Any] = {}
+        self._counter = 0
+
+    def constant(self, value: Any, prefix: str = "C") -> str:
+        self._counter += 1
+        name = f"_{prefix}{self._counter}"
+        self.constants[name] = value
+        return name
+
+    def variable(self, prefix: str = "v") -> str:
+        self._counter += 1
+        return f"{prefix}{self._counter}"
+
+    def emit(self, line: str, depth: int) -> None:
+        self.lines.append("    " * depth + line)
+
+    def error(self, path: tuple[str, ...], keyword: str, value: Any, message: str, depth: int) -> None:
+        value_name = self.constant(value, "V")
+        path_literal = "(" + ", ".join(path) + ("," if len(path) == 1 else "") + ")"
+        self.emit(f"_errors.append(_Violation({path_literal}, {keyword!r}, {value_name}, {message}))", depth)
+
+    def schema(self, schema: Any, v: str, path: tuple[str, ...], depth: int) -> None:
+        if schema is True or schema == {}:
+            return
+        if not isinstance(schema, dict):
+            raise SchemaCompilationError(f"Unsupported subschema: {schema!r}")
+
+        for keyword, value in schema.items():
+            if keyword in _ANNOTATIONS:
+                continue
+            handler = getattr(self, f"_kw_{keyword}", None)
+            if handler is None:
+                raise SchemaCompilationError(f"Unsupported schema keyword: {keyword!r}")
+            handler(value, schema, v, path, depth)
+
+    def _kw_type(self, types: Any, schema: dict, v: str, path: tuple[str, ...], depth: int) -> None:
+        types = [types] if isinstance(types, str) else list(types)
+        unknown = [t for t in types if t not in _TYPE_CHECKS]
+        if unknown:
+            raise SchemaCompilationError(f"Unsupported type: {unknown[0]!r}")
+        check = " or ".join(_TYPE_CHECKS[t].format(v=v) for t in types)
+        reprs = ", ".join(repr(t) for t in types)
+        self.emit(f"if not ({check}):", depth)
+        self.error(path, "type", schema["type"], f"f'{{{v}!r}} is not of type ' + {self.constant(reprs)}", depth + 1)
+
+    def _kw_const(self, const: Any, schema: dict, v: str, path: tuple[str, ...], depth: int) -> None:
+        name = self.constant(const)
+        check = f"{v} != {name}" if isinstance(const, str) else f"not _equal({v}, {name})"
+        self.emit(f"if {check}:", depth)
+        self.error(path, "const", const, self.constant(f"{const!r} was expected"), depth + 1)
+
+    def _kw_enum(self, enums: list, schema: dict, v: str, path: tuple[str, ...], depth: int) -> None:
+        if all(isinstance(each, str) for each in enums):
+            check = f"not (isinstance({v}, str) and {v} in {self.constant(frozenset(enums))})"
+        else:
+            check = f"all(not _equal(each, {v}) for each in {self.constant(list(enums))})"
+        self.emit(f"if {check}:", depth)
+        self.error(path, "enum", enums, f"f'{{{v}!r}} is not one of ' + {self.constant(repr(enums))}", depth + 1)
+
+    def _kw_pattern(self, pattern: str, schema: dict, v: str, path: tuple[str, ...], depth: int) -> None:
+        regex = self.constant(re.compile(pattern), "P")
+        self.emit(f"if isinstance({v}, str) and not {regex}.search({v}):", depth)
+        self.error(
+            path, "pattern", pattern, f"f'{{{v}!r}} does not match ' + {self.constant(repr(pattern))}", depth + 1
+        )
+
+    def _kw_format(self, format: str, schema: dict, v: str, path: tuple[str, ...], depth: int) -> None:
+        # Mirror jsonschema: formats without a registered checker always pass
+        if self.format_checker is None or format not in self.format_checker.checkers:
+            return
+        self.emit(f"if not _format_conforms({v}, {format!r}):", depth)
+        self.error(path, "format", format, f"f'{{{v}!r}} is not a ' + {self.constant(repr(format))}", depth + 1)
+
+    def _length(self, keyword: str, limit: int, kind: str, v: str, path: tuple[str, ...], depth: int) -> None:
+        isinstance_check = _TYPE_CHECKS[kind].format(v=v)
+        if keyword.startswith("min"):
+            self.emit(f"if {isinstance_check} and len({v}) < {limit!r}:", depth)
+            message = "should be non-empty" if limit == 1 else "is too short"
+        else:
+            self.emit(f"if {isinstance_check} and len({v}) > {limit!r}:", depth)
+            message = "is expected to be empty" if limit == 0 else "is too long"
+        self.error(path, keyword, limit, f"f'{{{v}!r}} ' + {self.constant(message)}", depth + 1)
+
+    def _kw_minLength(self, limit: int, schema: dict, v: str, path: tuple[str, ...], depth: int) -> None:
+        self._length("minLength", limit, "string", v, path, depth)
+
+    def _kw_maxLength(self, limit: int, schema: dict, v: str, path: tuple[str, ...], depth: int) -> None:
+        self._length("maxLength", limit, "string", v, path, depth)
+
+    def _kw_minItems(self, limit: int, schema: dict, v: str, path: tuple[str, ...], depth: int) -> None:
+        self._length("minItems", limit, "array", v, path, depth)
+
+    def _kw_maxItems(self, limit: int, schema: dict, v: str, path: tuple[str, ...], depth: int) -> None:
+        self._length("maxItems", limit, "array", v, path, depth)
+
+    def _kw_uniqueItems(self, unique: bool, schema: dict, v: str, path: tuple[str, ...], depth: int) -> None:
+        if not unique:
+            return
+        self.emit(f"if isinstance({v}, list) and not _uniq({v}):", depth)
+        self.error(path, "uniqueItems", unique, f"f'{{{v}!r}} has non-unique elements'", depth + 1)
+
+    def _kw_items(self, items: Any, schema: dict, v: str, path: tuple[str, ...], depth: int) -> None:
+        if "prefixItems" in schema or isinstance(items, bool):
+            raise SchemaCompilationError("Only single-schema 'items' is supported")
+        index, item = self.variable("i"), self.variable()
+        self.emit(f"if isinstance({v}, list):", depth)
+        self.emit(f"for {index}, {item} in enumerate({v}):", depth + 1)
+        start = len(self.lines)
+        self.schema(items, item, (*path, index), depth + 2)
+        if len(self.lines) == start:
+            self.emit("pass", depth + 2)
+
+    def _kw_properties(self, properties: dict, schema: dict, v: str, path: tuple[str, ...], depth: int) -> None:
+        self.emit(f"if isinstance({v}, dict):", depth)
+        start = len(self.lines)
+        for name, subschema in properties.items():
+            child = self.variable()
+            before = len(self.lines)
+            self.emit(f"if {name!r} in {v}:", depth + 1)
+            self.emit(f"{child} = {v}[{name!r}]", depth + 2)
+            body = len(self.lines)
+            self.schema(subschema, child, (*path, repr(name)), depth + 2)
+            if len(self.lines) == body:
+                del self.lines[before:]
+        if len(self.lines) == start:
+            self.emit("pass", depth + 1)
+
+    def _kw_required(self, required: list, schema: dict, v: str, path: tuple[str, ...], depth: int) -> None:
+        self.emit(f"if isinstance({v}, dict):", depth)
+        for name in required:
+            self.emit(f"if {name!r} not in {v}:", depth + 1)
+            self.error(path, "required", required, self.constant(f"{name!r} is a required property"), depth + 2)
+        if not required:
+            self.emit("pass", depth + 1)
+
+    def _kw_additionalProperties(
+        self, additional: Any, schema: dict, v: str, path: tuple[str, ...], depth: int
+    ) -> None:
+        if "patternProperties" in schema:
+            raise SchemaCompilationError("'patternProperties' is not supported")
+        if additional is True or additional == {}:
+            return
+        known = self.constant(frozenset(schema.get("properties", {})))
+        extras, extra = self.variable("extras"), self.variable()
+        self.emit(f"if isinstance({v}, dict):", depth)
+        self.emit(f"{extras} = [k for k in {v} if k not in {known}]", depth + 1)
+        if additional is False:
+            self.emit(f"if {extras}:", depth + 1)
+            self.emit(f"{extras}.sort(key=str)", depth + 2)
+            message = (
+                f"'Additional properties are not allowed (%s %s unexpected)' % "
+                f"(', '.join(repr(k) for k in {extras}), 'was' if len({extras}) == 1 else 'were')"
+            )
+            self.error(path, "additionalProperties", False, message, depth + 2)
+        else:
+            self.emit(f"for {extra} in {extras}:", depth + 1)
+            child = self.variable()
+            self.emit(f"{child} = {v}[{extra}]", depth + 2)
+            self.schema(additional, child, (*path, extra), depth + 2)
+
+
+def compile_schema(schema: dict[str, Any], format_checker: Any = None) -> Callable[[Any], list[SchemaViolation]]:
+    """
+    Compile a JSON schema into a specialised validation function.
+
+    Args:
+        schema: JSON schema dictionary (Draft 2020-12 subset)
+        format_checker: jsonschema FormatChecker used for "format" keywords (optional)
+
+    Returns:
+        Function taking an instance and returning the list of SchemaViolation
+        found, in the order the jsonschema interpreter would report them. The
+        generated source is available as its ``source`` attribute.
+
+    Raises:
+        SchemaCompilationError: If the schema uses unsupported keywords
+    """
+    emitter = _Emitter(format_checker)
+    emitter.emit("def validate(instance):", 0)
+    emitter.emit("_errors = []", 1)
+    emitter.schema(schema, "instance", (), 1)
+    emitter.emit("return _errors", 1)
+    source = "\n".join(emitter.lines) + "\n"
+
+    namespace: dict[str, Any] = {
+        "_Violation": SchemaViolation,
+        "_Number": numbers.Number,
+        "_equal": _equal,
+        "_uniq": _uniq,
+        "_format_conforms": format_checker.conforms if format_checker is not None else None,
+        **emitter.constants,
+    }
+    exec(compile(source, "<registry-schema-validator>", "exec"), namespace)
+    validate = namespace["validate"]
+    validate.source = source
+    return validate
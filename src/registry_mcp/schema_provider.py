@@ -0,0 +1,284 @@
+"""
+Registry schema provider.
+
+Loads the registry JSON schema from a configurable URL or local file, keeps a
+copy on disk together with its ETag/Last-Modified validators, revalidates it
+with conditional requests at most once per interval and falls back to the
+bundled schema when the source is unreachable.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REVALIDATE_INTERVAL = 3600.0
+
+
+def get_schema_version(schema: dict[str, Any]) -> str:
+    """
+    Compute a stable version identifier for a registry schema.
+
+    Args:
+        schema: JSON schema dictionary
+
+    Returns:
+        Short hex digest of the canonical JSON serialisation of the schema
+    """
+    canonical = json.dumps(schema, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
+
+
+def default_cache_dir() -> str:
+    """
+    Get the directory used for on-disk caches.
+
+    Returns:
+        REGISTRY_MCP_CACHE_DIR if set, otherwise registry-mcp under the XDG cache directory
+    """
+    if os.environ.get("REGISTRY_MCP_CACHE_DIR"):
+        return os.environ["REGISTRY_MCP_CACHE_DIR"]
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "registry-mcp")
+
+
+class SchemaProvider:
+    """
+    Provide the registry schema from a URL, a local file or the bundled copy.
+
+    Args:
+        fallback: Callable returning the bundled schema, used when no source is
+            configured or the source cannot be loaded
+        source: URL (http/https/file) or local path of the schema, None for the bundled schema
+        cache_dir: Directory for the on-disk copy of remote schemas
+        revalidate_interval: Minimum number of seconds between two checks of the source
+        timeout: Timeout in seconds for requests to the source
+        timer: Wall clock used for revalidation intervals, injectable for tests
+    """
+
+    def __init__(
+        self,
+        fallback: Callable[[], dict[str, Any]],
+        source: str | None = None,
+        cache_dir: str | None = None,
+        revalidate_interval: float = DEFAULT_REVALIDATE_INTERVAL,
+        timeout: float = 10.0,
+        timer: Callable[[], float] = time.time,
+    ):
+        if source and source.startswith("file://"):
+            source = source[len("file://") :]
+        self.source = source or None
+        self.is_remote = bool(self.source) and self.source.startswith(("http://", "https://"))
+        self.cache_dir = cache_dir or default_cache_dir()
+        self.revalidate_interval = revalidate_interval
+        self.timeout = timeout
+        self._fallback = fallback
+        self._timer = timer
+        self._lock = threading.Lock()
+
+        self._schema: dict[str, Any] | None = None
+        self._version: str | None = None
+        self._origin = "bundled"
+        self._meta: dict[str, Any] = {}
+        self._checked_at: float | None = None
+        self._revalidating = False
+
+    @classmethod
+    def from_env(cls, fallback: Callable[[], dict[str, Any]]) -> "SchemaProvider":
+        """
+        Create a provider configured from environment variables.
+
+        REGISTRY_MCP_SCHEMA_SOURCE selects the schema URL or file (bundled schema
+        if unset), REGISTRY_MCP_SCHEMA_REVALIDATE_INTERVAL the revalidation
+        interval in seconds and REGISTRY_MCP_CACHE_DIR the on-disk cache location.
+
+        Args:
+            fallback: Callable returning the bundled schema
+
+        Returns:
+            Configured SchemaProvider
+        """
+        return cls(
+            fallback,
+            source=os.environ.get("REGISTRY_MCP_SCHEMA_SOURCE"),
+            revalidate_interval=float(
+                os.environ.get("REGISTRY_MCP_SCHEMA_REVALIDATE_INTERVAL", DEFAULT_REVALIDATE_INTERVAL)
+            ),
+        )
+
+    @property
+    def cache_path(self) -> str:
+        """Path of the on-disk schema copy for the configured source."""
+        key = hashlib.sha256((self.source or "").encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self.cache_dir, f"schema-{key}.json")
+
+    def current(self) -> tuple[str, dict[str, Any]]:
+        """
+        Get the current schema version and schema, revalidating the source if due.
+
+        Only one thread revalidates at a time, without holding the lock; the
+        others keep getting the current schema meanwhile. The returned schema is
+        shared and must not be modified.
+
+        Returns:
+            Tuple of (schema version, schema)
+        """
+        with self._lock:
+            if self._schema is None:
+                self._load_initial()
+            due = self._checked_at is None or self._timer() - self._checked_at >= self.revalidate_interval
+            if not self.source or self._revalidating or not due:
+                return self._version, self._schema
+            self._revalidating = True
+            self._checked_at = self._timer()
+            current = (self._schema, self._origin, dict(self._meta), self._checked_at)
+
+        update = None
+        try:
+            update = self._revalidate(*current)
+        finally:
+            with self._lock:
+                self._revalidating = False
+                if update is not None:
+                    schema, origin, self._meta = update
+                    previous = self._version
+                    self._set_schema(schema, origin)
+                    if previous != self._version:
+                        logger.info("Registry schema updated from %s (version %s)", self.source, self._version)
+                version, schema = self._version, self._schema
+        return version, schema
+
+    def get_schema(self) -> dict[str, Any]:
+        """
+        Get the current schema (shared, must not be modified).
+
+        Returns:
+            Dict containing the JSON schema for registry submissions
+        """
+        return self.current()[1]
+
+    @property
+    def version(self) -> str:
+        """Version identifier of the current schema."""
+        return self.current()[0]
+
+    def status(self) -> dict[str, Any]:
+        """
+        Get information about where the current schema comes from.
+
+        Returns:
+            Dict containing source, origin (bundled, cache, file or remote), version and HTTP validators
+        """
+        version, _ = self.current()
+        return {
+            "source": self.source or "bundled",
+            "origin": self._origin,
+            "version": version,
+            "etag": self._meta.get("etag"),
+            "last_modified": self._meta.get("last_modified"),
+            "fetched_at": self._meta.get("fetched_at"),
+            "checked_at": self._checked_at,
+            "revalidate_interval": self.revalidate_interval,
+        }
+
+    def _set_schema(self, schema: dict[str, Any], origin: str) -> None:
+        self._schema = schema
+        self._version = get_schema_version(schema)
+        self._origin = origin
+
+    def _load_initial(self) -> None:
+        if self.is_remote:
+            cached = self._read_cache()
+            if cached is not None:
+                schema, self._meta = cached
+                self._set_schema(schema, "cache")
+                self._checked_at = self._meta.get("checked_at")
+                return
+        self._set_schema(self._fallback(), "bundled")
+
+    def _revalidate(
+        self, schema: dict[str, Any], origin: str, meta: dict[str, Any], checked_at: float
+    ) -> tuple[dict[str, Any], str, dict[str, Any]] | None:
+        # Runs without the lock, on a snapshot of the current state; returns the new state, if any
+        try:
+            if self.is_remote:
+                return self._revalidate_remote(schema, origin, meta, checked_at)
+            return self._revalidate_file(origin, meta)
+        except (OSError, ValueError, requests.exceptions.RequestException) as e:
+            logger.warning("Could not load registry schema from %s, using %s copy: %s", self.source, origin, e)
+            return None
+
+    def _revalidate_file(self, origin: str, meta: dict[str, Any]) -> tuple[dict[str, Any], str, dict[str, Any]] | None:
+        mtime = os.stat(self.source).st_mtime_ns
+        if origin == "file" and meta.get("mtime_ns") == mtime:
+            return None
+        with open(self.source, encoding="utf-8") as f:
+            schema = _check_schema(json.load(f))
+        return schema, "file", {"mtime_ns": mtime, "fetched_at": self._timer()}
+
+    def _revalidate_remote(
+        self, schema: dict[str, Any], origin: str, meta: dict[str, Any], checked_at: float
+    ) -> tuple[dict[str, Any], str, dict[str, Any]]:
+        headers = {"Accept": "application/schema+json, application/json"}
+        if origin == "cache" or origin == "remote":
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+
+        response = requests.get(self.source, headers=headers, timeout=self.timeout)
+        if response.status_code == 304:
+            meta = {**meta, "checked_at": checked_at}
+            self._write_cache(schema, meta)
+            return schema, origin, meta
+        response.raise_for_status()
+
+        schema = _check_schema(response.json())
+        meta = {
+            "url": self.source,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "fetched_at": checked_at,
+            "checked_at": checked_at,
+        }
+        self._write_cache(schema, meta)
+        return schema, "remote", meta
+
+    def _read_cache(self) -> tuple[dict[str, Any], dict[str, Any]] | None:
+        try:
+            with open(self.cache_path, encoding="utf-8") as f:
+                cached = json.load(f)
+            return _check_schema(cached["schema"]), cached.get("meta", {})
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _write_cache(self, schema: dict[str, Any], meta: dict[str, Any]) -> None:
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"meta": meta, "schema": schema}, f)
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            logger.warning("Could not write registry schema cache %s: %s", self.cache_path, e)
+
+
+def _check_schema(schema: Any) -> dict[str, Any]:
+    from jsonschema import Draft202012Validator
+    from jsonschema.exceptions import SchemaError
+
+    if not isinstance(schema, dict) or not isinstance(schema.get("properties"), dict):
+        raise ValueError("Registry schema must be a JSON object with 'properties'")
+    try:
+        Draft202012Validator.check_schema(schema)
+    except SchemaError as e:
+        raise ValueError(f"Registry schema is not a valid JSON schema: {e.message}") from e
+    return schema
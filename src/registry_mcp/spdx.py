@@ -0,0 +1,373 @@
+"""
+Offline SPDX license identification.
+
+License files are matched against a bundled index of SPDX license texts. Each
+text is normalised (lower-cased, copyright lines and punctuation removed,
+spelling variants unified) and split into overlapping word shingles, which
+are stored as 32-bit hashes. At match time the shingles of the project's
+LICENSE file are looked up in an inverted index built once from the bundled
+data, so identifying a license takes a single pass over the file instead of a
+diff against every license text.
+
+The index is generated from SPDX license-list-data with
+scripts/build_spdx_index.py.
+"""
+
+import base64
+import json
+import re
+import sys
+import threading
+import zlib
+from array import array
+from collections.abc import Iterable
+from importlib import resources
+from typing import Any, NamedTuple
+
+SPDX_URL = "https://spdx.org/licenses/{}.html"
+
+# Number of words per shingle
+SHINGLE_SIZE = 5
+
+# Matches below this confidence are not reported
+MIN_CONFIDENCE = 0.5
+
+_WORD = re.compile(r"[a-z0-9]+")
+# Copyright statements, which differ between copies of the same license (but not
+# wrapped license text such as "copyright notice and this permission notice ...")
+_COPYRIGHT_LINE = re.compile(
+    r"^\W*(?:copyright\b(?!\s+(?:notice|holder|owner|law|interest|and|or|license|statement|protection)s?\b)"
+    r"|\(c\)|©|all rights reserved)",
+    re.IGNORECASE,
+)
+# Spelling variants that do not change the meaning of a license
+_EQUIVALENT_WORDS = {
+    "licence": "license",
+    "licences": "licenses",
+    "licenced": "licensed",
+    "https": "http",
+    "www": "",
+    "sublicence": "sublicense",
+    "organisation": "organization",
+    "nonfringement": "noninfringement",
+    "noninfringment": "noninfringement",
+}
+
+# Common license names used in package manifests that are not SPDX identifiers
+_LICENSE_ALIASES = {
+    "apache": "Apache-2.0",
+    "apache 2": "Apache-2.0",
+    "apache 2.0": "Apache-2.0",
+    "apache-2": "Apache-2.0",
+    "apache2": "Apache-2.0",
+    "apache license 2.0": "Apache-2.0",
+    "apache license (== 2.0)": "Apache-2.0",
+    "apache license, version 2.0": "Apache-2.0",
+    "apache software license": "Apache-2.0",
+    "mit license": "MIT",
+    "mit + file license": "MIT",
+    "the mit license": "MIT",
+    "expat": "MIT",
+    "bsd": "BSD-3-Clause",
+    "new bsd": "BSD-3-Clause",
+    "bsd license": "BSD-3-Clause",
+    "bsd_3_clause": "BSD-3-Clause",
+    "bsd_3_clause + file license": "BSD-3-Clause",
+    "bsd_2_clause": "BSD-2-Clause",
+    "bsd_2_clause + file license": "BSD-2-Clause",
+    "simplified bsd": "BSD-2-Clause",
+    "isc license": "ISC",
+    "mpl 2.0": "MPL-2.0",
+    "mpl-2": "MPL-2.0",
+    "unlicense": "Unlicense",
+    "gpl-2": "GPL-2.0-only",
+    "gpl-3": "GPL-3.0-only",
+    "gpl (>= 2)": "GPL-2.0-or-later",
+    "gpl (>= 3)": "GPL-3.0-or-later",
+    "gpl (>= 2.0)": "GPL-2.0-or-later",
+    "gpl (>= 3.0)": "GPL-3.0-or-later",
+    "gpl-2 | gpl-3": "GPL-2.0-or-later",
+    "gpl": "GPL-3.0-or-later",
+    "gplv2": "GPL-2.0-only",
+    "gplv3": "GPL-3.0-only",
+    "lgpl-3": "LGPL-3.0-only",
+    "lgpl (>= 2.1)": "LGPL-2.1-or-later",
+    "lgpl (>= 3)": "LGPL-3.0-or-later",
+    "agpl-3": "AGPL-3.0-only",
+    "agplv3": "AGPL-3.0-only",
+    "cc0": "CC0-1.0",
+    "public domain": "Unlicense",
+    # Deprecated identifiers that mean the -only variant
+    "gpl-2.0": "GPL-2.0-only",
+    "gpl-3.0": "GPL-3.0-only",
+    "lgpl-2.1": "LGPL-2.1-only",
+    "lgpl-3.0": "LGPL-3.0-only",
+    "agpl-3.0": "AGPL-3.0-only",
+}
+
+_INDEX = None
+_INDEX_LOCK = threading.Lock()
+
+
+class LicenseMatch(NamedTuple):
+    """
+    Result of matching a license text against the index.
+
+    Attributes:
+        spdx_id: SPDX license identifier
+        name: Full name of the license
+        url: SPDX license URL as used by the registry schema
+        confidence: Similarity of the text and the license (0 to 1)
+    """
+
+    spdx_id: str
+    name: str
+    url: str
+    confidence: float
+
+
+def normalize_license_text(text: str) -> list[str]:
+    """
+    Normalise a license text to a list of words.
+
+    Copyright lines, punctuation, list numbering and single letters are dropped
+    and spelling variants unified, so copies of a license that differ only in
+    formatting and copyright holder normalise to the same words.
+
+    Args:
+        text: License text
+
+    Returns:
+        List of normalised words
+    """
+    words = []
+    for line in text.splitlines():
+        if _COPYRIGHT_LINE.match(line):
+            continue
+        for word in _WORD.findall(line.lower()):
+            word = _EQUIVALENT_WORDS.get(word, word)
+            if len(word) > 1 and not (word.isdigit() and len(word) < 3):
+                words.append(word)
+    return words
+
+
+def license_shingles(text: str, size: int = SHINGLE_SIZE) -> set[int]:
+    """
+    Compute the shingle hashes of a license text.
+
+    Args:
+        text: License text
+        size: Number of words per shingle
+
+    Returns:
+        Set of CRC-32 hashes of the overlapping word shingles
+    """
+    words = normalize_license_text(text)
+    return (
+        {zlib.crc32(" ".join(words[i : i + size]).encode("ascii")) for i in range(max(1, len(words) - size + 1))}
+        if words
+        else set()
+    )
+
+
+def _encode_hashes(hashes: Iterable[int]) -> str:
+    values = array("I", sorted(hashes))
+    if sys.byteorder == "big":
+        values.byteswap()
+    return base64.b64encode(values.tobytes()).decode("ascii")
+
+
+def _decode_hashes(data: str) -> array:
+    values = array("I")
+    values.frombytes(base64.b64decode(data))
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+def build_license_index(texts: dict[str, tuple[str, str]], license_ids: Iterable[str] = ()) -> dict[str, Any]:
+    """
+    Build the serialisable license index.
+
+    Args:
+        texts: License texts to match against, as {SPDX id: (name, text)}
+        license_ids: All known SPDX identifiers, used to recognise declared licenses
+
+    Returns:
+        JSON-serialisable index
+    """
+    return {
+        "shingle_size": SHINGLE_SIZE,
+        "licenses": {
+            spdx_id: {"name": name, "shingles": _encode_hashes(license_shingles(text))}
+            for spdx_id, (name, text) in sorted(texts.items())
+        },
+        "license_ids": sorted(set(license_ids) | set(texts)),
+    }
+
+
+class LicenseIndex:
+    """
+    Inverted index of license shingles.
+
+    Args:
+        data: Index as built by build_license_index
+    """
+
+    def __init__(self, data: dict[str, Any]):
+        self.shingle_size = data.get("shingle_size", SHINGLE_SIZE)
+        self.licenses: list[tuple[str, str, int]] = []
+        self._postings: dict[int, list[int]] = {}
+        for number, (spdx_id, entry) in enumerate(data.get("licenses", {}).items()):
+            hashes = _decode_hashes(entry["shingles"])
+            self.licenses.append((spdx_id, entry.get("name", spdx_id), len(hashes)))
+            for value in hashes:
+                self._postings.setdefault(value, []).append(number)
+        self.license_ids = {spdx_id.lower(): spdx_id for spdx_id in data.get("license_ids", [])}
+        self.license_ids.update((spdx_id.lower(), spdx_id) for spdx_id, _, _ in self.licenses)
+
+    @classmethod
+    def load(cls) -> "LicenseIndex":
+        """
+        Load the index bundled with the package.
+
+        Returns:
+            LicenseIndex of the bundled SPDX license texts
+        """
+        path = resources.files("registry_mcp").joinpath("data", "spdx_index.json")
+        with path.open("r", encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def matches(self, text: str, limit: int = 3) -> list[LicenseMatch]:
+        """
+        Rank the indexed licenses by similarity to a text.
+
+        The confidence is the Dice coefficient of the license's shingles and
+        the shingles of the text that occur in any indexed license. Text that
+        belongs to no indexed license (e.g. a preamble naming the project) is
+        ignored, while missing or altered parts of the license and a second
+        license in the same file lower the confidence.
+
+        Args:
+            text: License text
+            limit: Maximum number of matches
+
+        Returns:
+            Best matches, most similar first
+        """
+        counts: dict[int, int] = {}
+        known = 0
+        for value in license_shingles(text, self.shingle_size):
+            postings = self._postings.get(value)
+            if postings:
+                known += 1
+                for number in postings:
+                    counts[number] = counts.get(number, 0) + 1
+        ranked = []
+        for number, count in counts.items():
+            spdx_id, name, size = self.licenses[number]
+            confidence = 2 * count / (size + known)
+            ranked.append(LicenseMatch(spdx_id, name, SPDX_URL.format(spdx_id), round(confidence, 3)))
+        ranked.sort(key=lambda match: match.confidence, reverse=True)
+        return ranked[:limit]
+
+    def identify(self, text: str, min_confidence: float = MIN_CONFIDENCE) -> LicenseMatch | None:
+        """
+        Identify the license of a text.
+
+        Args:
+            text: License text
+            min_confidence: Minimum confidence of a match
+
+        Returns:
+            Best match, or None if no license matches with at least min_confidence
+        """
+        matches = self.matches(text, limit=1)
+        return matches[0] if matches and matches[0].confidence >= min_confidence else None
+
+    def license_id(self, value: Any) -> str | None:
+        """
+        Normalise a declared license to an SPDX identifier.
+
+        Accepts SPDX identifiers and expressions ("MIT OR Apache-2.0", the first
+        license is used), SPDX and opensource.org license URLs, common names used
+        in package manifests ("Apache License 2.0", "GPL (>= 3)", "MIT + file
+        LICENSE") and dicts with an "@id", "url", "identifier", "type" or "text" key.
+
+        Args:
+            value: Declared license
+
+        Returns:
+            SPDX identifier, or None if the value is not a recognised license
+        """
+        if isinstance(value, dict):
+            for key in ("@id", "url", "identifier", "spdx", "type", "text"):
+                if isinstance(value.get(key), str):
+                    return self.license_id(value[key])
+            return None
+        if not isinstance(value, str) or not value.strip():
+            return None
+        value = value.strip()
+        url = re.match(
+            r"^https?://(?:www\.)?(?:spdx\.org/licenses|opensource\.org/licenses?)/([^/?#]+?)(?:\.html|\.php)?/?$",
+            value,
+        )
+        if url:
+            value = url.group(1)
+        alias = _LICENSE_ALIASES.get(value.lower())
+        if alias:
+            return alias
+        for token in re.split(r"[\s()/,;|]+", value):
+            if not token:
+                continue
+            or_later = token.endswith("+")
+            spdx_id = None if or_later else _LICENSE_ALIASES.get(token.lower())
+            spdx_id = spdx_id or self.license_ids.get(token.rstrip("+").lower())
+            if spdx_id:
+                if or_later and f"{spdx_id}-or-later".lower() in self.license_ids:
+                    return self.license_ids[f"{spdx_id}-or-later".lower()]
+                return spdx_id
+        return None
+
+
+def get_license_index() -> LicenseIndex:
+    """
+    Get the shared license index, loading it on first use.
+
+    Returns:
+        LicenseIndex of the bundled SPDX license texts
+    """
+    global _INDEX
+    if _INDEX is None:
+        with _INDEX_LOCK:
+            if _INDEX is None:
+                _INDEX = LicenseIndex.load()
+    return _INDEX
+
+
+def identify_license(text: str, min_confidence: float = MIN_CONFIDENCE) -> LicenseMatch | None:
+    """
+    Identify the SPDX license of a license text with the bundled index.
+
+    Args:
+        text: License text
+        min_confidence: Minimum confidence of a match
+
+    Returns:
+        Best match, or None if no license matches with at least min_confidence
+    """
+    return get_license_index().identify(text, min_confidence)
+
+
+def spdx_license_url(value: Any) -> str | None:
+    """
+    Normalise a declared license to the SPDX license URL expected by the registry schema.
+
+    Args:
+        value: Declared license (see LicenseIndex.license_id)
+
+    Returns:
+        https://spdx.org/licenses/<id>.html URL, or None if the value is not a recognised license
+    """
+    spdx_id = get_license_index().license_id(value)
+    return SPDX_URL.format(spdx_id) if spdx_id else None
@@ -4,8 +4,16 @@ from .registry_submission import (
     generate_yaml_template_tool,
     validate_yaml_specification_tool,
     submit_to_registry_tool,
-    get_registry_schema_tool
+    get_registry_schema_tool,
+    get_validation_cache_stats_tool,
+    get_registry_schema_status_tool,
+    get_registry_http_stats_tool,
+    get_submission_history_tool,
+    get_submission_queue_tool,
+    get_yaml_backend_tool
 )
+from .registry_batch import validate_yaml_specifications_tool, submit_yaml_files_tool, analyze_monorepo_tool
+from .registry_search import search_registry_tool
 from .registry_guidance import (
     get_registry_workflow_guidance_tool,
     get_example_submissions_tool,
@@ -20,6 +28,16 @@ __all__ = [
     "validate_yaml_specification_tool",
     "submit_to_registry_tool",
     "get_registry_schema_tool",
+    "get_validation_cache_stats_tool",
+    "get_registry_schema_status_tool",
+    "get_registry_http_stats_tool",
+    "get_submission_history_tool",
+    "get_submission_queue_tool",
+    "get_yaml_backend_tool",
+    "validate_yaml_specifications_tool",
+    "submit_yaml_files_tool",
+    "analyze_monorepo_tool",
+    "search_registry_tool",
     "get_registry_workflow_guidance_tool",
     "get_example_submissions_tool",
     "get_troubleshooting_guide_tool",
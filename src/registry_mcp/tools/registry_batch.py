@@ -0,0 +1,461 @@
+"""
+Batch tools for working with many registry entries at once.
+
+This module provides tools to validate many meta.yaml documents in a single
+call, to submit many of them at once and to analyze every MCP server of a
+monorepo, reusing the same checks as the single-document registry tools.
+"""
+
+import asyncio
+import functools
+import glob
+import os
+import threading
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any
+from urllib.parse import urlsplit
+
+from fastmcp import Context
+
+from registry_mcp.executor import get_tool_executor, run_blocking
+from registry_mcp.mcp import mcp
+from registry_mcp.project_scan import DEFAULT_MAX_DEPTH, DEFAULT_MAX_FILES, ProjectScan
+from registry_mcp.rate_limit import RateLimiter
+from registry_mcp.tools.registry_submission import (
+    SubmissionDocument,
+    analyze_project_directory,
+    submit_confirmed_document,
+    validate_yaml_specification,
+)
+
+DEFAULT_VALIDATION_WORKERS = int(os.environ.get("REGISTRY_MCP_VALIDATION_WORKERS", min(32, (os.cpu_count() or 1) + 4)))
+# Batches smaller than this are validated in the calling thread: validation is mostly
+# CPU-bound under the GIL, so extra threads only pay off for larger batches of files
+PARALLEL_VALIDATION_MIN = 16
+DEFAULT_SUBMIT_CONCURRENCY = int(os.environ.get("REGISTRY_MCP_BULK_CONCURRENCY", 4))
+# Submissions per second to one registry host, shared by all bulk submissions (0 for no limit)
+SUBMIT_RATE_LIMIT = float(os.environ.get("REGISTRY_MCP_BULK_RATE_LIMIT", 5))
+
+_RATE_LIMITERS: dict[str, tuple[asyncio.AbstractEventLoop, RateLimiter]] = {}
+
+
+def find_meta_yaml_files(path: str, pattern: str = "**/meta.yaml") -> list[str]:
+    """
+    Find meta.yaml files in a directory or matching a glob.
+
+    Args:
+        path: Directory to search in, or a glob pattern (e.g. "registry/servers/*/meta.yaml")
+        pattern: Glob pattern relative to path, used when path is a directory
+
+    Returns:
+        Sorted list of matching file paths
+    """
+    if os.path.isdir(path):
+        path = os.path.join(path, pattern)
+    return sorted(p for p in glob.glob(path, recursive=True) if os.path.isfile(p))
+
+
+def _validate_file(file_path: str, engine: str | None = None) -> dict[str, Any]:
+    try:
+        with open(file_path, encoding="utf-8") as f:
+            yaml_content = f.read()
+    except (OSError, UnicodeDecodeError) as e:
+        message = f"Could not read file: {e}"
+        return {
+            "valid": False,
+            "errors": [message],
+            "error_details": [{"path": "", "validator": "file", "expected": None, "message": message}],
+            "warnings": [],
+            "suggestions": [],
+        }
+    return validate_yaml_specification(yaml_content, engine=engine)
+
+
+def _run_jobs(jobs: list[Callable[[], Any]], workers: int) -> list[Any]:
+    # Runs the jobs on the calling thread and up to workers - 1 threads of the shared tool pool.
+    # Helpers still waiting for a free pool thread once the jobs are done are cancelled, so a
+    # batch running on the tool pool itself never waits for the pool.
+    results: list[Any] = [None] * len(jobs)
+    remaining = iter(range(len(jobs)))
+    lock = threading.Lock()
+
+    def work() -> None:
+        while True:
+            with lock:
+                index = next(remaining, None)
+            if index is None:
+                return
+            results[index] = jobs[index]()
+
+    helpers = [get_tool_executor().submit(work) for _ in range(workers - 1)]
+    work()
+    for helper in helpers:
+        if not helper.cancel():
+            helper.result()
+    return results
+
+
+def validate_yaml_specifications(
+    yaml_contents: list[str] | None = None,
+    path: str | None = None,
+    pattern: str = "**/meta.yaml",
+    max_workers: int | None = None,
+    engine: str | None = None,
+) -> dict[str, Any]:
+    """
+    Validate many YAML specifications against the registry schema in parallel.
+
+    Each document is validated with validate_yaml_specification, so results are
+    identical to validating the documents one by one. Batches of at least
+    PARALLEL_VALIDATION_MIN documents are spread over the shared tool pool.
+
+    Args:
+        yaml_contents: List of YAML contents as strings
+        path: Directory to search for meta.yaml files, or a glob pattern
+        pattern: Glob pattern relative to path, used when path is a directory
+        max_workers: Maximum number of documents validated at once (defaults to REGISTRY_MCP_VALIDATION_WORKERS)
+        engine: Schema validation engine, "jsonschema" or "compiled" (the code-generated
+            validator is considerably faster for large registry mirrors)
+
+    Returns:
+        Dict containing per-document validation results and an aggregate summary
+    """
+    jobs: list[tuple[str, Any]] = []
+    for index, yaml_content in enumerate(yaml_contents or []):
+        jobs.append(
+            (f"yaml_contents[{index}]", functools.partial(validate_yaml_specification, yaml_content, engine=engine))
+        )
+    if path is not None:
+        for file_path in find_meta_yaml_files(path, pattern):
+            jobs.append((file_path, functools.partial(_validate_file, file_path, engine=engine)))
+
+    workers = max(1, min(max_workers or DEFAULT_VALIDATION_WORKERS, len(jobs) or 1))
+    if len(jobs) < PARALLEL_VALIDATION_MIN:
+        workers = 1
+    validations = _run_jobs([job for _, job in jobs], workers)
+
+    results = [{"source": source, **validation} for (source, _), validation in zip(jobs, validations, strict=True)]
+    valid_count = sum(1 for result in results if result["valid"])
+
+    return {
+        "results": results,
+        "summary": {
+            "total": len(results),
+            "valid": valid_count,
+            "invalid": len(results) - valid_count,
+            "error_count": sum(len(result["errors"]) for result in results),
+            "warning_count": sum(len(result["warnings"]) for result in results),
+            "invalid_sources": [result["source"] for result in results if not result["valid"]],
+        },
+    }
+
+
+@mcp.tool
+async def validate_yaml_specifications_tool(
+    yaml_contents: list[str] | None = None,
+    path: str | None = None,
+    pattern: str = "**/meta.yaml",
+    max_workers: int | None = None,
+    engine: str | None = None,
+) -> dict[str, Any]:
+    """
+    Validate many YAML specifications against the registry schema in one call.
+
+    This tool accepts a list of YAML strings and/or a directory (or glob) of
+    meta.yaml files, validates all documents in parallel and returns the
+    per-document results together with an aggregate summary.
+
+    Args:
+        yaml_contents: List of YAML contents as strings
+        path: Directory to search for meta.yaml files, or a glob pattern
+        pattern: Glob pattern relative to path (defaults to "**/meta.yaml")
+        max_workers: Number of parallel validation workers (optional)
+        engine: Schema validation engine, "jsonschema" or "compiled" (optional)
+
+    Returns:
+        Dict containing per-document results and a summary of valid/invalid documents
+    """
+    return await run_blocking(validate_yaml_specifications, yaml_contents, path, pattern, max_workers, engine)
+
+
+def get_rate_limiter(host: str) -> RateLimiter:
+    """
+    Get the rate limiter of a registry host, creating it on first use.
+
+    Args:
+        host: Host (with port, if not the default one) of the registry API
+
+    Returns:
+        RateLimiter allowing REGISTRY_MCP_BULK_RATE_LIMIT submissions per second
+    """
+    loop = asyncio.get_running_loop()
+    entry = _RATE_LIMITERS.get(host)
+    if entry is None or entry[0] is not loop:
+        entry = _RATE_LIMITERS[host] = (loop, RateLimiter(SUBMIT_RATE_LIMIT, burst=max(1, int(SUBMIT_RATE_LIMIT))))
+    return entry[1]
+
+
+def _check_file_for_submission(file_path: str) -> tuple[SubmissionDocument | None, dict[str, Any]]:
+    outcome: dict[str, Any] = {
+        "file": file_path,
+        "identifier": None,
+        "status": "pending",
+        "message": "",
+        "submission_id": None,
+        "errors": [],
+    }
+    try:
+        document = SubmissionDocument.from_file(file_path)
+    except OSError as e:
+        outcome.update(status="invalid", message="Could not read file", errors=[str(e)])
+        return None, outcome
+    outcome["identifier"] = document.get("identifier")
+    validation = document.validate()
+    if not validation["valid"]:
+        outcome.update(status="invalid", message="Validation failed", errors=list(validation["errors"]))
+        return None, outcome
+    return document, outcome
+
+
+async def submit_yaml_files(
+    yaml_file_paths: list[str],
+    api_endpoint: str = "https://api.biocontext.ai/registry/submit",
+    max_concurrency: int | None = None,
+    stop_on_invalid: bool = True,
+    progress: Callable[[int, int, dict[str, Any]], Awaitable[None]] | None = None,
+) -> dict[str, Any]:
+    """
+    Submit many meta.yaml files to the registry API.
+
+    All files are read and validated first. Files that pass are then submitted
+    like confirm_and_submit_to_registry, with at most max_concurrency submissions
+    in flight and the request rate to the registry host limited by
+    REGISTRY_MCP_BULK_RATE_LIMIT.
+
+    Args:
+        yaml_file_paths: Paths of the meta.yaml files, each with user_confirmed: false
+        api_endpoint: Registry API endpoint URL
+        max_concurrency: Maximum number of concurrent submissions (defaults to REGISTRY_MCP_BULK_CONCURRENCY)
+        stop_on_invalid: Whether to submit nothing if any file is invalid
+        progress: Coroutine function called with (completed, total, outcome) after each submission
+
+    Returns:
+        Dict containing one outcome per file, in input order, and a summary. The status of
+        an outcome is "submitted", "queued" (failed, retried in the background), "failed", "invalid",
+        "skipped" (already submitted or confirmed) or "not_submitted" (valid, but another file was invalid)
+    """
+    start = time.perf_counter()
+    paths = list(dict.fromkeys(os.path.abspath(path) for path in yaml_file_paths))
+    checks = await asyncio.gather(*(run_blocking(_check_file_for_submission, path) for path in paths))
+    outcomes = [outcome for _, outcome in checks]
+    pending = [(document, outcome) for document, outcome in checks if document is not None]
+
+    if stop_on_invalid and any(outcome["status"] == "invalid" for outcome in outcomes):
+        for _, outcome in pending:
+            outcome.update(status="not_submitted", message="Not submitted because other files are invalid")
+        pending = []
+
+    semaphore = asyncio.Semaphore(max(1, max_concurrency or DEFAULT_SUBMIT_CONCURRENCY))
+    limiter = get_rate_limiter(urlsplit(api_endpoint).netloc)
+
+    async def submit(document: SubmissionDocument, outcome: dict[str, Any]) -> dict[str, Any]:
+        async with semaphore:
+            try:
+                # Only submissions that send a request use up a token; skipped ones are not throttled
+                result = await submit_confirmed_document(document, outcome["file"], api_endpoint, limiter.acquire)
+            except Exception as e:  # noqa: BLE001 - one failing file must not abort the outcomes of the others
+                result = {"success": False, "message": f"Failed to process YAML file: {e}", "errors": [str(e)]}
+        outcome.update(
+            status="skipped"
+            if result.get("skipped")
+            else "submitted"
+            if result["success"]
+            else "queued"
+            if result.get("queued")
+            else "failed",
+            message=result["message"],
+            submission_id=result.get("submission_id"),
+            errors=list(result.get("errors", [])),
+        )
+        return outcome
+
+    completed = 0
+    for next_outcome in asyncio.as_completed([submit(document, outcome) for document, outcome in pending]):
+        outcome = await next_outcome
+        completed += 1
+        if progress is not None:
+            await progress(completed, len(pending), outcome)
+
+    statuses = [outcome["status"] for outcome in outcomes]
+    return {
+        "api_endpoint": api_endpoint,
+        "results": outcomes,
+        "summary": {
+            "total": len(outcomes),
+            **{
+                status: statuses.count(status)
+                for status in ("submitted", "queued", "failed", "invalid", "skipped", "not_submitted")
+            },
+            "elapsed_seconds": round(time.perf_counter() - start, 3),
+        },
+    }
+
+
+@mcp.tool
+async def submit_yaml_files_tool(
+    ctx: Context,
+    yaml_file_paths: list[str],
+    api_endpoint: str = "https://api.biocontext.ai/registry/submit",
+    max_concurrency: int | None = None,
+    stop_on_invalid: bool = True,
+) -> dict[str, Any]:
+    """
+    Submit many confirmed meta.yaml files to the registry API in one call.
+
+    This tool is the bulk counterpart of confirm_and_submit_to_registry_tool and
+    must only be called after the user has confirmed the submission of every
+    listed file. All files are validated first; then each one is submitted and
+    marked with user_confirmed: true, several at a time and rate limited per
+    registry host. Files already submitted unchanged are skipped. A progress
+    notification is sent after each submission.
+
+    Args:
+        yaml_file_paths: Paths of the meta.yaml files to submit
+        api_endpoint: Registry API endpoint URL (optional, defaults to BioContextAI API)
+        max_concurrency: Maximum number of concurrent submissions (optional)
+        stop_on_invalid: Submit nothing if any file is invalid (defaults to true)
+
+    Returns:
+        Dict containing the outcome (submitted, queued, failed, invalid, skipped, not_submitted) of every file and a summary
+    """
+
+    async def progress(completed: int, total: int, outcome: dict[str, Any]) -> None:
+        await ctx.report_progress(completed, total, message=f"{outcome['status']}: {outcome['file']}")
+
+    return await submit_yaml_files(yaml_file_paths, api_endpoint, max_concurrency, stop_on_invalid, progress)
+
+
+def _analyze_project_root(scan_root: str, project_root: str) -> dict[str, Any]:
+    analysis = analyze_project_directory(project_root)
+    analysis["relative_path"] = os.path.relpath(project_root, scan_root)
+    return analysis
+
+
+def iter_project_analyses(scan: ProjectScan, max_workers: int | None = None) -> Iterator[dict[str, Any]]:
+    """
+    Analyze every project root found by a scan, yielding results as they complete.
+
+    Project roots are analyzed on a thread pool while the walk is still running,
+    so the first results are available before the whole tree has been scanned.
+
+    Args:
+        scan: Scan of the directory tree
+        max_workers: Size of the worker pool (defaults to REGISTRY_MCP_VALIDATION_WORKERS)
+
+    Yields:
+        Analysis of each project root (see analyze_project_directory) with its relative_path
+    """
+    workers = max(1, max_workers or DEFAULT_VALIDATION_WORKERS)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="registry-scan") as executor:
+        pending = set()
+        for project_root in scan.roots():
+            pending.add(executor.submit(_analyze_project_root, scan.root, project_root))
+            done = {future for future in pending if future.done()}
+            pending -= done
+            for future in done:
+                yield future.result()
+        for future in as_completed(pending):
+            yield future.result()
+
+
+def _scan_summary(scan: ProjectScan, projects: list[dict[str, Any]]) -> dict[str, Any]:
+    return {
+        "projects": len(projects),
+        "directories_scanned": scan.directories,
+        "files_seen": scan.files,
+        "truncated": scan.truncated,
+        "missing_identifier": [p["relative_path"] for p in projects if not p["suggested_metadata"].get("identifier")],
+    }
+
+
+def analyze_monorepo(
+    root_path: str = ".",
+    max_depth: int | None = None,
+    max_files: int | None = None,
+    max_workers: int | None = None,
+) -> dict[str, Any]:
+    """
+    Discover and analyze every project (MCP server) in a directory tree.
+
+    Args:
+        root_path: Root of the monorepo
+        max_depth: Maximum directory depth to descend into (defaults to REGISTRY_MCP_SCAN_MAX_DEPTH)
+        max_files: Maximum number of files to visit (defaults to REGISTRY_MCP_SCAN_MAX_FILES)
+        max_workers: Number of projects analyzed in parallel
+
+    Returns:
+        Dict containing one analysis per project root, ordered by path, and a scan summary
+    """
+    scan = ProjectScan(
+        root_path,
+        DEFAULT_MAX_DEPTH if max_depth is None else max_depth,
+        DEFAULT_MAX_FILES if max_files is None else max_files,
+    )
+    projects = sorted(iter_project_analyses(scan, max_workers), key=lambda p: p["relative_path"])
+    return {"root_path": scan.root, "projects": projects, "summary": _scan_summary(scan, projects)}
+
+
+@mcp.tool
+async def analyze_monorepo_tool(
+    ctx: Context,
+    root_path: str = ".",
+    max_depth: int | None = None,
+    max_files: int | None = None,
+    max_workers: int | None = None,
+) -> dict[str, Any]:
+    """
+    Discover every MCP server in a monorepo and suggest metadata for each of them.
+
+    This tool walks the directory tree (skipping .git, node_modules, virtualenvs
+    and build directories), finds every package root and analyzes the roots in
+    parallel. Each analysis is streamed to the client as a log message as soon as
+    it completes, together with a progress notification; the final result
+    contains all analyses.
+
+    Args:
+        root_path: Root of the monorepo (defaults to current directory)
+        max_depth: Maximum directory depth to descend into (optional)
+        max_files: Maximum number of files to visit before stopping (optional)
+        max_workers: Number of projects analyzed in parallel (optional)
+
+    Returns:
+        Dict containing one analysis (suggested metadata block) per project and a scan summary
+    """
+    scan = ProjectScan(
+        root_path,
+        DEFAULT_MAX_DEPTH if max_depth is None else max_depth,
+        DEFAULT_MAX_FILES if max_files is None else max_files,
+    )
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+    done = object()
+
+    def produce() -> None:
+        try:
+            for analysis in iter_project_analyses(scan, max_workers):
+                loop.call_soon_threadsafe(queue.put_nowait, analysis)
+        finally:
+            loop.call_soon_threadsafe(queue.put_nowait, done)
+
+    producer = loop.run_in_executor(get_tool_executor(), produce)
+    projects = []
+    while (analysis := await queue.get()) is not done:
+        projects.append(analysis)
+        await ctx.report_progress(len(projects), message=f"Analyzed {analysis['relative_path']}")
+        await ctx.info(f"Analyzed project {analysis['relative_path']}", extra={"project": analysis})
+    await producer
+
+    projects.sort(key=lambda p: p["relative_path"])
+    return {"root_path": scan.root, "projects": projects, "summary": _scan_summary(scan, projects)}
@@ -0,0 +1,122 @@
+"""
+Registry search tools.
+
+This module provides a tool to search a local checkout of the registry by
+free text and by keyword, category, language, maintainer or identifier.
+"""
+
+import os
+from typing import Any
+
+from registry_mcp.executor import run_blocking
+from registry_mcp.mcp import mcp
+from registry_mcp.registry_index import DEFAULT_PATTERN, DEFAULT_REGISTRY_PATH, get_registry_index
+
+
+def search_registry(
+    query: str | None = None,
+    keywords: list[str] | None = None,
+    category: str | None = None,
+    language: str | None = None,
+    maintainer: str | None = None,
+    identifier: str | None = None,
+    offset: int = 0,
+    limit: int = 20,
+    registry_path: str | None = None,
+    pattern: str = DEFAULT_PATTERN,
+    refresh: bool = False,
+) -> dict[str, Any]:
+    """
+    Search the entries of a local registry checkout.
+
+    The index of the checkout is opened from its database on first use (see
+    registry_mcp.registry_store) and kept for later searches.
+
+    Args:
+        query: Free text; every word must occur in the identifier, name, keywords, description or featureList
+        keywords: Keywords that must all be present
+        category: Application category
+        language: Programming language
+        maintainer: Maintainer name
+        identifier: Exact identifier
+        offset: Number of matches to skip
+        limit: Maximum number of results per page
+        registry_path: Root of the registry checkout (defaults to REGISTRY_MCP_REGISTRY_PATH)
+        pattern: Glob pattern of the entries, relative to registry_path
+        refresh: Whether to sync the index with the checkout before searching
+
+    Returns:
+        Dict containing the total number of matches, a page of entries and index statistics
+
+    Raises:
+        ValueError: If no registry path is configured or it is not a directory
+    """
+    registry_path = registry_path or DEFAULT_REGISTRY_PATH
+    if not registry_path:
+        raise ValueError("No registry checkout given; pass registry_path or set REGISTRY_MCP_REGISTRY_PATH")
+    if not os.path.isdir(registry_path):
+        raise ValueError(f"Registry checkout not found: {registry_path}")
+
+    index = get_registry_index(registry_path, pattern, refresh)
+    result = index.search(
+        query,
+        offset=offset,
+        limit=limit,
+        keyword=keywords,
+        category=category,
+        language=language,
+        maintainer=maintainer,
+        identifier=identifier,
+    )
+    result["index"] = index.stats()
+    return result
+
+
+@mcp.tool
+async def search_registry_tool(
+    query: str | None = None,
+    keywords: list[str] | None = None,
+    category: str | None = None,
+    language: str | None = None,
+    maintainer: str | None = None,
+    identifier: str | None = None,
+    offset: int = 0,
+    limit: int = 20,
+    registry_path: str | None = None,
+    refresh: bool = False,
+) -> dict[str, Any]:
+    """
+    Search the entries of a local registry checkout.
+
+    Use this tool to find registered MCP servers, e.g. to check whether a server
+    is already registered or to look at similar entries before writing a new
+    meta.yaml. Filters are case-insensitive and combined; results are paginated.
+
+    Args:
+        query: Free-text search over identifier, name, keywords, description and features (optional)
+        keywords: Only entries with all of these keywords (optional)
+        category: Only entries of this applicationCategory (optional)
+        language: Only entries in this programmingLanguage (optional)
+        maintainer: Only entries maintained by this person or organization (optional)
+        identifier: Only the entry with this identifier (optional)
+        offset: Number of results to skip, for the next page (defaults to 0)
+        limit: Results per page (defaults to 20, at most 100)
+        registry_path: Root of the registry checkout (optional, defaults to REGISTRY_MCP_REGISTRY_PATH)
+        refresh: Sync the index with the checkout before searching, e.g. after a git pull (optional)
+
+    Returns:
+        Dict containing total, results (identifier, name, description, keywords, file, ...), next_offset and index statistics
+    """
+    return await run_blocking(
+        search_registry,
+        query,
+        keywords,
+        category,
+        language,
+        maintainer,
+        identifier,
+        offset,
+        limit,
+        registry_path,
+        refresh=refresh,
+    )
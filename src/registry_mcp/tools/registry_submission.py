@@ -5,21 +5,75 @@ This module provides tools to help users create, validate, and submit
 schema.org-compatible YAML specifications to the BioContextAI registry.
 """
 
+import copy
+import hashlib
+import json
+import logging
 import os
 import re
+import threading
 import yaml
+from collections.abc import Awaitable, Callable
 from typing import Any
-import requests
+import httpx
+from registry_mcp.cache import LRUCache
+from registry_mcp.executor import run_blocking
+from registry_mcp.http_client import get_http_stats, get_retry_policy, post_json
 from registry_mcp.mcp import mcp
+from registry_mcp.extractors import (
+    GIT_EXTRACTOR,
+    ExtractorResult,
+    applicable_extractors,
+    merge_suggestions,
+    repository_metadata,
+    run_extractors,
+)
+from registry_mcp.git_metadata import read_git_repository
+from registry_mcp.ledger import STATUS_SUBMITTED, get_submission_ledger
+from registry_mcp.outbox import OutboxWorker, get_submission_outbox
+from registry_mcp.languages import detect_languages
+from registry_mcp.project_files import ProjectFiles
+from registry_mcp.retry import CircuitOpenError, parse_retry_after
+from registry_mcp.schema_provider import SchemaProvider, get_schema_version
+from registry_mcp.spdx import SPDX_URL
+from registry_mcp.yaml_backend import dump_yaml, get_yaml_backend_info, load_yaml
 
+logger = logging.getLogger(__name__)
 
-def get_registry_schema() -> dict[str, Any]:
-    """
-    Get the registry schema definition for validation.
-    
-    Returns:
-        Dict containing the JSON schema for registry submissions
-    """
+# Schema validation engines: the generic jsonschema interpreter or a validator
+# code-generated from the registry schema (see registry_mcp.schema_compiler)
+VALIDATION_ENGINES = ("jsonschema", "compiled")
+DEFAULT_VALIDATION_ENGINE = os.environ.get("REGISTRY_MCP_VALIDATION_ENGINE", "jsonschema")
+
+# Compiled validators keyed by (engine, schema version), shared by all validation calls
+_REGISTRY_VALIDATORS: dict[tuple[str, str], Any] = {}
+_REGISTRY_VALIDATORS_LOCK = threading.RLock()
+
+# Validation results keyed by (schema version, engine, canonical content hash), plus an
+# alias cache mapping the hash of the raw YAML text to its canonical key
+_VALIDATION_CACHE_SIZE = int(os.environ.get("REGISTRY_MCP_VALIDATION_CACHE_SIZE", 1024))
+_VALIDATION_CACHE_TTL = float(os.environ["REGISTRY_MCP_VALIDATION_CACHE_TTL"]) if os.environ.get("REGISTRY_MCP_VALIDATION_CACHE_TTL") else None
+_VALIDATION_CACHE = LRUCache(maxsize=_VALIDATION_CACHE_SIZE, ttl=_VALIDATION_CACHE_TTL)
+_VALIDATION_CACHE_ALIASES = LRUCache(maxsize=_VALIDATION_CACHE_SIZE, ttl=_VALIDATION_CACHE_TTL)
+
+# Extractor results of analyzed projects keyed by absolute project path; each entry maps
+# an extractor name to (input file, (mtime_ns, size) of the input, result)
+_ANALYSIS_CACHE = LRUCache(maxsize=int(os.environ.get("REGISTRY_MCP_ANALYSIS_CACHE_SIZE", 128)))
+
+# Source language histograms keyed by project path; a changed file anywhere in the tree
+# cannot be detected without walking it, so entries expire instead
+_LANGUAGE_CACHE = LRUCache(
+    maxsize=int(os.environ.get("REGISTRY_MCP_ANALYSIS_CACHE_SIZE", 128)),
+    ttl=float(os.environ.get("REGISTRY_MCP_LANGUAGE_CACHE_TTL", 300)),
+)
+
+# Source of the registry schema, created from the environment on first use
+_SCHEMA_PROVIDER: SchemaProvider | None = None
+_SCHEMA_PROVIDER_LOCK = threading.Lock()
+
+
+def _bundled_registry_schema() -> dict[str, Any]:
+    """Registry schema bundled with this package, used when no schema source is configured or reachable."""
     return {
         "$schema": "https://json-schema.org/draft/2020-12/schema",
         "$id": "https://raw.githubusercontent.com/biocontext-ai/registry-dev/main/schema.json",
@@ -210,90 +264,269 @@ def get_registry_schema() -> dict[str, Any]:
     }
 
 
-def analyze_project_directory(project_path: str = ".") -> dict[str, Any]:
+def get_schema_provider() -> SchemaProvider:
+    """
+    Get the provider of the registry schema.
+    
+    The provider is configured from REGISTRY_MCP_SCHEMA_SOURCE (URL or file,
+    bundled schema if unset) on first use.
+    
+    Returns:
+        The shared SchemaProvider
+    """
+    global _SCHEMA_PROVIDER
+    if _SCHEMA_PROVIDER is None:
+        with _SCHEMA_PROVIDER_LOCK:
+            if _SCHEMA_PROVIDER is None:
+                _SCHEMA_PROVIDER = SchemaProvider.from_env(fallback=_bundled_registry_schema)
+    return _SCHEMA_PROVIDER
+
+
+def set_schema_provider(provider: SchemaProvider | None) -> None:
+    """
+    Replace the provider of the registry schema.
+    
+    Args:
+        provider: New SchemaProvider, or None to recreate it from the environment on next use
+    """
+    global _SCHEMA_PROVIDER
+    with _SCHEMA_PROVIDER_LOCK:
+        _SCHEMA_PROVIDER = provider
+
+
+def get_registry_schema() -> dict[str, Any]:
+    """
+    Get the registry schema definition for validation.
+    
+    Returns:
+        Dict containing the JSON schema for registry submissions
+    """
+    return copy.deepcopy(get_schema_provider().get_schema())
+
+
+def _get_cached_validator(engine: str, schema: dict[str, Any] | None, build: Any) -> Any:
+    if schema is None:
+        version, schema = get_schema_provider().current()
+    else:
+        version = get_schema_version(schema)
+    
+    validator = _REGISTRY_VALIDATORS.get((engine, version))
+    if validator is None:
+        with _REGISTRY_VALIDATORS_LOCK:
+            validator = _REGISTRY_VALIDATORS.get((engine, version))
+            if validator is None:
+                validator = build(schema)
+                _REGISTRY_VALIDATORS[(engine, version)] = validator
+    return validator
+
+
+def _build_jsonschema_validator(schema: dict[str, Any]) -> Any:
+    from jsonschema import Draft202012Validator
+
+    Draft202012Validator.check_schema(schema)
+    return Draft202012Validator(schema, format_checker=Draft202012Validator.FORMAT_CHECKER)
+
+
+def _build_compiled_validator(schema: dict[str, Any]) -> Any:
+    from registry_mcp.schema_compiler import compile_schema
+
+    return compile_schema(schema, format_checker=get_registry_validator(schema).format_checker)
+
+
+def get_registry_validator(schema: dict[str, Any] | None = None) -> Any:
+    """
+    Get the compiled Draft 2020-12 validator for the registry schema.
+    
+    The schema is checked and the validator (including its format checker) is built
+    once per schema version; subsequent calls return the shared instance.
+    
+    Args:
+        schema: JSON schema to compile (defaults to the registry schema)
+        
+    Returns:
+        A jsonschema Draft202012Validator instance
+    """
+    return _get_cached_validator("jsonschema", schema, _build_jsonschema_validator)
+
+
+def get_compiled_registry_validator(schema: dict[str, Any] | None = None) -> Any:
+    """
+    Get the code-generated validator for the registry schema.
+    
+    The schema is translated into a specialised Python function once per schema
+    version. It reports the same violations as get_registry_validator.
+    
+    Args:
+        schema: JSON schema to compile (defaults to the registry schema)
+        
+    Returns:
+        Function returning a list of SchemaViolation for an instance
+    """
+    return _get_cached_validator("compiled", schema, _build_compiled_validator)
+
+
+def _schema_violations(yaml_data: Any, engine: str) -> list[Any]:
+    """Collect every schema violation with the selected engine, ordered by JSON pointer."""
+    from registry_mcp.schema_compiler import SchemaCompilationError, SchemaViolation
+
+    if engine not in VALIDATION_ENGINES:
+        raise ValueError(f"Unknown validation engine {engine!r} (expected one of {', '.join(VALIDATION_ENGINES)})")
+    
+    violations = None
+    if engine == "compiled":
+        try:
+            violations = get_compiled_registry_validator()(yaml_data)
+        except SchemaCompilationError as e:
+            logger.warning("Schema cannot be compiled, falling back to the jsonschema engine: %s", e)
+    if violations is None:
+        violations = [
+            SchemaViolation(tuple(e.absolute_path), e.validator, e.validator_value, e.message)
+            for e in get_registry_validator().iter_errors(yaml_data)
+        ]
+    return sorted(violations, key=lambda violation: _json_pointer(violation.path))
+
+
+# Project files reported in detected_files (README and LICENSE variants are added separately)
+DETECTED_FILES = [
+    "pyproject.toml", "package.json", "Cargo.toml", "go.mod",
+    "requirements.txt", "setup.py", "setup.cfg", "DESCRIPTION",
+    "Project.toml", "CITATION.cff", "codemeta.json"
+]
+
+
+def analyze_project_directory(project_path: str = ".", use_cache: bool = True) -> dict[str, Any]:
     """
     Analyze the current project directory to extract metadata for registry submission.
     
+    Metadata is extracted from every supported manifest found in the project
+    (pyproject.toml, package.json, Cargo.toml, go.mod, DESCRIPTION, Project.toml,
+    setup.cfg, CITATION.cff, codemeta.json, README and LICENSE). The extractors
+    run concurrently and their suggestions are merged by precedence, so polyglot
+    projects get combined metadata in one call. Extractor results are cached per
+    project and reused while the (mtime, size) of their input file is unchanged,
+    so analyzing an unchanged project again reads no files. codeRepository and
+    identifier are taken from the origin remote of the git repository, parsed
+    from .git/config without running git. programming_language is ranked by the
+    byte share of the source files (see ``languages``), found by a bounded and,
+    for large trees, sampled walk of the project. Declared licenses are normalised to
+    SPDX license URLs and the LICENSE file is identified offline against a
+    bundled SPDX index (``license_detection`` holds the match and its confidence).
+    
     Args:
         project_path: Path to the project directory (defaults to current directory)
+        use_cache: Whether to use the analysis cache
         
     Returns:
-        Dict containing extracted project metadata
+        Dict containing extracted project metadata. ``metadata_sources`` lists
+        the files each suggested field was taken from, and ``git`` describes the
+        enclosing git repository, if any.
     """
     analysis = {
         "project_path": os.path.abspath(project_path),
         "detected_files": [],
         "suggested_metadata": {},
+        "metadata_sources": {},
         "warnings": [],
         "recommendations": []
     }
     
-    # Check for common project files
-    common_files = [
-        "pyproject.toml", "package.json", "Cargo.toml", "go.mod", 
-        "requirements.txt", "setup.py", "README.md", "LICENSE"
-    ]
+    # Index the project directory once; all file checks below are lookups in this index
+    files = ProjectFiles(project_path)
     
-    for file in common_files:
-        if os.path.exists(os.path.join(project_path, file)):
+    # Check for common project files
+    for file in DETECTED_FILES:
+        if file in files:
+            analysis["detected_files"].append(files.get(file))
+    for file in (files.readme, files.license):
+        if file:
             analysis["detected_files"].append(file)
     
-    # Try to extract metadata from pyproject.toml
-    pyproject_path = os.path.join(project_path, "pyproject.toml")
-    if os.path.exists(pyproject_path):
-        try:
-            import tomllib
-            with open(pyproject_path, "rb") as f:
-                pyproject_data = tomllib.load(f)
-            
-            project_data = pyproject_data.get("project", {})
-            if project_data:
-                analysis["suggested_metadata"]["name"] = project_data.get("name", "")
-                analysis["suggested_metadata"]["description"] = project_data.get("description", "")
-                analysis["suggested_metadata"]["license"] = project_data.get("license", {})
-                analysis["suggested_metadata"]["authors"] = project_data.get("authors", [])
-                analysis["suggested_metadata"]["keywords"] = project_data.get("keywords", [])
-                analysis["suggested_metadata"]["programming_language"] = ["Python"]
-                
-                # Extract repository URL
-                urls = project_data.get("urls", {})
-                if "Homepage" in urls:
-                    repo_url = urls["Homepage"]
-                    if "github.com" in repo_url:
-                        analysis["suggested_metadata"]["codeRepository"] = repo_url
-                        # Extract identifier from GitHub URL
-                        match = re.search(r"github\.com/([^/]+/[^/]+)", repo_url)
-                        if match:
-                            analysis["suggested_metadata"]["identifier"] = match.group(1)
-        except Exception as e:
-            analysis["warnings"].append(f"Could not parse pyproject.toml: {e}")
+    # Run the extractors of all detected formats, reusing cached results of
+    # extractors whose input file is unchanged, and merge their suggestions
+    cached = _ANALYSIS_CACHE.get(analysis["project_path"], {}) if use_cache else {}
+    entries = {}
+    stale = []
+    for extractor, filename in applicable_extractors(files):
+        signature = files.signature(filename)
+        entry = cached.get(extractor.name)
+        if entry is not None and entry[0] == filename and entry[1] == signature:
+            entries[extractor.name] = entry
+        else:
+            entries[extractor.name] = (filename, signature, None)
+            stale.append((extractor, filename))
+    for result in run_extractors(files, stale):
+        entries[result.extractor.name] = (result.filename, entries[result.extractor.name][1], result)
+    if use_cache:
+        _ANALYSIS_CACHE.set(analysis["project_path"], entries)
     
-    # Check for README.md
-    readme_path = os.path.join(project_path, "README.md")
-    if os.path.exists(readme_path):
-        try:
-            with open(readme_path, "r", encoding="utf-8") as f:
-                readme_content = f.read()
-                # Extract first paragraph as description if not found in pyproject.toml
-                if not analysis["suggested_metadata"].get("description"):
-                    lines = readme_content.split("\n")
-                    description_lines = []
-                    for line in lines:
-                        if line.strip() and not line.startswith("#"):
-                            description_lines.append(line.strip())
-                        elif description_lines:
-                            break
-                    if description_lines:
-                        analysis["suggested_metadata"]["description"] = " ".join(description_lines[:3])
-        except Exception as e:
-            analysis["warnings"].append(f"Could not read README.md: {e}")
+    results = [entry[2] for entry in entries.values()]
+    for result in results:
+        if result.error is not None:
+            analysis["warnings"].append(f"Could not parse {result.filename}: {result.error}")
+    
+    # Take codeRepository and identifier from the git remote, read from .git/config
+    # of the enclosing repository (which may be a parent of the project directory)
+    repository = read_git_repository(project_path)
+    if repository is not None:
+        remote_url = repository.remote_url()
+        analysis["git"] = {
+            "root": repository.root,
+            "branch": repository.branch,
+            "commit": repository.commit,
+            "remote": repository.remote,
+            "remote_url": re.sub(r"^(\w+://)[^/@]+@", r"\1", remote_url) if remote_url else None,
+        }
+        git_metadata = repository_metadata(remote_url)
+        if remote_url and not git_metadata:
+            analysis["warnings"].append(
+                f"Git remote {analysis['git']['remote_url']} is not on a supported host (GitHub, GitLab, Bitbucket, Codeberg) "
+                "or not an owner/repository URL"
+            )
+        for result in results:
+            identifier = result.metadata.get("identifier")
+            if git_metadata and identifier and identifier != git_metadata["identifier"]:
+                analysis["warnings"].append(
+                    f"{result.filename} points to {identifier}, but the git remote is {git_metadata['identifier']}"
+                )
+        config_path = os.path.relpath(os.path.join(repository.common_dir, "config"), analysis["project_path"])
+        results.append(ExtractorResult(GIT_EXTRACTOR, config_path, git_metadata))
+    
+    suggested_metadata, analysis["metadata_sources"] = merge_suggestions(results)
     
-    # Check for LICENSE file
-    license_files = ["LICENSE", "LICENSE.txt", "LICENSE.md"]
-    for license_file in license_files:
-        if os.path.exists(os.path.join(project_path, license_file)):
-            analysis["suggested_metadata"]["has_license_file"] = True
-            break
+    # Derived values the active schema would reject (e.g. a host missing from its
+    # codeRepository pattern) are reported instead of suggested
+    properties = get_schema_provider().get_schema().get("properties", {})
+    for field in ("codeRepository", "identifier"):
+        value = suggested_metadata.get(field)
+        pattern = properties.get(field, {}).get("pattern")
+        if isinstance(value, str) and isinstance(pattern, str) and not re.search(pattern, value):
+            sources = analysis["metadata_sources"].pop(field, [])
+            del suggested_metadata[field]
+            analysis["warnings"].append(
+                f"{field} {value} (from {', '.join(sources) or 'project files'}) does not match the registry schema "
+                f"pattern {pattern}; please set it manually"
+            )
+    
+    # Rank the languages of the source files by byte share; manifests only tell
+    # which package ecosystems are used, so they are the fallback
+    languages = _LANGUAGE_CACHE.get(analysis["project_path"]) if use_cache else None
+    if languages is None:
+        languages = detect_languages(project_path, entries=files.entries)
+        if use_cache:
+            _LANGUAGE_CACHE.set(analysis["project_path"], languages)
+    analysis["languages"] = languages._asdict()
+    if languages.schema_languages():
+        suggested_metadata["programming_language"] = languages.schema_languages()
+        analysis["metadata_sources"]["programming_language"] = ["source files"]
+    analysis["suggested_metadata"] = copy.deepcopy(suggested_metadata)
+    
+    # A declared license that differs from the LICENSE file is likely outdated
+    detection = suggested_metadata.get("license_detection")
+    if detection and suggested_metadata.get("license") != SPDX_URL.format(detection["spdx_id"]):
+        analysis["warnings"].append(
+            f"{analysis['metadata_sources']['license'][0]} declares {suggested_metadata['license']}, but "
+            f"{files.license} looks like {detection['spdx_id']} (confidence {detection['confidence']})"
+        )
     
     # Generate recommendations
     if not analysis["suggested_metadata"].get("identifier"):
@@ -389,68 +622,73 @@ def generate_yaml_template(metadata: dict[str, Any]) -> str:
     # Add user confirmation flag (default to False)
     yaml_data["user_confirmed"] = metadata.get("user_confirmed", False)
     
-    return yaml.dump(yaml_data, default_flow_style=False, sort_keys=False)
+    return dump_yaml(yaml_data)
+
+
+def _json_pointer(path: Any) -> str:
+    """Build an RFC 6901 JSON pointer from a jsonschema error path."""
+    return "".join("/" + str(part).replace("~", "~0").replace("/", "~1") for part in path)
+
+
+def _error_detail(pointer: str, validator: str, expected: Any, message: str) -> dict[str, Any]:
+    return {
+        "path": pointer,
+        "validator": validator,
+        "expected": expected,
+        "message": message
+    }
 
 
-def validate_yaml_specification(yaml_content: str) -> dict[str, Any]:
+def canonical_content_hash(yaml_data: Any) -> str:
     """
-    Validate a YAML specification against the registry schema.
+    Compute a content hash of parsed YAML data that ignores formatting and key order.
     
     Args:
-        yaml_content: YAML content as string
+        yaml_data: Parsed YAML data
         
     Returns:
-        Dict containing validation results
+        Hex SHA-256 digest of the canonical JSON serialisation of the data
     """
-    try:
-        from jsonschema import validate, ValidationError
-    except ImportError:
-        return {
-            "valid": False,
-            "errors": ["jsonschema package not available for validation"],
-            "warnings": []
-        }
-    
-    result = {
-        "valid": True,
-        "errors": [],
-        "warnings": [],
-        "suggestions": []
-    }
+    canonical = json.dumps(
+        yaml_data,
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=lambda o: f"{type(o).__name__}:{o}"
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _validate_yaml_data(yaml_data: Any, result: dict[str, Any], engine: str) -> None:
+    """Run the schema and custom checks on parsed YAML data, filling in result."""
+    # Collect every violation from the shared, pre-compiled schema validator
+    for violation in _schema_violations(yaml_data, engine):
+        pointer = _json_pointer(violation.path)
+        message = f"Schema validation error: {violation.message}"
+        if pointer:
+            message += f" (at path: {pointer[1:]})"
+        result["errors"].append(message)
+        result["error_details"].append(_error_detail(pointer, violation.validator, violation.validator_value, violation.message))
     
-    try:
-        # Parse YAML
-        yaml_data = yaml.safe_load(yaml_content)
-        if not yaml_data:
-            result["valid"] = False
-            result["errors"].append("YAML content is empty or invalid")
-            return result
-        
-        # Get schema
-        schema = get_registry_schema()
-        
-        # Validate against schema
-        validate(instance=yaml_data, schema=schema)
-        
+    if isinstance(yaml_data, dict):
         # Additional custom validations
         # Check license format
-        if "license" in yaml_data:
-            license_url = yaml_data["license"]
-            if not license_url.startswith("https://spdx.org/licenses/"):
-                result["warnings"].append("License should use SPDX format (https://spdx.org/licenses/...)")
-        
-        # Check identifier format
-        if "identifier" in yaml_data:
-            identifier = yaml_data["identifier"]
-            if not re.match(r"^[a-zA-Z0-9_-]+/[a-zA-Z0-9_.-]+$", identifier):
-                result["errors"].append("Identifier must be in format 'owner/repository'")
-                result["valid"] = False
+        license_url = yaml_data.get("license")
+        if isinstance(license_url, str) and not license_url.startswith("https://spdx.org/licenses/"):
+            result["warnings"].append("License should use SPDX format (https://spdx.org/licenses/...)")
+        
+        # Check identifier format (unless the schema already reported it)
+        identifier = yaml_data.get("identifier")
+        if isinstance(identifier, str) and not re.match(r"^[a-zA-Z0-9_-]+/[a-zA-Z0-9_.-]+$", identifier):
+            if not any(detail["path"] == "/identifier" for detail in result["error_details"]):
+                message = "Identifier must be in format 'owner/repository'"
+                result["errors"].append(message)
+                result["error_details"].append(_error_detail("/identifier", "custom", "owner/repository", message))
         
         # Check repository URL format
-        if "codeRepository" in yaml_data:
-            repo_url = yaml_data["codeRepository"]
-            if not re.match(r"^https://(github\.com|gitlab\.com|bitbucket\.org|codeberg\.com)(/[a-zA-Z0-9_-]+/[a-zA-Z0-9_.-]+|/record/[0-9]+)(/.*)?$", repo_url):
-                result["warnings"].append("Repository URL should be from a supported platform (GitHub, GitLab, Bitbucket, Codeberg)")
+        repo_url = yaml_data.get("codeRepository")
+        if isinstance(repo_url, str) and not re.match(r"^https://(github\.com|gitlab\.com|bitbucket\.org|codeberg\.com)(/[a-zA-Z0-9_-]+/[a-zA-Z0-9_.-]+|/record/[0-9]+)(/.*)?$", repo_url):
+            result["warnings"].append("Repository URL should be from a supported platform (GitHub, GitLab, Bitbucket, Codeberg)")
         
         # Suggest improvements
         if not yaml_data.get("url"):
@@ -461,32 +699,301 @@ def validate_yaml_specification(yaml_content: str) -> dict[str, Any]:
         
         if not yaml_data.get("featureList"):
             result["suggestions"].append("Consider adding 'featureList' to describe your MCP server's capabilities")
+    
+    result["valid"] = not result["errors"]
+
+
+_MISSING = object()
+
+
+class SubmissionDocument:
+    """
+    A registry submission parsed once and shared across the submit pipeline.
+    
+    The document owns the parsed YAML data and lazily computes its canonical YAML
+    serialisation, its content hash and its validation result, so the submit,
+    confirm and status tools can pass it along instead of converting between
+    strings and dictionaries at every step. Changing a field through set_field
+    invalidates the derived values.
+    
+    Args:
+        data: Parsed YAML data
+        parse_error: Error raised while parsing the YAML content, if any
+    """
+    
+    __slots__ = ("data", "parse_error", "_yaml", "_content_hash", "_validation")
+    
+    def __init__(self, data: Any, parse_error: yaml.YAMLError | None = None):
+        self.data = data
+        self.parse_error = parse_error
+        self._yaml: str | None = None
+        self._content_hash: str | None = None
+        self._validation: tuple[tuple[str, str], dict[str, Any]] | None = None
+    
+    @classmethod
+    def from_yaml(cls, yaml_content: str) -> "SubmissionDocument":
+        """
+        Parse a YAML specification.
+        
+        Parsing errors do not raise; they are reported by validate().
         
-    except yaml.YAMLError as e:
+        Args:
+            yaml_content: YAML content as string
+            
+        Returns:
+            SubmissionDocument for the parsed content
+        """
+        try:
+            return cls(load_yaml(yaml_content))
+        except yaml.YAMLError as e:
+            return cls(None, parse_error=e)
+    
+    @classmethod
+    def from_file(cls, yaml_file_path: str) -> "SubmissionDocument":
+        """
+        Read and parse a YAML specification file.
+        
+        Args:
+            yaml_file_path: Path to the YAML file
+            
+        Returns:
+            SubmissionDocument for the file content
+            
+        Raises:
+            OSError: If the file cannot be read
+        """
+        with open(yaml_file_path, encoding='utf-8') as f:
+            return cls.from_yaml(f.read())
+    
+    @property
+    def yaml(self) -> str:
+        """Canonical YAML serialisation of the document, as written to meta.yaml."""
+        if self._yaml is None:
+            self._yaml = dump_yaml(self.data)
+        return self._yaml
+    
+    @property
+    def content_hash(self) -> str:
+        """Content hash of the document data, independent of formatting and key order."""
+        if self._content_hash is None:
+            self._content_hash = canonical_content_hash(self.data)
+        return self._content_hash
+    
+    @property
+    def submission_hash(self) -> str:
+        """Content hash without the user_confirmed flag, identifying the document in the submission ledger."""
+        if not isinstance(self.data, dict) or "user_confirmed" not in self.data:
+            return self.content_hash
+        return canonical_content_hash({key: value for key, value in self.data.items() if key != "user_confirmed"})
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Get a top-level field of the document.
+        
+        Args:
+            key: Field name
+            default: Value returned if the field is missing or the document is not a mapping
+            
+        Returns:
+            Field value or default
+        """
+        return self.data.get(key, default) if isinstance(self.data, dict) else default
+    
+    def set_field(self, key: str, value: Any) -> None:
+        """
+        Set a top-level field of the document and invalidate derived values.
+        
+        Args:
+            key: Field name
+            value: New field value
+        """
+        if self.get(key, _MISSING) is value:
+            return
+        self.data[key] = value
+        self._yaml = None
+        self._content_hash = None
+        self._validation = None
+    
+    def write(self, yaml_file_path: str) -> None:
+        """
+        Write the canonical YAML serialisation to a file.
+        
+        Args:
+            yaml_file_path: Path of the YAML file to write
+        """
+        with open(yaml_file_path, 'w', encoding='utf-8') as f:
+            f.write(self.yaml)
+    
+    def validate(self, use_cache: bool = True, engine: str | None = None) -> dict[str, Any]:
+        """
+        Validate the document against the registry schema.
+        
+        The result is computed once per schema version and engine and shared by
+        all callers of this document; it must not be modified.
+        
+        Args:
+            use_cache: Whether to use the validation result cache
+            engine: Schema validation engine, "jsonschema" or "compiled"
+            
+        Returns:
+            Dict containing validation results (see validate_yaml_specification)
+        """
+        key = (get_schema_provider().version, engine or DEFAULT_VALIDATION_ENGINE)
+        if self._validation is None or self._validation[0] != key:
+            self._validation = (key, _validate_document(self, key[1], key[0], use_cache))
+        return self._validation[1]
+
+
+def _validate_document(
+    document: SubmissionDocument,
+    engine: str,
+    schema_version: str,
+    use_cache: bool,
+    fallback_key: tuple[str, str, str] | None = None,
+) -> dict[str, Any]:
+    result = {
+        "valid": True,
+        "errors": [],
+        "error_details": [],
+        "warnings": [],
+        "suggestions": []
+    }
+    
+    cache_key = fallback_key
+    if document.parse_error is not None:
         result["valid"] = False
-        result["errors"].append(f"YAML parsing error: {e}")
-    except ValidationError as e:
+        result["errors"].append(f"YAML parsing error: {document.parse_error}")
+    elif not document.data:
         result["valid"] = False
-        result["errors"].append(f"Schema validation error: {e.message}")
-        if e.path:
-            result["errors"].append(f"  at path: {'/'.join(str(p) for p in e.path)}")
+        result["errors"].append("YAML content is empty or invalid")
+    else:
+        cache_key = (schema_version, engine, document.content_hash)
+        cached = _VALIDATION_CACHE.get(cache_key) if use_cache else None
+        if cached is not None:
+            return copy.deepcopy(cached)
+        try:
+            _validate_yaml_data(document.data, result, engine)
+        except Exception as e:
+            result["valid"] = False
+            result["errors"].append(f"Unexpected error: {e}")
+            return result
+    
+    if use_cache and cache_key is not None:
+        _VALIDATION_CACHE.set(cache_key, copy.deepcopy(result))
+        logger.debug("Validation cache miss for %s: %s", cache_key[-1][:12], _VALIDATION_CACHE.stats())
+    return result
+
+
+def validate_yaml_specification(yaml_content: str, use_cache: bool = True, engine: str | None = None) -> dict[str, Any]:
+    """
+    Validate a YAML specification against the registry schema.
+    
+    All schema violations and custom checks are collected in a single pass, so a
+    document with several problems reports every one of them at once. Results are
+    cached by schema version and canonical content hash, so re-validating the same
+    document (even with different formatting) is answered from the cache.
+    
+    Args:
+        yaml_content: YAML content as string
+        use_cache: Whether to use the validation result cache
+        engine: Schema validation engine, "jsonschema" or "compiled" (defaults to
+            REGISTRY_MCP_VALIDATION_ENGINE, or "jsonschema")
+        
+    Returns:
+        Dict containing validation results. ``error_details`` holds one structured
+        entry per error with its JSON pointer, validator keyword, expected value
+        and message.
+    """
+    try:
+        import jsonschema  # noqa: F401
+    except ImportError:
+        return {
+            "valid": False,
+            "errors": ["jsonschema package not available for validation"],
+            "warnings": []
+        }
+    
+    engine = engine or DEFAULT_VALIDATION_ENGINE
+    schema_version = get_schema_provider().version
+    raw_key = (schema_version, engine, hashlib.sha256(yaml_content.encode("utf-8")).hexdigest())
+    if use_cache:
+        cache_key = _VALIDATION_CACHE_ALIASES.get(raw_key)
+        if cache_key is not None:
+            cached = _VALIDATION_CACHE.get(cache_key)
+            if cached is not None:
+                return copy.deepcopy(cached)
+    
+    try:
+        document = SubmissionDocument.from_yaml(yaml_content)
+        result = _validate_document(document, engine, schema_version, use_cache, fallback_key=raw_key)
     except Exception as e:
-        result["valid"] = False
-        result["errors"].append(f"Unexpected error: {e}")
+        return {
+            "valid": False,
+            "errors": [f"Unexpected error: {e}"],
+            "error_details": [],
+            "warnings": [],
+            "suggestions": []
+        }
     
+    if use_cache:
+        parsed = document.parse_error is None and document.data
+        _VALIDATION_CACHE_ALIASES.set(raw_key, (schema_version, engine, document.content_hash) if parsed else raw_key)
     return result
 
 
-def submit_to_registry(yaml_content: str, api_endpoint: str = "https://api.biocontext.ai/registry/submit") -> dict[str, Any]:
+def get_validation_cache_stats() -> dict[str, Any]:
+    """
+    Get hit/miss statistics of the validation result cache.
+    
+    Returns:
+        Dict containing cache size, limits and hit/miss/eviction counters
+    """
+    return _VALIDATION_CACHE.stats()
+
+
+def clear_validation_cache() -> None:
+    """Clear the validation result cache and reset its counters."""
+    _VALIDATION_CACHE.clear()
+    _VALIDATION_CACHE_ALIASES.clear()
+
+
+def get_analysis_cache_stats() -> dict[str, Any]:
+    """
+    Get hit/miss statistics of the project analysis cache.
+    
+    Returns:
+        Dict containing cache size, limits and hit/miss/eviction counters
+    """
+    return _ANALYSIS_CACHE.stats()
+
+
+def clear_analysis_cache() -> None:
+    """Clear the project analysis cache and reset its counters."""
+    _ANALYSIS_CACHE.clear()
+    _LANGUAGE_CACHE.clear()
+
+
+async def submit_to_registry(
+    yaml_content: str | SubmissionDocument,
+    api_endpoint: str = "https://api.biocontext.ai/registry/submit",
+    idempotency_key: str | None = None,
+) -> dict[str, Any]:
     """
     Submit a YAML specification to the registry API.
     
+    The request is sent with the shared HTTP client (see registry_mcp.http_client),
+    which reuses keep-alive connections to the registry and retries transient
+    failures. While the registry is known to be down, the submission fails fast
+    and retry_after says when to try again.
+    
     Args:
-        yaml_content: YAML content as string
+        yaml_content: YAML content as string, or an already parsed SubmissionDocument
         api_endpoint: Registry API endpoint URL
+        idempotency_key: Idempotency-Key header identifying repeats of the same submission
         
     Returns:
-        Dict containing submission results
+        Dict containing submission results. retryable is true if the submission failed
+        for a transient reason (network error, registry down or overloaded)
     """
     result = {
         "success": False,
@@ -497,27 +1004,16 @@ def submit_to_registry(yaml_content: str, api_endpoint: str = "https://api.bioco
     
     try:
         # First validate the YAML
-        validation_result = validate_yaml_specification(yaml_content)
+        document = yaml_content if isinstance(yaml_content, SubmissionDocument) else SubmissionDocument.from_yaml(yaml_content)
+        validation_result = await run_blocking(document.validate)
         if not validation_result["valid"]:
-            result["errors"] = validation_result["errors"]
+            result["errors"] = list(validation_result["errors"])
             result["message"] = "Validation failed before submission"
             return result
         
-        # Prepare submission data
-        yaml_data = yaml.safe_load(yaml_content)
-        
         # Submit to API
-        headers = {
-            "Content-Type": "application/json",
-            "Accept": "application/json"
-        }
-        
-        response = requests.post(
-            api_endpoint,
-            json=yaml_data,
-            headers=headers,
-            timeout=30
-        )
+        headers = {"Idempotency-Key": idempotency_key} if idempotency_key else None
+        response = await post_json(api_endpoint, document.data, headers=headers)
         
         if response.status_code == 200 or response.status_code == 201:
             result["success"] = True
@@ -534,10 +1030,22 @@ def submit_to_registry(yaml_content: str, api_endpoint: str = "https://api.bioco
                 result["errors"].append(error_data.get("message", "Unknown error"))
             except:
                 result["errors"].append(response.text)
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                result["retry_after"] = retry_after
+            # Transient by the same definition as the retries of post_json (502-504, 429 with Retry-After)
+            if get_retry_policy().retry_reason(response.request, response) is not None:
+                result["retryable"] = True
     
-    except requests.exceptions.RequestException as e:
-        result["errors"].append(f"Network error: {e}")
+    except CircuitOpenError as e:
+        result["errors"].append(str(e))
+        result["message"] = "Registry API is temporarily unavailable"
+        result["retry_after"] = round(e.retry_after, 1)
+        result["retryable"] = True
+    except (httpx.HTTPError, TimeoutError) as e:
+        result["errors"].append(f"Network error: {str(e) or type(e).__name__}")
         result["message"] = "Failed to connect to registry API"
+        result["retryable"] = True
     except Exception as e:
         result["errors"].append(f"Unexpected error: {e}")
         result["message"] = "Submission failed due to unexpected error"
@@ -547,7 +1055,7 @@ def submit_to_registry(yaml_content: str, api_endpoint: str = "https://api.bioco
 
 # Register tools with MCP
 @mcp.tool
-def analyze_project_directory_tool(project_path: str = ".") -> dict[str, Any]:
+async def analyze_project_directory_tool(project_path: str = ".") -> dict[str, Any]:
     """
     Analyze the current project directory to extract metadata for registry submission.
     
@@ -560,7 +1068,7 @@ def analyze_project_directory_tool(project_path: str = ".") -> dict[str, Any]:
     Returns:
         Dict containing extracted project metadata, detected files, and recommendations
     """
-    return analyze_project_directory(project_path)
+    return await run_blocking(analyze_project_directory, project_path)
 
 
 @mcp.tool
@@ -581,7 +1089,7 @@ def generate_yaml_template_tool(metadata: dict[str, Any]) -> str:
 
 
 @mcp.tool
-def validate_yaml_specification_tool(yaml_content: str) -> dict[str, Any]:
+async def validate_yaml_specification_tool(yaml_content: str) -> dict[str, Any]:
     """
     Validate a YAML specification against the registry schema.
     
@@ -594,32 +1102,24 @@ def validate_yaml_specification_tool(yaml_content: str) -> dict[str, Any]:
     Returns:
         Dict containing validation results, errors, warnings, and suggestions
     """
-    return validate_yaml_specification(yaml_content)
+    return await run_blocking(validate_yaml_specification, yaml_content)
 
 
-@mcp.tool
-def submit_to_registry_tool(yaml_content: str, api_endpoint: str = "https://api.biocontext.ai/registry/submit", project_path: str = ".") -> dict[str, Any]:
+def prepare_registry_submission(yaml_content: str, api_endpoint: str = "https://api.biocontext.ai/registry/submit", project_path: str = ".") -> dict[str, Any]:
     """
-    Prepare a YAML specification for registry submission with user confirmation.
-    
-    This tool validates a YAML specification, writes it to a file with user_confirmed: false,
-    and requests user confirmation before allowing submission to the BioContextAI registry API.
+    Validate a YAML specification and write it to meta.yaml with user_confirmed: false.
     
     Args:
         yaml_content: YAML content as string
-        api_endpoint: Registry API endpoint URL (optional, defaults to BioContextAI API)
-        project_path: Path to the project directory where meta.yaml should be saved (defaults to current directory)
+        api_endpoint: Registry API endpoint URL shown in the confirmation request
+        project_path: Path to the project directory where meta.yaml should be saved
         
     Returns:
-        Dict containing validation results, file path, and confirmation request.
-        
-    Note:
-        The meta.yaml file will be created in the specified project_path directory.
-        This ensures the file is saved in the correct project location rather than
-        the current working directory where the MCP server is running.
+        Dict containing validation results, file path, and confirmation request
     """
-    # First validate the YAML
-    validation_result = validate_yaml_specification(yaml_content)
+    # Parse and validate the YAML once
+    document = SubmissionDocument.from_yaml(yaml_content)
+    validation_result = document.validate()
     
     if not validation_result["valid"]:
         return {
@@ -629,22 +1129,13 @@ def submit_to_registry_tool(yaml_content: str, api_endpoint: str = "https://api.
             "requires_confirmation": False
         }
     
-    # Parse YAML to extract key information
-    try:
-        yaml_data = yaml.safe_load(yaml_content)
-        identifier = yaml_data.get("identifier", "Unknown")
-        name = yaml_data.get("name", "Unknown")
-        code_repository = yaml_data.get("codeRepository", "Unknown")
-    except Exception as e:
-        return {
-            "success": False,
-            "message": f"Failed to parse YAML: {e}",
-            "validation_result": validation_result,
-            "requires_confirmation": False
-        }
+    # Extract key information
+    identifier = document.get("identifier", "Unknown")
+    name = document.get("name", "Unknown")
+    code_repository = document.get("codeRepository", "Unknown")
     
     # Set user_confirmed to False and write to file
-    yaml_data["user_confirmed"] = False
+    document.set_field("user_confirmed", False)
     
     # Create meta.yaml file in the specified project directory
     # Convert relative path to absolute path for consistency
@@ -654,8 +1145,7 @@ def submit_to_registry_tool(yaml_content: str, api_endpoint: str = "https://api.
     
     try:
         # Write YAML to file
-        with open(yaml_filepath, 'w', encoding='utf-8') as f:
-            yaml.dump(yaml_data, f, default_flow_style=False, sort_keys=False)
+        document.write(yaml_filepath)
         
         return {
             "success": True,
@@ -710,46 +1200,194 @@ will the user_confirmed flag be set to true and the submission allowed.
 
 
 @mcp.tool
-def confirm_and_submit_to_registry_tool(yaml_file_path: str, api_endpoint: str = "https://api.biocontext.ai/registry/submit") -> dict[str, Any]:
+async def submit_to_registry_tool(yaml_content: str, api_endpoint: str = "https://api.biocontext.ai/registry/submit", project_path: str = ".") -> dict[str, Any]:
     """
-    Confirm and submit a YAML specification to the registry API.
+    Prepare a YAML specification for registry submission with user confirmation.
     
-    This tool reads a YAML file, sets user_confirmed to true, and performs the actual
-    submission to the BioContextAI registry API. It should only be called after the
-    user has confirmed they want to proceed with the submission.
+    This tool validates a YAML specification, writes it to a file with user_confirmed: false,
+    and requests user confirmation before allowing submission to the BioContextAI registry API.
     
     Args:
-        yaml_file_path: Path to the YAML file to submit
+        yaml_content: YAML content as string
         api_endpoint: Registry API endpoint URL (optional, defaults to BioContextAI API)
+        project_path: Path to the project directory where meta.yaml should be saved (defaults to current directory)
         
     Returns:
-        Dict containing submission results and any errors encountered
+        Dict containing validation results, file path, and confirmation request.
+        
+    Note:
+        The meta.yaml file will be created in the specified project_path directory.
+        This ensures the file is saved in the correct project location rather than
+        the current working directory where the MCP server is running.
     """
+    return await run_blocking(prepare_registry_submission, yaml_content, api_endpoint, project_path)
+
+
+async def _submit_recorded(document: SubmissionDocument, api_endpoint: str, content_hash: str, yaml_file_path: str | None) -> dict[str, Any]:
+    ledger = get_submission_ledger()
+    record = await run_blocking(ledger.begin, api_endpoint, content_hash, document.get("identifier"), yaml_file_path)
+    result = await submit_to_registry(document, api_endpoint, idempotency_key=record["idempotency_key"])
+    await run_blocking(
+        ledger.finish, api_endpoint, content_hash, result["success"], result["submission_id"], "; ".join(result["errors"]) or result["message"]
+    )
+    return result
+
+
+def _mark_file_submitted(yaml_file_path: str, content_hash: str) -> None:
+    # Only if the file still holds the submitted document
     try:
-        # Read the YAML file
-        with open(yaml_file_path, 'r', encoding='utf-8') as f:
-            yaml_data = yaml.safe_load(f)
-        
-        # Check if user_confirmed is False (safety check)
-        if yaml_data.get("user_confirmed", False):
-            return {
-                "success": False,
-                "message": "YAML file already has user_confirmed: true. Submission may have already been attempted.",
-                "errors": ["File already confirmed for submission"]
-            }
+        document = SubmissionDocument.from_file(yaml_file_path)
+    except OSError:
+        return
+    if document.parse_error is None and document.submission_hash == content_hash and not document.get("user_confirmed", False):
+        document.set_field("user_confirmed", True)
+        document.write(yaml_file_path)
+
+
+async def _submit_queued(item: dict[str, Any]) -> dict[str, Any]:
+    record = await run_blocking(get_submission_ledger().lookup, item["endpoint"], item["content_hash"])
+    if record is not None and record["status"] == STATUS_SUBMITTED:
+        # Submitted by a later call of confirm_and_submit_to_registry
+        result = {"success": True, "message": "Already submitted", "submission_id": record["submission_id"], "errors": []}
+    else:
+        document = SubmissionDocument(item["document"])
+        result = await _submit_recorded(document, item["endpoint"], item["content_hash"], item["file_path"])
+    if result["success"] and item["file_path"]:
+        await run_blocking(_mark_file_submitted, item["file_path"], item["content_hash"])
+    return result
+
+
+_OUTBOX_WORKER: OutboxWorker | None = None
+
+
+def start_submission_worker() -> OutboxWorker:
+    """
+    Start the background task retrying queued submissions on the running event loop.
+    
+    Returns:
+        The OutboxWorker of the shared submission outbox
+    """
+    global _OUTBOX_WORKER
+    outbox = get_submission_outbox()
+    if _OUTBOX_WORKER is None or _OUTBOX_WORKER.outbox is not outbox:
+        _OUTBOX_WORKER = OutboxWorker(outbox, _submit_queued)
+    _OUTBOX_WORKER.start()
+    return _OUTBOX_WORKER
+
+
+async def stop_submission_worker() -> None:
+    """Stop the background task retrying queued submissions."""
+    if _OUTBOX_WORKER is not None:
+        await _OUTBOX_WORKER.stop()
+
+
+async def submit_confirmed_document(
+    document: SubmissionDocument,
+    yaml_file_path: str,
+    api_endpoint: str = "https://api.biocontext.ai/registry/submit",
+    before_request: Callable[[], Awaitable[None]] | None = None,
+) -> dict[str, Any]:
+    """
+    Submit a parsed YAML file and set user_confirmed to true in it once the registry accepted it.
+    
+    Submissions are recorded in the submission ledger (see registry_mcp.ledger).
+    A document that was already submitted unchanged to the endpoint is not sent
+    again, and a retry of a failed submission carries the Idempotency-Key of the
+    first attempt. Since the file is only marked as confirmed after a successful
+    submission, a failed one can simply be retried. Submissions that fail for a
+    transient reason are also queued in the submission outbox (see
+    registry_mcp.outbox) and retried in the background.
+    
+    Args:
+        document: Parsed content of the YAML file
+        yaml_file_path: Path the document was read from
+        api_endpoint: Registry API endpoint URL
+        before_request: Coroutine function awaited right before the document is sent, e.g. to
+            wait for a rate limiter; not called if nothing is sent
         
-        # Set user_confirmed to True
-        yaml_data["user_confirmed"] = True
+    Returns:
+        Dict containing submission results and any errors encountered. skipped is
+        true if nothing was sent because the document was already submitted or confirmed,
+        queued is true if the submission failed and will be retried in the background
         
-        # Write the updated YAML back to file
-        with open(yaml_file_path, 'w', encoding='utf-8') as f:
-            yaml.dump(yaml_data, f, default_flow_style=False, sort_keys=False)
+    Raises:
+        OSError: If the file cannot be written
+    """
+    ledger = get_submission_ledger()
+    content_hash = document.submission_hash
+    record = await run_blocking(ledger.lookup, api_endpoint, content_hash)
+    
+    if record is not None and record["status"] == STATUS_SUBMITTED:
+        if not document.get("user_confirmed", False):
+            document.set_field("user_confirmed", True)
+            await run_blocking(document.write, yaml_file_path)
+        return {
+            "success": True,
+            "skipped": True,
+            "message": f"Unchanged since its submission at {record['submitted_at']}, not submitted again",
+            "submission_id": record["submission_id"],
+            "errors": []
+        }
+    
+    # Safety check: a confirmed file without a failed attempt in the ledger may have been submitted elsewhere
+    if document.get("user_confirmed", False) and record is None:
+        return {
+            "success": False,
+            "skipped": True,
+            "message": "YAML file already has user_confirmed: true. Submission may have already been attempted.",
+            "errors": ["File already confirmed for submission"]
+        }
+    
+    validation_result = await run_blocking(document.validate)
+    if not validation_result["valid"]:
+        return {
+            "success": False,
+            "message": "Validation failed before submission",
+            "submission_id": None,
+            "errors": list(validation_result["errors"])
+        }
+    
+    # The registry receives the document as it will be written once submitted
+    document.set_field("user_confirmed", True)
+    yaml_file_path = os.path.abspath(yaml_file_path)
+    if before_request is not None:
+        await before_request()
+    result = await _submit_recorded(document, api_endpoint, content_hash, yaml_file_path)
+    
+    if result["success"]:
+        await run_blocking(document.write, yaml_file_path)
+    elif result.get("retryable"):
+        item = await run_blocking(
+            get_submission_outbox().enqueue, api_endpoint, document.data, content_hash, document.get("identifier"),
+            yaml_file_path, "; ".join(result["errors"]) or result["message"], result.get("retry_after")
+        )
+        start_submission_worker().notify()
+        result["queued"] = True
+        result["queue_item_id"] = item["id"]
+        result["message"] += "; queued for automatic retry"
+    return result
+
+
+async def confirm_and_submit_to_registry(yaml_file_path: str, api_endpoint: str = "https://api.biocontext.ai/registry/submit") -> dict[str, Any]:
+    """
+    Set user_confirmed to true in a YAML file and submit it to the registry API.
+    
+    File I/O runs on the tool thread pool, the request on the shared HTTP client.
+    
+    Args:
+        yaml_file_path: Path to the YAML file to submit
+        api_endpoint: Registry API endpoint URL
         
-        # Convert back to string for submission
-        yaml_content = yaml.dump(yaml_data, default_flow_style=False, sort_keys=False)
+    Returns:
+        Dict containing submission results and any errors encountered
+    """
+    try:
+        # Read the YAML file
+        document = await run_blocking(SubmissionDocument.from_file, yaml_file_path)
+        if document.parse_error is not None:
+            raise document.parse_error
         
-        # Perform the actual submission
-        return submit_to_registry(yaml_content, api_endpoint)
+        return await submit_confirmed_document(document, yaml_file_path, api_endpoint)
         
     except FileNotFoundError:
         return {
@@ -766,12 +1404,31 @@ def confirm_and_submit_to_registry_tool(yaml_file_path: str, api_endpoint: str =
 
 
 @mcp.tool
-def check_yaml_file_status_tool(yaml_file_path: str) -> dict[str, Any]:
+async def confirm_and_submit_to_registry_tool(yaml_file_path: str, api_endpoint: str = "https://api.biocontext.ai/registry/submit") -> dict[str, Any]:
     """
-    Check the status of a YAML file for registry submission.
+    Confirm and submit a YAML specification to the registry API.
     
-    This tool reads a YAML file and reports its current status, including
-    whether the user has confirmed the submission.
+    This tool reads a YAML file, performs the actual submission to the BioContextAI
+    registry API and sets user_confirmed to true once it succeeded. It should only be
+    called after the user has confirmed they want to proceed with the submission.
+    A document that was already submitted unchanged is not submitted again, and a
+    failed submission can be retried by calling this tool again. If the registry is
+    unreachable or overloaded, the submission is queued and retried in the background
+    (see get_submission_queue_tool).
+    
+    Args:
+        yaml_file_path: Path to the YAML file to submit
+        api_endpoint: Registry API endpoint URL (optional, defaults to BioContextAI API)
+        
+    Returns:
+        Dict containing submission results and any errors encountered
+    """
+    return await confirm_and_submit_to_registry(yaml_file_path, api_endpoint)
+
+
+def check_yaml_file_status(yaml_file_path: str) -> dict[str, Any]:
+    """
+    Read a YAML file and report its submission status.
     
     Args:
         yaml_file_path: Path to the YAML file to check
@@ -789,17 +1446,18 @@ def check_yaml_file_status_tool(yaml_file_path: str) -> dict[str, Any]:
             }
         
         # Read the YAML file
-        with open(yaml_file_path, 'r', encoding='utf-8') as f:
-            yaml_data = yaml.safe_load(f)
+        document = SubmissionDocument.from_file(yaml_file_path)
+        if document.parse_error is not None:
+            raise document.parse_error
         
         # Extract key information
-        identifier = yaml_data.get("identifier", "Unknown")
-        name = yaml_data.get("name", "Unknown")
-        user_confirmed = yaml_data.get("user_confirmed", False)
+        identifier = document.get("identifier", "Unknown")
+        name = document.get("name", "Unknown")
+        user_confirmed = document.get("user_confirmed", False)
         
         # Validate the YAML
-        yaml_content = yaml.dump(yaml_data, default_flow_style=False, sort_keys=False)
-        validation_result = validate_yaml_specification(yaml_content)
+        validation_result = document.validate()
+        submissions = get_submission_ledger().history(content_hash=document.submission_hash, limit=1)
         
         return {
             "success": True,
@@ -810,7 +1468,8 @@ def check_yaml_file_status_tool(yaml_file_path: str) -> dict[str, Any]:
             "name": name,
             "user_confirmed": user_confirmed,
             "validation_result": validation_result,
-            "ready_for_submission": user_confirmed and validation_result["valid"]
+            "ready_for_submission": user_confirmed and validation_result["valid"],
+            "last_submission": submissions[0] if submissions else None
         }
         
     except Exception as e:
@@ -823,7 +1482,112 @@ def check_yaml_file_status_tool(yaml_file_path: str) -> dict[str, Any]:
 
 
 @mcp.tool
-def get_registry_schema_tool() -> dict[str, Any]:
+async def check_yaml_file_status_tool(yaml_file_path: str) -> dict[str, Any]:
+    """
+    Check the status of a YAML file for registry submission.
+    
+    This tool reads a YAML file and reports its current status, including
+    whether the user has confirmed the submission.
+    
+    Args:
+        yaml_file_path: Path to the YAML file to check
+        
+    Returns:
+        Dict containing file status information
+    """
+    return await run_blocking(check_yaml_file_status, yaml_file_path)
+
+
+def get_submission_history(
+    identifier: str | None = None,
+    status: str | None = None,
+    api_endpoint: str | None = None,
+    limit: int = 50,
+) -> dict[str, Any]:
+    """
+    List recorded submissions from the local submission ledger.
+    
+    Args:
+        identifier: Only submissions of this identifier
+        status: Only submissions with this status ("pending", "submitted" or "failed")
+        api_endpoint: Only submissions to this endpoint
+        limit: Maximum number of submissions
+        
+    Returns:
+        Dict containing the submissions, most recent first, and the ledger totals
+    """
+    ledger = get_submission_ledger()
+    return {
+        "submissions": ledger.history(identifier=identifier, status=status, endpoint=api_endpoint, limit=limit),
+        "ledger": ledger.stats()
+    }
+
+
+def get_submission_queue(include_finished: bool = False) -> dict[str, Any]:
+    """
+    Report the submissions queued for a retry in the submission outbox.
+    
+    Args:
+        include_finished: Whether to list items submitted or rejected since the queue was last compacted
+        
+    Returns:
+        Dict containing the queue depth, the time until the next retry, the items and whether the worker is running
+    """
+    outbox = get_submission_outbox()
+    return {
+        **outbox.stats(),
+        "worker_running": _OUTBOX_WORKER is not None and _OUTBOX_WORKER.outbox is outbox and _OUTBOX_WORKER.running,
+        "items": outbox.items(include_finished)
+    }
+
+
+@mcp.tool
+async def get_submission_queue_tool(include_finished: bool = False) -> dict[str, Any]:
+    """
+    Show the submissions waiting to be retried in the background.
+    
+    Confirmed submissions that failed because the registry was unreachable or
+    overloaded are kept in a queue on disk and retried with backoff, also after
+    a server restart. This tool reports the queue depth and the status, attempts
+    and last error of every queued submission.
+    
+    Args:
+        include_finished: Also list queued submissions that have since been submitted or rejected (optional)
+        
+    Returns:
+        Dict containing depth, next_attempt_in seconds, worker_running and the queued items
+    """
+    return await run_blocking(get_submission_queue, include_finished)
+
+
+@mcp.tool
+async def get_submission_history_tool(
+    identifier: str | None = None,
+    status: str | None = None,
+    api_endpoint: str | None = None,
+    limit: int = 50,
+) -> dict[str, Any]:
+    """
+    List past registry submissions without contacting the registry.
+    
+    This tool answers what was submitted, when, to which endpoint and with which
+    outcome, from the local submission ledger. Failed submissions can be retried
+    with confirm_and_submit_to_registry_tool.
+    
+    Args:
+        identifier: Only submissions of this identifier (optional)
+        status: Only submissions with this status: "pending", "submitted" or "failed" (optional)
+        api_endpoint: Only submissions to this endpoint (optional)
+        limit: Maximum number of submissions (defaults to 50)
+        
+    Returns:
+        Dict containing the submissions (identifier, content hash, endpoint, status, submission id, timestamps) and ledger totals
+    """
+    return await run_blocking(get_submission_history, identifier, status, api_endpoint, limit)
+
+
+@mcp.tool
+async def get_registry_schema_tool() -> dict[str, Any]:
     """
     Get the registry schema definition for validation.
     
@@ -833,4 +1597,64 @@ def get_registry_schema_tool() -> dict[str, Any]:
     Returns:
         Dict containing the JSON schema for registry submissions
     """
-    return get_registry_schema()
+    # Revalidating a remote schema source may hit the network
+    return await run_blocking(get_registry_schema)
+
+
+@mcp.tool
+def get_validation_cache_stats_tool() -> dict[str, Any]:
+    """
+    Get statistics of the validation result cache.
+    
+    This tool reports how many validations were answered from the cache
+    (hits) versus computed (misses), together with the cache size and limits.
+    
+    Returns:
+        Dict containing cache size, limits and hit/miss/eviction counters
+    """
+    return get_validation_cache_stats()
+
+
+@mcp.tool
+def get_registry_http_stats_tool() -> dict[str, Any]:
+    """
+    Get retry and circuit breaker metrics of the registry API client.
+    
+    This tool reports how many submissions were sent, how many attempts and
+    retries they took (by reason), how many were rejected while the API was
+    known to be down, and the state of the circuit breaker of every host.
+    
+    Returns:
+        Dict containing request/attempt/retry counters, circuit breaker states and the client configuration
+    """
+    return get_http_stats()
+
+
+@mcp.tool
+async def get_registry_schema_status_tool() -> dict[str, Any]:
+    """
+    Get information about the registry schema currently used for validation.
+    
+    This tool reports where the schema was loaded from (bundled copy, on-disk
+    cache, local file or the remote source), its version and the HTTP
+    validators used to revalidate it.
+    
+    Returns:
+        Dict containing source, origin, version, ETag/Last-Modified and check times
+    """
+    # Loading or revalidating the schema may hit the disk or the network
+    return await run_blocking(get_schema_provider().status)
+
+
+@mcp.tool
+def get_yaml_backend_tool() -> dict[str, Any]:
+    """
+    Get information about the YAML backend used to parse and write meta.yaml files.
+    
+    This tool reports whether the libyaml C loader/dumper or the pure-Python
+    implementation of PyYAML is in use.
+    
+    Returns:
+        Dict containing the active backend, the available backends and the PyYAML version
+    """
+    return get_yaml_backend_info()
@@ -0,0 +1,81 @@
+"""
+YAML loading and dumping for the registry tools.
+
+Uses the libyaml C implementation of the safe loader and dumper when PyYAML was
+built with it, and the pure-Python implementation otherwise. The backend can be
+forced with the REGISTRY_MCP_YAML_BACKEND environment variable ("libyaml" or
+"python").
+"""
+
+import logging
+import os
+from typing import IO, Any
+
+import yaml
+
+logger = logging.getLogger(__name__)
+
+# Safe loader/dumper classes of each available backend
+YAML_BACKENDS: dict[str, tuple[type, type]] = {"python": (yaml.SafeLoader, yaml.SafeDumper)}
+if getattr(yaml, "__with_libyaml__", False):
+    YAML_BACKENDS["libyaml"] = (yaml.CSafeLoader, yaml.CSafeDumper)
+
+
+def _select_backend(requested: str | None) -> str:
+    if requested and requested != "auto":
+        if requested in YAML_BACKENDS:
+            return requested
+        logger.warning("YAML backend %r is not available, falling back to the default backend", requested)
+    return "libyaml" if "libyaml" in YAML_BACKENDS else "python"
+
+
+YAML_BACKEND = _select_backend(os.environ.get("REGISTRY_MCP_YAML_BACKEND"))
+SafeLoader, SafeDumper = YAML_BACKENDS[YAML_BACKEND]
+
+
+def load_yaml(stream: str | bytes | IO, backend: str | None = None) -> Any:
+    """
+    Parse a YAML document with the safe loader.
+
+    Args:
+        stream: YAML content as string, bytes or file object
+        backend: Backend to use ("libyaml" or "python"), defaults to the active backend
+
+    Returns:
+        Parsed Python object
+    """
+    loader = YAML_BACKENDS[backend][0] if backend else SafeLoader
+    return yaml.load(stream, Loader=loader)
+
+
+def dump_yaml(data: Any, stream: IO | None = None, backend: str | None = None) -> str | None:
+    """
+    Serialise data as block-style YAML, keeping the key order.
+
+    Args:
+        data: Data to serialise
+        stream: File object to write to (optional)
+        backend: Backend to use ("libyaml" or "python"), defaults to the active backend
+
+    Returns:
+        YAML content as string, or None if a stream was given
+    """
+    dumper = YAML_BACKENDS[backend][1] if backend else SafeDumper
+    return yaml.dump(data, stream, Dumper=dumper, default_flow_style=False, sort_keys=False)
+
+
+def get_yaml_backend_info() -> dict[str, Any]:
+    """
+    Get information about the YAML backend.
+
+    Returns:
+        Dict containing the active backend, the available backends and the PyYAML version
+    """
+    return {
+        "backend": YAML_BACKEND,
+        "available_backends": sorted(YAML_BACKENDS),
+        "libyaml_available": "libyaml" in YAML_BACKENDS,
+        "loader": SafeLoader.__name__,
+        "dumper": SafeDumper.__name__,
+        "pyyaml_version": yaml.__version__,
+    }
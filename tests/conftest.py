@@ -1 +1,125 @@
+import json
+
+import httpx
+import pytest
+
+from registry_mcp.http_client import reset_http_stats, set_http_client, set_retry_policy
+from registry_mcp.ledger import SubmissionLedger, set_submission_ledger
+from registry_mcp.outbox import SubmissionOutbox, set_submission_outbox
+from registry_mcp.registry_index import clear_registry_indexes
+from registry_mcp.retry import RetryPolicy
+
 pytest_plugins = ("pytest_asyncio",)
+
+
+class MockRegistryAPI:
+    """Stand-in for the registry API behind an httpx.MockTransport."""
+
+    def __init__(self):
+        self.requests: list[httpx.Request] = []
+        self.handler = lambda request: httpx.Response(201, json={"id": "submission-123"})
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        response = self.handler(request)
+        if not isinstance(response, httpx.Response):
+            response = await response
+        return response
+
+    @property
+    def last_json(self):
+        """JSON body of the last request."""
+        return json.loads(self.requests[-1].content)
+
+
+@pytest.fixture(autouse=True)
+def submission_ledger(tmp_path):
+    """Record submissions in a fresh ledger under tmp_path instead of the user's data directory."""
+    ledger = SubmissionLedger(str(tmp_path / "submissions.db"))
+    set_submission_ledger(ledger)
+    yield ledger
+    set_submission_ledger(None)
+    ledger.close()
+
+
+@pytest.fixture(autouse=True)
+def submission_outbox(tmp_path):
+    """Queue failed submissions in a fresh outbox under tmp_path instead of the user's data directory."""
+    outbox = SubmissionOutbox(str(tmp_path / "outbox.jsonl"))
+    set_submission_outbox(outbox)
+    yield outbox
+    set_submission_outbox(None)
+
+
+@pytest.fixture(autouse=True)
+def registry_index_dir(tmp_path, monkeypatch):
+    """Keep registry index databases under tmp_path instead of the user's cache directory."""
+    monkeypatch.setenv("REGISTRY_MCP_REGISTRY_INDEX_DIR", str(tmp_path / "registry-index"))
+    yield tmp_path / "registry-index"
+    clear_registry_indexes()
+
+
+REGISTRY_ENTRIES = {
+    "servers/alpha/meta.yaml": """
+identifier: biocontext-ai/alpha-mcp
+name: Alpha Genomics MCP
+description: Query genome annotations and variant databases
+keywords: [genomics, variants]
+applicationCategory: HealthApplication
+programmingLanguage: [Python]
+maintainer:
+  - "@type": Person
+    name: Ada Lovelace
+featureList:
+  - Variant lookup
+""",
+    "servers/beta/meta.yaml": """
+identifier: biocontext-ai/beta-mcp
+name: Beta Proteomics MCP
+description: Protein structure search with genomics cross references
+keywords: [proteomics, Genomics]
+applicationCategory: [HealthApplication, DeveloperApplication]
+programmingLanguage: [TypeScript]
+maintainer:
+  - "@type": Organization
+    name: BioContext
+""",
+    "servers/gamma/meta.yaml": """
+identifier: other-org/gamma-mcp
+name: Gamma Literature MCP
+description: Search biomedical literature
+keywords: [literature]
+applicationCategory: ResearchApplication
+programmingLanguage: Python
+maintainer:
+  - "@type": Person
+    name: Ada Lovelace
+""",
+    "servers/broken/meta.yaml": "identifier: [unclosed",
+}
+
+
+@pytest.fixture
+def registry_checkout(tmp_path):
+    """Write a registry checkout with three entries and one unparseable meta.yaml."""
+    for relative_path, content in REGISTRY_ENTRIES.items():
+        path = tmp_path / "registry" / relative_path
+        path.parent.mkdir(parents=True)
+        path.write_text(content, encoding="utf-8")
+    return str(tmp_path / "registry")
+
+
+@pytest.fixture
+def registry_api():
+    """Route registry submissions to a MockRegistryAPI (201 with id "submission-123" by default).
+
+    Retries are not delayed, and metrics and circuit breakers start from scratch.
+    """
+    api = MockRegistryAPI()
+    set_http_client(httpx.AsyncClient(transport=httpx.MockTransport(api)))
+    set_retry_policy(RetryPolicy(base_delay=0))
+    reset_http_stats()
+    yield api
+    set_http_client(None)
+    set_retry_policy(None)
+    reset_http_stats()
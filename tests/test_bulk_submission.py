@@ -0,0 +1,232 @@
+"""
+Tests for bulk submission of meta.yaml files.
+"""
+
+import asyncio
+import os
+import tempfile
+
+import httpx
+import pytest
+import yaml
+from fastmcp import Client
+
+import registry_mcp
+from registry_mcp.rate_limit import RateLimiter
+from registry_mcp.tools import registry_batch
+from registry_mcp.tools.registry_batch import submit_yaml_files
+
+YAML_TEMPLATE = """
+"@context": https://schema.org
+"@type": SoftwareApplication
+"@id": https://github.com/test/bulk-mcp-{index}
+identifier: test/bulk-mcp-{index}
+name: Bulk MCP {index}
+description: A valid MCP server for bulk submission testing
+codeRepository: https://github.com/test/bulk-mcp-{index}
+maintainer:
+  - "@type": Person
+    name: Test User
+license: https://spdx.org/licenses/MIT.html
+applicationCategory: HealthApplication
+keywords:
+  - test
+programmingLanguage:
+  - Python
+user_confirmed: {confirmed}
+"""
+
+INVALID_YAML = """
+"@context": https://schema.org
+"@type": SoftwareApplication
+name: Incomplete MCP
+user_confirmed: false
+"""
+
+
+def _write_files(directory, count, confirmed=False):
+    paths = []
+    for index in range(count):
+        path = os.path.join(directory, f"mcp-{index}", "meta.yaml")
+        os.makedirs(os.path.dirname(path))
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(YAML_TEMPLATE.format(index=index, confirmed=str(confirmed).lower()))
+        paths.append(path)
+    return paths
+
+
+def _confirmed(path):
+    with open(path, encoding="utf-8") as f:
+        return yaml.safe_load(f)["user_confirmed"]
+
+
+@pytest.fixture(autouse=True)
+def no_rate_limit(monkeypatch):
+    """Disable the per-host rate limit unless a test sets one."""
+    monkeypatch.setattr(registry_batch, "SUBMIT_RATE_LIMIT", 0)
+    monkeypatch.setattr(registry_batch, "_RATE_LIMITERS", {})
+
+
+class TestSubmitYamlFiles:
+    """Test bulk submission."""
+
+    @pytest.mark.asyncio
+    async def test_submits_with_bounded_concurrency(self, registry_api):
+        """Test that all files are submitted with at most max_concurrency requests in flight."""
+        running = 0
+        peak = 0
+
+        async def slow_registry(request):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.02)
+            running -= 1
+            return httpx.Response(201, json={"id": "submission-" + request.read().decode().split("bulk-mcp-")[1][0]})
+
+        registry_api.handler = slow_registry
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            paths = _write_files(temp_dir, 6)
+            result = await submit_yaml_files(paths, max_concurrency=2)
+
+            assert all(_confirmed(path) for path in paths)
+
+        assert peak == 2
+        assert len(registry_api.requests) == 6
+        assert [r["file"] for r in result["results"]] == paths
+        assert [r["status"] for r in result["results"]] == ["submitted"] * 6
+        assert [r["submission_id"] for r in result["results"]] == [f"submission-{i}" for i in range(6)]
+        assert result["summary"]["submitted"] == 6
+        assert result["summary"]["failed"] == 0
+
+    @pytest.mark.asyncio
+    async def test_invalid_file_stops_submission(self, registry_api):
+        """Test that nothing is submitted if one file is invalid."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            paths = _write_files(temp_dir, 2)
+            invalid_path = os.path.join(temp_dir, "invalid.yaml")
+            with open(invalid_path, "w", encoding="utf-8") as f:
+                f.write(INVALID_YAML)
+
+            result = await submit_yaml_files([*paths, invalid_path, os.path.join(temp_dir, "missing.yaml")])
+
+            assert not any(_confirmed(path) for path in paths)
+
+        assert registry_api.requests == []
+        assert [r["status"] for r in result["results"]] == ["not_submitted", "not_submitted", "invalid", "invalid"]
+        assert result["results"][2]["errors"]
+        assert result["results"][3]["message"] == "Could not read file"
+        assert result["summary"]["invalid"] == 2
+
+    @pytest.mark.asyncio
+    async def test_submits_valid_files_without_stop_on_invalid(self, registry_api):
+        """Test that valid files are submitted despite invalid ones if requested."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            paths = _write_files(temp_dir, 2)
+            invalid_path = os.path.join(temp_dir, "invalid.yaml")
+            with open(invalid_path, "w", encoding="utf-8") as f:
+                f.write(INVALID_YAML)
+
+            result = await submit_yaml_files([*paths, invalid_path], stop_on_invalid=False)
+
+        assert [r["status"] for r in result["results"]] == ["submitted", "submitted", "invalid"]
+        assert len(registry_api.requests) == 2
+
+    @pytest.mark.asyncio
+    async def test_skips_confirmed_files_and_reports_failures(self, registry_api):
+        """Test that already confirmed files are skipped and registry errors reported per file."""
+        registry_api.handler = lambda request: httpx.Response(400, json={"error": "duplicate"})
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            confirmed = _write_files(os.path.join(temp_dir, "confirmed"), 1, confirmed=True)
+            pending = _write_files(os.path.join(temp_dir, "pending"), 1)
+
+            result = await submit_yaml_files([*confirmed, *pending, pending[0]])
+
+        assert len(result["results"]) == 2
+        assert [r["status"] for r in result["results"]] == ["skipped", "failed"]
+        assert result["results"][1]["errors"]
+        assert len(registry_api.requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_resubmission_does_not_use_rate_limit(self, registry_api, monkeypatch):
+        """Test that files skipped as already submitted do not wait for the rate limiter."""
+        acquired = []
+
+        class CountingLimiter(RateLimiter):
+            async def acquire(self):
+                acquired.append(1)
+                await super().acquire()
+
+        limiter = CountingLimiter(rate=0)
+        monkeypatch.setattr(registry_batch, "get_rate_limiter", lambda host: limiter)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            paths = _write_files(temp_dir, 3)
+            await submit_yaml_files(paths)
+            assert len(acquired) == 3
+
+            result = await submit_yaml_files(paths)
+
+        assert [r["status"] for r in result["results"]] == ["skipped"] * 3
+        assert len(acquired) == 3
+        assert len(registry_api.requests) == 3
+
+    @pytest.mark.asyncio
+    async def test_tool_reports_progress(self, registry_api):
+        """Test that the tool sends a progress notification per submitted file."""
+        notifications = []
+
+        async def on_progress(progress, total, message):
+            notifications.append((progress, total, message))
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            paths = _write_files(temp_dir, 3)
+            async with Client(registry_mcp.mcp, progress_handler=on_progress) as client:
+                result = await client.call_tool("submit_yaml_files_tool", {"yaml_file_paths": paths})
+
+        assert result.data["summary"]["submitted"] == 3
+        assert [(progress, total) for progress, total, _ in notifications] == [(1, 3), (2, 3), (3, 3)]
+        assert all(message.startswith("submitted: ") for _, _, message in notifications)
+
+
+class TestRateLimiter:
+    """Test the token bucket rate limiter."""
+
+    @pytest.mark.asyncio
+    async def test_spaces_requests_after_burst(self):
+        """Test that requests beyond the burst wait for new tokens."""
+        loop = asyncio.get_running_loop()
+        limiter = RateLimiter(rate=50, burst=2)
+        start = loop.time()
+        times = []
+        for _ in range(5):
+            await limiter.acquire()
+            times.append(loop.time() - start)
+
+        assert times[1] < 0.01
+        # Three requests after the burst, one every 20 ms
+        assert times[4] >= 0.055
+
+    @pytest.mark.asyncio
+    async def test_zero_rate_is_unlimited(self):
+        """Test that a rate of 0 never waits."""
+        loop = asyncio.get_running_loop()
+        limiter = RateLimiter(rate=0)
+        start = loop.time()
+        await asyncio.gather(*(limiter.acquire() for _ in range(100)))
+
+        assert loop.time() - start < 0.05
+
+    @pytest.mark.asyncio
+    async def test_limiter_shared_per_host(self, monkeypatch):
+        """Test that bulk submissions to one host share a limiter."""
+        monkeypatch.setattr(registry_batch, "SUBMIT_RATE_LIMIT", 5)
+
+        limiter = registry_batch.get_rate_limiter("api.example.org")
+
+        assert registry_batch.get_rate_limiter("api.example.org") is limiter
+        assert registry_batch.get_rate_limiter("other.example.org") is not limiter
+        assert limiter.rate == 5
+        assert limiter.burst == 5
@@ -0,0 +1,77 @@
+"""
+Tests for the in-process caches.
+"""
+
+from registry_mcp.cache import LRUCache
+
+
+class FakeTimer:
+    """Manually advanced clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestLRUCache:
+    """Test LRU cache behaviour."""
+
+    def test_get_and_set(self):
+        """Test storing and retrieving values."""
+        cache = LRUCache(maxsize=2)
+        cache.set("a", 1)
+
+        assert cache.get("a") == 1
+        assert cache.get("missing") is None
+        assert cache.get("missing", "default") == "default"
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 2
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted."""
+        cache = LRUCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert len(cache) == 2
+        assert cache.stats()["evictions"] == 1
+
+    def test_ttl_expiry(self):
+        """Test that entries expire after the TTL."""
+        timer = FakeTimer()
+        cache = LRUCache(maxsize=10, ttl=5, timer=timer)
+        cache.set("a", 1)
+
+        timer.now = 4.9
+        assert cache.get("a") == 1
+        timer.now = 5.0
+        assert cache.get("a") is None
+        assert cache.stats()["expirations"] == 1
+        assert len(cache) == 0
+
+    def test_disabled_cache(self):
+        """Test that maxsize 0 disables caching."""
+        cache = LRUCache(maxsize=0)
+        cache.set("a", 1)
+
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_clear_resets_counters(self):
+        """Test clearing the cache."""
+        cache = LRUCache()
+        cache.set("a", 1)
+        cache.get("a")
+        cache.clear()
+
+        stats = cache.stats()
+        assert stats["size"] == 0
+        assert stats["hits"] == 0
+        assert stats["hit_rate"] == 0.0
@@ -0,0 +1,140 @@
+"""
+Tests for running blocking tool work on the bounded tool thread pool.
+"""
+
+import asyncio
+import os
+import tempfile
+import threading
+import time
+
+import httpx
+import pytest
+from fastmcp import Client
+
+import registry_mcp
+from registry_mcp import executor
+from registry_mcp.executor import get_tool_executor, run_blocking, shutdown_tool_executor
+
+VALID_YAML = """
+"@context": https://schema.org
+"@type": SoftwareApplication
+"@id": https://github.com/test/concurrency-mcp
+identifier: test/concurrency-mcp
+name: Concurrency Test MCP
+description: A test MCP for concurrent tool calls
+codeRepository: https://github.com/test/concurrency-mcp
+maintainer:
+  - "@type": Person
+    name: Test User
+license: https://spdx.org/licenses/MIT.html
+applicationCategory: HealthApplication
+keywords:
+  - test
+programmingLanguage:
+  - Python
+"""
+
+
+@pytest.fixture
+def small_pool(monkeypatch):
+    """Recreate the tool pool with two workers."""
+    shutdown_tool_executor()
+    monkeypatch.setattr(executor, "DEFAULT_TOOL_WORKERS", 2)
+    yield
+    shutdown_tool_executor()
+
+
+class TestRunBlocking:
+    """Test the shared tool thread pool."""
+
+    @pytest.mark.asyncio
+    async def test_runs_off_the_event_loop(self):
+        """Test that the call runs on a pool thread and returns its result."""
+        thread_name = await run_blocking(lambda: threading.current_thread().name)
+
+        assert thread_name.startswith("registry-tool")
+        assert thread_name != threading.current_thread().name
+
+    @pytest.mark.asyncio
+    async def test_passes_arguments_and_exceptions(self):
+        """Test that arguments are passed through and exceptions re-raised."""
+        assert await run_blocking(divmod, 7, 2) == (3, 1)
+        assert await run_blocking(int, "ff", base=16) == 255
+        with pytest.raises(ZeroDivisionError):
+            await run_blocking(divmod, 1, 0)
+
+    @pytest.mark.asyncio
+    async def test_pool_is_bounded(self, small_pool):
+        """Test that no more than REGISTRY_MCP_TOOL_WORKERS calls run at once."""
+        lock = threading.Lock()
+        running = 0
+        peak = 0
+
+        def work():
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.05)
+            with lock:
+                running -= 1
+
+        await asyncio.gather(*(run_blocking(work) for _ in range(6)))
+
+        assert peak == 2
+        assert get_tool_executor()._max_workers == 2
+
+    def test_shutdown_recreates_pool(self):
+        """Test that the pool is recreated after a shutdown."""
+        pool = get_tool_executor()
+        shutdown_tool_executor()
+
+        assert get_tool_executor() is not pool
+
+
+class TestToolConcurrency:
+    """Test that slow tools do not block other tool calls."""
+
+    @pytest.mark.asyncio
+    async def test_fast_tools_respond_during_slow_submission(self, registry_api):
+        """Test that validation and analysis complete while a submission is in flight."""
+        release = asyncio.Event()
+        started = asyncio.Event()
+
+        async def slow_registry(request):
+            started.set()
+            await asyncio.wait_for(release.wait(), timeout=10)
+            return httpx.Response(201, json={"id": "submission-123"})
+
+        registry_api.handler = slow_registry
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            async with Client(registry_mcp.mcp) as client:
+                prepared = await client.call_tool(
+                    "submit_to_registry_tool", {"yaml_content": VALID_YAML, "project_path": temp_dir}
+                )
+                submission = asyncio.create_task(
+                    client.call_tool(
+                        "confirm_and_submit_to_registry_tool", {"yaml_file_path": prepared.data["yaml_file"]}
+                    )
+                )
+                await asyncio.wait_for(started.wait(), timeout=10)
+
+                try:
+                    validation = await asyncio.wait_for(
+                        client.call_tool("validate_yaml_specification_tool", {"yaml_content": VALID_YAML}), timeout=5
+                    )
+                    analysis = await asyncio.wait_for(
+                        client.call_tool("analyze_project_directory_tool", {"project_path": temp_dir}), timeout=5
+                    )
+                    assert not submission.done()
+                finally:
+                    release.set()
+
+                result = await submission
+
+        assert validation.data["valid"] is True
+        assert analysis.data["project_path"] == os.path.abspath(temp_dir)
+        assert result.data["success"] is True
+        assert result.data["submission_id"] == "submission-123"
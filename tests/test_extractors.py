@@ -0,0 +1,340 @@
+"""
+Tests for the project metadata extractors.
+"""
+
+import io
+import json
+import os
+import tempfile
+import threading
+
+import pytest
+
+from registry_mcp.extractors import (
+    ExtractorResult,
+    get_extractors,
+    merge_suggestions,
+    repository_metadata,
+    run_extractors,
+)
+from registry_mcp.extractors.readme import _bounded_lines, extract_description
+from registry_mcp.project_files import ProjectFiles
+from registry_mcp.tools.registry_submission import analyze_project_directory
+
+PACKAGE_JSON = {
+    "name": "node-mcp",
+    "description": "A Node MCP server",
+    "license": "MIT",
+    "author": "Jane Doe <jane@example.com> (https://jane.example.com)",
+    "keywords": ["mcp", "node"],
+    "homepage": "https://node-mcp.example.com",
+    "repository": {"type": "git", "url": "git+https://github.com/example/node-mcp.git"},
+    "devDependencies": {"typescript": "^5.0.0"},
+}
+
+CARGO_TOML = """
+[package]
+name = "rust-mcp"
+description = "A Rust MCP server"
+license = "Apache-2.0"
+authors = ["John Roe <john@example.com>"]
+keywords = ["mcp", "rust"]
+repository = "https://gitlab.com/example/rust-mcp"
+"""
+
+GO_MOD = """module github.com/example/go-mcp
+
+go 1.22
+"""
+
+R_DESCRIPTION = """Package: rmcp
+Title: An R MCP Server
+Description: Provides an MCP server
+    for R users.
+Authors@R: c(
+    person("Ada", "Lovelace", email = "ada@example.com", role = c("aut", "cre")),
+    person(given = "Charles", family = "Babbage", role = "ctb"))
+License: GPL-3
+URL: https://rmcp.example.com, https://github.com/example/rmcp
+"""
+
+PROJECT_TOML = """
+name = "JuliaMCP"
+uuid = "12345678-1234-1234-1234-123456789012"
+authors = ["Grace Hopper <grace@example.com>"]
+"""
+
+SETUP_CFG = """
+[metadata]
+name = setup-mcp
+description = A setup.cfg MCP server
+author = Alan Turing
+author_email = alan@example.com
+license = BSD-3-Clause
+keywords = mcp, setuptools
+project_urls =
+    Source = https://bitbucket.org/example/setup-mcp
+"""
+
+CITATION_CFF = """
+cff-version: 1.2.0
+title: Cited MCP
+abstract: An MCP server with citation metadata
+authors:
+  - given-names: Marie
+    family-names: Curie
+    orcid: https://orcid.org/0000-0000-0000-0000
+license: MIT
+repository-code: https://codeberg.org/example/cited-mcp
+keywords:
+  - citation
+"""
+
+CODEMETA = {
+    "@context": "https://w3id.org/codemeta/3.0",
+    "name": "codemeta-mcp",
+    "description": "An MCP server with CodeMeta",
+    "author": [{"@type": "Person", "givenName": "Rosalind", "familyName": "Franklin"}],
+    "programmingLanguage": ["Python 3", {"name": "C++"}],
+    "codeRepository": "https://github.com/example/codemeta-mcp",
+    "keywords": "codemeta, mcp",
+}
+
+PYPROJECT = """
+[project]
+name = "py-mcp"
+description = "A Python MCP server"
+keywords = ["mcp", "python"]
+urls = {Repository = "https://github.com/example/py-mcp"}
+"""
+
+
+def _write(directory, name, content):
+    with open(os.path.join(directory, name), "w", encoding="utf-8") as f:
+        f.write(content if isinstance(content, str) else json.dumps(content))
+
+
+def _extract(name, content):
+    with tempfile.TemporaryDirectory() as temp_dir:
+        _write(temp_dir, name, content)
+        results = run_extractors(ProjectFiles(temp_dir))
+        assert [r.error for r in results] == [None]
+        return results[0].metadata
+
+
+class TestManifestExtractors:
+    """Test the extractor of each manifest format."""
+
+    def test_package_json(self):
+        """Test metadata extraction from package.json."""
+        metadata = _extract("package.json", PACKAGE_JSON)
+
+        assert metadata["name"] == "node-mcp"
+        assert metadata["authors"] == [
+            {"name": "Jane Doe", "email": "jane@example.com", "url": "https://jane.example.com"}
+        ]
+        assert metadata["programming_language"] == ["TypeScript"]
+        assert metadata["codeRepository"] == "https://github.com/example/node-mcp"
+        assert metadata["identifier"] == "example/node-mcp"
+        assert metadata["url"] == "https://node-mcp.example.com"
+
+    def test_cargo_toml(self):
+        """Test metadata extraction from Cargo.toml."""
+        metadata = _extract("Cargo.toml", CARGO_TOML)
+
+        assert metadata["name"] == "rust-mcp"
+        assert metadata["license"] == "https://spdx.org/licenses/Apache-2.0.html"
+        assert metadata["authors"] == [{"name": "John Roe", "email": "john@example.com"}]
+        assert metadata["programming_language"] == ["Rust"]
+        assert metadata["identifier"] == "example/rust-mcp"
+
+    def test_go_mod(self):
+        """Test metadata extraction from go.mod."""
+        metadata = _extract("go.mod", GO_MOD)
+
+        assert metadata["name"] == "go-mcp"
+        assert metadata["programming_language"] == ["Go"]
+        assert metadata["codeRepository"] == "https://github.com/example/go-mcp"
+
+    def test_r_description(self):
+        """Test metadata extraction from an R DESCRIPTION file."""
+        metadata = _extract("DESCRIPTION", R_DESCRIPTION)
+
+        assert metadata["name"] == "rmcp"
+        assert metadata["description"] == "Provides an MCP server for R users."
+        assert metadata["authors"] == [
+            {"name": "Ada Lovelace", "email": "ada@example.com"},
+            {"name": "Charles Babbage"},
+        ]
+        assert metadata["programming_language"] == ["R"]
+        assert metadata["identifier"] == "example/rmcp"
+        assert metadata["url"] == "https://rmcp.example.com"
+
+    def test_julia_project_toml(self):
+        """Test metadata extraction from a Julia Project.toml."""
+        metadata = _extract("Project.toml", PROJECT_TOML)
+
+        assert metadata["name"] == "JuliaMCP"
+        assert metadata["programming_language"] == ["Julia"]
+        assert metadata["authors"] == [{"name": "Grace Hopper", "email": "grace@example.com"}]
+
+    def test_setup_cfg(self):
+        """Test metadata extraction from setup.cfg."""
+        metadata = _extract("setup.cfg", SETUP_CFG)
+
+        assert metadata["name"] == "setup-mcp"
+        assert metadata["authors"] == [{"name": "Alan Turing", "email": "alan@example.com"}]
+        assert metadata["keywords"] == ["mcp", "setuptools"]
+        assert metadata["codeRepository"] == "https://bitbucket.org/example/setup-mcp"
+
+    def test_citation_cff(self):
+        """Test metadata extraction from CITATION.cff."""
+        metadata = _extract("CITATION.cff", CITATION_CFF)
+
+        assert metadata["name"] == "Cited MCP"
+        assert metadata["description"] == "An MCP server with citation metadata"
+        assert metadata["authors"] == [{"name": "Marie Curie", "url": "https://orcid.org/0000-0000-0000-0000"}]
+        assert metadata["codeRepository"] == "https://codeberg.org/example/cited-mcp"
+
+    def test_codemeta_json(self):
+        """Test metadata extraction from codemeta.json."""
+        metadata = _extract("codemeta.json", CODEMETA)
+
+        assert metadata["name"] == "codemeta-mcp"
+        assert metadata["authors"] == [{"name": "Rosalind Franklin"}]
+        assert metadata["programming_language"] == ["Python", "C++"]
+        assert metadata["keywords"] == ["codemeta", "mcp"]
+
+    @pytest.mark.parametrize(
+        "url, expected",
+        [
+            ("git@github.com:example/repo.git", "example/repo"),
+            ("https://gitlab.com/example/repo/-/tree/main", "example/repo"),
+            ("ssh://git@bitbucket.org/example/repo.git", "example/repo"),
+            ("github:example/repo", "example/repo"),
+            ("https://example.com/example/repo", None),
+            ("https://github.com/example/repo#readme", "example/repo"),
+            ("ssh://git@github.com:22/example/repo.git", "example/repo"),
+            ("https://gitlab.com/group/sub/repo.git", None),
+            ("https://gitlab.com/group/sub/repo/-/tree/main", None),
+        ],
+    )
+    def test_repository_metadata(self, url, expected):
+        """Test repository URL parsing for supported hosts."""
+        assert repository_metadata(url).get("identifier") == expected
+
+    def test_repository_host_is_case_insensitive(self):
+        """Test that the host is matched case-insensitively and normalised."""
+        assert repository_metadata("https://GitHub.com/example/repo") == {
+            "codeRepository": "https://github.com/example/repo",
+            "identifier": "example/repo",
+        }
+
+
+class TestExtractorMerging:
+    """Test running and merging extractors."""
+
+    def test_polyglot_project(self):
+        """Test that a polyglot project gets merged metadata in one call."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            _write(temp_dir, "pyproject.toml", PYPROJECT)
+            _write(temp_dir, "package.json", PACKAGE_JSON)
+            _write(temp_dir, "Cargo.toml", CARGO_TOML)
+            _write(temp_dir, "README.md", "# Title\n\nFrom the README.\n")
+
+            result = analyze_project_directory(temp_dir)
+
+        metadata = result["suggested_metadata"]
+        assert metadata["name"] == "py-mcp"
+        assert metadata["description"] == "A Python MCP server"
+        assert metadata["identifier"] == "example/py-mcp"
+        assert metadata["programming_language"] == ["Python", "TypeScript", "Rust"]
+        assert metadata["keywords"] == ["mcp", "python", "node", "rust"]
+        assert metadata["license"] == "https://spdx.org/licenses/MIT.html"
+        assert result["metadata_sources"]["name"] == ["pyproject.toml"]
+        assert result["metadata_sources"]["license"] == ["package.json"]
+        assert sorted(result["detected_files"]) == ["Cargo.toml", "README.md", "package.json", "pyproject.toml"]
+
+    def test_empty_values_do_not_override(self):
+        """Test that lower-precedence extractors fill fields left empty by higher ones."""
+        extractors = {e.name: e for e in get_extractors()}
+        results = [
+            ExtractorResult(extractors["pyproject"], "pyproject.toml", {"name": "a", "description": ""}),
+            ExtractorResult(extractors["readme"], "README.md", {"description": "From README"}),
+        ]
+
+        metadata, sources = merge_suggestions(results)
+
+        assert metadata == {"name": "a", "description": "From README"}
+        assert sources["description"] == ["README.md"]
+
+    def test_parse_errors_become_warnings(self):
+        """Test that a broken manifest does not prevent other extractors from running."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            _write(temp_dir, "package.json", "{not json")
+            _write(temp_dir, "go.mod", GO_MOD)
+
+            result = analyze_project_directory(temp_dir)
+
+        assert any("Could not parse package.json" in warning for warning in result["warnings"])
+        assert result["suggested_metadata"]["name"] == "go-mcp"
+
+    def test_extractors_run_concurrently(self):
+        """Test that extractors run on a thread pool."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            _write(temp_dir, "package.json", PACKAGE_JSON)
+            _write(temp_dir, "Cargo.toml", CARGO_TOML)
+            files = ProjectFiles(temp_dir)
+            barrier = threading.Barrier(2, timeout=5)
+
+            def extract(path):
+                barrier.wait()
+                return {"name": os.path.basename(path)}
+
+            jobs = [
+                (e._replace(extract=extract), e.filenames[0]) for e in get_extractors() if e.name in ("npm", "cargo")
+            ]
+            results = run_extractors(files, jobs, max_workers=2)
+
+        assert [r.error for r in results] == [None, None]
+
+
+class TestReadmeExtraction:
+    """Test streaming description extraction from READMEs."""
+
+    @pytest.mark.parametrize(
+        "readme, expected",
+        [
+            ("# Title\n\nFirst paragraph\nsecond line.\n\nOther.\n", "First paragraph second line."),
+            ("---\ntitle: Front matter\n---\n# Title\nThe description.\n", "The description."),
+            (
+                "[![CI](https://ci/badge.svg)](https://ci) ![PyPI](https://pypi/badge.svg)\n\nThe description.\n",
+                "The description.",
+            ),
+            ('<p align="center">\n  <img src="logo.png">\n</p>\n\nThe description.\n', "The description."),
+            ("<!--\nA comment\n\nstill a comment\n-->\nThe description.\n", "The description."),
+            ("```bash\npip install x\n```\n\nThe description.\n", "The description."),
+            (
+                "Title\n=====\n\n.. image:: https://badge.svg\n   :target: https://ci\n\nThe description.\n",
+                "The description.",
+            ),
+            ("[ci]: https://ci\n\nOne.\nTwo.\nThree.\nFour.\n", "One. Two. Three."),
+            ("# Only headings\n## And more\n", None),
+        ],
+    )
+    def test_description(self, readme, expected):
+        """Test that non-prose blocks are skipped."""
+        assert extract_description(iter(readme.split("\n"))) == expected
+
+    def test_byte_budget(self):
+        """Test that at most the byte budget is read from huge READMEs."""
+        stream = io.BytesIO(b"<div>" + b"x" * 10_000_000 + b"</div>\n" + b"<br>\n" * 1_000_000 + b"\nLate paragraph.\n")
+
+        assert extract_description(_bounded_lines(stream, budget=65536)) is None
+        assert stream.tell() <= 65536
+
+    def test_overlong_lines_are_truncated(self):
+        """Test that a single long line does not leak into the following lines."""
+        stream = io.BytesIO(b"a" * 10000 + b"\nnext\n")
+
+        assert [len(line) for line in _bounded_lines(stream, budget=65536, max_line=100)] == [100, 4]
@@ -0,0 +1,86 @@
+"""
+Tests for the shared registry HTTP client.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from registry_mcp import http_client
+from registry_mcp.http_client import close_http_client, create_http_client, get_http_client, post_json, set_http_client
+
+
+@pytest.fixture(autouse=True)
+def reset_client():
+    """Start every test without a shared client."""
+    set_http_client(None)
+    yield
+    set_http_client(None)
+
+
+class TestHTTPClient:
+    """Test creation, reuse and shutdown of the shared client."""
+
+    @pytest.mark.asyncio
+    async def test_client_is_shared(self):
+        """Test that the same client (and connection pool) is reused."""
+        client = get_http_client()
+
+        assert get_http_client() is client
+        await close_http_client()
+        assert client.is_closed
+        assert get_http_client() is not client
+        await close_http_client()
+
+    def test_client_is_replaced_on_another_event_loop(self):
+        """Test that a client created on a finished event loop is not reused."""
+
+        async def current_client():
+            return get_http_client()
+
+        first = asyncio.run(current_client())
+        second = asyncio.run(current_client())
+
+        assert second is not first
+
+    def test_configured_limits_and_timeouts(self, monkeypatch):
+        """Test that pool limits and timeouts come from the configuration."""
+        monkeypatch.setattr(http_client, "CONNECT_TIMEOUT", 2.0)
+        monkeypatch.setattr(http_client, "READ_TIMEOUT", 7.0)
+        monkeypatch.setattr(http_client, "MAX_CONNECTIONS", 4)
+
+        client = create_http_client()
+
+        assert client.timeout.connect == 2.0
+        assert client.timeout.read == 7.0
+        pool = client._transport._pool
+        assert pool._max_connections == 4
+
+    @pytest.mark.asyncio
+    async def test_post_json(self):
+        """Test that documents are posted as JSON with the shared client."""
+        seen = []
+
+        def handler(request):
+            seen.append(request)
+            return httpx.Response(201, json={"id": "submission-123"})
+
+        set_http_client(httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+        response = await post_json("https://registry.example.org/submit", {"name": "Example"})
+
+        assert response.status_code == 201
+        assert seen[0].headers["content-type"] == "application/json"
+        assert seen[0].content == b'{"name":"Example"}'
+
+    @pytest.mark.asyncio
+    async def test_post_json_total_timeout(self):
+        """Test that the total timeout bounds the whole request."""
+
+        async def handler(request):
+            await asyncio.sleep(10)
+            return httpx.Response(201)
+
+        set_http_client(httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+        with pytest.raises(TimeoutError):
+            await post_json("https://registry.example.org/submit", {}, timeout=0.05)
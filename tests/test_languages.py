@@ -0,0 +1,119 @@
+"""
+Tests for source language detection.
+"""
+
+import os
+import tempfile
+
+import pytest
+
+from registry_mcp import languages
+from registry_mcp.languages import detect_languages
+from registry_mcp.tools.registry_submission import analyze_project_directory, clear_analysis_cache
+
+
+def _write(root, path, size):
+    full_path = os.path.join(root, path)
+    os.makedirs(os.path.dirname(full_path), exist_ok=True)
+    with open(full_path, "w") as f:
+        f.write("x" * size)
+
+
+@pytest.fixture
+def project():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        _write(temp_dir, "src/server/main.ts", 6000)
+        _write(temp_dir, "src/server/tools.tsx", 2000)
+        _write(temp_dir, "scripts/build.py", 1500)
+        _write(temp_dir, "scripts/helper.c", 400)
+        _write(temp_dir, "scripts/tiny.go", 100)
+        _write(temp_dir, "dist/bundle.min.js", 90000)
+        _write(temp_dir, "node_modules/dep/index.js", 90000)
+        _write(temp_dir, ".venv/lib/site.py", 90000)
+        _write(temp_dir, "env2/pyvenv.cfg", 10)
+        _write(temp_dir, "env2/lib/module.py", 90000)
+        _write(temp_dir, "docs/theme/app.js", 90000)
+        _write(temp_dir, "src/server/types.d.ts", 90000)
+        yield temp_dir
+
+
+class TestDetectLanguages:
+    """Test the extension histogram."""
+
+    def test_ranked_by_byte_share(self, project):
+        """Test that languages are ranked by bytes and vendor/generated files are skipped."""
+        stats = detect_languages(project)
+
+        assert [entry["language"] for entry in stats.languages] == ["TypeScript", "Python", "Go", "Other"]
+        assert stats.languages[0] == {"language": "TypeScript", "bytes": 8000, "files": 2, "share": 0.8}
+        assert stats.sampled is False
+        assert stats.files_scanned == 5
+
+    def test_schema_languages(self, project):
+        """Test that minor languages and "Other" below the minimum share are dropped."""
+        assert detect_languages(project).schema_languages() == ["TypeScript", "Python"]
+        assert detect_languages(project).schema_languages(min_share=0.0) == ["TypeScript", "Python", "Go", "Other"]
+
+    def test_only_other(self):
+        """Test that "Other" is reported when no enum language is used."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            _write(temp_dir, "main.c", 100)
+
+            assert detect_languages(temp_dir).schema_languages() == ["Other"]
+
+    def test_depth_limit(self, project):
+        """Test that files below max_depth are not visited."""
+        assert detect_languages(project, max_depth=1).schema_languages() == ["Python", "Go", "Other"]
+
+    def test_large_directory_is_sampled(self, monkeypatch):
+        """Test that a directory with many files is sampled and extrapolated."""
+        monkeypatch.setattr(languages, "FILES_PER_DIRECTORY", 20)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for i in range(100):
+                _write(temp_dir, f"gen/file{i}.py", 10)
+                _write(temp_dir, f"gen/file{i}.rs", 30)
+
+            stats = detect_languages(temp_dir)
+
+        assert stats.sampled is True
+        assert stats.files_scanned == 20
+        assert sum(entry["files"] for entry in stats.languages) == 200
+        assert stats.languages[0]["language"] == "Rust"
+        assert 0.6 < stats.languages[0]["share"] < 0.9
+
+    def test_wide_tree_is_sampled(self, monkeypatch):
+        """Test that levels with many directories are sampled and the walk is bounded."""
+        monkeypatch.setattr(languages, "DIRECTORIES_PER_LEVEL", 10)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for i in range(50):
+                _write(temp_dir, f"packages/p{i}/index.js", 100)
+
+            stats = detect_languages(temp_dir, max_files=1000)
+
+        assert stats.sampled is True
+        assert stats.files_scanned == 10
+        assert stats.languages[0]["files"] == 50
+        assert stats.languages[0]["bytes"] == 5000
+
+    def test_file_limit(self, project):
+        """Test that the walk stops after max_files source files."""
+        stats = detect_languages(project, max_files=2)
+
+        assert stats.files_scanned == 2
+        assert stats.sampled is True
+
+
+class TestLanguageAnalysis:
+    """Test programming_language in project analysis."""
+
+    def test_detected_languages_override_manifests(self, project):
+        """Test that a pyproject.toml no longer implies the project is Python."""
+        clear_analysis_cache()
+        with open(os.path.join(project, "pyproject.toml"), "w") as f:
+            f.write('[project]\nname = "ts-server"\n')
+
+        analysis = analyze_project_directory(project)
+
+        assert analysis["suggested_metadata"]["programming_language"] == ["TypeScript", "Python"]
+        assert analysis["metadata_sources"]["programming_language"] == ["source files"]
+        assert analysis["languages"]["languages"][0]["language"] == "TypeScript"
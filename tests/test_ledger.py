@@ -0,0 +1,87 @@
+"""
+Tests for the local submission ledger.
+"""
+
+import threading
+
+from registry_mcp.ledger import SubmissionLedger
+
+ENDPOINT = "https://registry.example.org/submit"
+
+
+class TestSubmissionLedger:
+    """Test recording and querying submissions."""
+
+    def test_begin_creates_record_with_idempotency_key(self, tmp_path):
+        """Test that the first attempt creates a pending record."""
+        ledger = SubmissionLedger(str(tmp_path / "ledger.db"))
+
+        record = ledger.begin(ENDPOINT, "hash-1", "test/mcp", "/tmp/meta.yaml")
+
+        assert record["status"] == "pending"
+        assert record["attempts"] == 1
+        assert record["identifier"] == "test/mcp"
+        assert len(record["idempotency_key"]) == 36
+        assert ledger.lookup(ENDPOINT, "hash-1") == record
+        assert ledger.lookup(ENDPOINT, "hash-2") is None
+        assert ledger.lookup("https://other.example.org/submit", "hash-1") is None
+
+    def test_retries_reuse_idempotency_key(self, tmp_path):
+        """Test that later attempts keep the key and count attempts."""
+        ledger = SubmissionLedger(str(tmp_path / "ledger.db"))
+
+        first = ledger.begin(ENDPOINT, "hash-1", "test/mcp")
+        ledger.finish(ENDPOINT, "hash-1", False, error="API request failed with status 503")
+        assert ledger.lookup(ENDPOINT, "hash-1")["last_error"] == "API request failed with status 503"
+        second = ledger.begin(ENDPOINT, "hash-1", "test/mcp")
+        ledger.finish(ENDPOINT, "hash-1", True, submission_id="submission-1")
+
+        record = ledger.lookup(ENDPOINT, "hash-1")
+        assert second["idempotency_key"] == first["idempotency_key"]
+        assert record["attempts"] == 2
+        assert record["status"] == "submitted"
+        assert record["submission_id"] == "submission-1"
+        assert record["last_error"] is None
+
+    def test_records_persist_across_reopen(self, tmp_path):
+        """Test that records survive closing and reopening the database."""
+        path = str(tmp_path / "nested" / "ledger.db")
+        ledger = SubmissionLedger(path)
+        ledger.begin(ENDPOINT, "hash-1", "test/mcp")
+        ledger.finish(ENDPOINT, "hash-1", True, submission_id="submission-1")
+        ledger.close()
+
+        reopened = SubmissionLedger(path)
+
+        assert reopened.lookup(ENDPOINT, "hash-1")["submission_id"] == "submission-1"
+        assert reopened.stats()["submitted"] == 1
+
+    def test_history_filters_and_orders(self):
+        """Test filtering the history and ordering by last update."""
+        ledger = SubmissionLedger(":memory:")
+        for index, identifier in enumerate(["test/a", "test/b", "test/a"]):
+            ledger.begin(ENDPOINT, f"hash-{index}", identifier)
+            ledger.finish(ENDPOINT, f"hash-{index}", index != 1)
+
+        assert [r["content_hash"] for r in ledger.history()] == ["hash-2", "hash-1", "hash-0"]
+        assert [r["content_hash"] for r in ledger.history(identifier="test/a")] == ["hash-2", "hash-0"]
+        assert [r["content_hash"] for r in ledger.history(status="failed")] == ["hash-1"]
+        assert len(ledger.history(limit=1)) == 1
+        assert ledger.stats() == {"path": ":memory:", "total": 3, "pending": 0, "submitted": 2, "failed": 1}
+
+    def test_concurrent_use_from_threads(self, tmp_path):
+        """Test that one ledger can be shared by the tool thread pool."""
+        ledger = SubmissionLedger(str(tmp_path / "ledger.db"))
+
+        def submit(index):
+            ledger.begin(ENDPOINT, f"hash-{index % 5}", "test/mcp")
+            ledger.finish(ENDPOINT, f"hash-{index % 5}", True)
+
+        threads = [threading.Thread(target=submit, args=(index,)) for index in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert ledger.stats()["submitted"] == 5
+        assert sum(r["attempts"] for r in ledger.history()) == 20
@@ -2,6 +2,9 @@
 Tests for MCP tool integration.
 """
 
+import os
+import tempfile
+
 import pytest
 from fastmcp import Client
 
@@ -94,6 +97,80 @@ programmingLanguage:
             assert "@context" in result.data["properties"]
             assert "@type" in result.data["properties"]
 
+    @pytest.mark.asyncio
+    async def test_get_validation_cache_stats_tool(self):
+        """Test get_validation_cache_stats_tool via MCP."""
+        async with Client(registry_mcp.mcp) as client:
+            result = await client.call_tool("get_validation_cache_stats_tool", {})
+            
+            assert "hits" in result.data
+            assert "misses" in result.data
+            assert "size" in result.data
+            assert "maxsize" in result.data
+
+    @pytest.mark.asyncio
+    async def test_get_registry_schema_status_tool(self):
+        """Test get_registry_schema_status_tool via MCP."""
+        async with Client(registry_mcp.mcp) as client:
+            result = await client.call_tool("get_registry_schema_status_tool", {})
+            
+            assert result.data["origin"] in ("bundled", "cache", "file", "remote")
+            assert "version" in result.data
+
+    @pytest.mark.asyncio
+    async def test_get_registry_http_stats_tool(self):
+        """Test get_registry_http_stats_tool via MCP."""
+        async with Client(registry_mcp.mcp) as client:
+            result = await client.call_tool("get_registry_http_stats_tool", {})
+            
+            assert "retries" in result.data
+            assert "retries_by_reason" in result.data
+            assert "circuit_breakers" in result.data
+            assert result.data["config"]["max_attempts"] >= 1
+
+    @pytest.mark.asyncio
+    async def test_get_yaml_backend_tool(self):
+        """Test get_yaml_backend_tool via MCP."""
+        async with Client(registry_mcp.mcp) as client:
+            result = await client.call_tool("get_yaml_backend_tool", {})
+            
+            assert result.data["backend"] in result.data["available_backends"]
+            assert "python" in result.data["available_backends"]
+
+    @pytest.mark.asyncio
+    async def test_analyze_monorepo_tool_streams_results(self):
+        """Test analyze_monorepo_tool via MCP, with one log message per project."""
+        messages = []
+        
+        async def log_handler(message):
+            messages.append(message)
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for name in ("server-a", "server-b"):
+                os.makedirs(os.path.join(temp_dir, "servers", name))
+                with open(os.path.join(temp_dir, "servers", name, "pyproject.toml"), "w") as f:
+                    f.write(f'[project]\nname = "{name}"\n')
+            
+            async with Client(registry_mcp.mcp, log_handler=log_handler) as client:
+                result = await client.call_tool("analyze_monorepo_tool", {"root_path": temp_dir})
+        
+        assert [p["relative_path"] for p in result.data["projects"]] == [
+            os.path.join("servers", "server-a"), os.path.join("servers", "server-b")
+        ]
+        assert result.data["projects"][0]["suggested_metadata"]["name"] == "server-a"
+        assert len(messages) == 2
+
+    @pytest.mark.asyncio
+    async def test_validate_yaml_specifications_tool(self):
+        """Test validate_yaml_specifications_tool via MCP."""
+        async with Client(registry_mcp.mcp) as client:
+            result = await client.call_tool("validate_yaml_specifications_tool", {"yaml_contents": ["name: test", "name: other"]})
+            
+            assert "results" in result.data
+            assert "summary" in result.data
+            assert result.data["summary"]["total"] == 2
+            assert result.data["summary"]["invalid"] == 2
+
     @pytest.mark.asyncio
     async def test_get_registry_workflow_guidance_tool(self):
         """Test get_registry_workflow_guidance_tool via MCP."""
@@ -165,6 +242,16 @@ programmingLanguage:
             "validate_yaml_specification_tool",
             "submit_to_registry_tool",
             "get_registry_schema_tool",
+            "get_validation_cache_stats_tool",
+            "get_registry_schema_status_tool",
+            "get_registry_http_stats_tool",
+            "get_submission_history_tool",
+            "get_submission_queue_tool",
+            "get_yaml_backend_tool",
+            "validate_yaml_specifications_tool",
+            "submit_yaml_files_tool",
+            "analyze_monorepo_tool",
+            "search_registry_tool",
             "get_registry_workflow_guidance_tool",
             "get_example_submissions_tool",
             "get_troubleshooting_guide_tool",
@@ -183,6 +270,12 @@ programmingLanguage:
                         await client.call_tool(tool_name, {"metadata": {"name": "test"}})
                     elif tool_name == "validate_yaml_specification_tool":
                         await client.call_tool(tool_name, {"yaml_content": 'name: test'})
+                    elif tool_name == "validate_yaml_specifications_tool":
+                        await client.call_tool(tool_name, {"yaml_contents": ['name: test']})
+                    elif tool_name == "submit_yaml_files_tool":
+                        await client.call_tool(tool_name, {"yaml_file_paths": []})
+                    elif tool_name == "search_registry_tool":
+                        await client.call_tool(tool_name, {"registry_path": os.path.dirname(__file__)})
                     elif tool_name == "submit_to_registry_tool":
                         await client.call_tool(tool_name, {"yaml_content": 'name: test'})
                     else:
@@ -0,0 +1,326 @@
+"""
+Tests for the durable submission outbox and its background worker.
+"""
+
+import asyncio
+import json
+import multiprocessing
+import os
+import tempfile
+
+import httpx
+import pytest
+import yaml
+from fastmcp import Client
+
+import registry_mcp
+from registry_mcp.outbox import OutboxWorker, SubmissionOutbox, set_submission_outbox
+from registry_mcp.tools.registry_submission import confirm_and_submit_to_registry, start_submission_worker
+
+ENDPOINT = "https://registry.example.org/submit"
+
+VALID_YAML = """
+"@context": https://schema.org
+"@type": SoftwareApplication
+"@id": https://github.com/test/outbox-mcp
+identifier: test/outbox-mcp
+name: Outbox MCP
+description: A test MCP for the submission outbox
+codeRepository: https://github.com/test/outbox-mcp
+maintainer:
+  - "@type": Person
+    name: Test User
+license: https://spdx.org/licenses/MIT.html
+applicationCategory: HealthApplication
+keywords:
+  - test
+programmingLanguage:
+  - Python
+user_confirmed: false
+"""
+
+
+class FakeClock:
+    """Settable wall clock."""
+
+    def __init__(self):
+        self.now = 1_700_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _enqueue_from_process(path, name, count):
+    outbox = SubmissionOutbox(path)
+    for i in range(count):
+        outbox.enqueue(ENDPOINT, {"n": i}, f"hash-{name}-{i}")
+
+
+class TestSubmissionOutbox:
+    """Test the disk-backed queue."""
+
+    def test_queued_items_survive_reopen(self, tmp_path):
+        """Test that queued items are replayed and finished ones compacted away on reopen."""
+        path = str(tmp_path / "outbox.jsonl")
+        outbox = SubmissionOutbox(path)
+        first = outbox.enqueue(ENDPOINT, {"identifier": "test/a"}, "hash-a", "test/a", error="Network error")
+        second = outbox.enqueue(ENDPOINT, {"identifier": "test/b"}, "hash-b", "test/b")
+        outbox.record_failure(first["id"], "Network error again")
+        outbox.record_success(second["id"], "submission-b")
+
+        reopened = SubmissionOutbox(path)
+
+        [item] = reopened.items()
+        assert item["id"] == first["id"]
+        assert item["attempts"] == 1
+        assert item["last_error"] == "Network error again"
+        with open(path, encoding="utf-8") as f:
+            [line] = f.readlines()
+        assert json.loads(line)["document"] == {"identifier": "test/a"}
+
+    def test_damaged_line_is_skipped(self, tmp_path):
+        """Test that a snapshot cut short by a crash does not lose earlier snapshots."""
+        path = str(tmp_path / "outbox.jsonl")
+        outbox = SubmissionOutbox(path)
+        item = outbox.enqueue(ENDPOINT, {"identifier": "test/a"}, "hash-a")
+        with open(path, "a", encoding="utf-8") as f:
+            f.write('{"id": "' + item["id"] + '", "status": "subm')
+
+        assert [i["id"] for i in SubmissionOutbox(path).items()] == [item["id"]]
+
+    def test_document_is_queued_once(self, tmp_path):
+        """Test that the same document and endpoint are not queued twice."""
+        outbox = SubmissionOutbox(str(tmp_path / "outbox.jsonl"))
+
+        first = outbox.enqueue(ENDPOINT, {}, "hash-a")
+        again = outbox.enqueue(ENDPOINT, {}, "hash-a")
+        other = outbox.enqueue("https://other.example.org/submit", {}, "hash-a")
+
+        assert again["id"] == first["id"]
+        assert other["id"] != first["id"]
+        assert outbox.stats()["depth"] == 2
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="needs fork and flock")
+    def test_processes_share_the_queue(self, tmp_path, monkeypatch):
+        """Test that items queued by other processes are seen and survive their compactions."""
+        monkeypatch.setattr("registry_mcp.outbox.COMPACT_LINES", 5)
+        path = str(tmp_path / "outbox.jsonl")
+        outbox = SubmissionOutbox(path)
+        first = outbox.enqueue(ENDPOINT, {}, "hash-a")
+
+        context = multiprocessing.get_context("fork")
+        processes = [context.Process(target=_enqueue_from_process, args=(path, name, 20)) for name in "xyz"]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join(30)
+
+        assert [process.exitcode for process in processes] == [0, 0, 0]
+        assert outbox.stats()["depth"] == 61
+        assert outbox.enqueue(ENDPOINT, {"n": 0}, "hash-x-0")["id"] != first["id"]
+        assert outbox.stats()["depth"] == 61
+        assert SubmissionOutbox(path).stats()["depth"] == 61
+
+    def test_claimed_item_is_sent_by_one_process(self, tmp_path):
+        """Test that an item claimed through one outbox is not due in another sharing the file."""
+        clock = FakeClock()
+        path = str(tmp_path / "outbox.jsonl")
+        first = SubmissionOutbox(path, base_delay=0, claim_timeout=60, timer=clock)
+        second = SubmissionOutbox(path, base_delay=0, claim_timeout=60, timer=clock)
+        item = first.enqueue(ENDPOINT, {"n": 1}, "hash-a")
+
+        assert second.claim(item["id"])["document"] == {"n": 1}
+        assert first.claim(item["id"]) is None
+        assert first.due() == []
+
+        # A claim that is not finished lapses, e.g. because the process died
+        clock.now += 60
+        assert first.claim(item["id"]) is not None
+        first.record_success(item["id"], "submission-1")
+        assert second.claim(item["id"]) is None
+        assert second.stats()["depth"] == 0
+
+    def test_backoff_and_retry_after(self, tmp_path):
+        """Test that retries back off exponentially and honour Retry-After."""
+        clock = FakeClock()
+        outbox = SubmissionOutbox(
+            str(tmp_path / "outbox.jsonl"), base_delay=5, max_delay=30, timer=clock, jitter=lambda: 1.0
+        )
+
+        item = outbox.enqueue(ENDPOINT, {}, "hash-a")
+        assert outbox.next_due() == 5
+        clock.now += 5
+        assert [i["id"] for i in outbox.due()] == [item["id"]]
+
+        outbox.record_failure(item["id"], "503")
+        assert outbox.next_due() == 10
+        outbox.record_failure(item["id"], "503")
+        outbox.record_failure(item["id"], "503")
+        assert outbox.next_due() == 30
+        outbox.record_failure(item["id"], "429", retry_after=120)
+        assert outbox.next_due() == 120
+        assert outbox.due() == []
+
+    def test_permanent_failure_leaves_queue(self, tmp_path):
+        """Test that a rejected document is not retried again."""
+        outbox = SubmissionOutbox(str(tmp_path / "outbox.jsonl"), base_delay=0)
+        item = outbox.enqueue(ENDPOINT, {}, "hash-a")
+
+        outbox.record_failure(item["id"], "API request failed with status 400", permanent=True)
+
+        assert outbox.stats()["depth"] == 0
+        assert outbox.stats()["failed"] == 1
+        assert outbox.next_due() is None
+        assert outbox.items(include_finished=True)[0]["status"] == "failed"
+
+    def test_item_is_given_up_after_max_attempts(self, tmp_path):
+        """Test that a transient failure is not retried forever."""
+        outbox = SubmissionOutbox(str(tmp_path / "outbox.jsonl"), base_delay=0, max_attempts=3)
+        item = outbox.enqueue(ENDPOINT, {}, "hash-a")
+
+        outbox.record_failure(item["id"], "503")
+        outbox.record_failure(item["id"], "503")
+        assert outbox.stats()["depth"] == 1
+        outbox.record_failure(item["id"], "503")
+
+        assert outbox.stats()["depth"] == 0
+        assert outbox.next_due() is None
+        [failed] = outbox.items(include_finished=True)
+        assert (failed["status"], failed["attempts"], failed["last_error"]) == ("failed", 3, "503")
+
+
+class TestOutboxWorker:
+    """Test retrying queued submissions."""
+
+    @pytest.mark.asyncio
+    async def test_flush_records_outcomes(self, tmp_path):
+        """Test that flush retries due items and records each outcome."""
+        outbox = SubmissionOutbox(str(tmp_path / "outbox.jsonl"), base_delay=0)
+        ok = outbox.enqueue(ENDPOINT, {"n": 1}, "hash-ok")
+        busy = outbox.enqueue(ENDPOINT, {"n": 2}, "hash-busy")
+        rejected = outbox.enqueue(ENDPOINT, {"n": 3}, "hash-rejected")
+        results = {
+            "hash-ok": {"success": True, "submission_id": "submission-1", "errors": []},
+            "hash-busy": {"success": False, "retryable": True, "retry_after": 60, "errors": ["status 503"]},
+            "hash-rejected": {"success": False, "errors": ["status 400"]},
+        }
+
+        async def submit(item):
+            return results[item["content_hash"]]
+
+        assert await OutboxWorker(outbox, submit).flush() == 3
+
+        items = {item["id"]: item for item in outbox.items(include_finished=True)}
+        assert items[ok["id"]]["status"] == "submitted"
+        assert items[ok["id"]]["submission_id"] == "submission-1"
+        assert items[busy["id"]]["status"] == "queued"
+        assert items[busy["id"]]["next_attempt_in"] >= 59
+        assert items[rejected["id"]]["status"] == "failed"
+        assert items[rejected["id"]]["last_error"] == "status 400"
+
+    @pytest.mark.asyncio
+    async def test_failed_submission_is_queued_and_retried(self, registry_api, submission_ledger, tmp_path):
+        """Test that a submission failing with 503 is queued, retried in the background and then confirmed."""
+        set_submission_outbox(SubmissionOutbox(str(tmp_path / "retry-outbox.jsonl"), base_delay=0.05))
+        registry_api.handler = lambda request: httpx.Response(503)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "meta.yaml")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(VALID_YAML)
+
+            result = await confirm_and_submit_to_registry(path, ENDPOINT)
+            assert result["success"] is False
+            assert result["queued"] is True
+            with open(path, encoding="utf-8") as f:
+                assert yaml.safe_load(f)["user_confirmed"] is False
+
+            registry_api.handler = lambda request: httpx.Response(201, json={"id": "submission-789"})
+            worker = start_submission_worker()
+            async with asyncio.timeout(5):
+                while worker.outbox.stats()["depth"]:
+                    await asyncio.sleep(0.01)
+
+            with open(path, encoding="utf-8") as f:
+                assert yaml.safe_load(f)["user_confirmed"] is True
+
+        assert len({request.headers["Idempotency-Key"] for request in registry_api.requests}) == 1
+        [record] = submission_ledger.history()
+        assert record["status"] == "submitted"
+        assert record["submission_id"] == "submission-789"
+        assert worker.outbox.items(include_finished=True)[0]["status"] == "submitted"
+        await worker.stop()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "response",
+        [
+            httpx.Response(500, json={"message": "Internal error"}),
+            httpx.Response(429, json={"message": "Too many requests"}),
+        ],
+    )
+    async def test_non_transient_failure_is_not_queued(
+        self, registry_api, submission_ledger, submission_outbox, response
+    ):
+        """Test that a 500, or a 429 without Retry-After, is reported as failed instead of queued."""
+        registry_api.handler = lambda request: response
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "meta.yaml")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(VALID_YAML)
+
+            result = await confirm_and_submit_to_registry(path, ENDPOINT)
+
+        assert result["success"] is False
+        assert not result.get("queued")
+        assert submission_outbox.stats()["depth"] == 0
+        assert submission_ledger.history()[0]["status"] == "failed"
+
+    @pytest.mark.asyncio
+    async def test_item_queued_during_flush_is_not_missed(self, tmp_path):
+        """Test that a notify arriving while the worker flushes wakes it again."""
+        outbox = SubmissionOutbox(str(tmp_path / "outbox.jsonl"), base_delay=0)
+        loop = asyncio.get_running_loop()
+        submitted = []
+        next_due = outbox.next_due
+
+        async def submit(item):
+            submitted.append(item["content_hash"])
+            return {"success": True, "submission_id": None, "errors": []}
+
+        worker = OutboxWorker(outbox, submit)
+
+        def next_due_then_enqueue():
+            # Queued right after the worker found nothing due, before it goes back to sleep
+            delay = next_due()
+            if not outbox.items(include_finished=True):
+                outbox.enqueue(ENDPOINT, {}, "hash-late")
+                loop.call_soon_threadsafe(worker.notify)
+            return delay
+
+        outbox.next_due = next_due_then_enqueue
+        worker.start()
+        async with asyncio.timeout(2):
+            while not submitted:
+                await asyncio.sleep(0.01)
+
+        assert submitted == ["hash-late"]
+        await worker.stop()
+
+    @pytest.mark.asyncio
+    async def test_queue_tool_reports_items(self, submission_outbox):
+        """Test that the queue tool reports depth and queued items."""
+        submission_outbox.enqueue(ENDPOINT, {"identifier": "test/a"}, "hash-a", "test/a", error="Network error")
+
+        async with Client(registry_mcp.mcp) as client:
+            result = await client.call_tool("get_submission_queue_tool", {})
+
+        assert result.data["depth"] == 1
+        assert result.data["path"] == submission_outbox.path
+        [item] = result.data["items"]
+        assert item["identifier"] == "test/a"
+        assert item["status"] == "queued"
+        assert item["last_error"] == "Network error"
+        assert "document" not in item
+        json.dumps(result.data)
@@ -0,0 +1,56 @@
+"""
+Tests for the project directory file index.
+"""
+
+import os
+import tempfile
+
+from registry_mcp.project_files import ProjectFiles
+
+
+def _touch(directory, *names):
+    for name in names:
+        with open(os.path.join(directory, name), "w") as f:
+            f.write("content")
+
+
+class TestProjectFiles:
+    """Test the case-insensitive file index."""
+
+    def test_case_insensitive_lookup(self):
+        """Test that lookups ignore case and return the name on disk."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            _touch(temp_dir, "Readme.MD", "pyproject.toml")
+            files = ProjectFiles(temp_dir)
+
+            assert "README.md" in files
+            assert files.get("readme.md") == "Readme.MD"
+            assert files.readme == "Readme.MD"
+            assert files.join(files.readme) == os.path.join(temp_dir, "Readme.MD")
+            assert files.get("setup.py") is None
+
+    def test_preference_order(self):
+        """Test that README and LICENSE variants are found in order of preference."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            _touch(temp_dir, "README.txt", "README.rst", "COPYING", "LICENSE.md")
+            files = ProjectFiles(temp_dir)
+
+            assert files.readme == "README.rst"
+            assert files.license == "LICENSE.md"
+
+    def test_directories_are_ignored(self):
+        """Test that only regular files are indexed."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            os.mkdir(os.path.join(temp_dir, "LICENSE"))
+            _touch(temp_dir, "COPYING")
+            files = ProjectFiles(temp_dir)
+
+            assert files.license == "COPYING"
+            assert files.names == ["COPYING"]
+
+    def test_missing_directory(self):
+        """Test that a missing directory gives an empty index."""
+        files = ProjectFiles(os.path.join(tempfile.gettempdir(), "does-not-exist-registry-mcp"))
+
+        assert len(files) == 0
+        assert files.readme is None
@@ -0,0 +1,109 @@
+"""
+Tests for project root discovery in directory trees.
+"""
+
+import os
+import tempfile
+
+import pytest
+
+from registry_mcp.project_scan import ProjectScan
+from registry_mcp.tools.registry_batch import analyze_monorepo, iter_project_analyses
+
+
+def _touch(root, *paths):
+    for path in paths:
+        full_path = os.path.join(root, path)
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        with open(full_path, "w") as f:
+            f.write("{}" if path.endswith(".json") else "")
+
+
+@pytest.fixture
+def monorepo():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        _touch(
+            temp_dir,
+            "package.json",
+            "servers/python-mcp/pyproject.toml",
+            "servers/node-mcp/package.json",
+            "servers/node-mcp/node_modules/dep/package.json",
+            "servers/rust-mcp/Cargo.toml",
+            "servers/rust-mcp/target/debug/build/Cargo.toml",
+            "servers/python-mcp/.venv/lib/site-packages/pkg/setup.py",
+            "servers/python-mcp/myenv/pyvenv.cfg",
+            "servers/python-mcp/myenv/lib/pkg/pyproject.toml",
+            ".git/modules/sub/package.json",
+            "deep/a/b/c/d/e/f/g/go.mod",
+        )
+        yield temp_dir
+
+
+class TestProjectScan:
+    """Test the scandir-based project walker."""
+
+    def test_finds_roots_and_prunes(self, monorepo):
+        """Test that package roots are found and vendor/VCS/venv/build directories skipped."""
+        scan = ProjectScan(monorepo)
+        roots = [os.path.relpath(root, monorepo) for root in scan.roots()]
+
+        assert roots == [
+            ".",
+            os.path.join("servers", "node-mcp"),
+            os.path.join("servers", "python-mcp"),
+            os.path.join("servers", "rust-mcp"),
+        ]
+        assert scan.truncated is False
+
+    def test_depth_limit(self, monorepo):
+        """Test that the walk does not descend below max_depth."""
+        assert len(list(ProjectScan(monorepo, max_depth=1).roots())) == 1
+        assert (
+            os.path.join(monorepo, "deep", "a", "b", "c", "d", "e", "f", "g")
+            in ProjectScan(monorepo, max_depth=8).roots()
+        )
+
+    def test_file_limit(self, monorepo):
+        """Test that the walk stops after max_files files."""
+        scan = ProjectScan(monorepo, max_files=1)
+
+        assert list(scan.roots()) == [os.path.abspath(monorepo)]
+        assert scan.truncated is True
+
+    def test_roots_are_streamed(self, monorepo):
+        """Test that roots are yielded before the walk is complete."""
+        scan = ProjectScan(monorepo)
+        roots = scan.roots()
+        next(roots)
+
+        assert scan.directories == 1
+
+
+class TestMonorepoAnalysis:
+    """Test analyzing every project of a monorepo."""
+
+    def test_analyze_monorepo(self, monorepo):
+        """Test one analysis per project root, ordered by path."""
+        result = analyze_monorepo(monorepo, max_workers=4)
+
+        assert [p["relative_path"] for p in result["projects"]] == [
+            ".",
+            os.path.join("servers", "node-mcp"),
+            os.path.join("servers", "python-mcp"),
+            os.path.join("servers", "rust-mcp"),
+        ]
+        assert result["summary"]["projects"] == 4
+        assert "package.json" in result["projects"][1]["detected_files"]
+
+    def test_results_stream_as_they_complete(self, monorepo):
+        """Test that analyses are yielded one by one."""
+        analyses = iter_project_analyses(ProjectScan(monorepo), max_workers=2)
+
+        assert "relative_path" in next(analyses)
+        assert len(list(analyses)) == 3
+
+    def test_zero_depth_scans_only_the_root(self, monorepo):
+        """Test that an explicit max_depth=0 is not replaced by the default depth."""
+        result = analyze_monorepo(monorepo, max_depth=0)
+
+        assert [p["relative_path"] for p in result["projects"]] == ["."]
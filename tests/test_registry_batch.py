@@ -0,0 +1,149 @@
+"""
+Tests for batch registry tools.
+"""
+
+import asyncio
+import os
+import tempfile
+
+import pytest
+
+from registry_mcp import executor
+from registry_mcp.executor import run_blocking, shutdown_tool_executor
+from registry_mcp.tools.registry_batch import (
+    find_meta_yaml_files,
+    validate_yaml_specifications,
+)
+from registry_mcp.tools.registry_submission import validate_yaml_specification
+
+VALID_YAML = """
+"@context": https://schema.org
+"@type": SoftwareApplication
+"@id": https://github.com/test/batch-mcp
+identifier: test/batch-mcp
+name: Batch MCP
+description: A valid MCP server for batch testing
+codeRepository: https://github.com/test/batch-mcp
+maintainer:
+  - "@type": Person
+    name: Test User
+license: https://spdx.org/licenses/MIT.html
+applicationCategory: HealthApplication
+keywords:
+  - test
+  - batch
+programmingLanguage:
+  - Python
+"""
+
+INVALID_YAML = """
+"@context": https://schema.org
+"@type": SoftwareApplication
+name: Incomplete MCP
+"""
+
+
+def _write(path, content):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
+
+
+class TestBatchValidation:
+    """Test batch validation functionality."""
+
+    def test_validate_yaml_strings(self):
+        """Test batch validation of YAML strings."""
+        result = validate_yaml_specifications([VALID_YAML, INVALID_YAML, VALID_YAML])
+
+        assert [r["source"] for r in result["results"]] == ["yaml_contents[0]", "yaml_contents[1]", "yaml_contents[2]"]
+        assert [r["valid"] for r in result["results"]] == [True, False, True]
+        assert result["summary"]["total"] == 3
+        assert result["summary"]["valid"] == 2
+        assert result["summary"]["invalid"] == 1
+        assert result["summary"]["invalid_sources"] == ["yaml_contents[1]"]
+
+    def test_results_match_single_validation(self):
+        """Test that batch results equal single-document validation."""
+        result = validate_yaml_specifications([VALID_YAML, INVALID_YAML], max_workers=2)
+
+        for entry, yaml_content in zip(result["results"], [VALID_YAML, INVALID_YAML], strict=True):
+            expected = validate_yaml_specification(yaml_content)
+            assert {k: v for k, v in entry.items() if k != "source"} == expected
+
+    def test_validate_directory(self):
+        """Test batch validation of a directory of meta.yaml files."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            _write(os.path.join(temp_dir, "servers", "a", "meta.yaml"), VALID_YAML)
+            _write(os.path.join(temp_dir, "servers", "b", "meta.yaml"), INVALID_YAML)
+            _write(os.path.join(temp_dir, "servers", "b", "other.yaml"), INVALID_YAML)
+
+            result = validate_yaml_specifications(path=temp_dir, max_workers=4)
+
+            sources = [r["source"] for r in result["results"]]
+            assert sources == sorted(sources)
+            assert len(sources) == 2
+            assert result["summary"]["valid"] == 1
+            assert result["summary"]["invalid_sources"] == [os.path.join(temp_dir, "servers", "b", "meta.yaml")]
+
+    def test_validate_glob(self):
+        """Test batch validation with a glob pattern as path."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            _write(os.path.join(temp_dir, "a", "meta.yaml"), VALID_YAML)
+            _write(os.path.join(temp_dir, "b", "entry.yaml"), VALID_YAML)
+
+            files = find_meta_yaml_files(os.path.join(temp_dir, "*", "*.yaml"))
+            result = validate_yaml_specifications(path=os.path.join(temp_dir, "*", "*.yaml"))
+
+            assert len(files) == 2
+            assert result["summary"]["total"] == 2
+            assert result["summary"]["valid"] == 2
+
+    def test_unreadable_file_has_error_details(self):
+        """Test that a file that cannot be read gives a result of the same shape as other documents."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "servers", "a", "meta.yaml")
+            _write(path, VALID_YAML)
+            with open(path, "wb") as f:
+                f.write(b"name: \xff\xfe\n")
+
+            [result] = validate_yaml_specifications(path=temp_dir)["results"]
+
+        assert result["valid"] is False
+        assert result["errors"][0].startswith("Could not read file")
+        assert [(d["path"], d["validator"]) for d in result["error_details"]] == [("", "file")]
+        assert result.keys() == {"source", *validate_yaml_specification(VALID_YAML)}
+
+    def test_large_batch_matches_single_validation(self):
+        """Test that a batch spread over the tool pool keeps the order and results of single validation."""
+        documents = [VALID_YAML, INVALID_YAML] * 20
+
+        result = validate_yaml_specifications(documents, max_workers=4)
+
+        assert [r["source"] for r in result["results"]] == [f"yaml_contents[{i}]" for i in range(40)]
+        assert [r["valid"] for r in result["results"]] == [True, False] * 20
+
+    @pytest.mark.asyncio
+    async def test_batches_on_a_saturated_tool_pool(self, monkeypatch):
+        """Test that batches running on the tool pool finish when it has no thread to spare."""
+        monkeypatch.setattr(executor, "DEFAULT_TOOL_WORKERS", 2)
+        shutdown_tool_executor()
+        try:
+            async with asyncio.timeout(10):
+                results = await asyncio.gather(
+                    *(
+                        run_blocking(validate_yaml_specifications, [VALID_YAML] * 20, None, "**/meta.yaml", 4)
+                        for _ in range(4)
+                    )
+                )
+        finally:
+            shutdown_tool_executor(wait=False)
+
+        assert [r["summary"]["valid"] for r in results] == [20] * 4
+
+    def test_validate_empty_batch(self):
+        """Test batch validation without any documents."""
+        result = validate_yaml_specifications([])
+
+        assert result["results"] == []
+        assert result["summary"]["total"] == 0
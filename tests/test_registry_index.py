@@ -0,0 +1,113 @@
+"""
+Tests for the in-memory registry index and the registry search tool.
+"""
+
+import os
+
+import pytest
+from fastmcp import Client
+
+import registry_mcp
+from registry_mcp.registry_index import RegistryIndex, get_registry_index
+
+
+def _identifiers(result):
+    return [entry["identifier"] for entry in result["results"]]
+
+
+class TestRegistryIndex:
+    """Test building and searching the index."""
+
+    def test_build_indexes_every_entry(self, registry_checkout):
+        """Test that all parseable entries are indexed and broken ones reported."""
+        index = RegistryIndex.build(registry_checkout)
+
+        stats = index.stats()
+        assert stats["entries"] == 3
+        assert stats["distinct_values"]["keyword"] == 4
+        assert stats["distinct_values"]["maintainer"] == 2
+        assert [os.path.basename(os.path.dirname(e["file"])) for e in stats["errors"]] == ["broken"]
+        assert _identifiers(index.search()) == [
+            "biocontext-ai/alpha-mcp",
+            "biocontext-ai/beta-mcp",
+            "other-org/gamma-mcp",
+        ]
+
+    def test_filters_are_case_insensitive_and_combined(self, registry_checkout):
+        """Test filtering on the inverted indexes."""
+        index = RegistryIndex.build(registry_checkout)
+
+        assert _identifiers(index.search(keyword="GENOMICS")) == ["biocontext-ai/alpha-mcp", "biocontext-ai/beta-mcp"]
+        assert _identifiers(index.search(keyword=["genomics", "variants"])) == ["biocontext-ai/alpha-mcp"]
+        assert _identifiers(index.search(category="DeveloperApplication")) == ["biocontext-ai/beta-mcp"]
+        assert _identifiers(index.search(language="python", maintainer="ada lovelace")) == [
+            "biocontext-ai/alpha-mcp",
+            "other-org/gamma-mcp",
+        ]
+        assert _identifiers(index.search(identifier="other-org/gamma-mcp")) == ["other-org/gamma-mcp"]
+        assert index.search(keyword="genomics", language="rust")["total"] == 0
+        with pytest.raises(ValueError):
+            index.search(license="MIT")
+
+    def test_text_query_ranks_name_matches_first(self, registry_checkout):
+        """Test that every query word must match and name matches rank above description matches."""
+        index = RegistryIndex.build(registry_checkout)
+
+        result = index.search("genomics")
+        assert _identifiers(result) == ["biocontext-ai/alpha-mcp", "biocontext-ai/beta-mcp"]
+        assert result["results"][0]["score"] > result["results"][1]["score"]
+        assert _identifiers(index.search("genomics protein")) == ["biocontext-ai/beta-mcp"]
+        assert _identifiers(index.search("variant lookup")) == ["biocontext-ai/alpha-mcp"]
+        assert index.search("nonexistent")["total"] == 0
+
+    def test_pagination(self, registry_checkout):
+        """Test paging through the results."""
+        index = RegistryIndex.build(registry_checkout)
+
+        first = index.search(limit=2)
+        second = index.search(offset=first["next_offset"], limit=2)
+
+        assert first["total"] == second["total"] == 3
+        assert _identifiers(first) + _identifiers(second) == _identifiers(index.search())
+        assert second["next_offset"] is None
+        assert index.search(limit=1000)["limit"] == 100
+
+    def test_index_is_cached_until_refresh(self, registry_checkout):
+        """Test that the index is built once per checkout."""
+        index = get_registry_index(registry_checkout)
+        os.remove(os.path.join(registry_checkout, "servers", "gamma", "meta.yaml"))
+
+        assert get_registry_index(registry_checkout) is index
+        assert get_registry_index(registry_checkout, refresh=True).stats()["entries"] == 2
+
+
+class TestSearchRegistryTool:
+    """Test the search tool via MCP."""
+
+    @pytest.mark.asyncio
+    async def test_search_registry_tool(self, registry_checkout):
+        """Test searching through the MCP client."""
+        async with Client(registry_mcp.mcp) as client:
+            result = await client.call_tool(
+                "search_registry_tool",
+                {
+                    "registry_path": registry_checkout,
+                    "query": "genomics",
+                    "language": "Python",
+                },
+            )
+
+        assert result.data["total"] == 1
+        assert result.data["results"][0]["name"] == "Alpha Genomics MCP"
+        assert result.data["index"]["entries"] == 3
+
+    @pytest.mark.asyncio
+    async def test_search_registry_tool_requires_checkout(self, tmp_path):
+        """Test that a missing checkout is reported as a tool error."""
+        async with Client(registry_mcp.mcp) as client:
+            result = await client.call_tool(
+                "search_registry_tool", {"registry_path": str(tmp_path / "missing")}, raise_on_error=False
+            )
+
+        assert result.is_error
+        assert "Registry checkout not found" in result.content[0].text
@@ -0,0 +1,162 @@
+"""
+Tests for the SQLite-backed registry index.
+"""
+
+import os
+
+import pytest
+
+from registry_mcp.registry_index import RegistryIndex, get_registry_index
+from registry_mcp.registry_store import RegistryIndexStore, default_index_path, match_expression
+
+
+def _identifiers(result):
+    return [entry["identifier"] for entry in result["results"]]
+
+
+def _meta(registry_checkout, name):
+    return os.path.join(registry_checkout, "servers", name, "meta.yaml")
+
+
+class TestRegistryIndexStore:
+    """Test syncing the database with a checkout."""
+
+    def test_sync_is_incremental(self, registry_checkout, tmp_path):
+        """Test that only changed files are read and parsed again."""
+        store = RegistryIndexStore(str(tmp_path / "index.db"))
+
+        assert store.sync(registry_checkout) == {
+            "added": 4,
+            "updated": 0,
+            "unchanged": 0,
+            "touched": 0,
+            "removed": 0,
+            "seconds": store.last_sync["seconds"],
+        }
+        assert store.stats()["entries"] == 3
+        assert [os.path.basename(os.path.dirname(e["file"])) for e in store.errors()] == ["broken"]
+        assert store.sync(registry_checkout)["unchanged"] == 4
+
+        # Same content with a new mtime is only re-hashed
+        alpha = _meta(registry_checkout, "alpha")
+        os.utime(alpha, ns=(0, 10**18))
+        assert store.sync(registry_checkout)["touched"] == 1
+
+        # Changed content is parsed again; fixing the broken file indexes it
+        with open(_meta(registry_checkout, "broken"), "w", encoding="utf-8") as f:
+            f.write("identifier: fixed/broken-mcp\nname: Fixed MCP\n")
+        os.remove(_meta(registry_checkout, "gamma"))
+        counts = store.sync(registry_checkout)
+
+        assert (counts["updated"], counts["removed"], counts["unchanged"]) == (1, 1, 2)
+        assert store.errors() == []
+        assert sorted(entry["identifier"] for _, entry in store.entries()) == [
+            "biocontext-ai/alpha-mcp",
+            "biocontext-ai/beta-mcp",
+            "fixed/broken-mcp",
+        ]
+        assert store.search("literature") == {}
+        store.close()
+
+    def test_search_ranks_with_bm25(self, registry_checkout, tmp_path):
+        """Test that every word must match and name matches rank above description matches."""
+        store = RegistryIndexStore(str(tmp_path / "index.db"))
+        store.sync(registry_checkout)
+        identifiers = {file_id: entry["identifier"] for file_id, entry in store.entries()}
+
+        scores = store.search("Genomics")
+        ranked = sorted(scores, key=scores.get, reverse=True)
+        assert [identifiers[file_id] for file_id in ranked] == ["biocontext-ai/alpha-mcp", "biocontext-ai/beta-mcp"]
+        assert scores[ranked[0]] > scores[ranked[1]] > 0
+        assert [identifiers[file_id] for file_id in store.search("genomics protein")] == ["biocontext-ai/beta-mcp"]
+        assert store.search("!!!") == {}
+        store.close()
+
+    def test_stats_are_counted_once_per_sync(self, registry_checkout, tmp_path):
+        """Test that stats() does not query the database."""
+        store = RegistryIndexStore(str(tmp_path / "index.db"))
+        store.sync(registry_checkout)
+        statements = []
+        store._conn.set_trace_callback(statements.append)
+
+        assert (store.stats()["files"], store.stats()["entries"]) == (4, 3)
+        assert statements == []
+
+        os.remove(_meta(registry_checkout, "gamma"))
+        store.sync(registry_checkout)
+        assert (store.stats()["files"], store.stats()["entries"]) == (3, 2)
+        store.close()
+
+    def test_match_expression_quotes_words(self):
+        """Test that FTS5 syntax in queries is matched as plain words."""
+        assert match_expression('genomics AND "variant" NEAR(x') == '"genomics" "and" "variant" "near" "x"'
+        assert match_expression("  ") is None
+
+
+class TestPersistentRegistryIndex:
+    """Test registry indexes loaded from their database."""
+
+    def test_open_searches_with_filters_and_fts(self, registry_checkout):
+        """Test that text queries use the database and filters still apply."""
+        index = RegistryIndex.open(registry_checkout)
+
+        assert index.stats()["database"]["path"] == default_index_path(registry_checkout)
+        assert index.stats()["tokens"] == 0
+        assert _identifiers(index.search("genomics")) == ["biocontext-ai/alpha-mcp", "biocontext-ai/beta-mcp"]
+        assert _identifiers(index.search("genomics", language="TypeScript")) == ["biocontext-ai/beta-mcp"]
+        assert _identifiers(index.search(maintainer="Ada Lovelace", limit=1)) == ["biocontext-ai/alpha-mcp"]
+        page = index.search("mcp", offset=1, limit=1)
+        assert (page["total"], page["next_offset"], len(page["results"])) == (3, 2, 1)
+        index.store.close()
+
+    def test_restart_opens_database_without_parsing(self, registry_checkout):
+        """Test that a second start reuses the database."""
+        first = RegistryIndex.open(registry_checkout)
+        results = first.search("genomics")["results"]
+        first.store.close()
+
+        second = RegistryIndex.open(registry_checkout)
+
+        assert second.store.last_sync["unchanged"] == 4
+        assert second.store.last_sync["added"] == second.store.last_sync["updated"] == 0
+        assert second.search("genomics")["results"] == results
+        assert len(second.errors) == 1
+        second.store.close()
+
+    def test_refresh_syncs_changes(self, registry_checkout):
+        """Test that refresh picks up changed entries through the same database."""
+        index = get_registry_index(registry_checkout)
+        with open(_meta(registry_checkout, "gamma"), "a", encoding="utf-8") as f:
+            f.write("featureList:\n  - Citation graphs\n")
+
+        assert get_registry_index(registry_checkout) is index
+        assert index.search("citation")["total"] == 0
+        refreshed = get_registry_index(registry_checkout, refresh=True)
+
+        assert refreshed.store is index.store
+        assert refreshed.store.last_sync["updated"] == 1
+        assert _identifiers(refreshed.search("citation")) == ["other-org/gamma-mcp"]
+
+    def test_schema_version_mismatch_rebuilds(self, registry_checkout, tmp_path):
+        """Test that a database of another layout is rebuilt."""
+        path = str(tmp_path / "index.db")
+        store = RegistryIndexStore(path)
+        store.sync(registry_checkout)
+        store._conn.execute("PRAGMA user_version = 0")
+        store.close()
+
+        store = RegistryIndexStore(path)
+
+        assert store.stats()["files"] == 0
+        assert store.sync(registry_checkout)["added"] == 4
+        store.close()
+
+
+@pytest.mark.parametrize("query", ["genomics", "variant lookup", "mcp"])
+def test_database_and_memory_match_the_same_entries(registry_checkout, query):
+    """Test that the database finds the same entries as the in-memory token index."""
+    opened = RegistryIndex.open(registry_checkout)
+    built = RegistryIndex.build(registry_checkout)
+
+    assert sorted(_identifiers(opened.search(query))) == sorted(_identifiers(built.search(query)))
+    opened.store.close()
@@ -0,0 +1,113 @@
+"""
+Tests for the stand-in registry API, through the real HTTP client.
+"""
+
+import pytest
+import pytest_asyncio
+
+from registry_mcp.http_client import (
+    close_http_client,
+    get_http_stats,
+    reset_http_stats,
+    set_http_client,
+    set_retry_policy,
+)
+from registry_mcp.registry_stub import RegistryStub
+from registry_mcp.retry import RetryPolicy
+from registry_mcp.tools.registry_submission import submit_to_registry
+
+VALID_YAML = """
+"@context": https://schema.org
+"@type": SoftwareApplication
+"@id": https://github.com/test/stub-mcp
+identifier: test/stub-mcp
+name: Stub MCP
+description: A test MCP for the stub registry
+codeRepository: https://github.com/test/stub-mcp
+maintainer:
+  - "@type": Person
+    name: Test User
+license: https://spdx.org/licenses/MIT.html
+applicationCategory: HealthApplication
+keywords:
+  - test
+programmingLanguage:
+  - Python
+"""
+
+
+@pytest_asyncio.fixture
+async def http_client():
+    """Use a fresh shared client over real sockets, retrying without delay."""
+    set_http_client(None)
+    set_retry_policy(RetryPolicy(base_delay=0))
+    reset_http_stats()
+    yield
+    await close_http_client()
+    set_retry_policy(None)
+    reset_http_stats()
+
+
+class TestRegistryStub:
+    """Test the stub registry API."""
+
+    @pytest.mark.asyncio
+    async def test_accepts_submissions(self, http_client):
+        """Test that valid submissions are accepted with increasing ids."""
+        with RegistryStub() as stub:
+            first = await submit_to_registry(VALID_YAML, stub.url)
+            second = await submit_to_registry(VALID_YAML, stub.url)
+            stats = stub.stats()
+
+        assert first["submission_id"] == "stub-1"
+        assert second["submission_id"] == "stub-2"
+        assert stats == {"requests": 2, "accepted": 2, "replayed": 0, "responses": {201: 2}}
+
+    @pytest.mark.asyncio
+    async def test_errors_are_retried_then_reported(self, http_client):
+        """Test that configured 503s are retried by the client and reported as retryable."""
+        with RegistryStub(error_rate=1.0) as stub:
+            result = await submit_to_registry(VALID_YAML, stub.url)
+            stats = stub.stats()
+
+        assert result["success"] is False
+        assert result["retryable"] is True
+        assert stats["responses"] == {503: 4}
+        assert get_http_stats()["retries_by_reason"] == {"status_503": 3}
+
+    @pytest.mark.asyncio
+    async def test_throttling_sends_retry_after(self, http_client):
+        """Test that 429 responses carry the configured Retry-After."""
+        with RegistryStub(throttle_rate=1.0, retry_after=120) as stub:
+            result = await submit_to_registry(VALID_YAML, stub.url)
+
+        assert result["success"] is False
+        assert result["retry_after"] == 120
+        # Longer than REGISTRY_MCP_RETRY_AFTER_MAX, so not retried
+        assert stub.stats()["requests"] == 1
+
+    @pytest.mark.asyncio
+    async def test_idempotent_replay_and_rejection(self, http_client):
+        """Test that a repeated Idempotency-Key returns the first id and invalid documents get 400."""
+        with RegistryStub() as stub:
+            first = await submit_to_registry(VALID_YAML, stub.url, idempotency_key="key-1")
+            replay = await submit_to_registry(VALID_YAML, stub.url, idempotency_key="key-1")
+            rejected = await submit_to_registry("name: No identifier", stub.url)
+            stats = stub.stats()
+
+        assert replay["submission_id"] == first["submission_id"] == "stub-1"
+        assert stats["accepted"] == 1
+        assert stats["replayed"] == 1
+        # Rejected by validation before reaching the stub
+        assert rejected["success"] is False
+        assert stats["requests"] == 2
+
+    @pytest.mark.asyncio
+    async def test_configured_status(self, http_client):
+        """Test that a configured status code is returned for every submission."""
+        with RegistryStub(status=409) as stub:
+            result = await submit_to_registry(VALID_YAML, stub.url)
+
+        assert result["success"] is False
+        assert result["message"] == "API request failed with status 409"
+        assert "retryable" not in result
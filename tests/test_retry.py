@@ -0,0 +1,317 @@
+"""
+Tests for retries and the circuit breaker of registry API requests.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from registry_mcp import http_client
+from registry_mcp.http_client import get_circuit_breaker, get_http_stats, post_json
+from registry_mcp.retry import CircuitBreaker, CircuitOpenError, RetryPolicy, parse_retry_after
+from registry_mcp.tools.registry_submission import submit_to_registry
+
+URL = "https://registry.example.org/registry/submit"
+
+VALID_YAML = """
+"@context": https://schema.org
+"@type": SoftwareApplication
+"@id": https://github.com/test/retry-mcp
+identifier: test/retry-mcp
+name: Retry Test MCP
+description: A test MCP for retried submissions
+codeRepository: https://github.com/test/retry-mcp
+maintainer:
+  - "@type": Person
+    name: Test User
+license: https://spdx.org/licenses/MIT.html
+applicationCategory: HealthApplication
+keywords:
+  - test
+programmingLanguage:
+  - Python
+"""
+
+
+def _responses(*responses):
+    """Handler answering with the given responses (or raising the given errors) in turn."""
+    remaining = list(responses)
+
+    def handler(request):
+        response = remaining.pop(0) if len(remaining) > 1 else remaining[0]
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    return handler
+
+
+class FakeTimer:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestRetryPolicy:
+    """Test which failures are retried and how long to wait."""
+
+    def test_parse_retry_after(self):
+        """Test delay-seconds and HTTP-date Retry-After values."""
+        assert parse_retry_after("120") == 120.0
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT", now=lambda: 1445412470.0) == 10.0
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT", now=lambda: 1445412490.0) == 0.0
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after(None) is None
+
+    def test_retry_reasons(self):
+        """Test that only transient failures are retried, read errors only if idempotent."""
+        policy = RetryPolicy()
+        post = httpx.Request("POST", URL)
+        keyed = httpx.Request("POST", URL, headers={"Idempotency-Key": "abc"})
+
+        assert policy.retry_reason(post, httpx.Response(503)) == "status_503"
+        assert policy.retry_reason(post, httpx.Response(502)) == "status_502"
+        assert policy.retry_reason(post, httpx.Response(429, headers={"Retry-After": "1"})) == "status_429"
+        assert policy.retry_reason(post, httpx.Response(429)) is None
+        assert policy.retry_reason(post, httpx.Response(500)) is None
+        assert policy.retry_reason(post, httpx.Response(400)) is None
+        assert policy.retry_reason(post, error=httpx.ConnectError("refused")) == "connect"
+        assert policy.retry_reason(post, error=httpx.ReadTimeout("slow")) is None
+        assert policy.retry_reason(keyed, error=httpx.ReadTimeout("slow")) == "timeout"
+        assert policy.retry_reason(httpx.Request("GET", URL), error=httpx.RemoteProtocolError("eof")) == "transport"
+
+    def test_exponential_backoff_with_jitter(self):
+        """Test that the delay cap doubles up to max_delay and jitter scales it."""
+        policy = RetryPolicy(max_attempts=10, base_delay=0.5, max_delay=4.0, jitter=lambda: 1.0)
+
+        assert [policy.delay(attempt) for attempt in range(1, 6)] == [0.5, 1.0, 2.0, 4.0, 4.0]
+        assert RetryPolicy(base_delay=1.0, jitter=lambda: 0.25).delay(2) == 0.5
+        assert policy.delay(10) is None
+
+    def test_retry_after_overrides_backoff(self):
+        """Test that Retry-After is honoured up to max_retry_after."""
+        policy = RetryPolicy(max_retry_after=30)
+
+        assert policy.delay(1, httpx.Response(429, headers={"Retry-After": "7"})) == 7.0
+        assert policy.delay(1, httpx.Response(429, headers={"Retry-After": "120"})) is None
+
+
+class TestCircuitBreaker:
+    """Test the circuit breaker states."""
+
+    def test_opens_after_threshold_and_probes(self):
+        """Test closed -> open -> half-open -> closed."""
+        timer = FakeTimer()
+        breaker = CircuitBreaker("registry", failure_threshold=3, reset_timeout=10, timer=timer)
+
+        for _ in range(2):
+            breaker.before_request()
+            breaker.record_failure()
+        assert breaker.state == "closed"
+        breaker.record_failure()
+        assert breaker.state == "open"
+        with pytest.raises(CircuitOpenError) as error:
+            breaker.before_request()
+        assert error.value.retry_after == 10
+
+        timer.now = 10
+        assert breaker.state == "half_open"
+        breaker.before_request()
+        # Only one probe at a time
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request()
+        breaker.record_success()
+        assert breaker.state == "closed"
+        assert breaker.stats()["opened"] == 1
+        assert breaker.stats()["rejected"] == 2
+
+    def test_failed_probe_reopens(self):
+        """Test that a failed probe opens the breaker again."""
+        timer = FakeTimer()
+        breaker = CircuitBreaker("registry", failure_threshold=1, reset_timeout=5, timer=timer)
+        breaker.record_failure()
+
+        timer.now = 5
+        breaker.before_request()
+        breaker.record_failure()
+
+        assert breaker.state == "open"
+        assert breaker.stats()["retry_after"] == 5
+
+    def test_success_resets_failures(self):
+        """Test that failures must be consecutive to open the breaker."""
+        breaker = CircuitBreaker("registry", failure_threshold=2)
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+
+        assert breaker.state == "closed"
+
+
+class TestRetriedRequests:
+    """Test retries of requests sent with the shared client."""
+
+    @pytest.mark.asyncio
+    async def test_retries_gateway_errors(self, registry_api):
+        """Test that 503 responses are retried until the registry answers."""
+        registry_api.handler = _responses(
+            httpx.Response(503), httpx.Response(503), httpx.Response(201, json={"id": "ok"})
+        )
+
+        response = await post_json(URL, {"name": "Example"})
+
+        assert response.status_code == 201
+        assert len(registry_api.requests) == 3
+        stats = get_http_stats()
+        assert stats["retries"] == 2
+        assert stats["retries_by_reason"] == {"status_503": 2}
+        assert stats["circuit_breakers"]["registry.example.org"]["consecutive_failures"] == 0
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_attempts(self, registry_api):
+        """Test that the last response is returned when no attempts are left."""
+        registry_api.handler = _responses(httpx.Response(502))
+
+        response = await post_json(URL, {})
+
+        assert response.status_code == 502
+        assert len(registry_api.requests) == 4
+        assert get_http_stats()["retries_exhausted"] == 1
+
+    @pytest.mark.asyncio
+    async def test_retries_connect_errors(self, registry_api):
+        """Test that requests which never reached the registry are retried."""
+        registry_api.handler = _responses(httpx.ConnectError("refused"), httpx.Response(201))
+
+        response = await post_json(URL, {})
+
+        assert response.status_code == 201
+        assert get_http_stats()["retries_by_reason"] == {"connect": 1}
+
+    @pytest.mark.asyncio
+    async def test_read_timeout_of_submission_is_not_retried(self, registry_api):
+        """Test that a POST which may have been processed is not repeated."""
+        registry_api.handler = _responses(httpx.ReadTimeout("slow"), httpx.Response(201))
+
+        with pytest.raises(httpx.ReadTimeout):
+            await post_json(URL, {})
+        assert len(registry_api.requests) == 1
+
+        response = await post_json(URL, {}, headers={"Idempotency-Key": "abc"})
+        assert response.status_code == 201
+
+    @pytest.mark.asyncio
+    async def test_honours_retry_after(self, registry_api, monkeypatch):
+        """Test that a 429 is retried after the delay the registry asked for."""
+        delays = []
+
+        async def sleep(delay):
+            delays.append(delay)
+
+        monkeypatch.setattr(http_client.asyncio, "sleep", sleep)
+        registry_api.handler = _responses(httpx.Response(429, headers={"Retry-After": "3"}), httpx.Response(201))
+
+        response = await post_json(URL, {})
+
+        assert response.status_code == 201
+        assert delays == [3.0]
+
+    @pytest.mark.asyncio
+    async def test_does_not_sleep_past_total_timeout(self, registry_api):
+        """Test that a retry that cannot finish in time is not attempted."""
+        registry_api.handler = _responses(httpx.Response(429, headers={"Retry-After": "30"}), httpx.Response(201))
+
+        response = await asyncio.wait_for(post_json(URL, {}, timeout=5), timeout=1)
+
+        assert response.status_code == 429
+        assert len(registry_api.requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_open_breaker_fails_fast(self, registry_api, monkeypatch):
+        """Test that submissions fail fast without a request while the breaker is open."""
+        monkeypatch.setattr(http_client, "BREAKER_THRESHOLD", 2)
+        registry_api.handler = _responses(httpx.Response(503))
+
+        first = await submit_to_registry(VALID_YAML, URL)
+        attempts = len(registry_api.requests)
+        second = await submit_to_registry(VALID_YAML, URL)
+
+        assert attempts == 2
+        assert first["success"] is False
+        assert second["success"] is False
+        assert len(registry_api.requests) == attempts
+        assert second["message"] == "Registry API is temporarily unavailable"
+        assert second["retry_after"] > 0
+        assert get_circuit_breaker("registry.example.org").state == "open"
+        assert get_http_stats()["circuit_rejections"] == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_probe_lets_next_probe_through(self, registry_api, monkeypatch):
+        """Test that a half-open probe cancelled by its caller does not leave the breaker rejecting requests."""
+        monkeypatch.setattr(http_client, "BREAKER_THRESHOLD", 1)
+        monkeypatch.setattr(http_client, "BREAKER_RESET_TIMEOUT", 0)
+        breaker = get_circuit_breaker("registry.example.org")
+        breaker.record_failure()
+        assert breaker.state == "half_open"
+
+        async def slow(request):
+            await asyncio.sleep(10)
+            return httpx.Response(201)
+
+        registry_api.handler = slow
+        probe = asyncio.create_task(post_json(URL, {}))
+        await asyncio.sleep(0.01)
+        probe.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await probe
+
+        assert breaker.state == "half_open"
+        registry_api.handler = _responses(httpx.Response(201))
+        response = await post_json(URL, {})
+
+        assert response.status_code == 201
+        assert breaker.state == "closed"
+
+    @pytest.mark.asyncio
+    async def test_timed_out_probe_counts_as_failure(self, registry_api, monkeypatch):
+        """Test that a half-open probe cut short by the total timeout reopens the breaker."""
+        monkeypatch.setattr(http_client, "BREAKER_THRESHOLD", 1)
+        monkeypatch.setattr(http_client, "BREAKER_RESET_TIMEOUT", 0)
+        breaker = get_circuit_breaker("registry.example.org")
+        breaker.record_failure()
+
+        async def slow(request):
+            await asyncio.sleep(10)
+            return httpx.Response(201)
+
+        registry_api.handler = slow
+        with pytest.raises(TimeoutError):
+            await post_json(URL, {}, timeout=0.05)
+
+        assert breaker.stats()["opened"] == 2
+        registry_api.handler = _responses(httpx.Response(201))
+        assert (await post_json(URL, {})).status_code == 201
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("exception", [httpx.DecodingError("bad body"), RuntimeError("client closed")])
+    async def test_probe_failing_locally_lets_next_probe_through(self, registry_api, monkeypatch, exception):
+        """Test that a half-open probe ending in an error other than a transport error releases the probe."""
+        monkeypatch.setattr(http_client, "BREAKER_THRESHOLD", 1)
+        monkeypatch.setattr(http_client, "BREAKER_RESET_TIMEOUT", 0)
+        breaker = get_circuit_breaker("registry.example.org")
+        breaker.record_failure()
+
+        def fail(request):
+            raise exception
+
+        registry_api.handler = fail
+        with pytest.raises(type(exception)):
+            await post_json(URL, {})
+
+        assert breaker.state == "half_open"
+        registry_api.handler = _responses(httpx.Response(201))
+        assert (await post_json(URL, {})).status_code == 201
+        assert breaker.state == "closed"
@@ -0,0 +1,168 @@
+"""
+Tests for the code-generated schema validator.
+"""
+
+import copy
+
+import pytest
+import yaml
+from jsonschema import Draft202012Validator, FormatChecker
+
+from registry_mcp.schema_compiler import SchemaCompilationError, compile_schema
+from registry_mcp.tools.registry_submission import (
+    get_compiled_registry_validator,
+    get_registry_schema,
+    validate_yaml_specification,
+)
+
+VALID_DOCUMENT = {
+    "@context": "https://schema.org",
+    "@type": "SoftwareApplication",
+    "@id": "https://github.com/test/parity-mcp",
+    "identifier": "test/parity-mcp",
+    "name": "Parity MCP",
+    "description": "A valid MCP server for parity testing",
+    "codeRepository": "https://github.com/test/parity-mcp",
+    "url": "https://parity.example.com",
+    "softwareHelp": {"@type": "CreativeWork", "url": "https://parity.example.com/docs", "name": "Docs"},
+    "maintainer": [
+        {"@type": "Person", "name": "Test User", "identifier": "GitHub: test", "url": "https://github.com/test"}
+    ],
+    "license": "https://spdx.org/licenses/MIT.html",
+    "applicationCategory": "HealthApplication",
+    "keywords": ["test", "parity"],
+    "operatingSystem": ["Linux", "macOS"],
+    "programmingLanguage": ["Python", "Rust"],
+    "featureList": ["Feature 1"],
+    "user_confirmed": False,
+}
+
+# Values of every JSON type (plus edge cases such as bool vs int) used to mutate fields
+WRONG_VALUES = [
+    None,
+    True,
+    False,
+    0,
+    1,
+    1.0,
+    2.5,
+    "",
+    "x",
+    "a" * 1001,
+    "not a uri",
+    [],
+    [1, True],
+    ["x", "x"],
+    [1, 1.0],
+    [{"a": 1}, {"a": 1}],
+    [[1], [True]],
+    {},
+    {"@type": "Robot"},
+]
+
+
+def _corpus():
+    """Generate a corpus of valid and invalid registry documents."""
+    yield copy.deepcopy(VALID_DOCUMENT)
+    yield {}
+    yield []
+    yield "just a string"
+    yield {"unknown": 1, "other": 2}
+
+    for field in VALID_DOCUMENT:
+        document = copy.deepcopy(VALID_DOCUMENT)
+        del document[field]
+        yield document
+        for value in WRONG_VALUES:
+            document = copy.deepcopy(VALID_DOCUMENT)
+            document[field] = copy.deepcopy(value)
+            yield document
+
+    for value in WRONG_VALUES:
+        for nested in ("maintainer", "softwareHelp"):
+            for key in ("@type", "name", "url", "identifier", "extra"):
+                document = copy.deepcopy(VALID_DOCUMENT)
+                target = document[nested][0] if nested == "maintainer" else document[nested]
+                target[key] = copy.deepcopy(value)
+                yield document
+        for field in ("keywords", "operatingSystem", "programmingLanguage", "featureList"):
+            document = copy.deepcopy(VALID_DOCUMENT)
+            document[field] = [copy.deepcopy(value), "Python"]
+            yield document
+
+    document = copy.deepcopy(VALID_DOCUMENT)
+    document["keywords"] = [f"keyword{i}" for i in range(11)]
+    yield document
+    document = copy.deepcopy(VALID_DOCUMENT)
+    document["maintainer"] = [{}, {"@type": "Organization", "name": "Org", "a": 1, "b": 2}]
+    yield document
+
+
+def _as_tuples(errors):
+    return [(tuple(e.absolute_path), e.validator, e.validator_value, e.message) for e in errors]
+
+
+def _sorted(violations):
+    return sorted(violations, key=lambda v: [str(p) for p in v[0]])
+
+
+def _uri_checker():
+    checker = FormatChecker(formats=())
+    checker.checks("uri")(lambda instance: not isinstance(instance, str) or instance.startswith("https://"))
+    return checker
+
+
+class TestCompiledValidatorParity:
+    """Test that the compiled validator matches the jsonschema interpreter."""
+
+    @pytest.mark.parametrize("format_checker", [None, _uri_checker()])
+    def test_parity_over_corpus(self, format_checker):
+        """Test identical violations for every document in the corpus."""
+        schema = get_registry_schema()
+        reference = Draft202012Validator(schema, format_checker=format_checker)
+        compiled = compile_schema(schema, format_checker=format_checker)
+
+        documents = list(_corpus())
+        assert len(documents) > 300
+        for document in documents:
+            expected = _as_tuples(reference.iter_errors(document))
+            actual = [tuple(v) for v in compiled(document)]
+            assert _sorted(actual) == _sorted(expected), document
+
+    def test_validate_yaml_specification_parity(self):
+        """Test that both engines give the same validation results."""
+        for document in _corpus():
+            yaml_content = yaml.safe_dump(document)
+            assert validate_yaml_specification(
+                yaml_content, use_cache=False, engine="compiled"
+            ) == validate_yaml_specification(yaml_content, use_cache=False, engine="jsonschema")
+
+    def test_compiled_validator_is_shared(self):
+        """Test that the compiled validator is generated once per schema version."""
+        validator = get_compiled_registry_validator()
+
+        assert validator is get_compiled_registry_validator()
+        assert "def validate(instance):" in validator.source
+
+    def test_unknown_engine(self):
+        """Test validation with an unknown engine."""
+        result = validate_yaml_specification("name: test", use_cache=False, engine="fastest")
+
+        assert result["valid"] is False
+        assert "Unknown validation engine" in result["errors"][0]
+
+
+class TestSchemaCompiler:
+    """Test schema compilation."""
+
+    def test_unsupported_keyword(self):
+        """Test that unsupported keywords are rejected."""
+        with pytest.raises(SchemaCompilationError):
+            compile_schema({"type": "object", "anyOf": [{"type": "string"}]})
+
+    def test_integer_and_number_types(self):
+        """Test numeric type checks follow JSON Schema semantics."""
+        validate = compile_schema({"type": "array", "items": {"type": "integer"}})
+
+        errors = validate([1, 2.0, 2.5, True, "3"])
+        assert [e.path for e in errors] == [(2,), (3,), (4,)]
@@ -0,0 +1,261 @@
+"""
+Tests for the registry schema provider.
+"""
+
+import json
+import os
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from registry_mcp.schema_provider import SchemaProvider, get_schema_version
+from registry_mcp.tools.registry_submission import (
+    _bundled_registry_schema,
+    get_registry_validator,
+    get_schema_provider,
+    set_schema_provider,
+    validate_yaml_specification,
+)
+
+
+class SchemaServer:
+    """Local HTTP stand-in for the upstream schema.json with ETag support."""
+
+    def __init__(self, schema):
+        self.schema = schema
+        self.requests = []
+        # Set to an unset threading.Event to hold responses until it is set
+        self.gate = None
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = json.dumps(server.schema).encode("utf-8")
+                etag = f'"{get_schema_version(server.schema)}"'
+                server.requests.append(dict(self.headers))
+                if server.gate is not None:
+                    server.gate.wait(5)
+                if self.headers.get("If-None-Match") == etag:
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("ETag", etag)
+                self.send_header("Last-Modified", "Wed, 01 Oct 2025 10:00:00 GMT")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}/schema.json"
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+class FakeTimer:
+    """Manually advanced wall clock."""
+
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def upstream_schema():
+    schema = _bundled_registry_schema()
+    schema["title"] = "Upstream Registry"
+    return schema
+
+
+@pytest.fixture
+def cache_dir():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        yield temp_dir
+
+
+class TestSchemaProvider:
+    """Test loading the schema from its source."""
+
+    def test_bundled_without_source(self, cache_dir):
+        """Test that the bundled schema is used when no source is configured."""
+        provider = SchemaProvider(_bundled_registry_schema, cache_dir=cache_dir)
+
+        assert provider.get_schema() == _bundled_registry_schema()
+        assert provider.status()["origin"] == "bundled"
+        assert os.listdir(cache_dir) == []
+
+    def test_fetch_and_persist(self, upstream_schema, cache_dir):
+        """Test fetching the schema and persisting it with its ETag."""
+        with SchemaServer(upstream_schema) as server:
+            provider = SchemaProvider(_bundled_registry_schema, source=server.url, cache_dir=cache_dir)
+
+            assert provider.get_schema()["title"] == "Upstream Registry"
+            status = provider.status()
+            assert status["origin"] == "remote"
+            assert status["etag"] == f'"{get_schema_version(upstream_schema)}"'
+            assert status["last_modified"] == "Wed, 01 Oct 2025 10:00:00 GMT"
+            assert os.path.exists(provider.cache_path)
+
+    def test_revalidates_at_most_once_per_interval(self, upstream_schema, cache_dir):
+        """Test conditional revalidation after the interval has elapsed."""
+        timer = FakeTimer()
+        with SchemaServer(upstream_schema) as server:
+            provider = SchemaProvider(
+                _bundled_registry_schema, source=server.url, cache_dir=cache_dir, revalidate_interval=60, timer=timer
+            )
+            for _ in range(5):
+                provider.get_schema()
+            assert len(server.requests) == 1
+
+            timer.now += 61
+            version = provider.version
+            assert len(server.requests) == 2
+            assert server.requests[1]["If-None-Match"] == f'"{get_schema_version(upstream_schema)}"'
+            assert version == get_schema_version(upstream_schema)
+
+    def test_upstream_change_updates_version(self, upstream_schema, cache_dir):
+        """Test that a changed upstream schema is picked up after revalidation."""
+        timer = FakeTimer()
+        with SchemaServer(upstream_schema) as server:
+            provider = SchemaProvider(
+                _bundled_registry_schema, source=server.url, cache_dir=cache_dir, revalidate_interval=60, timer=timer
+            )
+            old_version = provider.version
+
+            server.schema = dict(upstream_schema, title="Changed Registry")
+            timer.now += 61
+
+            assert provider.get_schema()["title"] == "Changed Registry"
+            assert provider.version != old_version
+
+    def test_restart_uses_disk_cache(self, upstream_schema, cache_dir):
+        """Test that a restarted provider uses the on-disk copy within the interval."""
+        timer = FakeTimer()
+        with SchemaServer(upstream_schema) as server:
+            SchemaProvider(_bundled_registry_schema, source=server.url, cache_dir=cache_dir, timer=timer).get_schema()
+            restarted = SchemaProvider(_bundled_registry_schema, source=server.url, cache_dir=cache_dir, timer=timer)
+
+            assert restarted.get_schema()["title"] == "Upstream Registry"
+            assert restarted.status()["origin"] == "cache"
+            assert len(server.requests) == 1
+
+    def test_offline_falls_back_to_disk_cache(self, upstream_schema, cache_dir):
+        """Test that an unreachable source uses the on-disk copy."""
+        timer = FakeTimer()
+        with SchemaServer(upstream_schema) as server:
+            url = server.url
+            SchemaProvider(_bundled_registry_schema, source=url, cache_dir=cache_dir, timer=timer).get_schema()
+
+        timer.now += 7200
+        offline = SchemaProvider(_bundled_registry_schema, source=url, cache_dir=cache_dir, timer=timer, timeout=1)
+        assert offline.get_schema()["title"] == "Upstream Registry"
+        assert offline.status()["origin"] == "cache"
+
+    def test_offline_falls_back_to_bundled(self, cache_dir):
+        """Test that an unreachable source without a cached copy uses the bundled schema."""
+        with SchemaServer({}) as server:
+            url = server.url
+        provider = SchemaProvider(_bundled_registry_schema, source=url, cache_dir=cache_dir, timeout=1)
+
+        assert provider.get_schema() == _bundled_registry_schema()
+        assert provider.status()["origin"] == "bundled"
+
+    def test_invalid_upstream_schema_is_ignored(self, cache_dir):
+        """Test that a response that is not a schema does not replace the current one."""
+        with SchemaServer({"not": "a schema"}) as server:
+            provider = SchemaProvider(_bundled_registry_schema, source=server.url, cache_dir=cache_dir)
+
+            assert provider.get_schema() == _bundled_registry_schema()
+
+    def test_schema_failing_metaschema_keeps_previous_copy(self, upstream_schema, cache_dir):
+        """Test that an upstream schema which is not valid JSON Schema does not replace the current one."""
+        timer = FakeTimer()
+        with SchemaServer(upstream_schema) as server:
+            provider = SchemaProvider(
+                _bundled_registry_schema, source=server.url, cache_dir=cache_dir, revalidate_interval=60, timer=timer
+            )
+            version = provider.version
+
+            server.schema = dict(upstream_schema, title="Broken Registry", properties={"name": {"type": "text"}})
+            timer.now += 61
+
+            assert provider.get_schema()["title"] == "Upstream Registry"
+            assert provider.version == version
+            assert len(server.requests) == 2
+
+    def test_revalidation_does_not_block_other_threads(self, upstream_schema, cache_dir):
+        """Test that other threads get the current schema while one thread revalidates."""
+        timer = FakeTimer()
+        with SchemaServer(upstream_schema) as server:
+            provider = SchemaProvider(
+                _bundled_registry_schema, source=server.url, cache_dir=cache_dir, revalidate_interval=60, timer=timer
+            )
+            version = provider.version
+            server.schema = dict(upstream_schema, title="Changed Registry")
+            server.gate = threading.Event()
+            timer.now += 61
+
+            revalidating = threading.Thread(target=provider.get_schema)
+            revalidating.start()
+            while len(server.requests) < 2:
+                revalidating.join(0.01)
+            others = []
+            reader = threading.Thread(target=lambda: others.extend(provider.current() for _ in range(3)))
+            reader.start()
+            reader.join(2)
+            server.gate.set()
+            revalidating.join(5)
+
+            assert [v for v, _ in others] == [version] * 3
+            assert len(server.requests) == 2
+            assert provider.get_schema()["title"] == "Changed Registry"
+
+    def test_local_file_source(self, upstream_schema, cache_dir):
+        """Test loading the schema from a local file."""
+        path = os.path.join(cache_dir, "schema.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(upstream_schema, f)
+
+        provider = SchemaProvider(_bundled_registry_schema, source=f"file://{path}", cache_dir=cache_dir)
+
+        assert provider.get_schema()["title"] == "Upstream Registry"
+        assert provider.status()["origin"] == "file"
+
+
+class TestSchemaProviderIntegration:
+    """Test that validation follows the provided schema version."""
+
+    def teardown_method(self):
+        set_schema_provider(None)
+
+    def test_validator_tied_to_schema_version(self, cache_dir):
+        """Test that a new schema version gets a new validator and new results."""
+        bundled_validator = get_registry_validator()
+        relaxed = _bundled_registry_schema()
+        relaxed["required"] = ["name"]
+        relaxed["additionalProperties"] = True
+        path = os.path.join(cache_dir, "schema.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(relaxed, f)
+
+        set_schema_provider(SchemaProvider(_bundled_registry_schema, source=path, cache_dir=cache_dir))
+
+        assert get_schema_provider().version == get_schema_version(relaxed)
+        assert get_registry_validator() is not bundled_validator
+        assert validate_yaml_specification("name: Only a name")["valid"] is True
@@ -0,0 +1,224 @@
+"""
+Tests for offline SPDX license identification.
+"""
+
+import os
+import tempfile
+
+import pytest
+
+from registry_mcp.spdx import (
+    LicenseIndex,
+    build_license_index,
+    get_license_index,
+    identify_license,
+    normalize_license_text,
+    spdx_license_url,
+)
+from registry_mcp.tools.registry_submission import analyze_project_directory, clear_analysis_cache
+
+MIT = """MIT License
+
+Copyright (c) 2025 Example Authors
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+ISC = """ISC License
+
+Copyright (c) 2020, Someone <someone@example.org>
+
+Permission to use, copy, modify, and/or distribute this software for any
+purpose with or without fee is hereby granted, provided that the above
+copyright notice and this permission notice appear in all copies.
+
+THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+"""
+
+BSD_3_CLAUSE = """Copyright (c) 2021, The Project Developers
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+* Redistributions of source code must retain the above copyright notice, this
+  list of conditions and the following disclaimer.
+
+* Redistributions in binary form must reproduce the above copyright notice,
+  this list of conditions and the following disclaimer in the documentation
+  and/or other materials provided with the distribution.
+
+* Neither the name of the copyright holder nor the names of its
+  contributors may be used to endorse or promote products derived from
+  this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+"""
+
+
+class TestLicenseIdentification:
+    """Test matching license texts against the bundled index."""
+
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            (MIT, "MIT"),
+            (ISC, "ISC"),
+            (BSD_3_CLAUSE, "BSD-3-Clause"),
+            (
+                BSD_3_CLAUSE.replace(
+                    """* Neither the name of the copyright holder nor the names of its
+  contributors may be used to endorse or promote products derived from
+  this software without specific prior written permission.
+""",
+                    "",
+                ),
+                "BSD-2-Clause",
+            ),
+        ],
+    )
+    def test_identify(self, text, expected):
+        """Test that common licenses and their close variants are told apart."""
+        match = identify_license(text)
+
+        assert match.spdx_id == expected
+        assert match.url == f"https://spdx.org/licenses/{expected}.html"
+        assert match.confidence > 0.9
+
+    def test_reformatted_text(self):
+        """Test that wrapping, case, spelling and the copyright holder do not matter."""
+        text = " ".join(MIT.replace("Example Authors", "Someone Else").split()).upper().replace("LICENSE", "LICENCE")
+
+        assert identify_license(text).spdx_id == "MIT"
+
+    def test_preamble_is_ignored(self):
+        """Test that text outside the license does not lower the confidence."""
+        text = "This project is distributed under the following terms, see also NOTICE.\n\n" + MIT
+
+        assert identify_license(text).confidence > 0.95
+
+    def test_no_match(self):
+        """Test that unrelated text is not identified as a license."""
+        assert identify_license("All rights reserved. Proprietary and confidential.") is None
+        assert identify_license("") is None
+
+    def test_wrapped_copyright_notice_is_kept(self):
+        """Test that only copyright statements, not wrapped license text, are dropped."""
+        words = normalize_license_text("Copyright (c) 2020 Someone\ncopyright notice and this permission notice")
+
+        assert words == ["copyright", "notice", "and", "this", "permission", "notice"]
+
+    def test_custom_index(self):
+        """Test building an index and ranking its licenses."""
+        index = LicenseIndex(build_license_index({"MIT": ("MIT License", MIT), "ISC": ("ISC License", ISC)}))
+
+        matches = index.matches(MIT)
+
+        assert [match.spdx_id for match in matches] == ["MIT", "ISC"]
+        assert matches[0].confidence == 1.0
+
+
+class TestDeclaredLicenses:
+    """Test normalising declared licenses to SPDX URLs."""
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            ("MIT", "MIT"),
+            ("mit", "MIT"),
+            ("Apache-2.0", "Apache-2.0"),
+            ("MIT OR Apache-2.0", "MIT"),
+            ("(Apache-2.0 OR MIT)", "Apache-2.0"),
+            ("MIT/Apache-2.0", "MIT"),
+            ("GPL-3.0+", "GPL-3.0-or-later"),
+            ("GPL-3.0", "GPL-3.0-only"),
+            ("GPL (>= 3)", "GPL-3.0-or-later"),
+            ("MIT + file LICENSE", "MIT"),
+            ("Apache License 2.0", "Apache-2.0"),
+            ("https://spdx.org/licenses/BSD-3-Clause.html", "BSD-3-Clause"),
+            ("http://opensource.org/licenses/MIT", "MIT"),
+            ({"text": "MIT"}, "MIT"),
+            ({"type": "ISC", "url": "https://opensource.org/licenses/ISC"}, "ISC"),
+            ({"@id": "https://spdx.org/licenses/Apache-2.0"}, "Apache-2.0"),
+        ],
+    )
+    def test_spdx_license_url(self, value, expected):
+        """Test SPDX identifiers, expressions, URLs and manifest conventions."""
+        assert spdx_license_url(value) == f"https://spdx.org/licenses/{expected}.html"
+
+    @pytest.mark.parametrize("value", [None, "", "Proprietary", {"file": "LICENSE"}, ["MIT"]])
+    def test_unrecognised(self, value):
+        """Test that values that are not licenses are dropped."""
+        assert spdx_license_url(value) is None
+
+    def test_index_knows_all_identifiers(self):
+        """Test that identifiers without an indexed text are still recognised."""
+        assert get_license_index().license_id("EUPL-1.2") == "EUPL-1.2"
+
+
+class TestLicenseAnalysis:
+    """Test license identification in project analysis."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self):
+        clear_analysis_cache()
+        yield
+        clear_analysis_cache()
+
+    def test_license_from_file(self):
+        """Test that the LICENSE file is identified when no manifest declares a license."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with open(os.path.join(temp_dir, "LICENSE"), "w") as f:
+                f.write(MIT)
+
+            analysis = analyze_project_directory(temp_dir)
+
+        metadata = analysis["suggested_metadata"]
+        assert metadata["license"] == "https://spdx.org/licenses/MIT.html"
+        assert metadata["license_detection"]["spdx_id"] == "MIT"
+        assert metadata["has_license_file"] is True
+        assert analysis["metadata_sources"]["license"] == ["LICENSE"]
+
+    def test_declared_license_mismatch(self):
+        """Test that a manifest license differing from the LICENSE file is reported."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with open(os.path.join(temp_dir, "COPYING"), "w") as f:
+                f.write(MIT)
+            with open(os.path.join(temp_dir, "pyproject.toml"), "w") as f:
+                f.write('[project]\nname = "x"\nlicense = "Apache-2.0"\n')
+
+            analysis = analyze_project_directory(temp_dir)
+
+        assert analysis["suggested_metadata"]["license"] == "https://spdx.org/licenses/Apache-2.0.html"
+        assert any("COPYING looks like MIT" in warning for warning in analysis["warnings"])
@@ -0,0 +1,59 @@
+"""
+Tests for the YAML backend layer.
+"""
+
+import io
+
+import pytest
+import yaml
+
+from registry_mcp.yaml_backend import YAML_BACKEND, YAML_BACKENDS, dump_yaml, get_yaml_backend_info, load_yaml
+
+DOCUMENT = {
+    "@context": "https://schema.org",
+    "@type": "SoftwareApplication",
+    "name": "Test MCP Server",
+    "description": "Ünïcödé description: with a colon",
+    "maintainer": [{"@type": "Person", "name": "Test User"}],
+    "keywords": ["test", "yaml"],
+    "user_confirmed": False,
+    "version": "1.0",
+}
+
+
+class TestYamlBackend:
+    """Test YAML loading and dumping."""
+
+    def test_prefers_libyaml(self):
+        """Test that the C backend is used when PyYAML was built with libyaml."""
+        if yaml.__with_libyaml__:
+            assert YAML_BACKEND == "libyaml"
+        assert get_yaml_backend_info()["backend"] == YAML_BACKEND
+
+    @pytest.mark.parametrize("backend", sorted(YAML_BACKENDS))
+    def test_round_trip(self, backend):
+        """Test that every backend round-trips registry documents in key order."""
+        content = dump_yaml(DOCUMENT, backend=backend)
+
+        assert load_yaml(content, backend=backend) == DOCUMENT
+        assert list(load_yaml(content, backend=backend)) == list(DOCUMENT)
+        assert content.startswith("'@context': https://schema.org\n")
+
+    def test_backends_agree(self):
+        """Test that all backends produce the same output."""
+        outputs = {dump_yaml(DOCUMENT, backend=backend) for backend in YAML_BACKENDS}
+
+        assert len(outputs) == 1
+        assert outputs.pop() == yaml.dump(DOCUMENT, default_flow_style=False, sort_keys=False)
+
+    def test_dump_to_stream(self):
+        """Test dumping to a file object."""
+        stream = io.StringIO()
+
+        assert dump_yaml(DOCUMENT, stream) is None
+        assert load_yaml(stream.getvalue()) == DOCUMENT
+
+    def test_safe_loading(self):
+        """Test that arbitrary Python objects are rejected."""
+        with pytest.raises(yaml.YAMLError):
+            load_yaml("!!python/object/apply:os.system ['true']")